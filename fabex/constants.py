@@ -23,8 +23,6 @@ CUTTER_OFFSET = (-5 * BULLET_SCALE, -5 * BULLET_SCALE, -5 * BULLET_SCALE)
 
 EPS = 1.0e-32
 
-NUMPYALG = False
-
 SHAPELY = True
 
 # DT = Bit diameter tolerance
@@ -37,6 +35,9 @@ was_hidden_dict = {}
 _IS_LOADING_DEFAULTS = False
 
 TOLERANCE = 1e-9
+
+# Size limit of the z-buffer and offset image cache in bytes, least recently used images are removed first
+IMAGE_CACHE_SIZE = 2 * 1024**3
 BIG_FLOAT = 1e38
 
 PY3 = True
@@ -45,8 +46,6 @@ OCL_SCALE = 1000.0
 
 PYTHON_BIN = None
 
-_PREVIOUS_OCL_MESH = None
-
 METRIC_CORRECTION = 1000.0
 
 IMPERIAL_CORRECTION = 1 / 0.0254
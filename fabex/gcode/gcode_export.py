@@ -12,6 +12,8 @@ from math import (
 import time
 
 
+import numpy as np
+
 import bpy
 from mathutils import Euler, Vector
 
@@ -24,6 +26,10 @@ from ..constants import (
 from ..post_processors import iso
 
 from ..utilities.compare_utils import point_on_line
+from ..utilities.internal_utils import (
+    _plunge_angles_internal,
+    _redundant_points_internal,
+)
 from ..utilities.logging_utils import log
 from ..utilities.simple_utils import (
     progress,
@@ -31,6 +37,224 @@ from ..utilities.simple_utils import (
     unit_value_to_string,
 )
 
+# post-processor methods that export_path_fast replaces with array operations
+FAST_EXPORT_METHODS = (
+    "rapid",
+    "feed",
+    "feedrate",
+    "filter_xyz",
+    "on_move",
+    "write",
+    "writem",
+    "SPACE",
+    "write_preps",
+    "write_feedrate",
+    "write_spindle",
+    "write_misc",
+)
+
+
+def fast_export_supported(c, o):
+    """Check if the moves of an operation can be written by export_path_fast.
+
+    This is the case for 3 axis milling with post-processors that use the ISO
+    rapid and feed moves, in absolute coordinates, with no codes waiting to be
+    written with the next move.
+
+    Args:
+        c (Creator): The post-processor.
+        o (Operation): The operation.
+
+    Returns:
+        bool: True if export_path_fast gives the same output as the per vertex loop.
+    """
+    if o.machine_axes != "3" or o.cutter_type in ["LASER", "PLASMA"]:
+        return False
+    if not isinstance(c, iso.Creator):
+        return False
+    if any(
+        getattr(type(c), name) is not getattr(iso.Creator, name) for name in FAST_EXPORT_METHODS
+    ):
+        return False
+    return (
+        c.absolute_flag
+        and c.start_of_line
+        and not c.fhv
+        and not c.output_fixtures
+        and not c.output_disabled
+        and c.shift_x == 0
+        and c.shift_y == 0
+        and c.shift_z == 0
+        and len(c.g_list) == 0
+        and len(c.m) == 0
+        and c.g_plane.str is None
+        and c.s.str is None
+    )
+
+
+def format_column(fmt, values):
+    """Format an array of numbers with a post-processor Format.
+
+    Every distinct value is formatted only once.
+
+    Args:
+        fmt (Format): The number format.
+        values (numpy.ndarray): The numbers.
+
+    Returns:
+        numpy.ndarray: Object array of the formatted strings.
+    """
+    unique, inverse = np.unique(values, return_inverse=True)
+    strings = np.array([fmt.string(value) for value in unique.tolist()], dtype=object)
+    return strings[inverse]
+
+
+def last_given(given, values, initial):
+    """For every row, get the value of the last previous row where given is True.
+
+    Args:
+        given (numpy.ndarray): Boolean array.
+        values (numpy.ndarray): Object array of values.
+        initial (object): Value used before the first given row.
+
+    Returns:
+        numpy.ndarray: Object array of the previous values.
+    """
+    rows = np.where(given, np.arange(len(given)), -1)
+    rows = np.maximum.accumulate(rows)
+    previous = np.concatenate(([-1], rows[:-1]))
+    result = np.full(len(given), initial, dtype=object)
+    result[previous >= 0] = values[previous[previous >= 0]]
+    return result
+
+
+def export_path_fast(c, o, co, feed_scale, last, first_vertex, feedrates, unitcorr):
+    """Write the moves of a 3 axis operation with whole array operations.
+
+    The output is the same as the per vertex loop in export_gcode_path
+    would write with the ISO post-processor moves: rapid, plunge and feed
+    moves are classified with the same vector math, coordinates and
+    feedrates that don't change are left out like filter_xyz and the modal
+    addresses do, and all lines are written at once.
+
+    Args:
+        c (iso.Creator): The post-processor, see fast_export_supported.
+        o (Operation): The operation.
+        co (numpy.ndarray): (N, 3) float32 vertex positions of the path.
+        feed_scale (numpy.ndarray): Feedrate adjustment of every vertex, or None.
+        last (numpy.ndarray): float32 position of the machine before the path.
+        first_vertex (int): Index of the first vertex to write.
+        feedrates (tuple): Mill, plunge and free feedrates.
+        unitcorr (float): Unit correction of the coordinates.
+
+    Returns:
+        tuple: Last position, duration, cut distance, number of removed points,
+            number of redundant point checks that kept a point and number of
+            written points.
+    """
+    mill_feedrate, plunge_feedrate, free_feedrate = feedrates
+    index = np.arange(first_vertex, len(co))
+    online = offline = 0
+    if o.remove_redundant_points and o.strategy != "DRILL":
+        keep, offline = _redundant_points_internal(
+            np.ascontiguousarray(co[first_vertex:]), o.simplify_tolerance / 1000
+        )
+        online = len(keep) - int(np.count_nonzero(keep))
+        index = index[keep]
+
+    n = len(index)
+    if n == 0:
+        return last, 0.0, 0.0, online, offline, 0
+
+    points = co[index]
+    previous = np.concatenate((last.reshape(1, 3), points[:-1]))
+    start = index == 0
+    # vectors in float32, lengths like mathutils Vector.length
+    vectors = points - previous
+    squares = (vectors * vectors).astype(np.float64)
+    lengths = np.sqrt(squares[:, 2] + squares[:, 1] + squares[:, 0])
+    angles = _plunge_angles_internal(vectors)
+
+    plunge = ~start & (lengths > 0) & (angles < pi / 2 - o.plunge_angle)
+    rapid = ~plunge & ((points[:, 2].astype(np.float64) >= o.movement.free_height) | start)
+    # coordinates that didn't change since the last point are not given to the move
+    given = (points != previous) | start[:, None]
+    values = points.astype(np.float64) * unitcorr
+
+    # feedrate of every move
+    if feed_scale is None:
+        scale = np.ones(n)
+        adjusted = np.zeros(n, dtype=bool)
+    else:
+        scale = feed_scale[index]
+        adjusted = scale != 1
+    base_feedrate = np.where(plunge, plunge_feedrate, np.where(rapid, free_feedrate, mill_feedrate))
+    set_feedrate = np.where(rapid, free_feedrate, base_feedrate * scale)
+    move_feedrate = set_feedrate.copy()
+    # rapid moves are timed with the feedrates that compensate for accelerations
+    rapid_z = rapid & given[:, 2]
+    move_feedrate[rapid_z] = (plunge_feedrate * scale * 0.35)[rapid_z]
+    move_feedrate[rapid & (given[:, 0] | given[:, 1])] = free_feedrate * 0.8
+    previous_feedrate = np.concatenate(([0.1123456], move_feedrate[:-1]))
+    calls = (previous_feedrate != base_feedrate) | (adjusted & ~rapid)
+
+    duration = float(np.sum(lengths / move_feedrate))
+    cut_distance = float(np.sum(lengths)) * unitcorr
+
+    # filter_xyz - coordinates are written when their formatted value changes
+    space = c.SPACE_STR()
+    words = np.full(n, "", dtype=object)
+    moved = np.zeros(n, dtype=bool)
+    for axis, (name, address) in enumerate((("x", c.X()), ("y", c.Y()), ("z", c.Z()))):
+        strings = format_column(c.fmt, values[:, axis])
+        written = last_given(given[:, axis], strings, c.fmt.string(getattr(c, name)))
+        changed = given[:, axis] & (strings != written)
+        words[changed] += space + address + strings[changed]
+        moved |= changed
+        if changed.any():
+            setattr(c, name, float(values[np.flatnonzero(changed)[-1], axis]))
+
+    # modal motion codes
+    codes = np.array([c.FEED(), c.RAPID()], dtype=object)[rapid.astype(int)]
+    if c.g0123_modal:
+        previous_codes = last_given(moved, codes, c.prev_g0123)
+        code_written = moved & (codes != previous_codes)
+        if moved.any():
+            c.prev_g0123 = codes[np.flatnonzero(moved)[-1]]
+    else:
+        code_written = moved
+
+    # feedrates are set before the move and written with the next feed move
+    feed_strings = c.f.text + format_column(c.f.fmt, set_feedrate)
+    # the first row stands for a feedrate that is already waiting
+    calls = np.concatenate(([c.f.str is not None], calls))
+    feed_strings = np.concatenate(([c.f.str], feed_strings))
+    feed_moves = np.concatenate(([False], moved & ~rapid))
+    rows = np.arange(n + 1)
+    last_call = np.maximum.accumulate(np.where(calls, rows, -1))
+    last_feed_move = np.concatenate(
+        ([-1], np.maximum.accumulate(np.where(feed_moves, rows, -1))[:-1])
+    )
+    pending = feed_moves & (last_call > last_feed_move)
+    candidates = feed_strings[np.maximum(last_call, 0)]
+    if c.f.modal:
+        previous_feeds = last_given(pending, candidates, c.f.previous)
+        feed_written = pending & (candidates != previous_feeds)
+    else:
+        feed_written = pending
+    words[feed_written[1:]] += space + candidates[feed_written]
+    if feed_written.any():
+        c.f.previous = candidates[np.flatnonzero(feed_written)[-1]]
+    # a feedrate set after the last feed move is still waiting to be written
+    last_move = np.max(np.where(feed_moves, rows, -1))
+    c.f.str = feed_strings[last_call[-1]] if last_call[-1] > last_move else None
+
+    lines = np.where(code_written, space + codes, "") + words
+    lines = [line[len(space) :] + "\n" for line in lines[moved].tolist()]
+    c.writem(lines)
+
+    return points[-1], duration, cut_distance, online, offline, n
+
 
 def export_gcode_path(filename, vertslist, operations):
     """Exports G-code using the Heeks NC Adopted Library.
@@ -190,7 +414,6 @@ def export_gcode_path(filename, vertslist, operations):
             c.set_path_control_mode(2, round(o.movement.G64 * 1000, 5), 0)
 
         mesh = vertslist[i]
-        verts = mesh.vertices[:]
 
         if o.machine_axes != "3":
             rots = mesh.shape_keys.key_blocks["rotations"].data
@@ -305,154 +528,177 @@ def export_gcode_path(filename, vertslist, operations):
         cut = True  # active cut variable for laser or plasma
         shapes = 0
 
-        for vi, vert in enumerate(verts):
-            # skip the first vertex if this is a chained operation
-            # ie: outputting more than one operation
-            # otherwise the machine gets sent back to 0,0 for each operation which is unecessary
-            shapes += 1  # Count amount of shapes
-
-            if i > 0 and vi == 0:
-                continue
-            v = vert.co
-            # redundant point on line detection
-            if o.remove_redundant_points and o.strategy != "DRILL":
-                nextv = v
-                if ii == 0:
-                    firstv = v  # only happens once
-                elif ii == 1:
-                    middlev = v
-                else:
-                    if point_on_line(firstv, middlev, nextv, o.simplify_tolerance / 1000):
-                        middlev = nextv
-                        online += 1
-                        continue
-                    else:  # create new start point with the last tested point
-                        ii = 0
-                        offline += 1
-                        firstv = nextv
-                ii += 1
-            # end of redundant point on line detection
-            if o.machine_axes != "3":
-                v = v.copy()  # we rotate it so we need to copy the vector
-                r = Euler(rots[vi].co)
-                # conversion to N-axis coordinates
-                # this seems to work correctly for 4 axis.
-                rcompensate = r.copy()
-                rcompensate.x = -r.x
-                rcompensate.y = -r.y
-                rcompensate.z = -r.z
-                v.rotate(rcompensate)
-
-                ra = None if r.x == lastrot.x else r.x * rotcorr
-                rb = None if r.y == lastrot.y else r.y * rotcorr
-
-            vx = None if vi > 0 and v.x == last.x else v.x * unitcorr
-            vy = None if vi > 0 and v.y == last.y else v.y * unitcorr
-            vz = None if vi > 0 and v.z == last.z else v.z * unitcorr
-
+        if not split and fast_export_supported(c, o):
+            co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", co)
+            feed_scale = None
             if fadjust:
-                fadjustval = shapek.data[vi].co.z / scale_graph
-
-            vect = v - last
-            l = vect.length
-            if vi > 0 and l > 0 and downvector.angle(vect) < plungelimit:
-                if f != plungefeedrate or (fadjust and fadjustval != 1):
-                    f = plungefeedrate * fadjustval
-                    c.feedrate(f)
-
-                if o.machine_axes == "3":
-                    if o.cutter_type in ["LASER", "PLASMA"]:
-                        if not cut:
-                            if o.cutter_type == "LASER":
-                                c.write("(*************dwell->laser on)\n")
-                                c.write("G04 P" + str(round(o.laser_delay, 2)) + "\n")
-                                c.write(o.laser_on + "\n")
-                            elif o.cutter_type == "PLASMA":
-                                c.write("(*************dwell->PLASMA on)\n")
-                                plasma_delay = round(o.plasma_delay, 5)
-                                if plasma_delay > 0:
-                                    c.write("G04 P" + str(plasma_delay) + "\n")
-                                c.write(o.plasma_on + "\n")
-                                plasma_dwell = round(o.plasma_dwell, 5)
-                                if plasma_dwell > 0:
-                                    c.write("G04 P" + str(plasma_dwell) + "\n")
-                            cut = True
+                feed_scale = np.empty(len(shapek.data) * 3, dtype=np.float32)
+                shapek.data.foreach_get("co", feed_scale)
+                feed_scale = feed_scale[2::3].astype(np.float64) / scale_graph
+
+            last, duration, op_cut_distance, online, offline, count = export_path_fast(
+                c,
+                o,
+                co.reshape(-1, 3),
+                feed_scale,
+                np.array(last, dtype=np.float32),
+                1 if i > 0 else 0,
+                (millfeedrate, plungefeedrate, freefeedrate),
+                unitcorr,
+            )
+            last = Vector(last)
+            cut_distance += op_cut_distance
+            processedops += count
+        else:
+            for vi, vert in enumerate(mesh.vertices):
+                # skip the first vertex if this is a chained operation
+                # ie: outputting more than one operation
+                # otherwise the machine gets sent back to 0,0 for each operation which is unecessary
+                shapes += 1  # Count amount of shapes
+
+                if i > 0 and vi == 0:
+                    continue
+                v = vert.co
+                # redundant point on line detection
+                if o.remove_redundant_points and o.strategy != "DRILL":
+                    nextv = v
+                    if ii == 0:
+                        firstv = v  # only happens once
+                    elif ii == 1:
+                        middlev = v
                     else:
-                        c.feed(x=vx, y=vy, z=vz)
-                else:
-                    c.feed(x=vx, y=vy, z=vz, a=ra, b=rb)
-
-            elif v.z >= free_height or vi == 0:
-                if f != freefeedrate:
-                    f = freefeedrate
-                    c.feedrate(f)
-
-                if o.machine_axes == "3":
-                    if o.cutter_type in ["LASER", "PLASMA"]:
-                        if cut:
-                            if o.cutter_type == "LASER":
-                                c.write("(**************laser off)\n")
-                                c.write(o.laser_off + "\n")
-                            elif o.cutter_type == "PLASMA":
-                                c.write("(**************Plasma off)\n")
-                                c.write(o.plasma_off + "\n")
-
-                            cut = False
-                        c.rapid(x=vx, y=vy)
+                        if point_on_line(firstv, middlev, nextv, o.simplify_tolerance / 1000):
+                            middlev = nextv
+                            online += 1
+                            continue
+                        else:  # create new start point with the last tested point
+                            ii = 0
+                            offline += 1
+                            firstv = nextv
+                    ii += 1
+                # end of redundant point on line detection
+                if o.machine_axes != "3":
+                    v = v.copy()  # we rotate it so we need to copy the vector
+                    r = Euler(rots[vi].co)
+                    # conversion to N-axis coordinates
+                    # this seems to work correctly for 4 axis.
+                    rcompensate = r.copy()
+                    rcompensate.x = -r.x
+                    rcompensate.y = -r.y
+                    rcompensate.z = -r.z
+                    v.rotate(rcompensate)
+
+                    ra = None if r.x == lastrot.x else r.x * rotcorr
+                    rb = None if r.y == lastrot.y else r.y * rotcorr
+
+                vx = None if vi > 0 and v.x == last.x else v.x * unitcorr
+                vy = None if vi > 0 and v.y == last.y else v.y * unitcorr
+                vz = None if vi > 0 and v.z == last.z else v.z * unitcorr
+
+                if fadjust:
+                    fadjustval = shapek.data[vi].co.z / scale_graph
+
+                vect = v - last
+                l = vect.length
+                if vi > 0 and l > 0 and downvector.angle(vect) < plungelimit:
+                    if f != plungefeedrate or (fadjust and fadjustval != 1):
+                        f = plungefeedrate * fadjustval
+                        c.feedrate(f)
+
+                    if o.machine_axes == "3":
+                        if o.cutter_type in ["LASER", "PLASMA"]:
+                            if not cut:
+                                if o.cutter_type == "LASER":
+                                    c.write("(*************dwell->laser on)\n")
+                                    c.write("G04 P" + str(round(o.laser_delay, 2)) + "\n")
+                                    c.write(o.laser_on + "\n")
+                                elif o.cutter_type == "PLASMA":
+                                    c.write("(*************dwell->PLASMA on)\n")
+                                    plasma_delay = round(o.plasma_delay, 5)
+                                    if plasma_delay > 0:
+                                        c.write("G04 P" + str(plasma_delay) + "\n")
+                                    c.write(o.plasma_on + "\n")
+                                    plasma_dwell = round(o.plasma_dwell, 5)
+                                    if plasma_dwell > 0:
+                                        c.write("G04 P" + str(plasma_dwell) + "\n")
+                                cut = True
+                        else:
+                            c.feed(x=vx, y=vy, z=vz)
+                    else:
+                        c.feed(x=vx, y=vy, z=vz, a=ra, b=rb)
+
+                elif v.z >= free_height or vi == 0:
+                    if f != freefeedrate:
+                        f = freefeedrate
+                        c.feedrate(f)
+
+                    if o.machine_axes == "3":
+                        if o.cutter_type in ["LASER", "PLASMA"]:
+                            if cut:
+                                if o.cutter_type == "LASER":
+                                    c.write("(**************laser off)\n")
+                                    c.write(o.laser_off + "\n")
+                                elif o.cutter_type == "PLASMA":
+                                    c.write("(**************Plasma off)\n")
+                                    c.write(o.plasma_off + "\n")
+
+                                cut = False
+                            c.rapid(x=vx, y=vy)
+                        else:
+                            c.rapid(x=vx, y=vy, z=vz)
+                            #  this is to evaluate operation time and adds a feedrate for fast moves
+                            if vz is not None:
+                                # compensate for multiple fast move accelerations
+                                f = plungefeedrate * fadjustval * 0.35
+                            if vx is not None or vy is not None:
+                                f = freefeedrate * 0.8  # compensate for free feedrate acceleration
                     else:
-                        c.rapid(x=vx, y=vy, z=vz)
-                        #  this is to evaluate operation time and adds a feedrate for fast moves
-                        if vz is not None:
-                            # compensate for multiple fast move accelerations
-                            f = plungefeedrate * fadjustval * 0.35
-                        if vx is not None or vy is not None:
-                            f = freefeedrate * 0.8  # compensate for free feedrate acceleration
+                        c.rapid(x=vx, y=vy, z=vz, a=ra, b=rb)
+
                 else:
-                    c.rapid(x=vx, y=vy, z=vz, a=ra, b=rb)
+                    if f != millfeedrate or (fadjust and fadjustval != 1):
+                        f = millfeedrate * fadjustval
+                        c.feedrate(f)
+
+                    if o.machine_axes == "3":
+                        c.feed(x=vx, y=vy, z=vz)
+                    else:
+                        c.feed(x=vx, y=vy, z=vz, a=ra, b=rb)
 
-            else:
-                if f != millfeedrate or (fadjust and fadjustval != 1):
-                    f = millfeedrate * fadjustval
-                    c.feedrate(f)
+                cut_distance += vect.length * unitcorr
+                vector_duration = vect.length / f
+                duration += vector_duration
+                last = v
 
-                if o.machine_axes == "3":
-                    c.feed(x=vx, y=vy, z=vz)
-                else:
-                    c.feed(x=vx, y=vy, z=vz, a=ra, b=rb)
-
-            cut_distance += vect.length * unitcorr
-            vector_duration = vect.length / f
-            duration += vector_duration
-            last = v
-
-            if o.machine_axes != "3":
-                lastrot = r
-
-            processedops += 1
-
-            if split and processedops > m.split_limit:
-                c.rapid(x=last.x * unitcorr, y=last.y * unitcorr, z=free_height * unitcorr)
-                c.program_end()
-                findex += 1
-                c.file_close()
-                c = start_new_file()
-                c.flush_nc()
-                c.comment(
-                    f"Tool change - D = {unit_value_to_string(o.cutter_diameter, 4)} type {o.cutter_type} flutes {o.cutter_flutes}"
-                )
-                c.tool_change(o.cutter_id)
-                c.spindle(o.spindle_rpm, spdir_clockwise)
-                c.write_spindle()
-                c.flush_nc()
+                if o.machine_axes != "3":
+                    lastrot = r
 
-                if m.spindle_start_time > 0:
-                    c.dwell(m.spindle_start_time)
+                processedops += 1
+
+                if split and processedops > m.split_limit:
+                    c.rapid(x=last.x * unitcorr, y=last.y * unitcorr, z=free_height * unitcorr)
+                    c.program_end()
+                    findex += 1
+                    c.file_close()
+                    c = start_new_file()
+                    c.flush_nc()
+                    c.comment(
+                        f"Tool change - D = {unit_value_to_string(o.cutter_diameter, 4)} type {o.cutter_type} flutes {o.cutter_flutes}"
+                    )
+                    c.tool_change(o.cutter_id)
+                    c.spindle(o.spindle_rpm, spdir_clockwise)
+                    c.write_spindle()
                     c.flush_nc()
 
-                c.feedrate(unitcorr * o.feedrate)
-                c.rapid(x=last.x * unitcorr, y=last.y * unitcorr, z=free_height * unitcorr)
-                c.rapid(x=last.x * unitcorr, y=last.y * unitcorr, z=last.z * unitcorr)
-                processedops = 0
+                    if m.spindle_start_time > 0:
+                        c.dwell(m.spindle_start_time)
+                        c.flush_nc()
+
+                    c.feedrate(unitcorr * o.feedrate)
+                    c.rapid(x=last.x * unitcorr, y=last.y * unitcorr, z=free_height * unitcorr)
+                    c.rapid(x=last.x * unitcorr, y=last.y * unitcorr, z=last.z * unitcorr)
+                    processedops = 0
 
         if o.remove_redundant_points and o.strategy != "DRILL":
             log.info(f"Online: {online}")
@@ -187,6 +187,12 @@ class DoBasRelief(Operator):
         description="",
         default=False,
     )
+    use_direct_solve: BoolProperty(
+        name="Direct Solve",
+        description="Solve the relief exactly in one step, like with very many V-Cycle and LINBCG "
+        "iterations. Not used with the planar constraint",
+        default=False,
+    )
     gradient_scaling_mask_use: BoolProperty(
         name="Scale Gradients with Mask",
         description="",
@@ -201,6 +207,12 @@ class DoBasRelief(Operator):
         default=0.1,
         precision=PRECISION,
     )
+    merge_flat_areas: BoolProperty(
+        name="Merge Flat Areas",
+        description="Build areas of the mesh with the same height from single faces "
+        "instead of a dense grid, before decimating. The shape of the mesh doesn't change",
+        default=False,
+    )
 
     gradient_scaling_mask_name: StringProperty(
         name="Scaling Mask Name",
@@ -356,10 +368,12 @@ class DoBasRelief(Operator):
             col.prop(self, "smooth_iterations", text="Smooth")
         col.prop(self, "vcycle_iterations", text="V-Cycle")
         col.prop(self, "linbcg_iterations", text="LINBCG")
+        col.prop(self, "use_direct_solve")
 
         if self.advanced:
             layout.prop(self, "min_gridsize")
         layout.prop(self, "decimate_ratio")
+        layout.prop(self, "merge_flat_areas")
         layout.prop(self, "use_planar")
 
         layout.prop(self, "gradient_scaling_mask_use")
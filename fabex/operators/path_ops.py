@@ -5,11 +5,11 @@ They mostly call the functions from 'utils.py'
 """
 
 from importlib import import_module
+import json
 from math import pi
-import os
-import subprocess
+import socket
+import sys
 import textwrap
-import threading
 import time
 import traceback
 
@@ -44,19 +44,38 @@ from ..utilities.simple_utils import (
     add_to_group,
     safe_filename,
 )
-from ..utilities.thread_utils import (
-    threadCom,
-    thread_read,
-    timer_update,
-)
 from ..utilities.machine_utils import add_machine_area_object
 from ..utilities.bounds_utils import get_bounds_worldspace
 from ..utilities.operation_utils import (
     chain_valid,
     source_valid,
     reload_paths,
+    save_paths,
     get_chain_operations,
 )
+from ..utilities.worker_utils import (
+    WORKER_POLL_INTERVAL,
+    PathWorkerPool,
+    get_worker_count,
+    send_message,
+)
+
+
+def background_file_ready(operator):
+    """Check if the file can be opened by background processes.
+
+    Args:
+        operator (bpy.types.Operator): The operator that reports problems.
+
+    Returns:
+        bool: True if the file is saved.
+    """
+    if bpy.data.filepath == "":
+        operator.report({"ERROR"}, "File Has to Be Saved Before Calculating in Background")
+        return False
+    if bpy.data.is_dirty:
+        operator.report({"WARNING"}, "Unsaved Changes Are Not Used in Background Calculations")
+    return True
 
 
 class PathsBackground(Operator):
@@ -69,11 +88,10 @@ class PathsBackground(Operator):
     def execute(self, context):
         """Execute the CAM operation in the background.
 
-        This method initiates a background process to perform CAM operations
-        based on the current scene and active CAM operation. It sets up the
-        necessary paths for the script and starts a subprocess to handle the
-        CAM computations. Additionally, it manages threading to ensure that
-        the main thread remains responsive while the background operation is
+        This method starts a background Blender process that opens the saved
+        file and calculates the path of the active CAM operation. A timer
+        reads its progress and loads the path when it is finished, so the
+        main thread remains responsive while the background operation is
         executed.
 
         Args:
@@ -86,32 +104,11 @@ class PathsBackground(Operator):
         s = bpy.context.scene
         o = s.cam_operations[s.cam_active_operation]
         self.operation = o
-        o.computing = True
-
-        bpath = bpy.app.binary_path
-        fpath = bpy.data.filepath
-
-        for p in bpy.utils.script_paths():
-            scriptpath = p + os.sep + "addons" + os.sep + "cam" + os.sep + "backgroundop.py"
-            log.info(scriptpath)
-            if os.path.isfile(scriptpath):
-                break
-        proc = subprocess.Popen(
-            [bpath, "-b", fpath, "-P", scriptpath, "--", "-o=" + str(s.cam_active_operation)],
-            bufsize=1,
-            stdout=subprocess.PIPE,
-            stdin=subprocess.PIPE,
-        )
 
-        tcom = threadCom(o, proc)
-        readthread = threading.Thread(target=thread_read, args=([tcom]), daemon=True)
-        readthread.start()
-        # self.__class__.cam_processes=[]
-        if not hasattr(bpy.ops.object.calculate_cam_paths_background.__class__, "cam_processes"):
-            bpy.ops.object.calculate_cam_paths_background.__class__.cam_processes = []
-        bpy.ops.object.calculate_cam_paths_background.__class__.cam_processes.append(
-            [readthread, tcom]
-        )
+        if not background_file_ready(self):
+            return {"CANCELLED"}
+
+        PathWorkerPool([o], 1).start()
         return {"FINISHED"}
 
 
@@ -126,11 +123,11 @@ class KillPathsBackground(Operator):
         """Execute the CAM operation in the given context.
 
         This method retrieves the active CAM operation from the scene and
-        checks if there are any ongoing processes related to CAM path
-        calculations. If such processes exist and match the current operation,
-        they are terminated. The method then marks the operation as not
-        computing and returns a status indicating that the execution has
-        finished.
+        removes it from the background calculations. If a process is
+        calculating it, the process is terminated, if it is still waiting in a
+        queue it is taken out of it. The operation is then marked as not
+        computing and a status indicating that the execution has finished is
+        returned.
 
         Args:
             context: The context in which the operation is executed.
@@ -143,14 +140,9 @@ class KillPathsBackground(Operator):
         o = s.cam_operations[s.cam_active_operation]
         self.operation = o
 
-        if hasattr(bpy.ops.object.calculate_cam_paths_background.__class__, "cam_processes"):
-            processes = bpy.ops.object.calculate_cam_paths_background.__class__.cam_processes
-            for p in processes:
-                tcom = p[1]
-                if tcom.opname == o.name:
-                    processes.remove(p)
-                    tcom.proc.kill()
-                    o.computing = False
+        for pool in PathWorkerPool.pools[:]:
+            pool.cancel(o.name)
+        o.computing = False
 
         return {"FINISHED"}
 
@@ -248,6 +240,68 @@ async def _calc_path(operator, context):
     return {"FINISHED", True}
 
 
+class WorkerReports:
+    """Collects the errors _calc_path reports in a background process."""
+
+    def __init__(self):
+        self.errors = []
+
+    def report(self, type, message):
+        if any(t.startswith("ERROR") for t in type):
+            self.errors.append(message)
+
+
+def path_worker_main():
+    """Entry point of a background process started by PathWorkerPool.
+
+    Jobs arrive on stdin, one JSON line each. The paths of the finished
+    operations a job depends on are loaded first, then the path is
+    calculated like Calculate CAM Paths does and stored with save_paths.
+    Progress and results are sent to the socket of the pool.
+    """
+    port, token, worker = sys.argv[sys.argv.index("--") + 1 :]
+    connection = socket.create_connection(("127.0.0.1", int(port)))
+    send_message(connection, {"token": token, "worker": int(worker)})
+
+    s = bpy.context.scene
+    for line in sys.stdin:
+        job = json.loads(line)
+        for name in job["load"]:
+            s.cam_active_operation = s.cam_operations.find(name)
+            reload_paths(s.cam_operations[name])
+
+        name = job["operation"]
+        s.cam_active_operation = s.cam_operations.find(name)
+        o = s.cam_operations[name]
+        o.computing = False
+
+        reports = WorkerReports()
+        coroutine = _calc_path(reports, bpy.context)
+        last_update = 0
+        result = None
+        try:
+            while True:
+                msg, args = coroutine.send(None)
+                if msg == "Progress:" and time.time() - last_update > WORKER_POLL_INTERVAL:
+                    last_update = time.time()
+                    text, n = args["text"], args["n"]
+                    if n is not None:
+                        text = f"{text}: {n:.2f}{args['value_type']}"
+                    send_message(connection, {"type": "progress", "text": text})
+        except StopIteration as e:
+            result = e.value
+        except Exception as e:
+            log.error(f"FAIL {e}")
+            traceback.print_tb(e.__traceback__)
+            reports.errors.append(str(e))
+
+        if result is not None and True in result:
+            save_paths(o)
+            send_message(connection, {"type": "finished", "path": s.cam_names.path_name_full})
+        else:
+            send_message(connection, {"type": "error", "text": " ".join(reports.errors)})
+
+
 class CalculatePath(Operator, AsyncOperatorMixin):
     """Calculate CAM Paths"""
 
@@ -298,7 +352,7 @@ class CalculatePath(Operator, AsyncOperatorMixin):
             Any: The result of the path calculation.
         """
 
-        (retval, success) = await _calc_path(self, context)
+        retval, success = await _calc_path(self, context)
         log.info(f"CALCULATED PATH (success={success},retval={retval})")
 
         # Import the Gcode file to Blender's Text Editor for inspection
@@ -362,11 +416,11 @@ class PathsAll(Operator):
     def execute(self, context):
         """Execute CAM operations in the current Blender context.
 
-        This function iterates through the CAM operations defined in the
-        current scene and executes the background calculation for each
-        operation. It sets the active CAM operation index and prints the name
-        of each operation being processed. This is typically used in a Blender
-        add-on or script to automate CAM path calculations.
+        This function calculates the paths of all CAM operations defined in
+        the current scene in a pool of background processes. The number of
+        processes is set in the addon preferences, operations in a chain wait
+        for the operations before them, and the biggest operations start
+        first.
 
         Args:
             context (bpy.context): The current Blender context.
@@ -376,13 +430,13 @@ class PathsAll(Operator):
                 typically {'FINISHED'}.
         """
 
-        i = 0
-        for o in bpy.context.scene.cam_operations:
-            bpy.context.scene.cam_active_operation = i
+        if not background_file_ready(self):
+            return {"CANCELLED"}
+
+        operations = [o for o in bpy.context.scene.cam_operations if not o.computing]
+        for o in operations:
             log.info(f"\nCalculating Path : {o.name}")
-            log.info("\n")
-            bpy.ops.object.calculate_cam_paths_background()
-            i += 1
+        PathWorkerPool(operations, get_worker_count()).start()
 
         return {"FINISHED"}
 
@@ -80,6 +80,7 @@ class AddPresetCamOperation(AddPresetBase, Operator):
         "o.optimisation.use_exact",
         "o.optimisation.exact_subdivide_edges",
         "o.optimisation.simulation_detail",
+        "o.optimisation.use_swept_simulation",
         "o.optimisation.pixsize",
         "o.optimisation.circle_detail",
         "o.cut_type",
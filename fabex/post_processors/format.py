@@ -1,4 +1,75 @@
 import math
+from functools import lru_cache
+
+# number of formatted values remembered by every formatter
+FORMAT_CACHE_SIZE = 4096
+
+# formatters specialized for one combination of Format settings
+formatters = {}
+
+
+def make_formatter(
+    number_of_decimal_places,
+    add_leading_zeros,
+    add_trailing_zeros,
+    dp_wanted,
+    add_plus,
+    no_minus,
+    rounded,
+):
+    scale = math.pow(10, number_of_decimal_places)
+    point = "." if dp_wanted else ""
+    plus = "+" if add_plus else ""
+
+    def formatter(number):
+        f = float(number) * scale
+        if rounded:
+            s = "%f" % float(number)
+            if f < 0:
+                f = f - 0.5
+            else:
+                f = f + 0.5
+        else:
+            s = "%f" % f
+
+        if math.fabs(f) < 1.0:
+            s = "0"
+
+        sign = plus
+        if s[0] == "-":
+            sign = ""
+            if no_minus:
+                s = s[1:]
+
+        before_dp, _, after_dp = s.partition(".")
+        after_dp = after_dp[:number_of_decimal_places]
+        before_dp = before_dp.zfill(add_leading_zeros)
+        if add_trailing_zeros:
+            after_dp = after_dp.ljust(number_of_decimal_places, "0")
+        else:
+            after_dp = after_dp.rstrip("0")
+
+        if len(after_dp):
+            return sign + before_dp + point + after_dp
+        return sign + before_dp
+
+    return formatter, lru_cache(maxsize=FORMAT_CACHE_SIZE)(formatter)
+
+
+def get_formatter(fmt):
+    key = (
+        fmt.number_of_decimal_places,
+        fmt.add_leading_zeros,
+        bool(fmt.add_trailing_zeros),
+        bool(fmt.dp_wanted),
+        fmt.add_plus == True,
+        bool(fmt.no_minus),
+        fmt.round_down == False,
+    )
+    formatter = formatters.get(key)
+    if formatter is None:
+        formatter = formatters[key] = make_formatter(*key)
+    return formatter
 
 
 class Format:
@@ -22,55 +93,22 @@ class Format:
         self.no_minus = no_minus
         self.round_down = round_down
 
+    def __setattr__(self, name, value):
+        # settings changed, the formatter is looked up again on the next call
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "formatter", None)
+
     def string(self, number):
         if number == None:
             return "None"
-        f = float(number) * math.pow(10, self.number_of_decimal_places)
-        s = format(f, "f")
-
-        if self.round_down == False:
-            if f < 0:
-                f = f - 0.5
-            else:
-                f = f + 0.5
-            s = format(float(number), "f")
-
-        if math.fabs(f) < 1.0:
-            s = "0"
-
-        minus = False
-        if s[0] == "-":
-            minus = True
-            if self.no_minus:
-                s = s[1:]
-
-        dot = s.find(".")
-        if dot == -1:
-            before_dp = s
-            after_dp = ""
-        else:
-            before_dp = s[0:dot]
-            after_dp = s[dot + 1 : dot + 1 + self.number_of_decimal_places]
-
-        before_dp = before_dp.zfill(self.add_leading_zeros)
-        if self.add_trailing_zeros:
-            for i in range(0, self.number_of_decimal_places - len(after_dp)):
-                after_dp += "0"
-        else:
-            after_dp = after_dp.rstrip("0")
-
-        s = ""
-
-        if minus == False:
-            if self.add_plus == True:
-                s += "+"
-        s += before_dp
-        if len(after_dp):
-            if self.dp_wanted:
-                s += "."
-            s += after_dp
-
-        return s
+        if self.formatter is None:
+            object.__setattr__(self, "formatter", get_formatter(self))
+        formatter, cached = self.formatter
+        try:
+            return cached(number)
+        except TypeError:
+            # unhashable numbers, like numpy arrays
+            return formatter(number)
 
 
 class Address:
@@ -502,6 +502,7 @@ class Creator(nc.Creator):
         if name == None:
             name = self.program_name + " subroutine " + str(id)
 
+        self.flush_buffer()
         self.save_file = self.file
         if self.subroutines_in_own_files:
             new_name = self.make_subroutine_name(id)
@@ -530,6 +531,7 @@ class Creator(nc.Creator):
     def sub_end(self):
         self.write(self.SPACE() + self.SUBPROG_END() + "\n")
 
+        self.flush_buffer()
         self.file.close()
         self.file = self.save_file
 
@@ -24,6 +24,9 @@ ncFLOOD = 2
 
 
 class Creator:
+    # number of characters collected by write before they are sent to the file
+    flush_size = 65536
+
     def __init__(self):
         pass
 
@@ -31,25 +34,30 @@ class Creator:
     # Internals
 
     def file_open(self, name):
-        # self.buffer=[]
+        self.buffer = []
+        self.buffered = 0
         self.file = open(name, "w")
         self.filename = name
 
     def file_close(self):
-        # self.file.write(''.join(self.buffer))
-        # self.buffer=[]
+        self.flush_buffer()
         self.file.close()
 
+    def flush_buffer(self):
+        # must be called before self.file is closed or replaced
+        if self.buffered:
+            self.file.write("".join(self.buffer))
+            self.buffer = []
+            self.buffered = 0
+
     def write(self, s):
-        self.file.write(s)
-        # self.buffer.append(s)
-        # if len(self.buffer)>100000:
-        # 	self.file.write(''.join(self.buffer))
-        # 	self.buffer=[]
+        self.buffer.append(s)
+        self.buffered += len(s)
+        if self.buffered >= self.flush_size:
+            self.flush_buffer()
 
     def writem(self, a):
-        self.file.write("".join(a))
-        # self.buffer.extend(a)
+        self.write("".join(a))
 
     ############################################################################
     # Programs
@@ -313,6 +313,15 @@ class CamAddonPreferences(AddonPreferences):
         default=True,
     )
 
+    path_workers: IntProperty(
+        name="Background Processes",
+        description="Number of background Blender processes used by Calculate All CAM Paths, "
+        "0 uses one for each CPU core",
+        default=0,
+        min=0,
+        max=64,
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.use_property_split = True
@@ -352,6 +361,10 @@ class CamAddonPreferences(AddonPreferences):
         header, panel = col.panel("Settings", default_closed=True)
         header.label(text="Settings", icon="TOOL_SETTINGS")
         if panel:
+            col = panel.column(align=True)
+            col.label(text="Background Calculation", icon="SORTTIME")
+            col.prop(self, "path_workers")
+
             col = panel.column(align=True)
             col.label(text="Naming System", icon="FONT_DATA")
 
@@ -937,46 +937,6 @@ class CAM_OPERATION_Properties(PropertyGroup):
         unit="LENGTH",
         update=update_rest,
     )
-    crazy_threshold_1: FloatProperty(
-        name="Min Engagement",
-        default=0.02,
-        min=0.00000001,
-        max=100,
-        precision=PRECISION,
-        update=update_rest,
-    )
-    crazy_threshold_2: FloatProperty(
-        name="Max Engagement",
-        default=0.5,
-        min=0.00000001,
-        max=100,
-        precision=PRECISION,
-        update=update_rest,
-    )
-    crazy_threshold_3: FloatProperty(
-        name="Max Angle",
-        default=2,
-        min=0.00000001,
-        max=100,
-        precision=PRECISION,
-        update=update_rest,
-    )
-    crazy_threshold_4: FloatProperty(
-        name="Test Angle Step",
-        default=0.05,
-        min=0.00000001,
-        max=100,
-        precision=PRECISION,
-        update=update_rest,
-    )
-    crazy_threshold_5: FloatProperty(
-        name="Optimal Engagement",
-        default=0.3,
-        min=0.00000001,
-        max=100,
-        precision=PRECISION,
-        update=update_rest,
-    )
 
     ##########
     # Medial #
@@ -1154,6 +1114,8 @@ class CAM_OPERATION_Properties(PropertyGroup):
 
     offset_image = np.array([], dtype=float)
     zbuffer_image = np.array([], dtype=float)
+    cylinder_image = np.array([], dtype=float)
+    cylinder_image_key = ""
     silhouette = Polygon()
     ambient = Polygon()
     operation_limit = Polygon()
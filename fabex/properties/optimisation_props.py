@@ -57,6 +57,14 @@ class CAM_OPTIMISATION_Properties(PropertyGroup):
         update=update_zbuffer_image,
     )
 
+    use_tiles: BoolProperty(
+        name="Tiled Processing",
+        description="Process images over the maximum resolution in tiles stored on disk, "
+        "instead of increasing the detail size",
+        default=False,
+        update=update_zbuffer_image,
+    )
+
     pixsize: FloatProperty(
         name="Sampling Raster Detail",
         default=0.0001,
@@ -74,6 +82,16 @@ class CAM_OPTIMISATION_Properties(PropertyGroup):
         update=update_opencamlib,
     )
 
+    sampling_processes: IntProperty(
+        name="Sampling Processes",
+        description="Number of background Blender processes sampling large exact mode jobs "
+        "without OpenCAMLib, 1 samples on the main thread",
+        default=1,
+        min=1,
+        max=64,
+        update=update_operation,
+    )
+
     exact_subdivide_edges: BoolProperty(
         name="Auto Subdivide Long Edges",
         description="This can avoid some collision issues when " "importing CAD models",
@@ -98,3 +116,12 @@ class CAM_OPTIMISATION_Properties(PropertyGroup):
         unit="LENGTH",
         update=update_operation,
     )
+
+    use_swept_simulation: BoolProperty(
+        name="Swept Volume Simulation",
+        description="Simulate each move as the exact volume swept by the cutter, "
+        "instead of stamping the cutter at Simulation Detail steps. "
+        "Allows a coarser detail at the same accuracy. Not used with custom cutters",
+        default=False,
+        update=update_operation,
+    )
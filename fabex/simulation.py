@@ -25,6 +25,12 @@ from .utilities.logging_utils import log
 from .utilities.operation_utils import (
     get_operation_sources,
     get_cutter_array,
+    get_cutter_profile,
+)
+from .utilities.internal_utils import (
+    _simulate_path_internal,
+    _simulate_swept_path_internal,
+    _smooth_loads_internal,
 )
 from .utilities.simple_utils import get_simulation_path
 
@@ -231,155 +237,65 @@ async def generate_simulation_image(operations, limits):
 
             shapek.data[0].co = (0.0, 0, 0)
 
-        totalvolume = 0.0
         cutterArray = get_cutter_array(o, simulation_detail)
         cutterArray = -cutterArray
-        lasts = verts[1].co
-        perc = -1
         vtotal = len(verts)
-        dropped = 0
-        xs = 0
-        ys = 0
-
-        for i, vert in enumerate(verts):
-            if perc != int(100 * i / vtotal):
-                perc = int(100 * i / vtotal)
-                total_perc = (perc + op_count * 100) / num_operations
-                await progress_async(f"Simulation", int(total_perc))
 
-            if i > 0:
-                volume = 0
-                volume_partial = 0
-                s = vert.co
-                v = s - lasts
-                l = v.length
-
-                # only simulate inside material, and exclude lift-ups
-                if (lasts.z < maxz or s.z < maxz) and not (v.x == 0 and v.y == 0 and v.z > 0):
-                    # if the cutter goes straight down, we don't have to interpolate.
-                    if v.x == 0 and v.y == 0 and v.z < 0:
-                        pass
-
-                    elif v.length > simulation_detail:
-                        v.length = simulation_detail
-                        lastxs = xs
-                        lastys = ys
-
-                        while v.length < l:
-                            xs = int(
-                                (lasts.x + v.x - minx) / simulation_detail
-                                + borderwidth
-                                + simulation_detail / 2
-                            )
-                            ys = int(
-                                (lasts.y + v.y - miny) / simulation_detail
-                                + borderwidth
-                                + simulation_detail / 2
-                            )
-                            z = lasts.z + v.z
-
-                            if lastxs != xs or lastys != ys:
-                                volume_partial = sim_cutter_spot(
-                                    xs,
-                                    ys,
-                                    z,
-                                    cutterArray,
-                                    si,
-                                    o.do_simulation_feedrate,
-                                )
-
-                                if o.do_simulation_feedrate:
-                                    totalvolume += volume
-                                    volume += volume_partial
-
-                                lastxs = xs
-                                lastys = ys
-
-                            else:
-                                dropped += 1
-
-                            v.length += simulation_detail
-
-                    xs = int((s.x - minx) / simulation_detail + borderwidth + simulation_detail / 2)
-                    ys = int((s.y - miny) / simulation_detail + borderwidth + simulation_detail / 2)
-                    volume_partial = sim_cutter_spot(
-                        xs,
-                        ys,
-                        s.z,
-                        cutterArray,
+        co = np.empty(vtotal * 3, dtype=np.float32)
+        verts.foreach_get("co", co)
+        co = co.reshape(-1, 3).astype(np.double)
+        loads = np.zeros(vtotal)
+        lengths = np.zeros(vtotal)
+        position = np.zeros(2, dtype=np.int64)
+
+        # swept volume needs a radially symmetric cutter, custom cutters are stamped
+        profile = get_cutter_profile(o)
+        swept = o.optimisation.use_swept_simulation and profile is not None
+
+        # the whole path is simulated in a compiled kernel, in batches to report progress
+        if vtotal > 1:
+            batch = max(1, vtotal // 100)
+            for start in range(0, vtotal, batch):
+                if swept:
+                    _simulate_swept_path_internal(
+                        co,
+                        start,
+                        min(start + batch, vtotal),
                         si,
+                        profile,
+                        minx,
+                        miny,
+                        maxz,
+                        simulation_detail,
+                        borderwidth,
                         o.do_simulation_feedrate,
+                        loads,
+                        lengths,
                     )
+                else:
+                    _simulate_path_internal(
+                        co,
+                        start,
+                        min(start + batch, vtotal),
+                        si,
+                        cutterArray,
+                        minx,
+                        miny,
+                        maxz,
+                        simulation_detail,
+                        borderwidth,
+                        o.do_simulation_feedrate,
+                        position,
+                        loads,
+                        lengths,
+                    )
+                perc = int(100 * start / vtotal)
+                total_perc = (perc + op_count * 100) / num_operations
+                await progress_async(f"Simulation", int(total_perc))
 
-                # compute volumes and write data into shapekey.
-                if o.do_simulation_feedrate:
-                    volume += volume_partial
-                    totalvolume += volume
-                    load = volume / l if l > 0 else 0
-
-                    # this will show the shapekey as debugging graph and will use same data to estimate parts
-                    # with heavy load
-                    shapek.data[i].co.x = shapek.data[i - 1].co.x + l * 0.04
-                    shapek.data[i].co.y = (load) * 0.000002 if l != 0 else shapek.data[i - 1].co.y
-                    shapek.data[i].co.z = 0
-                lasts = s
-
-        # smoothing ,but only backward!
+        # compute volumes and write data into shapekey.
         if o.do_simulation_feedrate:
-            xcoef = shapek.data[len(shapek.data) - 1].co.x / len(shapek.data)
-
-            for a in range(0, 10):
-                nvals = []
-                val1 = 0
-                val2 = 0
-                w1 = 0
-                w2 = 0
-
-                for i, d in enumerate(shapek.data):
-                    val = d.co.y
-
-                    if i > 1:
-                        d1 = shapek.data[i - 1].co
-                        val1 = d1.y
-
-                        if d1.x - d.co.x != 0:
-                            w1 = 1 / (abs(d1.x - d.co.x) / xcoef)
-
-                    if i < len(shapek.data) - 1:
-                        d2 = shapek.data[i + 1].co
-                        val2 = d2.y
-
-                        if d2.x - d.co.x != 0:
-                            w2 = 1 / (abs(d2.x - d.co.x) / xcoef)
-
-                    val = (val + val1 * w1 + val2 * w2) / (1.0 + w1 + w2)
-                    nvals.append(val)
-
-                for i, d in enumerate(shapek.data):
-                    d.co.y = nvals[i]
-
-            # apply mapping - convert the values to actual feedrates.
-            total_load = 0
-            max_load = 0
-
-            for i, d in enumerate(shapek.data):
-                total_load += d.co.y
-                max_load = max(max_load, d.co.y)
-
-            normal_load = total_load / len(shapek.data)
-            thres = 0.5
-            scale_graph = 0.05  # warning this has to be same as in export in utils!!!!
-            totverts = len(shapek.data)
-
-            for i, d in enumerate(shapek.data):
-                d.co.z = (
-                    scale_graph * max(0.3, normal_load / d.co.y)
-                    if d.co.y > normal_load
-                    else scale_graph * 1
-                )
-
-                if i < totverts - 1:
-                    m.attributes[".edge_creases"].data[i].value = d.co.y / (normal_load * 4)
+            set_feedrate_shape_key(m, shapek, loads, lengths)
 
     si = si[borderwidth:-borderwidth, borderwidth:-borderwidth]
     si += -minz
@@ -389,106 +305,47 @@ async def generate_simulation_image(operations, limits):
     return si
 
 
-def sim_cutter_spot(xs, ys, z, cutterArray, si, getvolume=False):
-    """Simulates a cutter cutting into stock and optionally returns the volume
-    removed.
+def set_feedrate_shape_key(mesh, shapek, loads, lengths):
+    """Write the simulated cutter load into the 'feedrates' shape key.
 
-    This function takes the position of a cutter and modifies a stock image
-    by simulating the cutting process. It updates the stock image based on
-    the cutter's dimensions and position, ensuring that the stock does not
-    go below a certain level defined by the cutter's height. If requested,
-    it also calculates and returns the volume of material that has been
-    milled away.
+    The shape key shows the load as a debugging graph - x is the distance along
+    the path, y the smoothed load, and z the feedrate scale used by the export.
 
     Args:
-        xs (int): The x-coordinate of the cutter's position.
-        ys (int): The y-coordinate of the cutter's position.
-        z (float): The height of the cutter.
-        cutterArray (numpy.ndarray): A 2D array representing the cutter's shape.
-        si (numpy.ndarray): A 2D array representing the stock image to be modified.
-        getvolume (bool?): If True, the function returns the volume removed. Defaults to False.
-
-    Returns:
-        float: The volume of material removed if `getvolume` is True; otherwise,
-            returns 0.
+        mesh (bpy.types.Mesh): The path mesh.
+        shapek (bpy.types.ShapeKey): The 'feedrates' shape key.
+        loads (numpy.ndarray): Removed volume per path length for each vertex.
+        lengths (numpy.ndarray): Length of the segment ending in each vertex.
     """
 
-    m = int(cutterArray.shape[0] / 2)
-    size = cutterArray.shape[0]
-
-    # whole cutter in image there
-    if m < xs < si.shape[0] - m and m < ys < si.shape[1] - m:
-        if getvolume:
-            volarray = si[
-                xs - m : xs - m + size,
-                ys - m : ys - m + size,
-            ].copy()
-
-        si[
-            xs - m : xs - m + size,
-            ys - m : ys - m + size,
-        ] = np.minimum(
-            si[
-                xs - m : xs - m + size,
-                ys - m : ys - m + size,
-            ],
-            cutterArray + z,
+    count = len(shapek.data)
+    x = np.zeros(count, dtype=np.float32)
+    x[1:] = np.cumsum(lengths[1:count] * 0.04)
+
+    # zero length segments keep the load of the previous vertex
+    y = (loads[:count] * 0.000002).astype(np.float32)
+    y[0] = 0
+    keep = np.where(lengths[:count] != 0, np.arange(count), 0)
+    y = y[np.maximum.accumulate(keep)]
+
+    _smooth_loads_internal(x, y, 10)
+
+    # apply mapping - convert the values to actual feedrates.
+    normal_load = np.sum(y, dtype=np.double) / count
+    scale_graph = 0.05  # warning this has to be same as in export in utils!!!!
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(
+            y > normal_load,
+            scale_graph * np.maximum(0.3, normal_load / y),
+            scale_graph * 1,
         )
+        crease = y / (normal_load * 4)
 
-        if getvolume:
-            volarray = (
-                si[
-                    xs - m : xs - m + size,
-                    ys - m : ys - m + size,
-                ]
-                - volarray
-            )
-            vsum = abs(volarray.sum())
-
-            return vsum
-
-    elif -m < xs < si.shape[0] + m and -m < ys < si.shape[1] + m:
-        # part of cutter in image, for extra large cutters
-        startx = max(0, xs - m)
-        starty = max(0, ys - m)
-        endx = min(si.shape[0], xs - m + size)
-        endy = min(si.shape[0], ys - m + size)
-        castartx = max(0, m - xs)
-        castarty = max(0, m - ys)
-        caendx = min(size, si.shape[0] - xs + m)
-        caendy = min(size, si.shape[1] - ys + m)
-
-        if getvolume:
-            volarray = si[
-                startx:endx,
-                starty:endy,
-            ].copy()
-
-        si[
-            startx:endx,
-            starty:endy,
-        ] = np.minimum(
-            si[
-                startx:endx,
-                starty:endy,
-            ],
-            cutterArray[
-                castartx:caendx,
-                castarty:caendy,
-            ]
-            + z,
-        )
-
-        if getvolume:
-            volarray = (
-                si[
-                    startx:endx,
-                    starty:endy,
-                ]
-                - volarray
-            )
-            vsum = abs(volarray.sum())
-
-            return vsum
+    shapek.data.foreach_set("co", np.column_stack((x, y, z)).astype(np.float32).ravel())
 
-    return 0
+    creases = mesh.attributes[".edge_creases"].data
+    values = np.empty(len(creases), dtype=np.float32)
+    creases.foreach_get("value", values)
+    crease_count = min(len(creases), count - 1)
+    values[:crease_count] = crease[:crease_count]
+    creases.foreach_set("value", values)
@@ -1,41 +1,70 @@
+import numpy as np
+
 from ..bridges import use_bridges
 
+from ..utilities.async_utils import progress_async
 from ..utilities.chunk_utils import (
-    chunks_refine,
-    sample_chunks,
-    sort_chunks,
+    chunks_to_mesh,
+    limit_chunks,
 )
 from ..utilities.image_utils import prepare_area
 from ..utilities.logging_utils import log
-from ..utilities.operation_utils import get_layers
-from ..utilities.stroke_utils import crazy_stroke_image_binary
+from ..utilities.operation_utils import (
+    check_min_z,
+    get_layers,
+)
+from ..utilities.stroke_utils import (
+    adaptive_strokes,
+    stroke_chunks,
+)
 
 
 async def crazy(o):
-    log.info("~ Strategy: Crazy ~")
+    """Adaptive clearing with a constant cutter engagement.
 
-    await prepare_area(o)
+    Every layer is cleared on its own, from the z-buffer and offset images.
+    Layers with the same material and cutter area reuse the strokes of the
+    layer above. The strokes are kept in the order they were found, as each
+    of them relies on the material removed by the previous ones.
 
-    millarea = o.zbuffer_image < o.min_z + 0.000001
-    avoidarea = o.offset_image > o.min_z + 0.000001
+    Args:
+        o (Operation): The operation.
+    """
 
-    pathSamples = crazy_stroke_image_binary(o, millarea, avoidarea)
-    pathSamples = await sort_chunks(pathSamples, o)
-    pathSamples = chunks_refine(pathSamples, o)
+    log.info("~ Strategy: Adaptive ~")
+
+    await prepare_area(o)
 
     chunks = []
-    layers = get_layers(o, o.max_z, o.min.z)
+    strokes = None
+    last_areas = None
+    layers = get_layers(o, o.max_z, check_min_z(o))
+
+    for layer_index, layer in enumerate(layers):
+        z = layer[1]
+        millarea = o.zbuffer_image < z + 0.000001
+        avoidarea = o.offset_image > z + 0.000001
+
+        if (
+            last_areas is None
+            or not np.array_equal(millarea, last_areas[0])
+            or not np.array_equal(avoidarea, last_areas[1])
+        ):
+            strokes = adaptive_strokes(o, millarea, avoidarea)
+            last_areas = (millarea, avoidarea)
+
+        layer_chunks = limit_chunks(stroke_chunks(o, strokes, z), o)
 
-    log.info(f"Sampling Object: {o.name}")
-    chunks.extend(await sample_chunks(o, pathSamples, layers))
-    log.info("Sampling Finished Successfully")
+        if o.movement.ramp:
+            for chunk in layer_chunks:
+                chunk.zstart = layer[0]
+                chunk.zend = layer[1]
+                chunk.ramp_zig_zag(chunk.zstart, chunk.get_point(0)[2], o)
 
-    if o.movement.ramp:
-        for ch in chunks:
-            ch.ramp_zig_zag(ch.zstart, None, o)
+        chunks.extend(layer_chunks)
+        await progress_async("Adaptive Layers", int((layer_index + 1) * 100 / len(layers)))
 
     if o.use_bridges:
-        log.info(chunks)
         for bridge_chunk in chunks:
             use_bridges(bridge_chunk, o)
 
@@ -1,15 +1,11 @@
 from math import (
     pi,
-    sqrt,
     tan,
 )
-import sys
 
-from shapely.geometry import (
-    LineString,
-    MultiPolygon,
-    Point,
-)
+import numpy as np
+import shapely
+from shapely.geometry import MultiPolygon
 from shapely.ops import linemerge
 
 import bpy
@@ -35,7 +31,7 @@ from ..utilities.simple_utils import (
     remove_multiple,
 )
 from ..utilities.strategy_utils import add_pocket
-from ..utilities.voronoi_utils import compute_voronoi_diagram
+from ..utilities.voronoi_utils import compute_voronoi_edges
 
 
 async def medial_axis(o):
@@ -165,87 +161,38 @@ async def medial_axis(o):
         log.info(f"Tesselation... ({vertex_count} Points)")
 
         x_buffer, y_buffer = 5, 5
-        z_position = 0
-        verts_as_points = [Point(vertex[0], vertex[1], vertex[2]) for vertex in vertices]
-        points, edges = compute_voronoi_diagram(
-            verts_as_points,
-            x_buffer,
-            y_buffer,
-            polygonsOutput=False,
-            formatOutput=True,
-        )
-
-        vertr = []
-        filtered_points = []
+        points, edges = compute_voronoi_edges(np.array(vertices)[:, :2], x_buffer, y_buffer)
 
         log.info("Filtering Points...")
 
-        newIdx = 0
-        point_count = len(points)
-
-        for point_index, point in enumerate(points):
-            point_index += 1
-
-            if point_index % 500 == 0:
-                sys.stdout.write("\r")
-                # the exact output you're looking for:
-                prog_message = f"Points: {point_index}/{point_count} - {round(100 * point_index / point_count)}%"
-                sys.stdout.write(prog_message)
-                sys.stdout.flush()
-
-            if not polygon.contains(Point(point)):
-                vertr.append((True, -1))
-            else:
-                vertr.append((False, newIdx))
-
-                if o.cutter_type == "VCARVE":
-                    # start the z depth calc from the "start depth" of the operation.
-                    z = o.max_z - multipolygon.boundary.distance(Point(point)) * slope
-                    z = max_depth if z < max_depth else z
-
-                elif o.cutter_type == "BALL" or o.cutter_type == "BALLNOSE":
-                    d = multipolygon_boundary.distance(Point(point))
-                    r = new_cutter_diameter / 2.0
-
-                    if d >= r:
-                        z = -r
-                    else:
-                        z = -r + sqrt(r * r - d * d)
-                else:
-                    z = 0  #
+        # Voronoi vertices outside of the polygon are not on its medial axis
+        inside = shapely.contains_xy(polygon, points[:, 0], points[:, 1])
+        filtered_points = points[inside]
+        distances = shapely.distance(multipolygon_boundary, shapely.points(filtered_points))
+
+        if o.cutter_type == "VCARVE":
+            # start the z depth calc from the "start depth" of the operation.
+            z = np.maximum(o.max_z - distances * slope, max_depth)
+        elif o.cutter_type == "BALL" or o.cutter_type == "BALLNOSE":
+            r = new_cutter_diameter / 2.0
+            # -r where the distance is bigger than the radius
+            z = -r + np.sqrt(np.maximum(r * r - distances * distances, 0))
+        else:
+            z = np.zeros(len(filtered_points))
 
-                filtered_points.append((point[0], point[1], z))
-                newIdx += 1
+        filtered_points = np.column_stack((filtered_points, z))
 
         log.info("-")
         log.info("Filtering Edges...")
         log.info("-")
 
-        filtered_edges = []
-        line_edges = []
-
-        for edge in edges:
-            # Exclude Edges with already excluded Points
-            do = False if vertr[edge[0]][0] or vertr[edge[1]][0] else True
-
-            if do:
-                filtered_edges.append(
-                    (
-                        vertr[edge[0]][1],
-                        vertr[edge[1]][1],
-                    )
-                )
-                line_edges.append(
-                    LineString(
-                        (
-                            filtered_points[vertr[edge[0]][1]],
-                            filtered_points[vertr[edge[1]][1]],
-                        )
-                    )
-                )
+        # Exclude Edges with already excluded Points
+        new_indices = np.cumsum(inside) - 1
+        filtered_edges = new_indices[edges[inside[edges].all(axis=1)]]
+        line_edges = shapely.linestrings(filtered_points[filtered_edges])
 
         polygon_buffer = polygon.buffer(-new_cutter_diameter / 2, resolution=64)
-        lines = linemerge(line_edges)
+        lines = linemerge(shapely.multilinestrings(line_edges))
 
         if polygon_buffer.geom_type in ["Polygon", "MultiPolygon"]:
             lines = lines.difference(polygon_buffer)
@@ -107,10 +107,12 @@ class BASRELIEF_Panel(Panel):
             col.prop(br, "smooth_iterations", text="Smooth")
         col.prop(br, "vcycle_iterations", text="V-Cycle")
         col.prop(br, "linbcg_iterations", text="LINBCG")
+        col.prop(br, "use_direct_solve")
 
         if br.advanced:
             layout.prop(br, "min_gridsize")
         layout.prop(br, "decimate_ratio")
+        layout.prop(br, "merge_flat_areas")
         layout.prop(br, "use_planar")
         layout.prop(br, "gradient_scaling_mask_use")
         if br.advanced:
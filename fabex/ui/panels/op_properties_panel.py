@@ -184,6 +184,15 @@ class CAM_OPERATION_PROPERTIES_Panel(CAMParentPanel, Panel):
             sub.label(text="Toolpath")
             sub.prop(self.op, "distance_between_paths", text="Stepover")
 
+        # Adaptive Options
+        if self.op.strategy in ["CRAZY"]:
+            col = box.column(align=True)
+            col.prop(self.op, "skin")
+            box = col.box()
+            sub = box.column(align=True)
+            sub.label(text="Toolpath")
+            sub.prop(self.op, "distance_between_paths", text="Stepover")
+
         # Default Options
         if self.op.strategy not in [
             "CUTOUT",
@@ -193,6 +202,7 @@ class CAM_OPERATION_PROPERTIES_Panel(CAMParentPanel, Panel):
             "MEDIAL_AXIS",
             "DRILL",
             "POCKET",
+            "CRAZY",
         ]:
             # box = layout.box()
             col = box.column(align=True)
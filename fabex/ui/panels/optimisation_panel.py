@@ -41,6 +41,7 @@ class CAM_OPTIMISATION_Panel(CAMParentPanel, Panel):
                 "DRILL",
                 "PENCIL",
                 "CURVE",
+                "CRAZY",
             ]
 
             # Exact Mode
@@ -51,6 +52,7 @@ class CAM_OPTIMISATION_Panel(CAMParentPanel, Panel):
                 col = layout.column(align=True)
                 col.prop(self.op.optimisation, "pixsize", text="Detail Size")
                 col.prop(self.op.optimisation, "imgres_limit", text="Max Res (MP)")
+                col.prop(self.op.optimisation, "use_tiles", text="Tiled Processing")
 
                 sx = self.op.max.x - self.op.min.x
                 sy = self.op.max.y - self.op.min.y
@@ -66,6 +68,7 @@ class CAM_OPTIMISATION_Panel(CAMParentPanel, Panel):
                     # Simulation Detail
                     col = layout.column(align=True)
                     col.prop(self.op.optimisation, "simulation_detail", text="Sim Detail")
+                    col.prop(self.op.optimisation, "use_swept_simulation", text="Swept Simulation")
                     col.prop(self.op.optimisation, "circle_detail", text="Offset Detail")
 
                 layout.use_property_split = False
@@ -86,6 +89,9 @@ class CAM_OPTIMISATION_Panel(CAMParentPanel, Panel):
                         # col = layout.column(align=True)
                         col.prop(self.op.optimisation, "use_opencamlib")
 
+                    if not self.op.optimisation.use_opencamlib:
+                        col.prop(self.op.optimisation, "sampling_processes", text="Processes")
+
                     # Simplify Gcode
                     if self.op.strategy not in ["DRILL"]:
                         col.prop(self.op, "remove_redundant_points")
@@ -0,0 +1,565 @@
+"""Fabex 'bvh_utils.py' © 2025
+
+N-Axis sampling with a BVH tree of the operation objects.
+
+Radially symmetric cutters are swept along their axis with their exact
+profile against the triangles the tree finds near each sampling ray. Other
+cutters, and sweeps across the cutter axis, are dropped as a bundle of
+parallel rays over the cutter surface. Nothing in the scene is moved,
+rotated or simulated.
+"""
+
+from math import (
+    hypot,
+    sqrt,
+)
+
+import numpy as np
+
+from mathutils import (
+    Euler,
+    Vector,
+)
+from mathutils.bvhtree import BVHTree
+
+from ..constants import BULLET_SCALE
+from ..exception import CamException
+from .internal_utils import _cutter_profile_height
+from .logging_utils import log
+from .numba_utils import jit
+from .ocl_utils import get_object_triangles
+from .operation_utils import (
+    get_cutter_array,
+    get_cutter_profile,
+)
+
+# the cutter surface is sampled with at least this many rays across its diameter
+CUTTER_RAY_DETAIL = 20
+
+# rays around the first touching ray are this many times denser
+CUTTER_RAY_REFINE = 4
+
+# triangles whose normal is this close to perpendicular to the sampling ray are parallel to it
+EDGE_ON_TOLERANCE = 1e-6
+
+# golden section steps to find the point of an edge closest to the cutter
+EDGE_SEARCH_STEPS = 40
+
+# the cutter touches an edge when it is this close, 0.001 units of the Bullet world it replaces
+CONTACT_TOLERANCE = 1e-7
+
+# the cutter gives up advancing towards an edge it only grazes after this many steps
+CONTACT_STEPS = 64
+
+# sampling rays pointing at the tip within this angle of the cutter axis sweep the cutter along it
+AXIAL_TOLERANCE = 1e-6
+
+
+def get_operation_triangles(operation):
+    """Get the triangles of the objects of an operation in world coordinates.
+
+    Args:
+        operation (Operation): The operation.
+
+    Returns:
+        numpy.ndarray: (N, 3, 3) array of triangle vertex positions.
+
+    Raises:
+        CamException: If the operation has no mesh, curve or equivalent object.
+    """
+    triangles = [
+        get_object_triangles(collision_object, operation.use_modifiers)
+        for collision_object in operation.objects
+        if collision_object.type in ["MESH", "CURVE", "FONT", "SURFACE"]
+    ]
+
+    if len(triangles) == 0:
+        raise CamException(
+            "This Operation Requires a Mesh or Curve Object or Equivalent (e.g. Text, Volume)."
+        )
+
+    triangles = np.concatenate(triangles)
+    log.info(f"BVH Tree Triangles: {len(triangles)}")
+
+    return triangles
+
+
+def get_triangles_bvh(triangles):
+    """Get a BVH tree of triangles from get_operation_triangles.
+
+    Args:
+        triangles (numpy.ndarray): (N, 3, 3) array of triangle vertex positions.
+
+    Returns:
+        mathutils.bvhtree.BVHTree: The BVH tree.
+    """
+    return BVHTree.FromPolygons(
+        triangles.reshape(-1, 3).tolist(),
+        np.arange(len(triangles) * 3).reshape(-1, 3).tolist(),
+        all_triangles=True,
+    )
+
+
+def _profile_heights(profile, rho):
+    """Heights of a cutter profile from get_cutter_profile at distances from its axis."""
+    sphere = profile[3] - np.sqrt(np.maximum(profile[3] * profile[3] - rho * rho, 0.0))
+    cone = (rho - profile[4]) * profile[6] + profile[5]
+    return np.where(rho <= profile[1], 0.0, np.where(rho <= profile[2], sphere, cone))
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _profile_distance(profile, rho, axial):
+    # distance from a point to the end of a cutter, and how far ahead of the tip the closest
+    # point of the cutter is, with the point given by its distance from the axis and how far
+    # ahead of the tip it is; the closest point is on the flat end, sphere or cone, or where
+    # two of those meet
+    radius = profile[0]
+    flat = profile[1]
+    ball = profile[2]
+    sphere = profile[3]
+    cone_start = max(flat, ball, 0.0)
+    start_axial = -_cutter_profile_height(profile, cone_start)
+    rim_axial = -_cutter_profile_height(profile, radius)
+
+    flat_end = max(flat, 0.0)
+    closest_axial = -_cutter_profile_height(profile, flat_end)
+    distance = hypot(rho - flat_end, axial - closest_axial)
+    candidates = np.empty((4, 2))
+    candidates[0, 0] = cone_start
+    candidates[0, 1] = start_axial
+    candidates[1, 0] = radius
+    candidates[1, 1] = rim_axial
+    count = 2
+
+    if flat > 0:
+        candidates[count, 0] = min(rho, flat)
+        candidates[count, 1] = 0.0
+        count += 1
+
+    if ball > 0:
+        scale = sphere / max(hypot(rho, axial + sphere), 1e-30)
+        arc_rho = min(max(rho * scale, flat_end), cone_start)
+        candidates[count, 0] = arc_rho
+        candidates[count, 1] = sqrt(max(sphere * sphere - arc_rho * arc_rho, 0.0)) - sphere
+        count += 1
+
+    if radius > cone_start:
+        cone_rho = radius - cone_start
+        cone_axial = rim_axial - start_axial
+        ratio = (rho - cone_start) * cone_rho + (axial - start_axial) * cone_axial
+        ratio = min(max(ratio / (cone_rho * cone_rho + cone_axial * cone_axial), 0.0), 1.0)
+        candidates[count, 0] = cone_start + ratio * cone_rho
+        candidates[count, 1] = start_axial + ratio * cone_axial
+        count += 1
+
+    for k in range(count):
+        candidate = hypot(rho - candidates[k, 0], axial - candidates[k, 1])
+        if candidate < distance:
+            distance = candidate
+            closest_axial = candidates[k, 1]
+
+    return distance, closest_axial
+
+
+class BVHCutter:
+    """The cutter, dropped against a BVH tree.
+
+    Radially symmetric cutters sweeping along their axis, like in 4 axis
+    operations, touch the triangles with their exact profile, see _contact.
+
+    Other cutters, and sweeps across the cutter axis, are a bundle of parallel
+    rays. The rays start on the cutter surface, at the points of the cutter
+    array like in the offset image of 3 axis operations, plus one at the tip.
+    The shortest hit distance of all the rays is where the cutter first
+    touches the objects. Radially symmetric cutters then cast a finer grid of
+    rays around the ray that touched first.
+    """
+
+    def __init__(self, operation):
+        self.skin = operation.skin
+        self.radius = operation.cutter_diameter / 2
+        self.triangles = get_operation_triangles(operation)
+        self.bvh = get_triangles_bvh(self.triangles)
+        self.spacing = max(
+            operation.optimisation.pixsize, operation.cutter_diameter / CUTTER_RAY_DETAIL
+        )
+        cutter_array = get_cutter_array(operation, self.spacing)
+        m = len(cutter_array) / 2
+        a, b = np.nonzero(cutter_array > -10)
+
+        # tip is at the origin, the cutter body is above it along Z
+        self.rays = np.empty((len(a) + 1, 3))
+        self.rays[0] = 0
+        self.rays[1:, 0] = (a + 0.5 - m) * self.spacing
+        self.rays[1:, 1] = (b + 0.5 - m) * self.spacing
+        self.rays[1:, 2] = -cutter_array[a, b]
+
+        self.profile = get_cutter_profile(operation)
+        steps = np.arange(-CUTTER_RAY_REFINE, CUTTER_RAY_REFINE + 1) / CUTTER_RAY_REFINE
+        x, y = np.meshgrid(steps, steps, indexing="ij")
+        self.refine_offsets = np.column_stack((x.ravel(), y.ravel())) * self.spacing
+
+        normals = np.cross(
+            self.triangles[:, 1] - self.triangles[:, 0],
+            self.triangles[:, 2] - self.triangles[:, 0],
+        )
+        lengths = np.linalg.norm(normals, axis=1)
+        self.normals = normals / np.maximum(lengths, 1e-30)[:, None]
+
+        self.rotation = None
+        self.set_rotation((0, 0, 0))
+
+    def set_rotation(self, rotation):
+        """Rotate the cutter, if the rotation changed.
+
+        Args:
+            rotation (tuple): Euler rotation of the cutter.
+        """
+        rotation = tuple(rotation)
+        if rotation != self.rotation:
+            self.rotation = rotation
+            self.matrix = np.array(Euler(rotation).to_matrix())
+            self.rotated_rays = self.rays @ self.matrix.T
+            self.offset = (self.matrix[:, 2] * self.radius * BULLET_SCALE).astype(np.float32)
+
+    def drop(self, startpoint, endpoint):
+        """Drop the cutter from the start point towards the end point.
+
+        Args:
+            startpoint (Vector): The starting point of the sampling ray.
+            endpoint (Vector): The ending point of the sampling ray.
+
+        Returns:
+            Vector or None: The tip position at the first contact, offset by the
+                skin, or None if the cutter reaches the end point without touching
+                the objects.
+        """
+        # like the Bullet sweep this replaces, the point one radius up the cutter axis is swept
+        # in single precision Bullet units, so samples match it to the last digit
+        offset = self.offset
+        start = np.array(startpoint, dtype=np.float32) * np.float32(BULLET_SCALE) + offset
+        sweep = np.array(endpoint, dtype=np.float32) * np.float32(BULLET_SCALE) + offset - start
+        origin = (start.astype(float) - offset) / BULLET_SCALE
+        length = np.linalg.norm(sweep.astype(float)) / BULLET_SCALE
+        direction = sweep.astype(float) / (length * BULLET_SCALE)
+
+        axis = self.matrix[:, 2]
+        tilt = np.linalg.norm(np.cross(axis, direction))
+        if self.profile is not None and axis @ direction < 0 and tilt < AXIAL_TOLERANCE:
+            contact = self._contact(origin, direction, length)
+        else:
+            contact = self._ray_contact(origin, Vector(direction), length)
+
+        if contact is None:
+            return None
+
+        fraction = np.float32(max(contact - self.skin, 0) / length)
+        scale = np.float32(1) / np.float32(BULLET_SCALE)
+
+        return Vector((start + sweep * fraction) * scale - offset * scale)
+
+    def _ray_contact(self, start, direction, length):
+        contact, index = self._cast(self.rotated_rays + start, direction, length)
+
+        if contact is not None and self.profile is not None:
+            points = self.rays[index, :2] + self.refine_offsets
+            rho = np.hypot(points[:, 0], points[:, 1])
+            inside = rho <= self.profile[0]
+            rays = np.column_stack((points[inside], _profile_heights(self.profile, rho[inside])))
+            refined, _ = self._cast(rays @ self.matrix.T + start, direction, contact)
+            if refined is not None:
+                contact = refined
+
+        return contact
+
+    def _cast(self, origins, direction, length):
+        # later rays only matter if they hit before the closest hit so far
+        ray_cast = self.bvh.ray_cast
+        contact = None
+        index = -1
+
+        for i, origin in enumerate(origins.tolist()):
+            distance = ray_cast(origin, direction, length)[3]
+
+            if distance is not None:
+                contact = distance
+                index = i
+                length = distance
+
+        return contact, index
+
+    def _nearby(self, start, direction, length):
+        # triangles near the end of the cutter anywhere along the sweep, from spheres around it
+        radius, height = self.profile[0], _profile_heights(self.profile, self.profile[0])
+        bound = np.hypot(radius, height / 2)
+        travels = np.linspace(0, length, int(length / bound) + 2)
+        centres = start + (travels[:, None] - height / 2) * direction
+        find = self.bvh.find_nearest_range
+        distance = bound * 1.5 + CONTACT_TOLERANCE
+
+        return sorted({hit[2] for centre in centres.tolist() for hit in find(centre, distance)})
+
+    def _contact(self, start, direction, length):
+        """Distance at which the end of the cutter, sweeping along its axis, touches the objects.
+
+        How far points of a triangle are ahead of the cutter surface, within
+        the cutter radius, is a convex function, lowest either where the
+        cutter surface is parallel to the triangle or on an edge. A triangle
+        with points both behind and ahead of the surface overlaps the cutter
+        at the start point, which stops it there. Like the Bullet convex sweep
+        this replaces, triangles parallel to the sweep that the cutter already
+        overlaps are skipped, and the cutter advances towards the closest edges
+        by its distance to them until it is within the contact tolerance.
+        Distances are convex along an edge, so golden section searches find
+        the closest points.
+
+        Args:
+            start (numpy.ndarray): The tip at the start point.
+            direction (numpy.ndarray): The unit sampling direction, along the cutter axis.
+            length (float): Only contacts up to this distance are returned.
+
+        Returns:
+            float or None: The travel to the first contact, or None.
+        """
+        indices = self._nearby(start, direction, length)
+        if len(indices) == 0:
+            return None
+
+        triangles = self.triangles[indices] - start
+        contact = _sweep_contact(self.profile, triangles, self.normals[indices], direction, length)
+        if contact >= length:
+            return None
+
+        return contact
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _profile_support(profile, alpha, beta):
+    # distance from the axis of the point of a cutter end furthest in a unit direction, given
+    # by its components towards the tip and away from the axis
+    flat_end = max(profile[1], 0.0)
+    cone_start = max(profile[1], profile[2], 0.0)
+    candidates = np.array([0.0, flat_end, cone_start, profile[0], 0.0])
+    count = 4
+    if profile[2] > 0:
+        candidates[4] = min(max(profile[3] * beta, flat_end), cone_start)
+        count = 5
+
+    support = 0.0
+    best = -np.inf
+    for k in range(count):
+        reach = beta * candidates[k] - alpha * _cutter_profile_height(profile, candidates[k])
+        if reach > best:
+            best = reach
+            support = candidates[k]
+
+    return support
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _inside_triangle(triangle, point):
+    # whether a point on the plane of a triangle is inside it
+    v0 = triangle[1] - triangle[0]
+    v1 = triangle[2] - triangle[0]
+    v2 = point - triangle[0]
+    d00 = v0[0] * v0[0] + v0[1] * v0[1] + v0[2] * v0[2]
+    d01 = v0[0] * v1[0] + v0[1] * v1[1] + v0[2] * v1[2]
+    d11 = v1[0] * v1[0] + v1[1] * v1[1] + v1[2] * v1[2]
+    d20 = v2[0] * v0[0] + v2[1] * v0[1] + v2[2] * v0[2]
+    d21 = v2[0] * v1[0] + v2[1] * v1[1] + v2[2] * v1[2]
+    denominator = d00 * d11 - d01 * d01
+    if denominator <= 1e-30:
+        return False
+    v = (d11 * d20 - d01 * d21) / denominator
+    w = (d00 * d21 - d01 * d20) / denominator
+
+    return v >= -1e-9 and w >= -1e-9 and v + w <= 1 + 1e-9
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _sweep_contact(profile, triangles, normals, direction, length):
+    # travel of the end of a cutter along its axis, from its tip at the origin, to its first
+    # contact with triangles, or the length if there is none
+    count = triangles.shape[0]
+    radius = profile[0]
+    rim_height = _cutter_profile_height(profile, radius)
+    edge_on = np.empty(count, dtype=np.bool_)
+    triangle_min = np.full(count, np.inf)
+    triangle_max = np.full(count, -np.inf)
+    facet_min = np.full(count, np.inf)
+    a_along = np.empty(3 * count)
+    e_along = np.empty(3 * count)
+    a_across = np.empty((3 * count, 3))
+    e_across = np.empty((3 * count, 3))
+    nearest_rho = np.empty(3 * count)
+    edge_min = np.full(3 * count, np.inf)
+
+    for t in range(count):
+        triangle = triangles[t]
+
+        # the facet, with its normal facing the cutter
+        normal = normals[t].copy()
+        normal_along = _dot(normal, direction)
+        edge_on[t] = abs(normal_along) < EDGE_ON_TOLERANCE
+        if not edge_on[t]:
+            if normal_along > 0:
+                normal = -normal
+            alpha = abs(normal_along)
+            lateral = -normal - alpha * direction
+            beta = sqrt(_dot(lateral, lateral))
+            lateral /= max(beta, 1e-30)
+            offset = _dot(triangle[0], normal)
+
+            support_rho = _profile_support(profile, alpha, beta)
+            support = (
+                support_rho * lateral - _cutter_profile_height(profile, support_rho) * direction
+            )
+            travel = (_dot(support, normal) - offset) / alpha
+            if _inside_triangle(triangle, support + travel * direction):
+                facet_min[t] = travel
+                triangle_min[t] = travel
+
+            # the point of the rim furthest ahead on the plane of the facet
+            rim = -radius * lateral
+            travel = (_dot(rim, normal) - offset) / alpha
+            if _inside_triangle(triangle, rim + travel * direction):
+                triangle_max[t] = travel + rim_height
+
+        for k in range(3):
+            i = 3 * t + k
+            a = triangle[k]
+            e = triangle[(k + 1) % 3] - a
+            a_along[i] = _dot(a, direction)
+            e_along[i] = _dot(e, direction)
+            a_across[i] = a - a_along[i] * direction
+            e_across[i] = e - e_along[i] * direction
+
+            # part of the edge within the cutter radius from the axis, edges along the axis
+            # are either all in or all out
+            q2 = _dot(e_across[i], e_across[i])
+            q1 = 2 * _dot(a_across[i], e_across[i])
+            q0 = _dot(a_across[i], a_across[i])
+            parallel = q2 < 1e-20
+            if parallel:
+                q2 = 1.0
+            nearest = min(max(-q1 / (2 * q2), 0.0), 1.0)
+            nearest_rho[i] = sqrt(max(q0 + nearest * (q1 + nearest * q2), 0.0))
+            root = sqrt(max(q1 * q1 - 4 * q2 * (q0 - radius * radius), 0.0))
+            low = 0.0 if parallel else max((-q1 - root) / (2 * q2), 0.0)
+            high = 1.0 if parallel else min((-q1 + root) / (2 * q2), 1.0)
+            if nearest_rho[i] > radius or low > high:
+                continue
+
+            # how far the part of the edge within the radius is ahead of the cutter surface
+            ahead = max(
+                _edge_value(profile, a_along, e_along, a_across, e_across, i, low, 0.0, True)[0],
+                _edge_value(profile, a_along, e_along, a_across, e_across, i, high, 0.0, True)[0],
+            )
+            triangle_max[t] = max(triangle_max[t], ahead)
+            u = _golden_section(
+                profile, a_along, e_along, a_across, e_across, i, 0.0, True, low, high
+            )
+            edge_min[i] = _edge_value(
+                profile, a_along, e_along, a_across, e_across, i, u, 0.0, True
+            )[0]
+            triangle_min[t] = min(triangle_min[t], edge_min[i])
+
+    # a triangle behind and ahead of the cutter surface overlaps the cutter, which stops it,
+    # unless it is parallel to the sweep, like in the Bullet sweep
+    contact = length
+    closest_edge = length
+    for t in range(count):
+        if triangle_min[t] < 0:
+            if not edge_on[t] and triangle_max[t] >= 0:
+                return 0.0
+            continue
+        contact = min(contact, facet_min[t])
+        for i in range(3 * t, 3 * t + 3):
+            closest_edge = min(closest_edge, edge_min[i])
+
+    # edges the cutter touches first or only grazes, with the tolerance of the Bullet sweep
+    margin = sqrt(2 * max(radius, profile[3]) * CONTACT_TOLERANCE)
+    margin += CONTACT_TOLERANCE * hypot(1.0, profile[6])
+    close = np.zeros(3 * count, dtype=np.bool_)
+    for i in range(3 * count):
+        if triangle_min[i // 3] < 0 or nearest_rho[i] > radius + CONTACT_TOLERANCE:
+            continue
+        if edge_min[i] == np.inf or edge_min[i] <= min(closest_edge, contact) + margin:
+            close[i] = True
+        else:
+            contact = min(contact, edge_min[i])
+
+    return _edge_advance(profile, a_along, e_along, a_across, e_across, close, contact)
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _edge_value(profile, a_along, e_along, a_across, e_across, i, u, travel, ahead):
+    # how far the point of an edge is ahead of the cutter surface, or its distance to the
+    # cutter after a travel and how far ahead of the tip the closest point of the cutter is
+    x = a_across[i, 0] + u * e_across[i, 0]
+    y = a_across[i, 1] + u * e_across[i, 1]
+    z = a_across[i, 2] + u * e_across[i, 2]
+    rho = sqrt(x * x + y * y + z * z)
+    axial = a_along[i] + u * e_along[i]
+    if ahead:
+        return axial + _cutter_profile_height(profile, min(rho, profile[0])), 0.0
+    return _profile_distance(profile, rho, axial - travel)
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _golden_section(profile, a_along, e_along, a_across, e_across, i, travel, ahead, low, high):
+    # narrows down the minimum of _edge_value, which is convex along an edge
+    ratio = (sqrt(5.0) - 1) / 2
+    u1 = high - ratio * (high - low)
+    u2 = low + ratio * (high - low)
+    f1 = _edge_value(profile, a_along, e_along, a_across, e_across, i, u1, travel, ahead)[0]
+    f2 = _edge_value(profile, a_along, e_along, a_across, e_across, i, u2, travel, ahead)[0]
+    for _ in range(EDGE_SEARCH_STEPS):
+        if f1 < f2:
+            high = u2
+            u2 = u1
+            f2 = f1
+            u1 = high - ratio * (high - low)
+            f1 = _edge_value(profile, a_along, e_along, a_across, e_across, i, u1, travel, ahead)[0]
+        else:
+            low = u1
+            u1 = u2
+            f1 = f2
+            u2 = low + ratio * (high - low)
+            f2 = _edge_value(profile, a_along, e_along, a_across, e_across, i, u2, travel, ahead)[0]
+
+    return (low + high) / 2
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _edge_advance(profile, a_along, e_along, a_across, e_across, close, limit):
+    # conservative advancement towards edges, like the Bullet convex cast: the cutter moves by
+    # its distance to an edge over the speed it closes in at, until it is within the contact
+    # tolerance, returns the first contact or the limit
+    for i in range(a_along.shape[0]):
+        if not close[i]:
+            continue
+        travel = 0.0
+        for step in range(CONTACT_STEPS):
+            u = _golden_section(
+                profile, a_along, e_along, a_across, e_across, i, travel, False, 0.0, 1.0
+            )
+            gap, closest_axial = _edge_value(
+                profile, a_along, e_along, a_across, e_across, i, u, travel, False
+            )
+            speed = (a_along[i] + u * e_along[i] - travel - closest_axial) / max(gap, 1e-30)
+            if gap <= CONTACT_TOLERANCE and (speed > 1e-12 or step > 0):
+                limit = travel
+                break
+            if speed <= 1e-12:
+                break
+            travel += gap / speed
+            if travel > limit:
+                break
+
+    return limit
@@ -0,0 +1,181 @@
+"""Fabex 'cache_utils.py' © 2025
+
+Content addressed cache of z-buffer and offset images, shared by all operations.
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+import bpy
+
+from .logging_utils import log
+from .simple_utils import get_simulation_path
+from ..constants import IMAGE_CACHE_SIZE
+
+
+def get_image_cache_folder():
+    """Get the folder of the image cache, next to the .blend file.
+
+    Returns:
+        str: Path to the image cache folder.
+    """
+    return os.path.join(get_simulation_path(), "image_cache")
+
+
+def hash_objects(objects, hasher=None):
+    """Hash the evaluated mesh data and transforms of objects.
+
+    Modifiers are applied, so any edit of the geometry changes the hash, while
+    objects that only have different names or selection states don't.
+
+    Args:
+        objects (list): Blender objects.
+        hasher (hashlib object, optional): Hasher to update, a new one is created if None.
+
+    Returns:
+        hashlib object: The updated hasher.
+    """
+    if hasher is None:
+        hasher = hashlib.blake2b(digest_size=20)
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    for ob in objects:
+        hasher.update(np.array(ob.matrix_world, dtype=np.float64).tobytes())
+        evaluated = ob.evaluated_get(depsgraph)
+        try:
+            mesh = evaluated.to_mesh()
+        except RuntimeError:
+            mesh = None
+
+        if mesh is None:
+            hasher.update(ob.type.encode())
+            continue
+
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        loops = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loops)
+        loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        evaluated.to_mesh_clear()
+
+        hasher.update(co.tobytes())
+        hasher.update(loops.tobytes())
+        hasher.update(loop_totals.tobytes())
+
+    return hasher
+
+
+def z_buffer_key(o, resolution_x, resolution_y):
+    """Get the cache key of the z-buffer of an operation.
+
+    Args:
+        o (object): The operation.
+        resolution_x (int): Z-buffer width in pixels.
+        resolution_y (int): Z-buffer height in pixels.
+
+    Returns:
+        str: The cache key.
+    """
+    hasher = hash_objects(o.objects)
+    settings = (
+        "z",
+        o.optimisation.pixsize,
+        o.borderwidth,
+        o.min.x,
+        o.min.y,
+        o.max.x,
+        o.max.y,
+        resolution_x,
+        resolution_y,
+    )
+    hasher.update(repr(settings).encode())
+    return hasher.hexdigest()
+
+
+def offset_image_key(o, samples, cutter_array):
+    """Get the cache key of an offset image.
+
+    The source image and the cutter array describe everything the offset
+    depends on, including custom cutters and skin.
+
+    Args:
+        o (object): The operation.
+        samples (numpy.ndarray): The source z-buffer image.
+        cutter_array (numpy.ndarray): The cutter array from get_cutter_array.
+
+    Returns:
+        str: The cache key.
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(repr(("offset", samples.shape, cutter_array.shape, o.inverse, o.min.z)).encode())
+    hasher.update(np.ascontiguousarray(samples, dtype=np.double).tobytes())
+    hasher.update(np.ascontiguousarray(cutter_array, dtype=np.double).tobytes())
+    return hasher.hexdigest()
+
+
+def load_cached_image(key):
+    """Load an image from the cache.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        numpy.ndarray: The image, or None if it isn't in the cache.
+    """
+    filename = os.path.join(get_image_cache_folder(), key + ".npz")
+    try:
+        with np.load(filename) as data:
+            image = data["image"]
+    except (OSError, KeyError, ValueError):
+        return None
+
+    # mark as recently used
+    os.utime(filename)
+    log.info(f"Image Loaded from Cache: {key}")
+    return image
+
+
+def save_cached_image(key, image):
+    """Save an image to the cache and evict the least recently used images
+    when the cache grows over IMAGE_CACHE_SIZE.
+
+    Args:
+        key (str): The cache key.
+        image (numpy.ndarray): The image to store.
+    """
+    folder = get_image_cache_folder()
+    os.makedirs(folder, exist_ok=True)
+    filename = os.path.join(folder, key + ".npz")
+    temp_filename = os.path.join(folder, key + ".tmp.npz")
+    np.savez_compressed(temp_filename, image=image)
+    os.replace(temp_filename, filename)
+
+    evict_cached_images(folder, IMAGE_CACHE_SIZE)
+
+
+def evict_cached_images(folder, size_limit):
+    """Remove the least recently used images until the cache fits the size limit.
+
+    Args:
+        folder (str): The image cache folder.
+        size_limit (int): Maximum size of the cache in bytes.
+    """
+    entries = []
+    for entry in os.scandir(folder):
+        if entry.is_file() and entry.name.endswith(".npz"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= size_limit:
+            break
+        try:
+            os.remove(path)
+            total -= size
+            log.info(f"Image Removed from Cache: {os.path.basename(path)}")
+        except OSError:
+            pass
@@ -31,17 +31,25 @@ from ..chunk_builder import (
     CamPathChunk,
     CamPathChunkBuilder,
 )
+from .bvh_utils import BVHCutter
 from .collision_utils import (
     cleanup_bullet_collision,
     get_sample_bullet,
-    get_sample_bullet_n_axis,
     prepare_bullet_collision,
+    sample_bullet_points,
+)
+from .cylinder_utils import (
+    render_cylinder_image,
+    sample_cylinder_image,
 )
 from .image_utils import (
-    get_sample_image,
+    get_sample_image_array,
     prepare_area,
 )
-from .internal_utils import _optimize_internal
+from .internal_utils import (
+    _optimize_internal,
+    _split_layers_internal,
+)
 from .logging_utils import log
 from .ocl_utils import (
     oclSample,
@@ -49,13 +57,20 @@ from .ocl_utils import (
 )
 
 from .operation_utils import (
+    create_path_mesh,
     get_ambient,
     get_operation_axes,
+    set_path_rotations,
+)
+from .pool_utils import (
+    sample_bullet_pool,
+    use_sampling_pool,
 )
 from .parent_utils import (
     parent_child,
     parent_child_distance,
 )
+from .sort_utils import ChunkSortIndex
 from .simple_utils import (
     activate,
     progress,
@@ -71,73 +86,89 @@ from .simple_utils import (
 from ..exception import CamException
 
 
+def _steps_below(step, lengths):
+    """Count the Steps i >= 1 that Stay Shorter than each Length (step * i < length)"""
+    counts = np.maximum(np.ceil(lengths / step).astype(int) - 1, 0)
+    counts -= (counts > 0) & (step * counts >= lengths)
+    counts += step * (counts + 1) < lengths
+    return counts
+
+
+def _step_numbers(counts):
+    """Number the Steps of each Segment from 1 to its Count"""
+    firsts = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(counts.sum()) - firsts + 1
+
+
+def _segment_vectors(points):
+    """Segments of a Chunk as Vectors, their Lengths and their Directions"""
+    vectors = np.diff(points, axis=0)
+    lengths = np.linalg.norm(vectors, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        directions = vectors / lengths[:, None]
+    return lengths, directions
+
+
 def chunks_refine(chunks, o):
-    """Add Extra Points in Between for Chunks"""
+    """Add Extra Points in Between for Chunks
+
+    Segments longer than the Distance Along Paths get points at every multiple
+    of that distance from their start, the end of the segment is not repeated.
+    """
+    step = o.distance_along_paths
     for ch in chunks:
-        # print('before',len(ch))
-        newchunk = []
-        v2 = Vector(ch.points[0])
-        # print(ch.points)
-        for s in ch.points:
-            v1 = Vector(s)
-            v = v1 - v2
-
-            if v.length > o.distance_along_paths:
-                d = v.length
-                v.normalize()
-                i = 0
-                vref = Vector((0, 0, 0))
-
-                while vref.length < d:
-                    i += 1
-                    vref = v * o.distance_along_paths * i
-                    if vref.length < d:
-                        p = v2 + vref
-
-                        newchunk.append((p.x, p.y, p.z))
-
-            newchunk.append(s)
-            v2 = v1
-        ch.points = np.array(newchunk)
+        points = np.asarray(ch.points, dtype=float)
+        lengths, directions = _segment_vectors(points)
+
+        counts = np.where(lengths > step, _steps_below(step, lengths), 0)
+        segments = np.repeat(np.arange(len(lengths)), counts)
+        offsets = step * _step_numbers(counts)
+        new_points = points[segments] + directions[segments] * offsets[:, None]
+
+        ch.points = np.insert(points, segments + 1, new_points, axis=0)
 
     return chunks
 
 
 def chunks_refine_threshold(chunks, distance, limitdistance):
-    """Add Extra Points in Between for Chunks. for Medial Axis Strategy only!"""
+    """Add Extra Points in Between for Chunks. for Medial Axis Strategy only!
+
+    Segments longer than the limit distance get points at every multiple of the
+    distance from their start up to their middle, followed by the points at the
+    same multiples measured back from their end.
+    """
     for ch in chunks:
-        newchunk = []
-        v2 = Vector(ch.points[0])
-
-        for s in ch.points:
-            v1 = Vector(s)
-            v = v1 - v2
-
-            if v.length > limitdistance:
-                d = v.length
-                v.normalize()
-                i = 1
-                vref = Vector((0, 0, 0))
-                while vref.length < d / 2:
-                    vref = v * distance * i
-                    if vref.length < d:
-                        p = v2 + vref
-
-                        newchunk.append((p.x, p.y, p.z))
-                    i += 1
-                    # because of the condition, so it doesn't run again.
-                    vref = v * distance * i
-                while i > 0:
-                    vref = v * distance * i
-                    if vref.length < d:
-                        p = v1 - vref
-
-                        newchunk.append((p.x, p.y, p.z))
-                    i -= 1
-
-            newchunk.append(s)
-            v2 = v1
-        ch.points = np.array(newchunk)
+        points = np.asarray(ch.points, dtype=float)
+        lengths, directions = _segment_vectors(points)
+
+        refine = lengths > limitdistance
+        below_length = _steps_below(distance, lengths)
+        # first step from the start that reaches the middle, but at least the 2nd
+        middle = np.maximum(_steps_below(distance, lengths / 2) + 1, 2)
+        forward_counts = np.where(refine & (below_length > 0), middle - 1, 0)
+        backward_counts = np.where(refine, np.minimum(middle, below_length), 0)
+
+        forward_segments = np.repeat(np.arange(len(lengths)), forward_counts)
+        forward_offsets = distance * _step_numbers(forward_counts)
+        forward_points = (
+            points[forward_segments] + directions[forward_segments] * forward_offsets[:, None]
+        )
+
+        backward_segments = np.repeat(np.arange(len(lengths)), backward_counts)
+        # counted down from the step closest to the start to the one next to the end
+        backward_steps = np.repeat(backward_counts, backward_counts) + 1
+        backward_offsets = distance * (backward_steps - _step_numbers(backward_counts))
+        backward_points = (
+            points[backward_segments + 1]
+            - directions[backward_segments] * backward_offsets[:, None]
+        )
+
+        ch.points = np.insert(
+            points,
+            np.concatenate((forward_segments, backward_segments)) + 1,
+            np.concatenate((forward_points, backward_points)),
+            axis=0,
+        )
 
     return chunks
 
@@ -248,43 +279,6 @@ def extend_chunks_5_axis(chunks, o):
             )  # TODO: this is a placeholder. It does 99.9% probably write total nonsense.
 
 
-def get_closest_chunk(o, pos, chunks):
-    """Find the closest chunk to a given position.
-
-    This function iterates through a list of chunks and determines which
-    chunk is closest to the specified position. It checks if each chunk's
-    children are sorted before calculating the distance. The chunk with the
-    minimum distance to the given position is returned.
-
-    Args:
-        o: An object representing the origin point.
-        pos: A position to which the closest chunk is calculated.
-        chunks (list): A list of chunk objects to evaluate.
-
-    Returns:
-        Chunk: The closest chunk object to the specified position, or None if no valid
-            chunk is found.
-    """
-
-    # ch=-1
-    mind = 2000
-    d = 100000000000
-    ch = None
-    for chtest in chunks:
-        cango = True
-        # here was chtest.getNext==chtest, was doing recursion error and slowing down.
-        for child in chtest.children:
-            if not child.sorted:
-                cango = False
-                break
-        if cango:
-            d = chtest.distance(pos, o)
-            if d < mind:
-                ch = chtest
-                mind = d
-    return ch
-
-
 def chunks_coherency(chunks):
     """Checks CAM path chunks for Stability for Pencil path
 
@@ -385,9 +379,11 @@ async def sample_chunks_n_axis(o, pathSamples, layers):
     """Sample chunks along a specified axis based on provided paths and layers.
 
     This function processes a set of path samples and organizes them into
-    chunks according to specified layers. It prepares the collision world if
-    necessary, updates the cutter's rotation based on the path samples, and
-    handles the sampling of points along the paths. The function also
+    chunks according to specified layers. It drops the cutter, rotated by
+    the path sample rotations, along each sampling ray against a BVH tree
+    of the operation objects, without changing the scene. Out of exact mode,
+    4 axis operations drop it on the cylinder image instead, except for the
+    rays the image can't answer. The function also
     manages the relationships between the sampled points and their
     respective layers, ensuring that the correct points are added to each
     chunk. The resulting chunks can be used for further processing in a 3D
@@ -408,14 +404,18 @@ async def sample_chunks_n_axis(o, pathSamples, layers):
     #
     minx, miny, minz, maxx, maxy, maxz = o.min.x, o.min.y, o.min.z, o.max.x, o.max.y, o.max.z
 
-    # prepare collision world
+    # the cutter is dropped as a bundle of rays against a BVH tree, nothing in the scene changes
     if o.update_bullet_collision_tag:
-        prepare_bullet_collision(o)
         get_ambient(o)
         o.update_bullet_collision_tag = False
 
-    cutter = o.cutter_shape
-    cutterdepth = cutter.dimensions.z / 2
+    # out of exact mode 4 axis operations drop the cutter on a cylindrical height map
+    use_cylinder_image = o.machine_axes == "4" and not o.optimisation.use_exact
+    cutter = None
+    if use_cylinder_image:
+        cylinder_image = render_cylinder_image(o)
+    else:
+        cutter = BVHCutter(o)
     t = time.time()
     totlen = 0  # total length of all chunks, to estimate sampling time.
 
@@ -449,6 +449,13 @@ async def sample_chunks_n_axis(o, pathSamples, layers):
         lastrotation = (0, 0, 0)
         spl = len(patternchunk.startpoints)
 
+        if use_cylinder_image:
+            cylinder_samples, cylinder_exact = sample_cylinder_image(
+                o, cylinder_image, patternchunk.startpoints, patternchunk.endpoints
+            )
+            if cutter is None and cylinder_exact.any():
+                cutter = BVHCutter(o)
+
         for si in range(0, spl):
             # #TODO: seems we are writing into the source chunk ,
             #  and that is why we need to write endpoints everywhere too?
@@ -469,21 +476,11 @@ async def sample_chunks_n_axis(o, pathSamples, layers):
             sweepvect.normalize()
 
             # sampling
-            if rotation != lastrotation:
-                cutter.rotation_euler = rotation
-
-                if o.cutter_type == "VCARVE":  # Bullet cone is always pointing Up Z in the object
-                    cutter.rotation_euler.x += pi
-
-                cutter.update_tag()
-                # # this has to be :( it resets the rigidbody world.
-                # # No other way to update it probably now :(
-                # # actually 2 frame jumps are needed.
-                bpy.context.scene.frame_set(1)
-                bpy.context.scene.frame_set(2)
-                bpy.context.scene.frame_set(0)
-
-            newsample = get_sample_bullet_n_axis(cutter, startp, endp, rotation, cutterdepth)
+            if use_cylinder_image and not cylinder_exact[si]:
+                newsample = cylinder_samples[si]
+            else:
+                cutter.set_rotation(rotation)
+                newsample = cutter.drop(startp, endp)
 
             ################################
             # handling samples
@@ -688,18 +685,78 @@ def sample_path_low(o, ch1, ch2, dosample):
 
                     if z > p[2]:
                         p[2] = z
-            else:
-                for p in bpath_points:
-                    xs = (p[0] - o.min.x) / pixsize + o.borderwidth + pixsize / 2
-                    ys = (p[1] - o.min.y) / pixsize + o.borderwidth + pixsize / 2
-                    z = get_sample_image((xs, ys), o.offset_image, o.min_z) + o.skin
-
-                    if z > p[2]:
-                        p[2] = z
+            elif len(bpath_points) > 0:
+                bpath_array = np.array(bpath_points)
+                coords = (bpath_array[:, 0:2] - (o.min.x, o.min.y)) / pixsize + o.borderwidth
+                coords += pixsize / 2
+                z = get_sample_image_array(coords, o.offset_image, o.min_z) + o.skin
+                bpath_array[:, 2] = np.maximum(bpath_array[:, 2], z)
+                bpath_points = bpath_array
 
     return CamPathChunk(bpath_points)
 
 
+def split_layers(samples, layers, o):
+    """Split the sampled points of one pattern chunk into chunks per layer.
+
+    Points above a layer terminate its current chunk, points below it are
+    raised to the layer bottom. Where the path crosses layer borders, the
+    crossing points are added to both neighbouring layers, so that every
+    layer is milled up to its border.
+
+    Args:
+        samples (numpy.ndarray): An (N, 3) array of sampled points of one pattern chunk.
+        layers (list): A list of layers, as [top, bottom] pairs.
+        o (object): The operation, for the protect vertical settings.
+
+    Returns:
+        list: A list with the chunks of each layer, in the order of the layers.
+    """
+    layer_array = np.array(layers, dtype=np.float64).reshape(-1, 2)
+    tops = layer_array[:, 0]
+    bottoms = layer_array[:, 1]
+    z = samples[:, 2]
+    layer_count = len(layer_array)
+
+    if layer_count == 1:
+        # no borders to cross, chunks are the runs of samples not above the layer
+        kept = np.flatnonzero(~(tops[0] < z))
+        chunk_points = samples[kept]
+        chunk_points[:, 2] = np.maximum(chunk_points[:, 2], bottoms[0])
+        chunk_starts = np.concatenate(([0], np.flatnonzero(np.diff(kept) > 1) + 1, [len(kept)]))
+        chunk_layers = np.zeros(len(chunk_starts) - 1 if len(kept) > 0 else 0, dtype=np.int64)
+    else:
+        # layer membership of every sample, the last matching layer wins like in the sampling loop
+        in_layer = (bottoms <= z[:, None]) & (z[:, None] <= tops)
+        sample_layers = np.where(
+            np.any(in_layer, axis=1),
+            layer_count - 1 - np.argmax(in_layer[:, ::-1], axis=1),
+            -1,
+        )
+
+        # every layer not below the sample gets a point, every border crossing up to 2 more
+        capacity = np.count_nonzero(~(tops < z[:, None]))
+        if len(z) > 1:
+            last_layers = sample_layers[:-1, None]
+            crossings = np.abs(np.arange(layer_count) - last_layers) * in_layer[1:]
+            capacity += 2 * int(np.sum(crossings * (last_layers >= 0)))
+
+        chunk_points, chunk_layers, chunk_starts = _split_layers_internal(
+            samples,
+            layer_array,
+            sample_layers,
+            capacity + 1,
+            o.movement.protect_vertical,
+            o.movement.protect_vertical_limit,
+        )
+
+    layer_chunks = [[] for l in layers]
+    for i, layer in enumerate(chunk_layers):
+        chunk = CamPathChunkBuilder(chunk_points[chunk_starts[i] : chunk_starts[i + 1]])
+        layer_chunks[layer].append(chunk.to_chunk())
+    return layer_chunks
+
+
 # samples in both modes now - image and bullet collision too.
 async def sample_chunks(o, pathSamples, layers):
     """Sample chunks of paths based on the provided parameters.
@@ -727,11 +784,25 @@ async def sample_chunks(o, pathSamples, layers):
     minx, miny, minz, maxx, maxy, maxz = o.min.x, o.min.y, o.min.z, o.max.x, o.max.y, o.max.z
     get_ambient(o)
 
+    totlen = 0  # total length of all chunks, to estimate sampling time.
+
+    for ch in pathSamples:
+        totlen += ch.count()
+
+    # large exact mode jobs are sampled in background processes, with their own collision world
+    pool_samples = None
+    if use_sampling_pool(o, totlen):
+        pattern_points = [ch.get_points_np()[:, 0:2] for ch in pathSamples]
+        ambient_masks = [contains(o.ambient, points(p)) for p in pattern_points]
+        pool_samples = await sample_bullet_pool(
+            o, pattern_points, ambient_masks, o.min_z - 0.000001
+        )
+
     if o.optimisation.use_exact:  # prepare collision world
         if o.optimisation.use_opencamlib:
             await oclSample(o, pathSamples)
             cutterdepth = 0
-        else:
+        elif pool_samples is None:
             if o.update_bullet_collision_tag:
                 prepare_bullet_collision(o)
                 o.update_bullet_collision_tag = False
@@ -750,19 +821,12 @@ async def sample_chunks(o, pathSamples, layers):
 
     t = time.time()
 
-    totlen = 0  # total length of all chunks, to estimate sampling time.
-
-    for ch in pathSamples:
-        totlen += ch.count()
-
     layerchunks = []
     minz = o.min_z - 0.000001  # correction for image method problems
-    layeractivechunks = []
     lastrunchunks = []
 
     for l in layers:
         layerchunks.append([])
-        layeractivechunks.append(CamPathChunkBuilder([]))
         lastrunchunks.append([])
 
     zinvert = 0
@@ -781,159 +845,51 @@ async def sample_chunks(o, pathSamples, layers):
     sortingtime = timing_init()
     totaltime = timing_init()
     timing_start(totaltime)
-    lastz = minz
 
-    for patternchunk in pathSamples:
-        thisrunchunks = []
-
-        for l in layers:
-            thisrunchunks.append([])
-
-        lastlayer = None
-        currentlayer = None
-        lastsample = None
+    for chunk_index, patternchunk in enumerate(pathSamples):
         our_points = patternchunk.get_points_np()
         ambient_contains = contains(o.ambient, points(our_points[:, 0:2]))
+        samples = np.empty((len(our_points), 3))
+        samples[:, 0:2] = our_points[:, 0:2]
+
+        if pool_samples is not None:
+            samples[:, 2] = pool_samples[chunk_index]
+            n += len(our_points)
+
+        elif o.optimisation.use_exact and not o.optimisation.use_opencamlib:
+            samples[:, 2] = sample_bullet_points(
+                o, cutter, cutterdepth, our_points, ambient_contains, minz
+            )
+            n += len(our_points)
 
-        for s, in_ambient in zip(our_points, ambient_contains):
             if o.strategy != "WATERLINE" and int(100 * n / totlen) != last_percent:
                 last_percent = int(100 * n / totlen)
                 await progress_async("Sampling Paths", last_percent)
 
-            n += 1
-            x = s[0]
-            y = s[1]
-
-            if not in_ambient:
-                newsample = (x, y, 1)
+        else:
+            if o.optimisation.use_opencamlib and o.optimisation.use_exact:
+                z = our_points[:, 2]
             else:
-                if o.optimisation.use_opencamlib and o.optimisation.use_exact:
-                    z = s[2]
-
-                    if minz > z:
-                        z = minz
-                    newsample = (x, y, z)
-
-                # ampling
-                elif o.optimisation.use_exact and not o.optimisation.use_opencamlib:
-                    if lastsample is not None:  # this is an optimalization,
-                        # search only for near depths to the last sample. Saves about 30% of sampling time.
-                        z = get_sample_bullet(
-                            cutter, x, y, cutterdepth, 1, lastsample[2] - o.distance_along_paths
-                        )  # first try to the last sample
-
-                        if z < minz - 1:
-                            z = get_sample_bullet(
-                                cutter,
-                                x,
-                                y,
-                                cutterdepth,
-                                lastsample[2] - o.distance_along_paths,
-                                minz,
-                            )
-                    else:
-                        z = get_sample_bullet(cutter, x, y, cutterdepth, 1, minz)
+                # whole pattern chunk is sampled in one call
+                timing_start(samplingtime)
+                coords = (our_points[:, 0:2] - (minx, miny)) / pixsize + coordoffset
+                z = get_sample_image_array(coords, o.offset_image, minz) + o.skin
+                timing_add(samplingtime)
 
-                else:
-                    timing_start(samplingtime)
-                    xs = (x - minx) / pixsize + coordoffset
-                    ys = (y - miny) / pixsize + coordoffset
-                    timing_add(samplingtime)
-                    z = get_sample_image((xs, ys), o.offset_image, minz) + o.skin
-
-                ################################
-                # handling samples
-                ############################################
-
-                if minz > z:
-                    z = minz
-                newsample = (x, y, z)
-
-            for i, l in enumerate(layers):
-                terminatechunk = False
-                ch = layeractivechunks[i]
-
-                if l[1] <= newsample[2] <= l[0]:
-                    lastlayer = None  # rather the last sample here ? has to be set to None,
-                    # since sometimes lastsample vs lastlayer didn't fit and did ugly ugly stuff....
-                    if lastsample is not None:
-                        for i2, l2 in enumerate(layers):
-                            if l2[1] <= lastsample[2] <= l2[0]:
-                                lastlayer = i2
-
-                    currentlayer = i
-
-                    if lastlayer is not None and lastlayer != currentlayer:
-                        # #sampling for sorted paths in layers- to go to the border of the sampled layer at least...
-                        # there was a bug here, but should be fixed.
-                        if currentlayer < lastlayer:
-                            growing = True
-                            r = range(currentlayer, lastlayer)
-                            spliti = 1
-                        else:
-                            r = range(lastlayer, currentlayer)
-                            growing = False
-                            spliti = 0
-
-                        li = 0
-
-                        for ls in r:
-                            splitz = layers[ls][1]
-                            v1 = lastsample
-                            v2 = newsample
-
-                            if o.movement.protect_vertical:
-                                v1, v2 = is_vertical_limit(
-                                    v1, v2, o.movement.protect_vertical_limit
-                                )
-                            v1 = Vector(v1)
-                            v2 = Vector(v2)
-
-                            # Prevent divide by zero:
-                            dz = v2.z - v1.z
-                            if abs(dz) < 1e-8:
-                                # no vertical change – nothing to split
-                                continue
-                            ratio = (splitz - v1.z) / dz
-                            betweensample = v1 + (v2 - v1) * ratio
-
-                            if growing:
-                                if li > 0:
-                                    layeractivechunks[ls].points.insert(
-                                        -1, betweensample.to_tuple()
-                                    )
-                                else:
-                                    layeractivechunks[ls].points.append(betweensample.to_tuple())
-                                layeractivechunks[ls + 1].points.append(betweensample.to_tuple())
-                            else:
-                                layeractivechunks[ls].points.insert(-1, betweensample.to_tuple())
-                                layeractivechunks[ls + 1].points.insert(0, betweensample.to_tuple())
-
-                            li += 1
-                    # this chunk is terminated, and allready in layerchunks /
-
-                    # ch.points.append(betweensample.to_tuple())#
-                    ch.points.append(newsample)
-                elif l[1] > newsample[2]:
-                    ch.points.append((newsample[0], newsample[1], l[1]))
-                elif l[0] < newsample[2]:  # terminate chunk
-                    terminatechunk = True
-
-                if terminatechunk:
-                    if len(ch.points) > 0:
-                        as_chunk = ch.to_chunk()
-                        layerchunks[i].append(as_chunk)
-                        thisrunchunks[i].append(as_chunk)
-                        layeractivechunks[i] = CamPathChunkBuilder([])
-            lastsample = newsample
+            samples[:, 2] = np.where(ambient_contains, np.maximum(z, minz), 1)
+            n += len(our_points)
+
+            if o.strategy != "WATERLINE" and int(100 * n / totlen) != last_percent:
+                last_percent = int(100 * n / totlen)
+                await progress_async("Sampling Paths", last_percent)
+
+        ################################
+        # handling samples
+        ############################################
+        thisrunchunks = split_layers(samples, layers, o)
 
         for i, l in enumerate(layers):
-            ch = layeractivechunks[i]
-            if len(ch.points) > 0:
-                as_chunk = ch.to_chunk()
-                layerchunks[i].append(as_chunk)
-                thisrunchunks[i].append(as_chunk)
-                layeractivechunks[i] = CamPathChunkBuilder([])
+            layerchunks[i].extend(thisrunchunks[i])
 
             # PARENTING
             if o.strategy == "PARALLEL" or o.strategy == "CROSS" or o.strategy == "OUTLINEFILL":
@@ -1093,37 +1049,45 @@ async def sort_chunks(chunks, o, last_pos=None):
     lastch = None
     last_progress_time = time.time()
     total = len(chunks)
-    i = len(chunks)
     pos = (0, 0, 0) if last_pos is None else last_pos
+    # finds the closest ready chunk in ~log(n) instead of scanning the whole list
+    index = ChunkSortIndex(chunks, o)
 
-    while len(chunks) > 0:
+    while len(index) > 0:
         if o.strategy != "WATERLINE" and time.time() - last_progress_time > 0.1:
-            await progress_async("Sorting Paths", 100.0 * (total - len(chunks)) / total)
+            await progress_async("Sorting Paths", 100.0 * (total - len(index)) / total)
             last_progress_time = time.time()
         ch = None
         if len(sortedchunks) == 0 or len(lastch.parents) == 0:
             # first chunk or when there are no parents -> parents come after children here...
-            ch = get_closest_chunk(o, pos, chunks)
+            ch = index.closest(pos)
         elif len(lastch.parents) > 0:  # looks in parents for next candidate, recursively
             for parent in lastch.parents:
                 ch = parent.get_next_closest(o, pos)
-                if ch is not None:
+                if ch is not None and index.contains(ch):
                     break
+                ch = None
             if ch is None:
-                ch = get_closest_chunk(o, pos, chunks)
+                ch = index.closest(pos)
 
-        if ch is not None:  # found next chunk, append it to list
-            # only adaptdist the chunk if it has not been sorted before
-            if not ch.sorted:
-                ch.adapt_distance(pos, o)
-                ch.sorted = True
+        if ch is None:
+            # nothing can be reached from here, e.g. children missing from the list
+            log.warning(f"Sorting Stopped, {len(index)} Chunks Left Unsorted")
+            sortedchunks.extend(index.remaining_chunks())
+            break
 
-            chunks.remove(ch)
-            sortedchunks.append(ch)
-            lastch = ch
-            pos = lastch.get_point(-1)
+        # found next chunk, append it to list
+        # only adaptdist the chunk if it has not been sorted before
+        if not ch.sorted:
+            ch.adapt_distance(pos, o)
+            ch.sorted = True
+
+        index.consume(ch)
+        sortedchunks.append(ch)
+        lastch = ch
+        pos = lastch.get_point(-1)
 
-        i -= 1
+    chunks.clear()
 
     if o.strategy == "POCKET" and o.pocket_option == "OUTSIDE":
         sortedchunks.reverse()
@@ -1160,7 +1124,9 @@ def chunks_to_mesh(chunks, o):
     t = time.time()
     scene = bpy.context.scene
     machine = scene.cam_machine
+    # arrays of vertices and rotations, concatenated when the path is complete
     vertices = []
+    vertices_rotations = []
 
     free_height = o.movement.free_height
 
@@ -1180,10 +1146,7 @@ def chunks_to_mesh(chunks, o):
 
     if three_axis:
         origin = user_origin if machine.use_position_definitions else default_origin
-        vertices = [origin]
-
-    if not three_axis:
-        vertices_rotations = []
+        vertices = [[origin]]
 
     if indexed_five_axis or indexed_four_axis:
         extend_chunks_5_axis(chunks, o)
@@ -1221,22 +1184,22 @@ def chunks_to_mesh(chunks, o):
                 # did the cutter lift before? if yes, put a new position above of the first point of next chunk.
                 if three_axis or indexed_five_axis or indexed_four_axis:
                     vertex = (
-                        chunk.get_point(0)[0],
-                        chunk.get_point(0)[1],
+                        chunk.points[0, 0],
+                        chunk.points[0, 1],
                         free_height,
                     )
                 # otherwise, continue with the next chunk without lifting/dropping
                 else:
                     vertex = chunk.startpoints[0]
-                    vertices_rotations.append(chunk.rotations[0])
-                vertices.append(vertex)
+                    vertices_rotations.append([chunk.rotations[0]])
+                vertices.append([vertex])
 
             # add whole chunk
-            vertices.extend(chunk.get_points())
+            vertices.append(chunk.get_points_np())
 
             # add rotations for n-axis
-            if not three_axis:
-                vertices_rotations.extend(chunk.rotations)
+            if not three_axis and len(chunk.rotations) > 0:
+                vertices_rotations.append(chunk.rotations)
 
             lift = True
             # check if lifting should happen
@@ -1259,11 +1222,11 @@ def chunks_to_mesh(chunks, o):
 
             if lift:
                 if three_axis or indexed_five_axis or indexed_four_axis:
-                    vertex = (chunk.get_point(-1)[0], chunk.get_point(-1)[1], free_height)
+                    vertex = (chunk.points[-1, 0], chunk.points[-1, 1], free_height)
                 else:
                     vertex = chunk.startpoints[-1]
-                    vertices_rotations.append(chunk.rotations[-1])
-                vertices.append(vertex)
+                    vertices_rotations.append([chunk.rotations[-1]])
+                vertices.append([vertex])
             lifted = lift
 
     if o.optimisation.use_exact and not o.optimisation.use_opencamlib:
@@ -1273,11 +1236,9 @@ def chunks_to_mesh(chunks, o):
     t = time.time()
 
     # Blender Object generation starts here:
-    edges = [(a, a + 1) for a in range(0, len(vertices) - 1)]
+    vertices = np.concatenate(vertices) if len(vertices) > 0 else np.empty((0, 3))
     path_name = scene.cam_names.path_name_full
-    mesh = bpy.data.meshes.new(path_name)
-    mesh.name = path_name
-    mesh.from_pydata(vertices, edges, [])
+    mesh = create_path_mesh(path_name, vertices)
 
     if path_name in scene.objects:
         scene.objects[path_name].data = mesh
@@ -1286,19 +1247,12 @@ def chunks_to_mesh(chunks, o):
         ob = object_utils.object_data_add(bpy.context, mesh, operator=None)
 
     if not three_axis:
-        # store rotations into shape keys, only way to store large arrays with correct floating point precision
-        # - object/mesh attributes can only store array up to 32000 intems.
-        ob.shape_key_add()
-        ob.shape_key_add()
-        shapek = mesh.shape_keys.key_blocks[1]
-        shapek.name = "rotations"
-
-        log.info(len(shapek.data))
-        log.info(len(vertices_rotations))
-
-        # TODO: optimize this. this is just rewritten too many times...
-        for i, co in enumerate(vertices_rotations):
-            shapek.data[i].co = co
+        rotations = (
+            np.concatenate(vertices_rotations) if len(vertices_rotations) > 0 else np.empty((0, 3))
+        )
+        log.info(len(vertices))
+        log.info(len(rotations))
+        set_path_rotations(ob, rotations)
 
     log.info(f"Path Object Generation Time: {time.time() - t}")
     log.info("-")
@@ -12,11 +12,9 @@ from math import (
 )
 import time
 
+import numpy as np
+
 import bpy
-from mathutils import (
-    Euler,
-    Vector,
-)
 
 from ..constants import (
     BULLET_SCALE,
@@ -397,40 +395,52 @@ def get_sample_bullet(cutter, x, y, radius, startz, endz):
         return endz - 10
 
 
-def get_sample_bullet_n_axis(cutter, startpoint, endpoint, rotation, cutter_compensation):
-    """Perform a fully 3D collision test for N-Axis milling.
+def sample_bullet_points(o, cutter, cutterdepth, points, ambient_contains, minz):
+    """Sample the heights of one pattern chunk with Bullet collision.
 
-    This function computes the collision detection between a cutter and a
-    specified path in a 3D space. It takes into account the cutter's
-    rotation and compensation to accurately determine if a collision occurs
-    during the milling process. The function uses Bullet physics for the
-    collision detection and returns the adjusted position of the cutter if a
-    collision is detected.
+    Points are sampled in order, each search starts near the depth of the
+    previous sample, which saves about 30% of sampling time.
 
     Args:
-        cutter (object): The cutter object used in the milling operation.
-        startpoint (Vector): The starting point of the milling path.
-        endpoint (Vector): The ending point of the milling path.
-        rotation (Euler): The rotation applied to the cutter.
-        cutter_compensation (float): The compensation factor for the cutter's position.
+        o (object): The operation.
+        cutter (bpy.types.Object): The collision cutter from get_cutter_bullet.
+        cutterdepth (float): Half of the cutter height.
+        points (numpy.ndarray): (N, 2) or (N, 3) array of points, only x and y are used.
+        ambient_contains (numpy.ndarray): True for points inside the ambient.
+        minz (float): Lowest allowed height.
 
     Returns:
-        Vector or None: The adjusted position of the cutter if a collision is
-            detected;
-            otherwise, returns None.
+        numpy.ndarray: Heights of the points, 1 for points outside the ambient.
     """
-    cutterVec = Vector((0, 0, 1)) * cutter_compensation
-    # cutter compensation vector - cutter physics object has center in the middle, while cam needs the tip position.
-    cutterVec.rotate(Euler(rotation))
-    start = (startpoint * BULLET_SCALE + cutterVec).to_tuple()
-    end = (endpoint * BULLET_SCALE + cutterVec).to_tuple()
-    pos = bpy.context.scene.rigidbody_world.convex_sweep_test(cutter, start, end)
-
-    if pos[3] == 1:
-        pos = Vector(pos[0])
-        # rescale and compensate from center to tip.
-        res = pos / BULLET_SCALE - cutterVec / BULLET_SCALE
-
-        return res
-    else:
-        return None
+    z_values = np.empty(len(points))
+
+    for si, (s, in_ambient) in enumerate(zip(points, ambient_contains)):
+        x = s[0]
+        y = s[1]
+
+        if not in_ambient:
+            z_values[si] = 1
+            continue
+
+        if si > 0:
+            # search only for near depths to the last sample, first try to the last sample
+            lastz = z_values[si - 1]
+            z = get_sample_bullet(cutter, x, y, cutterdepth, 1, lastz - o.distance_along_paths)
+
+            if z < minz - 1:
+                z = get_sample_bullet(
+                    cutter,
+                    x,
+                    y,
+                    cutterdepth,
+                    lastz - o.distance_along_paths,
+                    minz,
+                )
+        else:
+            z = get_sample_bullet(cutter, x, y, cutterdepth, 1, minz)
+
+        if minz > z:
+            z = minz
+        z_values[si] = z
+
+    return z_values
@@ -0,0 +1,432 @@
+"""Fabex 'cylinder_utils.py' © 2025
+
+Cylindrical height map of 4 axis operations.
+
+The cylinder image stores, for every position along the rotary axis and every
+angle around it, the radius of the outermost surface of the operation objects.
+It is the 4 axis counterpart of the z-buffer of 3 axis operations, and the
+cutter is dropped on it with array lookups instead of collision tests.
+"""
+
+from math import (
+    atan2,
+    ceil,
+    cos,
+    floor,
+    pi,
+    sin,
+    sqrt,
+)
+import time
+
+import numpy as np
+
+from mathutils import Euler, Vector
+
+from ..exception import CamException
+from .cache_utils import (
+    hash_objects,
+    load_cached_image,
+    save_cached_image,
+)
+from .internal_utils import _cutter_profile_height
+from .logging_utils import log
+from .numba_utils import jit, prange
+from .ocl_utils import get_object_triangles
+from .operation_utils import (
+    get_cutter_array,
+    get_cutter_profile,
+)
+from .simple_utils import progress
+
+
+def get_rotary_frame(operation):
+    """Get the rotary axis of an operation and the directions of angle 0 and 90 degrees.
+
+    Angles follow the rotations of the 4 axis strategies, which rotate the
+    sampling rays from the a3 axis around the a1 axis.
+
+    Args:
+        operation (Operation): The operation.
+
+    Returns:
+        tuple: (axis index, numpy.ndarray up direction, numpy.ndarray side direction).
+    """
+    axis = {"X": 0, "Y": 1, "Z": 2}[operation.rotary_axis_1]
+    up = Vector((0, 0, 0))
+    up[1 if axis == 2 else 2] = 1
+    rotation = Euler((0, 0, 0))
+    rotation[axis] = pi / 2
+    side = up.copy()
+    side.rotate(rotation)
+    return axis, np.array(up), np.array(side)
+
+
+def get_cylinder_grid(operation):
+    """Get the grid of the cylinder image of an operation.
+
+    Rows run along the rotary axis, with a border of the cutter radius at
+    both ends, columns run around it. The angle step keeps columns a detail
+    size apart at the top radius of the operation, and both steps grow when
+    the image would exceed the resolution limit.
+
+    Args:
+        operation (Operation): The operation.
+
+    Returns:
+        tuple: (axial start, axial step, rows, angle step, columns).
+    """
+    axis = get_rotary_frame(operation)[0]
+    pixsize = operation.optimisation.pixsize
+    margin = operation.cutter_diameter / 2 + operation.skin + pixsize
+    start = operation.min[axis] - margin
+    length = operation.max[axis] + margin - start
+    circumference = 2 * pi * max(operation.max_z, pixsize)
+
+    limit = operation.optimisation.imgres_limit * 1000000
+    resolution = (length / pixsize) * (circumference / pixsize)
+    if resolution > limit:
+        pixsize *= sqrt(resolution / limit)
+        log.warning(f"Cylinder Image Detail Size Increased to {round(pixsize, 5)}")
+
+    rows = ceil(length / pixsize) + 1
+    columns = max(ceil(circumference / pixsize), 4)
+    return start, pixsize, rows, 2 * pi / columns, columns
+
+
+def _cylinder_image_key(operation, grid):
+    hasher = hash_objects(operation.objects)
+    settings = ("cylinder", operation.rotary_axis_1, operation.use_modifiers) + grid
+    hasher.update(repr(settings).encode())
+    return hasher.hexdigest()
+
+
+# casts a ray from the axis outwards at every grid position a triangle can cover,
+# keeping the farthest hit, so the image holds the outermost surface
+@jit(nopython=True, fastmath=False, cache=True)
+def _cylinder_image_internal(triangles, axis, up, side, start, step, angle_step, image):
+    rows, columns = image.shape
+    directions = np.empty((columns, 3))
+    for j in range(columns):
+        for k in range(3):
+            directions[j, k] = cos(j * angle_step) * up[k] + sin(j * angle_step) * side[k]
+    u = np.empty(3)
+    v = np.empty(3)
+    angles = np.empty(3)
+    eps = 1e-9
+
+    for t in range(triangles.shape[0]):
+        p = triangles[t]
+        e1x = p[1, 0] - p[0, 0]
+        e1y = p[1, 1] - p[0, 1]
+        e1z = p[1, 2] - p[0, 2]
+        e2x = p[2, 0] - p[0, 0]
+        e2y = p[2, 1] - p[0, 1]
+        e2z = p[2, 2] - p[0, 2]
+
+        low = min(p[0, axis], p[1, axis], p[2, axis])
+        high = max(p[0, axis], p[1, axis], p[2, axis])
+        i1 = max(ceil((low - start) / step), 0)
+        i2 = min(floor((high - start) / step), rows - 1)
+        if i1 > i2:
+            continue
+
+        # the angles the triangle covers, all of them if it surrounds the axis
+        for k in range(3):
+            u[k] = p[k, 0] * up[0] + p[k, 1] * up[1] + p[k, 2] * up[2]
+            v[k] = p[k, 0] * side[0] + p[k, 1] * side[1] + p[k, 2] * side[2]
+        c0 = u[0] * v[1] - v[0] * u[1]
+        c1 = u[1] * v[2] - v[1] * u[2]
+        c2 = u[2] * v[0] - v[2] * u[0]
+
+        if (c0 >= 0 and c1 >= 0 and c2 >= 0) or (c0 <= 0 and c1 <= 0 and c2 <= 0):
+            j1 = 0
+            j2 = columns - 1
+        else:
+            for k in range(3):
+                angles[k] = atan2(v[k], u[k]) % (2 * pi)
+            angles.sort()
+            first = angles[0]
+            gap = angles[0] + 2 * pi - angles[2]
+            if angles[1] - angles[0] > gap:
+                first = angles[1]
+                gap = angles[1] - angles[0]
+            if angles[2] - angles[1] > gap:
+                first = angles[2]
+                gap = angles[2] - angles[1]
+            j1 = floor(first / angle_step)
+            j2 = ceil((first + 2 * pi - gap) / angle_step)
+
+        for i in range(i1, i2 + 1):
+            tx = -p[0, 0]
+            ty = -p[0, 1]
+            tz = -p[0, 2]
+            if axis == 0:
+                tx += start + i * step
+            elif axis == 1:
+                ty += start + i * step
+            else:
+                tz += start + i * step
+            qx = ty * e1z - tz * e1y
+            qy = tz * e1x - tx * e1z
+            qz = tx * e1y - ty * e1x
+            distance_det = e2x * qx + e2y * qy + e2z * qz
+
+            for jj in range(j1, j2 + 1):
+                j = jj % columns
+                dx = directions[j, 0]
+                dy = directions[j, 1]
+                dz = directions[j, 2]
+                px = dy * e2z - dz * e2y
+                py = dz * e2x - dx * e2z
+                pz = dx * e2y - dy * e2x
+                det = e1x * px + e1y * py + e1z * pz
+                if abs(det) < 1e-20:
+                    continue
+                a = (tx * px + ty * py + tz * pz) / det
+                if a < -eps or a > 1 + eps:
+                    continue
+                b = (dx * qx + dy * qy + dz * qz) / det
+                if b < -eps or a + b > 1 + eps:
+                    continue
+                distance = distance_det / det
+                if distance >= 0 and distance > image[i, j]:
+                    image[i, j] = distance
+
+
+def render_cylinder_image(operation):
+    """Get the cylinder image of an operation.
+
+    The image is kept on the operation with a hash of its objects and grid,
+    so it is only rendered again when they change, and stored in the image
+    cache.
+
+    Args:
+        operation (Operation): The operation.
+
+    Returns:
+        numpy.ndarray: Radius of the outermost surface at each row and column
+            of the grid from get_cylinder_grid, -1 where there is no surface.
+
+    Raises:
+        CamException: If the operation has no mesh, curve or equivalent object.
+    """
+    t = time.time()
+    progress("~ Getting Cylinder Image ~")
+    grid = get_cylinder_grid(operation)
+    start, step, rows, angle_step, columns = grid
+
+    cache_key = _cylinder_image_key(operation, grid)
+    if operation.cylinder_image_key == cache_key:
+        return operation.cylinder_image
+
+    cached = load_cached_image(cache_key)
+    if cached is not None and cached.shape == (rows, columns):
+        operation.cylinder_image = cached
+
+    else:
+        triangles = [
+            get_object_triangles(ob, operation.use_modifiers)
+            for ob in operation.objects
+            if ob.type in ["MESH", "CURVE", "FONT", "SURFACE"]
+        ]
+        if len(triangles) == 0:
+            raise CamException(
+                "This Operation Requires a Mesh or Curve Object or Equivalent (e.g. Text, Volume)."
+            )
+
+        axis, up, side = get_rotary_frame(operation)
+        image = np.full((rows, columns), -1.0, dtype=np.float32)
+        _cylinder_image_internal(
+            np.concatenate(triangles).astype(np.float64),
+            axis,
+            up,
+            side,
+            start,
+            step,
+            angle_step,
+            image,
+        )
+        save_cached_image(cache_key, image)
+        operation.cylinder_image = image
+
+    operation.cylinder_image_key = cache_key
+    log.info(f"Cylinder Image {rows} x {columns} Time: {time.time() - t}")
+    return operation.cylinder_image
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _cutter_height(profile, cutter_array, spacing, dx, dy):
+    # height of the cutter surface above its tip, or -1 outside of the cutter
+    if cutter_array.shape[0] == 0:
+        rho = sqrt(dx * dx + dy * dy)
+        if rho > profile[0]:
+            return -1.0
+        return _cutter_profile_height(profile, rho)
+
+    m = cutter_array.shape[0] / 2
+    a = floor(dx / spacing + m)
+    b = floor(dy / spacing + m)
+    if a < 0 or b < 0 or a >= cutter_array.shape[0] or b >= cutter_array.shape[1]:
+        return -1.0
+    if cutter_array[a, b] <= -10:
+        return -1.0
+    return -cutter_array[a, b]
+
+
+# the tip radius of a cutter pointing at the axis is the highest r*cos(da) - h over
+# the image points it covers, where h is the cutter height at the lateral distance
+# of the point; rows are visited from the centre out, and angles stop once no point
+# further around could reach the cutter above the best radius so far
+@jit(nopython=True, parallel=True, fastmath=False, cache=True)
+def _offset_cylinder_internal(
+    image, row_max, start, step, angle_step, profile, cutter_array, spacing, axial, angles, out
+):
+    rows, columns = image.shape
+    radius = profile[0]
+    reach = int(radius / step) + 1
+    quarter = columns // 4 + 1
+
+    for n in prange(axial.shape[0]):
+        x = axial[n]
+        phi = angles[n]
+        centre = int(round((x - start) / step))
+        first = int(floor(phi / angle_step))
+        best = -np.inf
+
+        # cosines and sines of the angles of columns around the first one, filled when needed
+        cosines = np.empty(2 * quarter + 2)
+        sines = np.empty(2 * quarter + 2)
+        known_low = 1
+        known_high = 0
+
+        for k in range(2 * reach + 1):
+            if k % 2 == 0:
+                i = centre - k // 2
+            else:
+                i = centre + (k + 1) // 2
+            if i < 0 or i >= rows:
+                continue
+
+            dx = start + i * step - x
+            if abs(dx) > radius:
+                continue
+            lateral = sqrt(radius * radius - dx * dx)
+            low = 0.0
+            if cutter_array.shape[0] == 0:
+                low = _cutter_profile_height(profile, abs(dx))
+            if row_max[i] - low <= best:
+                continue
+
+            for direction in (-1, 1):
+                offset = 0 if direction == -1 else 1
+                for _ in range(quarter):
+                    if offset < known_low or offset > known_high:
+                        delta = (first + offset) * angle_step - phi
+                        cosines[offset + quarter] = cos(delta)
+                        sines[offset + quarter] = sin(delta)
+                        known_low = min(known_low, offset)
+                        known_high = max(known_high, offset)
+                    c = cosines[offset + quarter]
+                    s = sines[offset + quarter]
+                    if c <= 0 or (best > 0 and best * abs(s) > lateral * c):
+                        break
+
+                    r = image[i, (first + offset) % columns]
+                    if r * c - low > best:
+                        h = _cutter_height(profile, cutter_array, spacing, dx, r * s)
+                        if h >= 0 and r * c - h > best:
+                            best = r * c - h
+                    offset += direction
+
+        out[n] = best if best > -np.inf else np.nan
+
+
+def offset_cylinder_image(operation, image, axial, angles):
+    """Drop the cutter on the cylinder image at positions along and around the axis.
+
+    The offset is evaluated at the sampled positions only, as a full image
+    offset in polar coordinates costs a lot more than the paths need.
+
+    Args:
+        operation (Operation): The operation.
+        image (numpy.ndarray): Image from render_cylinder_image.
+        axial (numpy.ndarray): Positions along the rotary axis.
+        angles (numpy.ndarray): Angles around the rotary axis.
+
+    Returns:
+        numpy.ndarray: Radius of the cutter tip at each position, including
+            the skin, or NaN where the cutter covers no surface.
+    """
+    start, step, rows, angle_step, columns = get_cylinder_grid(operation)
+    profile = get_cutter_profile(operation)
+    spacing = step
+    if profile is None:
+        cutter_array = get_cutter_array(operation, spacing)
+        profile = np.array([operation.cutter_diameter / 2 + operation.skin])
+    else:
+        cutter_array = np.empty((0, 0))
+
+    row_max = image.max(axis=1)
+    out = np.empty(len(axial))
+    _offset_cylinder_internal(
+        image,
+        row_max,
+        start,
+        step,
+        angle_step,
+        np.asarray(profile, dtype=np.float64),
+        cutter_array,
+        spacing,
+        np.ascontiguousarray(axial, dtype=np.float64),
+        np.ascontiguousarray(angles, dtype=np.float64) % (2 * pi),
+        out,
+    )
+    return out + operation.skin
+
+
+def sample_cylinder_image(operation, image, startpoints, endpoints):
+    """Drop the cutter on the cylinder image along sampling rays towards the rotary axis.
+
+    The image only holds the outermost surface, so it can't answer rays that
+    start with the cutter already touching it, where the start may be in a
+    cavity, or rays that cross the axis before any contact. These are left
+    for an exact drop.
+
+    Args:
+        operation (Operation): The operation.
+        image (numpy.ndarray): Image from render_cylinder_image.
+        startpoints (list): Start points of the sampling rays.
+        endpoints (list): End points of the sampling rays.
+
+    Returns:
+        tuple: (list, numpy.ndarray) Tip position of each ray at the first contact
+            as a Vector, or None if the cutter reaches the end point without
+            touching the objects, and a mask of the rays that need an exact drop.
+    """
+    axis, up, side = get_rotary_frame(operation)
+    starts = np.asarray(startpoints, dtype=np.float64).reshape(-1, 3)
+    ends = np.asarray(endpoints, dtype=np.float64).reshape(-1, 3)
+
+    angles = np.arctan2(starts @ side, starts @ up)
+    directions = np.outer(np.cos(angles), up) + np.outer(np.sin(angles), side)
+    start_radius = np.einsum("ij,ij->i", starts, directions)
+    end_radius = np.einsum("ij,ij->i", ends, directions)
+
+    radius = offset_cylinder_image(operation, image, starts[:, axis], angles)
+
+    with np.errstate(invalid="ignore"):
+        contact = (radius >= np.maximum(end_radius, 0)) & (radius < start_radius)
+        miss = (end_radius >= 0) & ~(radius >= end_radius)
+    exact = ~(contact | miss)
+
+    samples = []
+    for s, e, r, r1, r2, c in zip(
+        startpoints, endpoints, radius, start_radius, end_radius, contact
+    ):
+        if not c:
+            samples.append(None)
+        else:
+            s = Vector(s)
+            samples.append(s + (Vector(e) - s) * ((r1 - r) / (r1 - r2)))
+    return samples, exact
@@ -7,10 +7,10 @@ from math import (
     acos,
     ceil,
     cos,
-    floor,
     pi,
     radians,
     sin,
+    sqrt,
     tan,
 )
 from typing import Optional
@@ -19,20 +19,24 @@ import random
 import time
 
 import numpy as np
+import shapely
 
 import bpy
 
 try:
-    import bl_ext.blender_org.simplify_curves_plus as curve_simplify
+    from skimage.measure import find_contours
 except ImportError:
-    pass
+    find_contours = None
 
-from mathutils import (
-    Euler,
-    Vector,
-)
+from mathutils import Euler
 
 from .async_utils import progress_async
+from .cache_utils import (
+    load_cached_image,
+    offset_image_key,
+    save_cached_image,
+    z_buffer_key,
+)
 from ..chunk_builder import CamPathChunkBuilder
 from .logging_utils import log
 from .operation_utils import get_cutter_array
@@ -212,6 +216,280 @@ def _offset_inner_loop(y1, y2, cutterArrayNan, cwidth, sourceArray, width, heigh
             )
 
 
+def _sliding_max(a, length):
+    """Running maximum over windows of a given length along the second axis.
+
+    Van Herk/Gil-Werman algorithm - prefix and suffix maxima of blocks the size
+    of the window, so the cost doesn't depend on the window length. NaN values
+    are ignored, like in np.nanmax.
+
+    Args:
+        a (numpy.ndarray): A 2D array.
+        length (int): The window length.
+
+    Returns:
+        numpy.ndarray: Array where [x, y] is the maximum of a[x, y : y + length].
+    """
+
+    width, height = a.shape
+    blocks = -(-height // length)
+    padded = np.full((width, blocks * length), np.nan)
+    padded[:, :height] = a
+    padded = padded.reshape(width, blocks, length)
+    prefix = np.fmax.accumulate(padded, axis=2).reshape(width, -1)
+    suffix = np.fmax.accumulate(padded[:, :, ::-1], axis=2)[:, :, ::-1].reshape(width, -1)
+    count = height - length + 1
+    return np.fmax(suffix[:, :count], prefix[:, length - 1 : length - 1 + count])
+
+
+def _cutter_rows(cutterArrayNan):
+    """Get the span of every row of the cutter.
+
+    Args:
+        cutterArrayNan (numpy.ndarray): Cutter array, NaN outside of the cutter.
+
+    Returns:
+        list: (row, first, last) column of the cutter in every non-empty row, or None
+            if some row of the cutter isn't one continuous span.
+    """
+
+    rows = []
+    for i, row in enumerate(cutterArrayNan):
+        columns = np.flatnonzero(~np.isnan(row))
+        if len(columns) == 0:
+            continue
+        if columns[-1] - columns[0] + 1 != len(columns):
+            return None
+        rows.append((i, columns[0], columns[-1]))
+    return rows
+
+
+def _is_concave(profile):
+    # cutter lengths are single precision Vector lengths, allow for their rounding
+    tolerance = 1e-6 * np.max(np.abs(profile))
+    return len(profile) < 3 or np.all(np.diff(profile, 2) <= tolerance)
+
+
+# each row of a radially symmetric cutter is a concave profile, so the best position
+# of the profile over the source moves monotonically along the row, and the maxima
+# can be found with divide and conquer instead of testing every position
+@jit(nopython=True, parallel=True, fastmath=False, cache=True)
+def _offset_concave_rows(sourceArray, profile, row_offset, column_offset, comparearea):
+    rows = comparearea.shape[0]
+    count = comparearea.shape[1]
+    length = profile.shape[0]
+
+    for x in prange(rows):
+        line = sourceArray[x + row_offset, column_offset:]
+        # stack of (first y, last y, first candidate, last candidate)
+        stack = np.empty((128, 4), dtype=np.int64)
+        stack[0, 0] = 0
+        stack[0, 1] = count - 1
+        stack[0, 2] = 0
+        stack[0, 3] = count + length - 2
+        top = 1
+
+        while top > 0:
+            top -= 1
+            y1 = stack[top, 0]
+            y2 = stack[top, 1]
+            t1 = stack[top, 2]
+            t2 = stack[top, 3]
+            if y1 > y2:
+                continue
+
+            y = (y1 + y2) // 2
+            best = np.nan
+            best_t = -1
+            for t in range(max(t1, y), min(t2, y + length - 1) + 1):
+                value = line[t] + profile[t - y]
+                if value > best or (best_t == -1 and not np.isnan(value)):
+                    best = value
+                    best_t = t
+
+            if best_t != -1:
+                current = comparearea[x, y]
+                if np.isnan(current) or best > current:
+                    comparearea[x, y] = best
+                left = best_t
+                right = best_t
+            else:
+                left = t2
+                right = t1
+
+            stack[top, 0] = y1
+            stack[top, 1] = y - 1
+            stack[top, 2] = t1
+            stack[top, 3] = left
+            stack[top + 1, 0] = y + 1
+            stack[top + 1, 1] = y2
+            stack[top + 1, 2] = right
+            stack[top + 1, 3] = t2
+            top += 2
+
+
+def use_tiled_images(o, resolution_x, resolution_y):
+    """Check if the images of an operation should be processed in tiles.
+
+    Args:
+        o (object): The operation.
+        resolution_x (int): Image width in pixels.
+        resolution_y (int): Image height in pixels.
+
+    Returns:
+        bool: True if tiled processing is enabled and the image exceeds the limit.
+    """
+
+    limit = o.optimisation.imgres_limit * 1000000
+    return o.optimisation.use_tiles and resolution_x * resolution_y > limit
+
+
+def get_tile_size(o):
+    """Get the side of a square tile that fits into the image resolution limit.
+
+    Args:
+        o (object): The operation.
+
+    Returns:
+        int: Tile size in pixels.
+    """
+
+    return int(sqrt(o.optimisation.imgres_limit * 1000000))
+
+
+def image_tiles(size_x, size_y, tile_size):
+    """Split an image area into tiles.
+
+    Args:
+        size_x (int): Area width in pixels.
+        size_y (int): Area height in pixels.
+        tile_size (int): Maximum tile side in pixels.
+
+    Returns:
+        list: (start x, end x, start y, end y) of every tile.
+    """
+
+    return [
+        (x, min(x + tile_size, size_x), y, min(y + tile_size, size_y))
+        for x in range(0, size_x, tile_size)
+        for y in range(0, size_y, tile_size)
+    ]
+
+
+def open_image_cache(filename, shape, fill_value=None):
+    """Open a memory mapped .npy image, so large images don't have to fit in memory.
+
+    Args:
+        filename (str): Path of the .npy file.
+        shape (tuple): Shape of the image - if the file doesn't have this shape, it is
+            created again.
+        fill_value (float, optional): Value to fill a newly created image with.
+
+    Returns:
+        numpy.memmap: The image, or None if it doesn't exist and fill_value is None.
+    """
+
+    if os.path.isfile(filename):
+        image = np.lib.format.open_memmap(filename, mode="r+")
+        if image.shape == tuple(shape) and fill_value is None:
+            return image
+        del image
+
+    if fill_value is None:
+        return None
+
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    image = np.lib.format.open_memmap(filename, mode="w+", dtype=np.double, shape=tuple(shape))
+    image[:] = fill_value
+    return image
+
+
+def _offset_method(o, cutterArrayNan):
+    """Pick the fastest offset method the cutter allows, all give the same result.
+
+    Args:
+        o (object): The operation.
+        cutterArrayNan (numpy.ndarray): Cutter array, NaN outside of the cutter.
+
+    Returns:
+        tuple: Method name and the spans of the cutter rows.
+    """
+
+    rows = _cutter_rows(cutterArrayNan) if o.cutter_type != "CUSTOM" else None
+    if rows is not None and o.cutter_type == "END":
+        method = "FLAT"
+    elif rows is not None and all(
+        _is_concave(cutterArrayNan[i, first : last + 1]) for i, first, last in rows
+    ):
+        method = "CONCAVE"
+    else:
+        method = "DIRECT"
+    log.info(f"Offset Method: {method}")
+    return method, rows
+
+
+async def _offset_block(sourceArray, cutterArrayNan, method, rows, comparearea, text):
+    """Offset one block of the source image into comparearea.
+
+    Args:
+        sourceArray (numpy.ndarray): Source image, larger than comparearea by the cutter width.
+        cutterArrayNan (numpy.ndarray): Cutter array, NaN outside of the cutter.
+        method (str): Method from _offset_method.
+        rows (list): Cutter row spans from _offset_method.
+        comparearea (numpy.ndarray): Output array, filled in place.
+        text (str): Progress text.
+    """
+
+    cwidth = len(cutterArrayNan)
+    width = len(sourceArray)
+    height = len(sourceArray[0])
+
+    if method == "FLAT":
+        # the flat cutter is a disc - for each row of the disc, take the running
+        # maximum of the source over the row length, then shift it in place
+        comparearea[:] = np.nan
+        rows_cols = comparearea.shape
+        lengths = sorted(set(last - first + 1 for i, first, last in rows))
+        for n, length in enumerate(lengths):
+            row_max = _sliding_max(sourceArray, length)
+            for i, first, last in rows:
+                if last - first + 1 == length:
+                    np.fmax(
+                        comparearea,
+                        row_max[i : i + rows_cols[0], first : first + rows_cols[1]],
+                        out=comparearea,
+                    )
+            await progress_async(text, int(((n + 1) * 100) / len(lengths)))
+
+    elif method == "CONCAVE":
+        comparearea[:] = np.nan
+        for n, (i, first, last) in enumerate(rows):
+            _offset_concave_rows(
+                sourceArray,
+                np.ascontiguousarray(cutterArrayNan[i, first : last + 1]),
+                i,
+                first,
+                comparearea,
+            )
+            await progress_async(text, int(((n + 1) * 100) / len(rows)))
+
+    else:
+        for y in range(0, 10):
+            y1 = (y * comparearea.shape[1]) // 10
+            y2 = ((y + 1) * comparearea.shape[1]) // 10
+            _offset_inner_loop(
+                y1,
+                y2,
+                cutterArrayNan,
+                cwidth,
+                sourceArray,
+                width,
+                height,
+                comparearea,
+            )
+            await progress_async(text, int((y2 * 100) / comparearea.shape[1]))
+
+
 async def offset_area(o, samples):
     """Offsets the whole image with the cutter and skin offsets.
 
@@ -220,7 +498,9 @@ async def offset_area(o, samples):
     arrays, initializes an offset image, and processes the image in
     segments. The function handles the inversion of the source array if
     specified and updates the offset image accordingly. Progress is reported
-    asynchronously during processing.
+    asynchronously during processing. With tiled processing, images over the
+    resolution limit are offset in tiles overlapping by the cutter radius, and
+    the result is memory mapped from the cache folder.
 
     Args:
         o: An object containing properties such as `update_offset_image_tag`,
@@ -239,40 +519,54 @@ async def offset_area(o, samples):
         width = len(sourceArray)
         height = len(sourceArray[0])
         cwidth = len(cutterArray)
-        o.offset_image = np.full(shape=(width, height), fill_value=-10.0, dtype=np.double)
 
         t = time.time()
         m = int(cwidth / 2.0)
 
-        if o.inverse:
-            sourceArray = -sourceArray + minz
-        comparearea = o.offset_image[
-            m : width - cwidth + m,
-            m : height - cwidth + m,
-        ]
         cutterArrayNan = np.where(
             cutterArray > -10, cutterArray, np.full(cutterArray.shape, np.nan)
         )
+        method, rows = _offset_method(o, cutterArrayNan)
 
-        for y in range(0, 10):
-            y1 = (y * comparearea.shape[1]) // 10
-            y2 = ((y + 1) * comparearea.shape[1]) // 10
-            _offset_inner_loop(
-                y1,
-                y2,
-                cutterArrayNan,
-                cwidth,
-                sourceArray,
-                width,
-                height,
-                comparearea,
+        if use_tiled_images(o, width, height):
+            # tiles overlap by the cutter radius on each side, the result goes to disk
+            o.offset_image = open_image_cache(
+                get_cache_path(o) + "_off.npy", (width, height), fill_value=-10.0
             )
-            await progress_async("Offset Depth Image", int((y2 * 100) / comparearea.shape[1]))
+            tiles = image_tiles(width - cwidth, height - cwidth, get_tile_size(o))
+            for n, (x1, x2, y1, y2) in enumerate(tiles):
+                tile = np.array(sourceArray[x1 : x2 + cwidth, y1 : y2 + cwidth])
+                if o.inverse:
+                    tile = -np.maximum(tile, minz - 0.00001) + minz
+                comparearea = np.empty((x2 - x1, y2 - y1))
+                await _offset_block(
+                    tile,
+                    cutterArrayNan,
+                    method,
+                    rows,
+                    comparearea,
+                    f"Offset Depth Image Tile {n + 1}/{len(tiles)}",
+                )
+                o.offset_image[m + x1 : m + x2, m + y1 : m + y2] = comparearea
+            o.offset_image.flush()
+
+        else:
+            o.offset_image = np.full(shape=(width, height), fill_value=-10.0, dtype=np.double)
 
-        o.offset_image[
-            m : width - cwidth + m,
-            m : height - cwidth + m,
-        ] = comparearea
+            if o.inverse:
+                sourceArray = -np.maximum(sourceArray, minz - 0.00001) + minz
+            comparearea = o.offset_image[
+                m : width - cwidth + m,
+                m : height - cwidth + m,
+            ]
+            await _offset_block(
+                sourceArray, cutterArrayNan, method, rows, comparearea, "Offset Depth Image"
+            )
+
+            o.offset_image[
+                m : width - cwidth + m,
+                m : height - cwidth + m,
+            ] = comparearea
 
         log.info(f"\nOffset Image Time: {time.time() - t}")
 
@@ -280,47 +574,46 @@ async def offset_area(o, samples):
     return o.offset_image
 
 
-def get_sample_image(s, sarray, minz):
-    """Get a sample image value from a 2D array based on given coordinates.
+def get_sample_image_array(coords, sarray, minz):
+    """Get interpolated values for many coordinates of a 2D array at once.
 
-    This function retrieves a value from a 2D array by performing bilinear
-    interpolation based on the provided coordinates. It checks if the
-    coordinates are within the bounds of the array and calculates the
-    interpolated value accordingly. If the coordinates are out of bounds, it
-    returns -10.
+    Samples a whole chunk of points with bilinear interpolation in a single
+    call. Points that fall outside of the array get -10.
 
     Args:
-        s (tuple): A tuple containing the x and y coordinates (float).
+        coords (numpy.ndarray): An (N, 2) array of x and y coordinates in pixels.
         sarray (numpy.ndarray): A 2D array from which to sample the image values.
         minz (float): A minimum threshold value (not used in the current implementation).
 
     Returns:
-        float: The interpolated value from the 2D array, or -10 if the coordinates are
-            out of bounds.
+        numpy.ndarray: The interpolated values, -10 where the coordinates are out of bounds.
     """
 
-    x = s[0]
-    y = s[1]
-    if (x < 0 or x > len(sarray) - 1) or (y < 0 or y > len(sarray[0]) - 1):
-        return -10
-    else:
-        minx = floor(x)
-        maxx = minx + 1
-        miny = floor(y)
-        maxy = miny + 1
-        s1a = sarray[minx, miny]
-        s2a = sarray[maxx, miny]
-        s1b = sarray[minx, maxy]
-        s2b = sarray[maxx, maxy]
-        # s1a = sarray.item(minx, miny)  # most optimal access to array so far
-        # s2a = sarray.item(maxx, miny)
-        # s1b = sarray.item(minx, maxy)
-        # s2b = sarray.item(maxx, maxy)
-
-        sa = s1a * (maxx - x) + s2a * (x - minx)
-        sb = s1b * (maxx - x) + s2b * (x - minx)
-        z = sa * (maxy - y) + sb * (y - miny)
-        return z
+    x = coords[:, 0]
+    y = coords[:, 1]
+    width = len(sarray)
+    height = len(sarray[0])
+    inside = (x >= 0) & (x <= width - 1) & (y >= 0) & (y <= height - 1)
+    z = np.full(len(coords), -10.0)
+
+    x = x[inside]
+    y = y[inside]
+    minx = np.floor(x).astype(np.int64)
+    maxx = minx + 1
+    miny = np.floor(y).astype(np.int64)
+    maxy = miny + 1
+    # points on the last row or column get zero weight for the next one
+    maxx_index = np.minimum(maxx, width - 1)
+    maxy_index = np.minimum(maxy, height - 1)
+    s1a = sarray[minx, miny]
+    s2a = sarray[maxx_index, miny]
+    s1b = sarray[minx, maxy_index]
+    s2b = sarray[maxx_index, maxy_index]
+
+    sa = s1a * (maxx - x) + s2a * (x - minx)
+    sb = s1b * (maxx - x) + s2b * (x - minx)
+    z[inside] = sa * (maxy - y) + sb * (y - miny)
+    return z
 
 
 def get_resolution(o):
@@ -464,8 +757,13 @@ def render_sample_image(o):
 
         # Setup Image name
         image_name = get_cache_path(o) + "_z.exr"
+        tiled = use_tiled_images(o, resolution_x, resolution_y)
 
-        if static_z_buffer:
+        if static_z_buffer and tiled:
+            zbuffer = open_image_cache(get_cache_path(o) + "_z.npy", (resolution_x, resolution_y))
+            if zbuffer is None:
+                o.update_z_buffer_image_tag = True
+        elif static_z_buffer:
             try:
                 i = bpy.data.images.load(image_name)
                 image_size_x = i.size[0]
@@ -477,6 +775,17 @@ def render_sample_image(o):
             except:
                 o.update_z_buffer_image_tag = True
 
+        # other operations, or earlier versions of this one may have rendered the same z-buffer
+        cache_key = None
+        if o.update_z_buffer_image_tag and not tiled:
+            cache_key = z_buffer_key(o, resolution_x, resolution_y)
+            cached = load_cached_image(cache_key)
+            if cached is not None and cached.shape == (resolution_x, resolution_y):
+                o.zbuffer_image = cached
+                o.update_z_buffer_image_tag = False
+                progress(time.time() - t)
+                return o.zbuffer_image
+
         if o.update_z_buffer_image_tag:
             blender_version = int(bpy.app.version_string[0])
             scene = bpy.context.scene
@@ -563,11 +872,21 @@ def render_sample_image(o):
                 mist_settings.intensity = 0
 
                 # resize operation image
-                o.offset_image = np.full(
-                    shape=(resolution_x, resolution_y),
-                    fill_value=-10,
-                    dtype=np.double,
-                )
+                if tiled:
+                    o.offset_image = np.array([], dtype=float)
+                    zbuffer = open_image_cache(
+                        get_cache_path(o) + "_z.npy",
+                        (resolution_x, resolution_y),
+                        fill_value=-10.0,
+                    )
+                    tiles = image_tiles(resolution_x, resolution_y, get_tile_size(o))
+                else:
+                    o.offset_image = np.full(
+                        shape=(resolution_x, resolution_y),
+                        fill_value=-10,
+                        dtype=np.double,
+                    )
+                    tiles = [(0, resolution_x, 0, resolution_y)]
 
                 # Add a Camera and settings
                 bpy.ops.object.camera_add(
@@ -579,15 +898,6 @@ def render_sample_image(o):
                 camera = bpy.context.active_object
                 bpy.context.scene.camera = camera
                 camera.data.type = "ORTHO"
-                camera.data.ortho_scale = max(
-                    resolution_x * pixsize,
-                    resolution_y * pixsize,
-                )
-                camera.location = (
-                    o.min.x + size_x / 2,
-                    o.min.y + size_y / 2,
-                    1,
-                )
                 camera.rotation_euler = (0, 0, 0)
                 camera.data.clip_end = 10.0
 
@@ -596,7 +906,27 @@ def render_sample_image(o):
                 for ob in o.objects:
                     ob.hide_render = False
 
-                bpy.ops.render.render()
+                for n, (x1, x2, y1, y2) in enumerate(tiles):
+                    # the camera is moved over each tile, keeping the pixel grid of the whole image
+                    render.resolution_x = x2 - x1
+                    render.resolution_y = y2 - y1
+                    camera.data.ortho_scale = max(
+                        (x2 - x1) * pixsize,
+                        (y2 - y1) * pixsize,
+                    )
+                    camera.location = (
+                        o.min.x + size_x / 2 + ((x1 + x2 - resolution_x) / 2) * pixsize,
+                        o.min.y + size_y / 2 + ((y1 + y2 - resolution_y) / 2) * pixsize,
+                        1,
+                    )
+
+                    bpy.ops.render.render()
+
+                    if tiled:
+                        progress(f"Z-Buffer Tile {n + 1}/{len(tiles)}")
+                        tile_image = bpy.data.images.load(image_name)
+                        zbuffer[x1:x2, y1:y2] = 1.0 - 10.0 * image_to_numpy(tile_image)
+                        bpy.data.images.remove(tile_image)
 
                 # if blender_version < 5:
                 #     node_tree.nodes.remove(node_out)
@@ -613,16 +943,23 @@ def render_sample_image(o):
                 else:
                     log.info("Failed to Backup Scene Settings")
 
-            i = bpy.data.images.load(image_name)
-            print(f"Image load: {image_name}")
+            if not tiled:
+                i = bpy.data.images.load(image_name)
+                print(f"Image load: {image_name}")
             bpy.context.scene.render.engine = "FABEX_RENDER"
 
         ####################################################################
 
-        image_array = image_to_numpy(i)
-        image_array = 10.0 * image_array
-        image_array = 1.0 - image_array
-        o.zbuffer_image = image_array
+        if tiled:
+            zbuffer.flush()
+            o.zbuffer_image = zbuffer
+        else:
+            image_array = image_to_numpy(i)
+            image_array = 10.0 * image_array
+            image_array = 1.0 - image_array
+            o.zbuffer_image = image_array
+            if cache_key is not None:
+                save_cached_image(cache_key, image_array)
         o.update_z_buffer_image_tag = False
 
     else:
@@ -731,20 +1068,34 @@ async def prepare_area(o):
     render_sample_image(o)
     samples = o.zbuffer_image
 
-    iname = get_cache_path(o) + "_off.exr"
+    tiled = use_tiled_images(o, len(samples), len(samples[0]))
+    iname = get_cache_path(o) + ("_off.npy" if tiled else "_off.exr")
 
     if not o.update_offset_image_tag:
         progress("Loading Offset Image")
         try:
-            o.offset_image = image_to_numpy(bpy.data.images.load(iname))
+            if tiled:
+                o.offset_image = open_image_cache(iname, samples.shape)
+                if o.offset_image is None:
+                    o.update_offset_image_tag = True
+            else:
+                o.offset_image = image_to_numpy(bpy.data.images.load(iname))
         except:
             o.update_offset_image_tag = True
 
-    if o.update_offset_image_tag:
-        if o.inverse:
-            samples = np.maximum(samples, o.min.z - 0.00001)
+    if o.update_offset_image_tag and not tiled:
+        cache_key = offset_image_key(o, samples, get_cutter_array(o, o.optimisation.pixsize))
+        cached = load_cached_image(cache_key)
+        if cached is not None:
+            o.offset_image = cached
+            o.update_offset_image_tag = False
+        else:
+            await offset_area(o, samples)
+            numpy_save(o.offset_image, iname)
+            save_cached_image(cache_key, o.offset_image)
+
+    elif o.update_offset_image_tag:
         await offset_area(o, samples)
-        numpy_save(o.offset_image, iname)
 
 
 # search edges for pencil strategy, another try.
@@ -950,12 +1301,128 @@ def get_offset_image_cavities(o, i):  # for pencil operation mainly
     return chunks
 
 
+@jit(nopython=True, cache=True)
+def _chain_contour_segments(following, incoming):
+    """Chain contour segments into polylines.
+
+    Args:
+        following (numpy.ndarray): Index of the point each segment goes to,
+            -1 for the last point of an open contour.
+        incoming (numpy.ndarray): True for points that a segment goes to.
+
+    Returns:
+        tuple: Point indices of all contours one after another, closed
+            contours repeat their first point, and the start of each contour
+            in them, followed by their total count.
+    """
+    count = len(following)
+    order = np.empty(2 * count, dtype=np.int64)
+    starts = np.empty(count + 1, dtype=np.int64)
+    visited = np.zeros(count, dtype=np.bool_)
+    length = 0
+    contours = 0
+    # open contours start at the image border, the rest are loops
+    for loops in range(2):
+        for start in range(count):
+            if visited[start] or (loops == 0 and incoming[start]):
+                continue
+            starts[contours] = length
+            contours += 1
+            i = start
+            while i != -1 and not visited[i]:
+                visited[i] = True
+                order[length] = i
+                length += 1
+                i = following[i]
+            if i == start:
+                order[length] = start
+                length += 1
+    starts[contours] = length
+    return order[:length], starts[: contours + 1]
+
+
+def trace_image_contours(image):
+    """Find the outlines of the True areas of a boolean image.
+
+    The outlines are marching squares contours, which go through the middle
+    of the pixel edges between True and False pixels, and connect diagonal
+    True pixels. They are oriented so the True pixels are on the left,
+    islands are counterclockwise and holes are clockwise. Contours that
+    reach the image border are left open, all others are closed and end
+    with their first point. Uses scikit-image if it is installed, otherwise
+    only chaining the segments runs in a loop, compiled with numba.
+
+    Args:
+        image (numpy.ndarray): 2D boolean array, indexed by x and y pixel.
+
+    Returns:
+        list: (N, 2) arrays of x, y pixel coordinates of each contour.
+    """
+    image = np.asarray(image, dtype=bool)
+    if min(image.shape) < 2:
+        return []
+
+    if find_contours is not None:
+        # rows and columns are x and y, so positive orientation is counterclockwise
+        return find_contours(
+            image.astype(np.float32), 0.5, fully_connected="high", positive_orientation="high"
+        )
+
+    width, height = image.shape
+    # ids of the points between neighbours along x, then of those along y
+    y_start = (width - 1) * height
+    i, j = np.mgrid[0 : width - 1, 0 : height - 1]
+    edge_ids = (
+        i * height + j,
+        y_start + (i + 1) * (height - 1) + j,
+        i * height + j + 1,
+        y_start + i * (height - 1) + j,
+    )
+    # cell corners counterclockwise, edge k goes from corner k to corner k + 1
+    corners = (image[:-1, :-1], image[1:, :-1], image[1:, 1:], image[:-1, 1:])
+    crossing = [corners[k] != corners[(k + 1) % 4] for k in range(4)]
+
+    sources = []
+    targets = []
+    for k in range(4):
+        # the contour enters the cell where True changes to False going around,
+        # and leaves at the next crossed edge, keeping True on the left
+        enters = corners[k] & ~corners[(k + 1) % 4]
+        target = np.select(
+            [crossing[(k + 1) % 4], crossing[(k + 2) % 4]],
+            [edge_ids[(k + 1) % 4], edge_ids[(k + 2) % 4]],
+            edge_ids[(k + 3) % 4],
+        )
+        sources.append(edge_ids[k][enters])
+        targets.append(target[enters])
+    sources = np.concatenate(sources)
+    targets = np.concatenate(targets)
+    if len(sources) == 0:
+        return []
+
+    ids = np.union1d(sources, targets)
+    following = np.full(len(ids), -1, dtype=np.int64)
+    following[np.searchsorted(ids, sources)] = np.searchsorted(ids, targets)
+    incoming = np.zeros(len(ids), dtype=bool)
+    incoming[np.searchsorted(ids, targets)] = True
+    order, starts = _chain_contour_segments(following, incoming)
+
+    ids = ids[order]
+    along_y = ids >= y_start
+    points = np.empty((len(ids), 2))
+    points[~along_y, 0] = ids[~along_y] // height + 0.5
+    points[~along_y, 1] = ids[~along_y] % height
+    points[along_y, 0] = (ids[along_y] - y_start) // (height - 1)
+    points[along_y, 1] = (ids[along_y] - y_start) % (height - 1) + 0.5
+    return np.split(points, starts[1:-1])
+
+
 def image_to_chunks(o, image, with_border=False):
     """Convert an image into chunks based on detected edges.
 
-    This function processes a given image to identify edges and convert them
-    into polychunks, which are essentially collections of connected edge
-    segments. It utilizes the properties of the input object `o` to
+    This function traces the outlines of the image with
+    trace_image_contours and converts them into polychunks, simplified to
+    the pixel size. It utilizes the properties of the input object `o` to
     determine the boundaries and size of the chunks. The function can
     optionally include borders in the edge detection process. The output is
     a list of chunks that represent the detected polygons in the image.
@@ -973,178 +1440,36 @@ def image_to_chunks(o, image, with_border=False):
             points that outline the detected edges in the image.
     """
 
-    t = time.time()
-    minx, miny, minz, maxx, maxy, maxz = o.min.x, o.min.y, o.min.z, o.max.x, o.max.y, o.max.z
+    minx, miny = o.min.x, o.min.y
     pixsize = o.optimisation.pixsize
-    image = image.astype(np.uint8)
-    edges = []
-    ar = image[:, :-1] - image[:, 1:]
-    indices1 = ar.nonzero()
     borderspread = 2
     # when the border was excluded precisely, sometimes it did remove some silhouette parts
     r = o.borderwidth - borderspread
     # to prevent outline of the border was 3 before and also (o.cutter_diameter/2)/pixsize+o.borderwidth
     if with_border:
         r = 0
+    # outlines crossing the excluded border are cut open there
+    start = max(r + 1, 0)
     w = image.shape[0]
     h = image.shape[1]
-    coef = 0.75  # compensates for imprecisions
-
-    for id in range(0, len(indices1[0])):
-        a = indices1[0][id]
-        b = indices1[1][id]
-
-        if r < a < w - r and r < b < h - r:
-            edges.append(((a - 1, b), (a, b)))
-
-    ar = image[:-1, :] - image[1:, :]
-    indices2 = ar.nonzero()
-
-    for id in range(0, len(indices2[0])):
-        a = indices2[0][id]
-        b = indices2[1][id]
-
-        if r < a < w - r and r < b < h - r:
-            edges.append(((a, b - 1), (a, b)))
-
-    polychunks = []
-    d = {}
-
-    for e in edges:
-        d[e[0]] = []
-        d[e[1]] = []
-
-    for e in edges:
-        verts1 = d[e[0]]
-        verts2 = d[e[1]]
-        verts1.append(e[1])
-        verts2.append(e[0])
-
-    if len(edges) > 0:
-        ch = [edges[0][0], edges[0][1]]  # first and his reference
-        d[edges[0][0]].remove(edges[0][1])
-        i = 0
-        specialcase = 0
-
-        while len(d) > 0 and i < 20000000:
-            verts = d.get(ch[-1], [])
-            closed = False
-
-            if len(verts) <= 1:  # this will be good for not closed loops...some time
-                closed = True
-                if len(verts) == 1:
-                    ch.append(verts[0])
-                    verts.remove(verts[0])
-            elif len(verts) >= 3:
-                specialcase += 1
-                v1 = ch[-1]
-                v2 = ch[-2]
-                white = image[v1[0], v1[1]]
-                comesfromtop = v1[1] < v2[1]
-                comesfrombottom = v1[1] > v2[1]
-                comesfromleft = v1[0] > v2[0]
-                comesfromright = v1[0] < v2[0]
-                take = False
-
-                for v in verts:
-                    if v[0] == ch[-2][0] and v[1] == ch[-2][1]:
-                        verts.remove(v)
-
-                    if not take:
-                        if (not white and comesfromtop) or (white and comesfrombottom):
-                            # goes right
-                            if v1[0] + 0.5 < v[0]:
-                                take = True
-                        elif (not white and comesfrombottom) or (white and comesfromtop):
-                            # goes left
-                            if v1[0] > v[0] + 0.5:
-                                take = True
-                        elif (not white and comesfromleft) or (white and comesfromright):
-                            # goes down
-                            if v1[1] > v[1] + 0.5:
-                                take = True
-                        elif (not white and comesfromright) or (white and comesfromleft):
-                            # goes up
-                            if v1[1] + 0.5 < v[1]:
-                                take = True
-                        if take:
-                            ch.append(v)
-                            verts.remove(v)
-
-            else:  # here it has to be 2 always
-                done = False
-                for vi in range(len(verts) - 1, -1, -1):
-                    if not done:
-                        v = verts[vi]
-
-                        if v[0] == ch[-2][0] and v[1] == ch[-2][1]:
-                            verts.remove(v)
-                        else:
-                            ch.append(v)
-                            done = True
-                            verts.remove(v)
-                            # or len(verts)<=1:
-                            if v[0] == ch[0][0] and v[1] == ch[0][1]:
-                                closed = True
-
-            if closed:
-                polychunks.append(ch)
-
-                for si, s in enumerate(ch):
-                    if si > 0:  # first one was popped
-                        if d.get(s, None) is not None and len(d[s]) == 0:
-                            # this makes the case much less probable, but i think not impossible
-                            d.pop(s)
-                if len(d) > 0:
-                    newch = False
-
-                    while not newch:
-                        v1 = d.popitem()
-
-                        if len(v1[1]) > 0:
-                            ch = [v1[0], v1[1][0]]
-                            newch = True
-
-            i += 1
-
-            if i % 10000 == 0:
-                log.info(len(ch))
-                log.info(i)
-
-        vecchunks = []
-
-        for ch in polychunks:
-            vecchunk = []
-            vecchunks.append(vecchunk)
-
-            for i in range(0, len(ch)):
-                ch[i] = (
-                    (ch[i][0] + coef - o.borderwidth) * pixsize + minx,
-                    (ch[i][1] + coef - o.borderwidth) * pixsize + miny,
-                    0,
-                )
-                vecchunk.append(Vector(ch[i]))
-
-        reduxratio = 1.25  # was 1.25
-        soptions = [
-            "distance",
-            "distance",
-            o.optimisation.pixsize * reduxratio,
-            5,
-            o.optimisation.pixsize * reduxratio,
-        ]
-        nchunks = []
-
-        for i, ch in enumerate(vecchunks):
-            s = curve_simplify.simplify_RDP(ch, soptions)
-            nch = CamPathChunkBuilder([])
-
-            for i in range(0, len(s)):
-                nch.points.append((ch[s[i]].x, ch[s[i]].y))
-
-            if len(nch.points) > 2:
-                nchunks.append(nch.to_chunk())
-
-        return nchunks
-    else:
+    contours = trace_image_contours(image[start : w - max(r, 0), start : h - max(r, 0)])
+    if len(contours) == 0:
         return []
+
+    coef = 0.25  # compensates for imprecisions, contours go through the middle of pixel edges
+    points = (np.concatenate(contours) + start + coef - o.borderwidth) * pixsize + (minx, miny)
+    contour_index = np.repeat(np.arange(len(contours)), [len(c) for c in contours])
+    reduxratio = 1.25  # was 1.25
+    lines = shapely.simplify(
+        shapely.linestrings(points, indices=contour_index),
+        pixsize * reduxratio,
+        preserve_topology=False,
+    )
+    coordinates, line_index = shapely.get_coordinates(lines, return_index=True)
+    ends = np.cumsum(np.bincount(line_index, minlength=len(contours)))
+
+    nchunks = []
+    for chunk_points in np.split(coordinates, ends[:-1]):
+        if len(chunk_points) > 2:
+            nchunks.append(CamPathChunkBuilder(chunk_points).to_chunk())
+    return nchunks
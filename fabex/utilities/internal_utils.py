@@ -1,4 +1,5 @@
 from math import (
+    acos,
     cos,
     sqrt,
 )
@@ -85,3 +86,480 @@ def _optimize_internal(points, keep_points, e, protect_vertical, protect_vertica
             if protect_vertical:
                 _applyVerticalLimit(points[prev_i], points[i], cos_limit)
             prev_i = i
+
+
+# the active chunk of every layer is kept as a linked list in one pool of points,
+# so the insert(-1) / insert(0) behaviour of CamPathChunkBuilder.points lists is
+# reproduced without moving any data
+@jit(nopython=True, fastmath=False, cache=True)
+def _split_layers_internal(
+    samples, layers, sample_layers, capacity, protect_vertical, protect_vertical_limit
+):
+    def _add(pool, next_node, used, x, y, z):
+        node = used[0]
+        used[0] += 1
+        pool[node, 0] = x
+        pool[node, 1] = y
+        pool[node, 2] = z
+        next_node[node] = -1
+        return node
+
+    def _append(state, pool, next_node, used, j, x, y, z):
+        # state columns: head, tail, node before tail, length
+        node = _add(pool, next_node, used, x, y, z)
+        if state[j, 3] == 0:
+            state[j, 0] = node
+            state[j, 2] = -1
+        else:
+            next_node[state[j, 1]] = node
+            state[j, 2] = state[j, 1]
+        state[j, 1] = node
+        state[j, 3] += 1
+
+    def _insert_before_last(state, pool, next_node, used, j, x, y, z):
+        if state[j, 3] == 0:
+            _append(state, pool, next_node, used, j, x, y, z)
+            return
+        node = _add(pool, next_node, used, x, y, z)
+        next_node[node] = state[j, 1]
+        if state[j, 2] == -1:
+            state[j, 0] = node
+        else:
+            next_node[state[j, 2]] = node
+        state[j, 2] = node
+        state[j, 3] += 1
+
+    def _insert_first(state, pool, next_node, used, j, x, y, z):
+        if state[j, 3] == 0:
+            _append(state, pool, next_node, used, j, x, y, z)
+            return
+        node = _add(pool, next_node, used, x, y, z)
+        next_node[node] = state[j, 0]
+        if state[j, 3] == 1:
+            state[j, 2] = node
+        state[j, 0] = node
+        state[j, 3] += 1
+
+    n = samples.shape[0]
+    m = layers.shape[0]
+    cos_limit = cos(protect_vertical_limit)
+
+    pool = np.empty((capacity, 3))
+    next_node = np.empty(capacity, dtype=np.int64)
+    used = np.zeros(1, dtype=np.int64)
+    state = np.zeros((m, 4), dtype=np.int64)
+    state[:, 0:3] = -1
+
+    chunk_layers = np.empty(capacity, dtype=np.int64)
+    chunk_heads = np.empty(capacity, dtype=np.int64)
+    chunk_lengths = np.empty(capacity, dtype=np.int64)
+    chunk_count = 0
+
+    for k in range(n):
+        x = samples[k, 0]
+        y = samples[k, 1]
+        z = samples[k, 2]
+        for i in range(m):
+            top = layers[i, 0]
+            bottom = layers[i, 1]
+            terminate = False
+            if bottom <= z <= top:
+                last_layer = sample_layers[k - 1] if k > 0 else -1
+                if last_layer != -1 and last_layer != i:
+                    growing = i < last_layer
+                    first = min(i, last_layer)
+                    stop = max(i, last_layer)
+
+                    v1x = samples[k - 1, 0]
+                    v1y = samples[k - 1, 1]
+                    v1z = samples[k - 1, 2]
+                    v2x = x
+                    v2y = y
+                    v2z = z
+                    if protect_vertical:
+                        dz = abs(v1z - v2z)
+                        if dz > 0:
+                            length = sqrt((v1x - v2x) ** 2 + (v1y - v2y) ** 2 + dz**2)
+                            if dz > cos_limit * length:
+                                if v1z > v2z:
+                                    v1x = v2x
+                                    v1y = v2y
+                                else:
+                                    v2x = v1x
+                                    v2y = v1y
+
+                    # match the single precision of mathutils.Vector
+                    f1x = np.float32(v1x)
+                    f1y = np.float32(v1y)
+                    f1z = np.float32(v1z)
+                    f2x = np.float32(v2x)
+                    f2y = np.float32(v2y)
+                    f2z = np.float32(v2z)
+
+                    li = 0
+                    for ls in range(first, stop):
+                        split_z = layers[ls, 1]
+                        dz = np.float64(f2z) - np.float64(f1z)
+                        if abs(dz) < 1e-8:
+                            continue
+                        ratio = np.float32((split_z - np.float64(f1z)) / dz)
+                        bx = np.float64(f1x + (f2x - f1x) * ratio)
+                        by = np.float64(f1y + (f2y - f1y) * ratio)
+                        bz = np.float64(f1z + (f2z - f1z) * ratio)
+
+                        if growing:
+                            if li > 0:
+                                _insert_before_last(state, pool, next_node, used, ls, bx, by, bz)
+                            else:
+                                _append(state, pool, next_node, used, ls, bx, by, bz)
+                            _append(state, pool, next_node, used, ls + 1, bx, by, bz)
+                        else:
+                            _insert_before_last(state, pool, next_node, used, ls, bx, by, bz)
+                            _insert_first(state, pool, next_node, used, ls + 1, bx, by, bz)
+                        li += 1
+
+                _append(state, pool, next_node, used, i, x, y, z)
+            elif bottom > z:
+                _append(state, pool, next_node, used, i, x, y, bottom)
+            elif top < z:
+                terminate = True
+
+            if terminate and state[i, 3] > 0:
+                chunk_layers[chunk_count] = i
+                chunk_heads[chunk_count] = state[i, 0]
+                chunk_lengths[chunk_count] = state[i, 3]
+                chunk_count += 1
+                state[i, 0:3] = -1
+                state[i, 3] = 0
+
+    for i in range(m):
+        if state[i, 3] > 0:
+            chunk_layers[chunk_count] = i
+            chunk_heads[chunk_count] = state[i, 0]
+            chunk_lengths[chunk_count] = state[i, 3]
+            chunk_count += 1
+
+    # gather the linked lists into one contiguous array
+    chunk_starts = np.zeros(chunk_count + 1, dtype=np.int64)
+    for c in range(chunk_count):
+        chunk_starts[c + 1] = chunk_starts[c] + chunk_lengths[c]
+    points = np.empty((chunk_starts[chunk_count], 3))
+    for c in range(chunk_count):
+        node = chunk_heads[c]
+        for p in range(chunk_starts[c], chunk_starts[c + 1]):
+            points[p] = pool[node]
+            node = next_node[node]
+
+    return points, chunk_layers[:chunk_count].copy(), chunk_starts
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _sim_stamp_internal(si, cutter, xs, ys, z, get_volume):
+    m = cutter.shape[0] // 2
+    size = cutter.shape[0]
+    if not (-m < xs < si.shape[0] + m and -m < ys < si.shape[1] + m):
+        return 0.0
+
+    # clip the cutter to the image, for extra large cutters
+    startx = max(0, xs - m)
+    starty = max(0, ys - m)
+    endx = min(si.shape[0], xs - m + size)
+    endy = min(si.shape[1], ys - m + size)
+
+    volume = 0.0
+    for a in range(startx, endx):
+        for b in range(starty, endy):
+            h = cutter[a - xs + m, b - ys + m] + z
+            if h < si[a, b]:
+                if get_volume:
+                    volume += si[a, b] - h
+                si[a, b] = h
+    return volume
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _simulate_path_internal(
+    co,
+    start,
+    end,
+    si,
+    cutter,
+    minx,
+    miny,
+    maxz,
+    detail,
+    borderwidth,
+    get_volume,
+    position,
+    loads,
+    lengths,
+):
+    # position holds the last stamped pixel, so the path can be simulated in batches
+    xs = position[0]
+    ys = position[1]
+
+    for i in range(max(start, 1), end):
+        # the first segment starts from the second vertex, like the original simulation
+        p = i - 1 if i > 1 else 1
+        lx = co[p, 0]
+        ly = co[p, 1]
+        lz = co[p, 2]
+        vx = co[i, 0] - lx
+        vy = co[i, 1] - ly
+        vz = co[i, 2] - lz
+        l = sqrt(vx * vx + vy * vy + vz * vz)
+        lengths[i] = l
+        volume = 0.0
+
+        # only simulate inside material, and exclude lift-ups
+        if (lz < maxz or co[i, 2] < maxz) and not (vx == 0 and vy == 0 and vz > 0):
+            # if the cutter goes straight down, we don't have to interpolate
+            if not (vx == 0 and vy == 0 and vz < 0) and l > detail:
+                lastxs = xs
+                lastys = ys
+                d = detail
+                while d < l:
+                    f = d / l
+                    xs = int((lx + vx * f - minx) / detail + borderwidth + detail / 2)
+                    ys = int((ly + vy * f - miny) / detail + borderwidth + detail / 2)
+                    if lastxs != xs or lastys != ys:
+                        volume += _sim_stamp_internal(si, cutter, xs, ys, lz + vz * f, get_volume)
+                        lastxs = xs
+                        lastys = ys
+                    d += detail
+
+            xs = int((co[i, 0] - minx) / detail + borderwidth + detail / 2)
+            ys = int((co[i, 1] - miny) / detail + borderwidth + detail / 2)
+            volume += _sim_stamp_internal(si, cutter, xs, ys, co[i, 2], get_volume)
+
+        loads[i] = volume / l if l > 0 else 0.0
+
+    position[0] = xs
+    position[1] = ys
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _smooth_loads_internal(x, y, passes):
+    # smoothing, but only backward - weights carry over where neighbours share x
+    n = len(y)
+    x = x.astype(np.float64)
+    xcoef = x[n - 1] / n
+    nvals = np.empty(n)
+    for a in range(passes):
+        val1 = 0.0
+        val2 = 0.0
+        w1 = 0.0
+        w2 = 0.0
+        for i in range(n):
+            val = np.float64(y[i])
+            if i > 1:
+                val1 = np.float64(y[i - 1])
+                if x[i - 1] - x[i] != 0:
+                    w1 = 1 / (abs(x[i - 1] - x[i]) / xcoef)
+            if i < n - 1:
+                val2 = np.float64(y[i + 1])
+                if x[i + 1] - x[i] != 0:
+                    w2 = 1 / (abs(x[i + 1] - x[i]) / xcoef)
+            nvals[i] = (val + val1 * w1 + val2 * w2) / (1.0 + w1 + w2)
+        for i in range(n):
+            y[i] = nvals[i]
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _cutter_profile_height(profile, rho):
+    if rho <= profile[1]:
+        return 0.0
+    if rho <= profile[2]:
+        return profile[3] - sqrt(max(profile[3] * profile[3] - rho * rho, 0.0))
+    return (rho - profile[4]) * profile[6] + profile[5]
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _sweep_segment_internal(si, profile, p0, p1, minx, miny, detail, borderwidth, get_volume):
+    # lowers si to the lower envelope of the cutter swept from p0 to p1
+    radius = profile[0]
+    bx = p1[0] - p0[0]
+    by = p1[1] - p0[1]
+    dz = p1[2] - p0[2]
+    length = sqrt(bx * bx + by * by)
+    k = 0.0
+    if length > 0:
+        bx /= length
+        by /= length
+        k = dz / length
+
+    # pixel window around the segment, pixel centers are at (X + 0.5 - borderwidth) * detail
+    reach = radius / detail + 1
+    ux0 = (p0[0] - minx) / detail + borderwidth
+    uy0 = (p0[1] - miny) / detail + borderwidth
+    ux1 = (p1[0] - minx) / detail + borderwidth
+    uy1 = (p1[1] - miny) / detail + borderwidth
+    startx = max(0, int(min(ux0, ux1) - reach))
+    endx = min(si.shape[0], int(max(ux0, ux1) + reach) + 1)
+    starty = max(0, int(min(uy0, uy1) - reach))
+    endy = min(si.shape[1], int(max(uy0, uy1) + reach) + 1)
+
+    candidates = np.empty(8)
+    volume = 0.0
+    for a in range(startx, endx):
+        wx = minx + (a + 0.5 - borderwidth) * detail - p0[0]
+        for b in range(starty, endy):
+            wy = miny + (b + 0.5 - borderwidth) * detail - p0[1]
+
+            if length == 0:
+                # vertical move, the lowest point is at the bottom of the move
+                rho = sqrt(wx * wx + wy * wy)
+                if rho > radius:
+                    continue
+                z = min(p0[2], p1[2]) + _cutter_profile_height(profile, rho)
+
+            else:
+                # s is the position of the cutter along the segment, relative to the pixel,
+                # e the distance of the pixel from the segment line
+                along = wx * bx + wy * by
+                e2 = max(wx * wx + wy * wy - along * along, 0.0)
+                if e2 > radius * radius:
+                    continue
+                reach_s = sqrt(radius * radius - e2)
+                lo = max(-along, -reach_s)
+                hi = min(length - along, reach_s)
+                if lo > hi:
+                    continue
+
+                # the height is convex in s - its minimum is at an end, at a profile
+                # boundary, or where the sphere or the cone part is tangent to the move
+                n = 0
+                candidates[n] = lo
+                n += 1
+                candidates[n] = hi
+                n += 1
+                for boundary in (profile[1], profile[2]):
+                    if boundary >= 0 and boundary * boundary > e2:
+                        candidates[n] = sqrt(boundary * boundary - e2)
+                        candidates[n + 1] = -candidates[n]
+                        n += 2
+                if profile[2] >= 0 and profile[3] * profile[3] > e2:
+                    candidates[n] = -k * sqrt(profile[3] * profile[3] - e2) / sqrt(1 + k * k)
+                    n += 1
+                if profile[6] > abs(k):
+                    candidates[n] = -k * sqrt(e2) / sqrt(profile[6] * profile[6] - k * k)
+                    n += 1
+
+                z = np.inf
+                for c in range(n):
+                    s = min(max(candidates[c], lo), hi)
+                    zc = p0[2] + (s + along) * k + _cutter_profile_height(profile, sqrt(s * s + e2))
+                    z = min(z, zc)
+
+            if z < si[a, b]:
+                if get_volume:
+                    volume += si[a, b] - z
+                si[a, b] = z
+    return volume
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _simulate_swept_path_internal(
+    co,
+    start,
+    end,
+    si,
+    profile,
+    minx,
+    miny,
+    maxz,
+    detail,
+    borderwidth,
+    get_volume,
+    loads,
+    lengths,
+):
+    for i in range(max(start, 1), end):
+        # the first segment starts from the second vertex, like the stamping simulation
+        p = i - 1 if i > 1 else 1
+        vx = co[i, 0] - co[p, 0]
+        vy = co[i, 1] - co[p, 1]
+        vz = co[i, 2] - co[p, 2]
+        l = sqrt(vx * vx + vy * vy + vz * vz)
+        lengths[i] = l
+        volume = 0.0
+
+        # only simulate inside material, and exclude lift-ups
+        if (co[p, 2] < maxz or co[i, 2] < maxz) and not (vx == 0 and vy == 0 and vz > 0):
+            volume = _sweep_segment_internal(
+                si, profile, co[p], co[i], minx, miny, detail, borderwidth, get_volume
+            )
+
+        loads[i] = volume / l if l > 0 else 0.0
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _redundant_points_internal(co, tolerance):
+    # same greedy test as compare_utils.point_on_line, in the precision of mathutils vectors
+    n = co.shape[0]
+    keep = np.ones(n, dtype=np.bool_)
+    breaks = 0
+    first = 0
+    middle = 0
+    count = 0
+    for i in range(n):
+        if count == 0:
+            first = i
+        elif count == 1:
+            middle = i
+        else:
+            bx = co[middle, 0] - co[first, 0]
+            by = co[middle, 1] - co[first, 1]
+            bz = co[middle, 2] - co[first, 2]
+            cx = co[i, 0] - co[first, 0]
+            cy = co[i, 1] - co[first, 1]
+            cz = co[i, 2] - co[first, 2]
+            dot = np.float64(bz * cz)
+            dot += np.float64(by * cy)
+            dot += np.float64(bx * cx)
+            norm_b = np.float32(0.0)
+            norm_b += bx * bx
+            norm_b += by * by
+            norm_b += bz * bz
+            norm_c = np.float32(0.0)
+            norm_c += cx * cx
+            norm_c += cy * cy
+            norm_c += cz * cz
+            norms = np.float32(sqrt(norm_b)) * np.float32(sqrt(norm_c))
+            on_line = True
+            if dot != 0 and norms != 0:
+                angle = np.rad2deg(np.arccos(dot / np.float64(norms)))
+                if angle > tolerance:
+                    on_line = False
+            if on_line:
+                middle = i
+                keep[i] = False
+                continue
+            breaks += 1
+            first = i
+            count = 0
+        count += 1
+    return keep, breaks
+
+
+@jit(nopython=True, fastmath=False, cache=True)
+def _plunge_angles_internal(vectors):
+    # angle to the down vector, in the precision of mathutils Vector.angle
+    n = vectors.shape[0]
+    angles = np.empty(n)
+    for i in range(n):
+        x = np.float64(vectors[i, 0])
+        y = np.float64(vectors[i, 1])
+        z = np.float64(vectors[i, 2])
+        length = sqrt(x * x + y * y + z * z)
+        if length == 0:
+            angles[i] = 0.0
+            continue
+        fac = np.float32(-z / length)
+        if fac <= -1:
+            angles[i] = np.float32(np.pi)
+        elif fac >= 1:
+            angles[i] = 0.0
+        else:
+            angles[i] = acos(fac)
+    return angles
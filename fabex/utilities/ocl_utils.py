@@ -5,13 +5,12 @@ Functions used by OpenCAMLib sampling.
 
 """
 
+from collections import OrderedDict
+import hashlib
 from math import radians, tan
-import os
-import tempfile
 
 import numpy as np
 
-
 try:
     import ocl
 
@@ -28,16 +27,7 @@ except ImportError:
 import bpy
 
 
-try:
-
-    from bl_ext.blender_org.stl_format_legacy import blender_utils
-
-except ImportError:
-    pass
-import mathutils
-
-
-from ..constants import OCL_SCALE, _PREVIOUS_OCL_MESH
+from ..constants import OCL_SCALE
 
 from ..exception import CamException
 
@@ -47,7 +37,10 @@ from ..chunk_builder import CamPathChunk
 
 from .logging_utils import log
 
-from .simple_utils import activate
+# number of OpenCAMLib surfaces kept in memory, one for each distinct set of objects
+OCL_SURF_CACHE_SIZE = 4
+
+_OCL_SURF_CACHE = OrderedDict()
 
 
 def pointSamplesFromOCL(points, samples):
@@ -161,82 +154,6 @@ def chunkPointsResampleFromOCL(chunks, samples):
         s_index += ch_points
 
 
-def exportModelsToSTL(operation):
-    """Export models to STL format.
-
-
-    This function takes an operation containing a collection of collision
-
-    objects and exports each object as an STL file. It duplicates each
-
-    object, applies transformations, and resizes them according to a
-
-    predefined scale before exporting them to the temporary directory. The
-
-    exported files are named sequentially as "model0.stl", "model1.stl",
-
-    etc. After exporting, the function deletes the duplicated objects to
-    clean up the scene.
-
-
-    Args:
-
-        operation: An object containing a collection of collision objects to be exported.
-
-    """
-
-    file_number = 0
-
-    for collision_object in operation.objects:
-
-        activate(collision_object)
-
-        bpy.ops.object.duplicate(linked=False)
-
-        # collision_object = bpy.context.scene.objects.active
-
-        # bpy.context.scene.objects.selected = collision_object
-
-        file_name = os.path.join(tempfile.gettempdir(), "model{0}.stl".format(str(file_number)))
-
-        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-
-        bpy.ops.transform.resize(
-            value=(OCL_SCALE, OCL_SCALE, OCL_SCALE),
-            constraint_axis=(False, False, False),
-            orient_type="GLOBAL",
-            mirror=False,
-            use_proportional_edit=False,
-            proportional_edit_falloff="SMOOTH",
-            proportional_size=1,
-            snap=False,
-            snap_target="CLOSEST",
-            snap_point=(0, 0, 0),
-            snap_align=False,
-            snap_normal=(0, 0, 0),
-            texture_space=False,
-            release_confirm=False,
-        )
-
-        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-
-        bpy.ops.export_mesh.stl(
-            check_existing=True,
-            filepath=file_name,
-            filter_glob="*.stl",
-            use_selection=True,
-            ascii=False,
-            use_mesh_modifiers=True,
-            axis_forward="Y",
-            axis_up="Z",
-            global_scale=1.0,
-        )
-
-        bpy.ops.object.delete()
-
-        file_number += 1
-
-
 async def oclSamplePoints(operation, points):
     """Sample points using an operation and process the results.
 
@@ -298,94 +215,103 @@ async def oclSample(operation, chunks):
     chunkPointSamplesFromOCL(chunks, samples)
 
 
-def get_oclSTL(operation):
-    """Get the oclSTL representation from the provided operation.
+def get_object_triangles(collision_object, use_modifiers):
+    """Get the triangles of an object in world coordinates.
 
+    The triangles are read from the loop triangles of the object's mesh with
+    foreach_get, without duplicating the object or calling any operators.
 
-    This function iterates through the objects in the given operation and
+    Args:
+        collision_object (bpy.types.Object): A mesh, curve, font or surface object.
+        use_modifiers (bool): Apply the modifiers of the object.
 
-    constructs an oclSTL object by extracting triangle data from mesh,
+    Returns:
+        numpy.ndarray: (N, 3, 3) array of triangle vertex positions.
+    """
+    if collision_object.mode == "EDIT":
+        collision_object.update_from_editmode()
 
-    curve, font, or surface objects. It activates each object and checks its
+    if use_modifiers:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        mesh_owner = collision_object.evaluated_get(depsgraph)
+    else:
+        mesh_owner = collision_object
 
-    type to determine if it can be processed. If no valid objects are found,
+    try:
+        mesh = mesh_owner.to_mesh()
+    except RuntimeError:
+        mesh = None
 
-    it raises an exception.
+    if mesh is None:
+        return np.empty((0, 3, 3))
 
+    mesh.calc_loop_triangles()
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    indices = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", indices)
+    mesh_owner.to_mesh_clear()
 
-    Args:
+    matrix = np.array(collision_object.matrix_world, dtype=np.float64)
+    co = co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    return co[indices.reshape(-1, 3)]
 
-        operation (Operation): An object containing a collection of objects
 
+def get_oclSTL(operation):
+    """Get the oclSTL representation from the provided operation.
 
-    Returns:
+    The triangles of all mesh, curve, font and surface objects of the
+    operation are collected in world coordinates, offset by the skin and
+    scaled by OCL_SCALE. Surfaces are cached by a hash of the triangle data
+    and the scale, so operations and chains sampling the same unchanged
+    objects share one surface.
 
-        ocl.STLSurf: An oclSTL object containing the triangles derived from
+    Args:
+        operation (Operation): An object containing a collection of objects
 
+    Returns:
+        ocl.STLSurf: An oclSTL object containing the triangles derived from
         the valid objects.
 
-
     Raises:
-
         CamException: If no mesh, curve, or equivalent object is found in
-
     """
-
-    me = None
-
-    oclSTL = ocl.STLSurf()
-
+    triangles = []
     found_mesh = False
-
     for collision_object in operation.objects:
-
-        activate(collision_object)
-
-        if (
-            collision_object.type == "MESH"
-            or collision_object.type == "CURVE"
-            or collision_object.type == "FONT"
-            or collision_object.type == "SURFACE"
-        ):
-
+        if collision_object.type in ["MESH", "CURVE", "FONT", "SURFACE"]:
             found_mesh = True
-
-            global_matrix = mathutils.Matrix.Identity(4)
-
-            faces = blender_utils.faces_from_mesh(
-                collision_object, global_matrix, operation.use_modifiers
-            )
-
-            for face in faces:
-
-                t = ocl.Triangle(
-                    ocl.Point(
-                        face[0][0] * OCL_SCALE,
-                        face[0][1] * OCL_SCALE,
-                        (face[0][2] + operation.skin) * OCL_SCALE,
-                    ),
-                    ocl.Point(
-                        face[1][0] * OCL_SCALE,
-                        face[1][1] * OCL_SCALE,
-                        (face[1][2] + operation.skin) * OCL_SCALE,
-                    ),
-                    ocl.Point(
-                        face[2][0] * OCL_SCALE,
-                        face[2][1] * OCL_SCALE,
-                        (face[2][2] + operation.skin) * OCL_SCALE,
-                    ),
-                )
-
-                oclSTL.addTriangle(t)
-
+            triangles.append(get_object_triangles(collision_object, operation.use_modifiers))
         # FIXME needs to work with collections
 
     if not found_mesh:
-
         raise CamException(
             "This Operation Requires a Mesh or Curve Object or Equivalent (e.g. Text, Volume)."
         )
 
+    triangles = np.concatenate(triangles)
+    triangles[:, :, 2] += operation.skin
+    triangles *= OCL_SCALE
+
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(repr((triangles.shape, OCL_SCALE)).encode())
+    hasher.update(triangles.tobytes())
+    key = hasher.hexdigest()
+
+    oclSTL = _OCL_SURF_CACHE.get(key)
+    if oclSTL is not None:
+        _OCL_SURF_CACHE.move_to_end(key)
+        log.info("OpenCAMLib Surface Loaded from Cache")
+        return oclSTL
+
+    oclSTL = ocl.STLSurf()
+    for a, b, c in triangles.tolist():
+        oclSTL.addTriangle(ocl.Triangle(ocl.Point(*a), ocl.Point(*b), ocl.Point(*c)))
+
+    _OCL_SURF_CACHE[key] = oclSTL
+    while len(_OCL_SURF_CACHE) > OCL_SURF_CACHE_SIZE:
+        _OCL_SURF_CACHE.popitem(last=False)
+
     return oclSTL
 
 
@@ -415,9 +341,9 @@ async def ocl_sample(operation, chunks, use_cached_mesh=False):
         chunks (list): A list of chunk objects that contain point data to be
             processed.
 
-        use_cached_mesh (bool): A flag indicating whether to use a cached mesh
+        use_cached_mesh (bool): Has no effect, the surface of unchanged objects
 
-            if available. Defaults to False.
+            always comes from the cache of get_oclSTL. Defaults to False.
 
 
     Returns:
@@ -426,8 +352,6 @@ async def ocl_sample(operation, chunks, use_cached_mesh=False):
 
     """
 
-    global _PREVIOUS_OCL_MESH
-
     op_cutter_type = operation.cutter_type
 
     op_cutter_diameter = operation.cutter_diameter
@@ -492,15 +416,7 @@ async def ocl_sample(operation, chunks, use_cached_mesh=False):
 
     bdc = ocl.BatchDropCutter()
 
-    if use_cached_mesh and _PREVIOUS_OCL_MESH is not None:
-
-        oclSTL = _PREVIOUS_OCL_MESH
-
-    else:
-
-        oclSTL = get_oclSTL(operation)
-
-        _PREVIOUS_OCL_MESH = oclSTL
+    oclSTL = get_oclSTL(operation)
 
     bdc.setSTL(oclSTL)
 
@@ -15,8 +15,10 @@ from math import (
     tan,
 )
 
+import os
+import struct
+
 import numpy as np
-import pickle
 
 from shapely.geometry import Polygon
 
@@ -24,6 +26,7 @@ import bpy
 from bpy_extras import object_utils
 from mathutils import Vector
 
+from .cache_utils import hash_objects
 from .curve_utils import curve_to_shapely
 from .logging_utils import log
 from .simple_utils import (
@@ -34,6 +37,13 @@ from .simple_utils import (
 from .. import __package__ as base_package
 from ..constants import was_hidden_dict
 
+# binary path files of background calculations: magic, vertex count, rotation count,
+# warnings size and duration, followed by the warnings and the float32 arrays
+PATH_FILE_MAGIC = b"FABEXPTH"
+PATH_FILE_HEADER = struct.Struct("<8sQQQd")
+PATH_FILE_ALIGNMENT = 16
+PATH_FILE_EXTENSION = ".path"
+
 
 def get_operation_sources(o):
     """Get operation sources based on the geometry source type.
@@ -97,8 +107,183 @@ def get_operation_sources(o):
         o.onlycurves = False
 
 
-def reload_paths(o):
-    """Reload the CAM path data from a pickle file.
+def create_path_mesh(name, vertices):
+    """Create a mesh that connects the path vertices with one chain of edges.
+
+    The vertices and edges are written straight from arrays with
+    foreach_set, without going through Python lists.
+
+    Args:
+        name (str): Name of the mesh.
+        vertices (numpy.ndarray): (N, 3) array of the path vertices.
+
+    Returns:
+        bpy.types.Mesh: The path mesh.
+    """
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1, 3)
+    edge_count = max(len(vertices) - 1, 0)
+    edges = np.empty((edge_count, 2), dtype=np.int32)
+    edges[:, 0] = np.arange(edge_count)
+    edges[:, 1] = edges[:, 0] + 1
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.name = name
+    mesh.vertices.add(len(vertices))
+    mesh.edges.add(edge_count)
+    # the attributes are copied as one block, vertices.foreach_set goes vertex by vertex,
+    # empty meshes don't have them
+    if len(vertices) > 0:
+        mesh.attributes["position"].data.foreach_set("vector", vertices.ravel())
+    if edge_count > 0:
+        mesh.attributes[".edge_verts"].data.foreach_set("value", edges.ravel())
+    mesh.update(calc_edges_loose=edge_count > 0)
+    return mesh
+
+
+def set_path_rotations(ob, rotations):
+    """Store the rotations of an n-axis path in the 'rotations' shape key.
+
+    Shape keys are the only way to store large arrays with correct floating
+    point precision, object/mesh attributes can only store arrays up to
+    32000 items.
+
+    Args:
+        ob (bpy.types.Object): The path object.
+        rotations (numpy.ndarray): (N, 3) array of the rotations, N can be
+            less than the vertex count.
+    """
+    mesh = ob.data
+    ob.shape_key_add()
+    ob.shape_key_add()
+    shapek = mesh.shape_keys.key_blocks[1]
+    shapek.name = "rotations"
+
+    # new shape keys start as a copy of the vertices
+    values = np.empty((len(mesh.vertices), 3), dtype=np.float32)
+    if len(values) > 0:
+        mesh.attributes["position"].data.foreach_get("vector", values.ravel())
+    values[: len(rotations)] = rotations
+    shapek.points.foreach_set("co", values.ravel())
+
+
+def get_path_rotations(ob):
+    """Get the rotations of an n-axis path from its 'rotations' shape key.
+
+    Args:
+        ob (bpy.types.Object): The path object.
+
+    Returns:
+        numpy.ndarray: (N, 3) array of the rotations, None for 3 axis paths.
+    """
+    mesh = ob.data
+    if mesh.shape_keys is None or mesh.shape_keys.key_blocks.find("rotations") == -1:
+        return None
+    rotations = np.empty((len(mesh.vertices), 3), dtype=np.float32)
+    if len(rotations) > 0:
+        mesh.shape_keys.key_blocks["rotations"].points.foreach_get("co", rotations.ravel())
+    return rotations
+
+
+def write_path_file(filepath, vertices, rotations, warnings, duration):
+    """Write a calculated path to a binary path file.
+
+    The file is a fixed header, the warnings text, and the float32 vertex
+    and rotation arrays, so read_path_file can map the arrays without
+    parsing them. It is written to a temporary file first and then moved
+    in place, a reader never sees a partly written path.
+
+    Args:
+        filepath (str): Path of the file.
+        vertices (numpy.ndarray): (N, 3) array of the path vertices.
+        rotations (numpy.ndarray): (N, 3) array of the rotations, or None.
+        warnings (str): Warnings of the operation.
+        duration (float): Estimated machining time of the operation.
+    """
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1, 3)
+    if rotations is None:
+        rotations = np.empty((0, 3), dtype=np.float32)
+    rotations = np.ascontiguousarray(rotations, dtype=np.float32).reshape(-1, 3)
+    text = warnings.encode()
+
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    temppath = f"{filepath}.{os.getpid()}.tmp"
+    with open(temppath, "wb") as f:
+        f.write(
+            PATH_FILE_HEADER.pack(
+                PATH_FILE_MAGIC, len(vertices), len(rotations), len(text), duration
+            )
+        )
+        f.write(text)
+        f.write(bytes(-f.tell() % PATH_FILE_ALIGNMENT))
+        f.write(vertices.tobytes())
+        f.write(rotations.tobytes())
+    os.replace(temppath, filepath)
+
+
+def read_path_file(filepath):
+    """Read a binary path file written by write_path_file.
+
+    The arrays are memory mapped, they are only read from the disk when
+    they are used.
+
+    Args:
+        filepath (str): Path of the file.
+
+    Returns:
+        tuple: (N, 3) vertex array, (N, 3) rotation array or None,
+            warnings and duration.
+
+    Raises:
+        ValueError: If the file is not a path file.
+    """
+    with open(filepath, "rb") as f:
+        header = f.read(PATH_FILE_HEADER.size)
+        if len(header) < PATH_FILE_HEADER.size or header[:8] != PATH_FILE_MAGIC:
+            raise ValueError(f"{filepath} Is Not a Path File")
+        magic, vertex_count, rotation_count, text_size, duration = PATH_FILE_HEADER.unpack(header)
+        warnings = f.read(text_size).decode()
+
+    offset = PATH_FILE_HEADER.size + text_size
+    offset += -offset % PATH_FILE_ALIGNMENT
+
+    def map_array(count):
+        # mapping 0 bytes fails
+        if count == 0:
+            return np.empty((0, 3), dtype=np.float32)
+        return np.memmap(filepath, dtype=np.float32, mode="r", offset=offset, shape=(count, 3))
+
+    vertices = map_array(vertex_count)
+    offset += vertices.nbytes
+    rotations = map_array(rotation_count) if rotation_count > 0 else None
+    return vertices, rotations, warnings, duration
+
+
+def save_paths(o):
+    """Save the calculated CAM path of an operation to a binary path file.
+
+    Background processes store their results this way, reload_paths
+    creates the path object from the file again.
+
+    Args:
+        o (Object): The operation, its path object has to exist.
+    """
+    s = bpy.context.scene
+    ob = s.objects[s.cam_names.path_name_full]
+    vertices = np.empty((len(ob.data.vertices), 3), dtype=np.float32)
+    if len(vertices) > 0:
+        ob.data.attributes["position"].data.foreach_get("vector", vertices.ravel())
+
+    write_path_file(
+        get_cache_path(o) + PATH_FILE_EXTENSION,
+        vertices,
+        get_path_rotations(ob),
+        o.info.warnings,
+        o.info.duration,
+    )
+
+
+def reload_paths(o, path_name=None):
+    """Reload the CAM path data from a binary path file.
 
     This function retrieves the CAM path data associated with the given
     object `o`. It constructs a new mesh from the path vertices and updates
@@ -109,30 +294,22 @@ def reload_paths(o):
 
     Args:
         o (Object): The object for which the CAM path is being
+        path_name (str): Name of the path object, the path name of the
+            active operation if None.
     """
 
     s = bpy.context.scene
-    oname = s.cam_names.path_name_full
-    ob = s.objects[oname] if oname in s.objects else None
+    oname = s.cam_names.path_name_full if path_name is None else path_name
     old_pathmesh = s.objects[oname].data if oname in s.objects else None
 
-    picklepath = get_cache_path(o) + ".pickle"
-    f = open(picklepath, "rb")
-    d = pickle.load(f)
-    f.close()
-
-    o.info.warnings = d["warnings"]
-    o.info.duration = d["duration"]
+    vertices, rotations, warnings, duration = read_path_file(
+        get_cache_path(o) + PATH_FILE_EXTENSION
+    )
 
-    verts = d["path"]
-    edges = [(a, a + 1) for a in range(0, len(verts) - 1)]
+    o.info.warnings = warnings
+    o.info.duration = duration
 
-    # for a in range(0, len(verts) - 1):
-    #     edges.append((a, a + 1))
-
-    mesh = bpy.data.meshes.new(oname)
-    mesh.name = oname
-    mesh.from_pydata(verts, edges, [])
+    mesh = create_path_mesh(oname, vertices)
 
     if oname in s.objects:
         s.objects[oname].data = mesh
@@ -142,6 +319,8 @@ def reload_paths(o):
         ob.name = oname
 
     ob = s.objects[oname]
+    if rotations is not None:
+        set_path_rotations(ob, rotations)
     ob.location = (0, 0, 0)
     o.path_object_name = oname
     o.changed = False
@@ -531,21 +710,18 @@ def get_change_data(o):
     """Check if object properties have changed to determine if image updates
     are needed.
 
-    This function inspects the properties of objects specified by the input
-    parameter to see if any changes have occurred. It concatenates the
-    location, rotation, and dimensions of the relevant objects into a single
-    string, which can be used to determine if an image update is necessary
-    based on changes in the object's state.
+    This function hashes the evaluated mesh data and transforms of the
+    objects specified by the input parameter, so that moving, rotating,
+    scaling or editing the geometry of any of them changes the result, which
+    can be used to determine if an image update is necessary.
 
     Args:
         o (object): An object containing properties that specify the geometry source
             and relevant object or collection names.
 
     Returns:
-        str: A string representation of the location, rotation, and dimensions of
-            the specified objects.
+        str: A hash of the geometry and transforms of the specified objects.
     """
-    changedata = ""
     obs = []
 
     if o.geometry_source == "OBJECT":
@@ -553,12 +729,7 @@ def get_change_data(o):
     elif o.geometry_source == "COLLECTION":
         obs = bpy.data.collections[o.collection_name].objects
 
-    for ob in obs:
-        changedata += str(ob.location)
-        changedata += str(ob.rotation_euler)
-        changedata += str(ob.dimensions)
-
-    return changedata
+    return hash_objects(obs).hexdigest()
 
 
 def check_memory_limit(o):
@@ -568,7 +739,8 @@ def check_memory_limit(o):
     dimensions and the specified pixel size. If the calculated resolution
     exceeds the defined memory limit, it adjusts the pixel size accordingly
     to reduce the resolution. A warning message is appended to the object's
-    info if the pixel size is modified.
+    info if the pixel size is modified. With tiled processing enabled, the
+    pixel size is kept and the images are processed in tiles instead.
 
     Args:
         o (object): An object containing properties such as max, min, optimisation, and
@@ -586,7 +758,10 @@ def check_memory_limit(o):
     res = resx * resy
     limit = o.optimisation.imgres_limit * 1000000
 
-    if res > limit:
+    if res > limit and o.optimisation.use_tiles:
+        log.info(f"Resolution {int(resx)} x {int(resy)} Exceeds Limit, Processing in Tiles")
+
+    elif res > limit:
         ratio = res / limit
         o.optimisation.pixsize = o.optimisation.pixsize * sqrt(ratio)
 
@@ -798,6 +973,57 @@ def get_cutter_array(operation, pixsize):
     return car
 
 
+def get_cutter_profile(operation):
+    """Describe the radial profile of the cutter, matching get_cutter_array.
+
+    The height of the cutter surface above its tip at distance rho from the
+    axis is 0 up to the flat radius, then follows a sphere up to the ball
+    radius, then a cone. Profiles of all radially symmetric cutters are
+    convex, which the swept volume simulation relies on.
+
+    Args:
+        operation (object): An object containing properties of the cutter.
+
+    Returns:
+        numpy.ndarray: (radius, flat radius, ball radius, sphere radius, cone start,
+            cone offset, cone slope), or None for custom cutters.
+    """
+
+    cutter_type = operation.cutter_type
+    r = operation.cutter_diameter / 2 + operation.skin
+
+    if cutter_type == "END":
+        profile = (r, r, -1, 0, 0, 0, 0)
+
+    elif cutter_type in ["BALL", "BALLNOSE"]:
+        profile = (r, -1, r, r, 0, 0, 0)
+
+    elif cutter_type == "VCARVE":
+        angle = operation.cutter_tip_angle
+        s = tan(pi * (90 - angle / 2) / 180)  # angle in degrees
+        profile = (r, -1, -1, 0, 0, 0, s)
+
+    elif cutter_type == "CYLCONE":
+        angle = operation.cutter_tip_angle
+        cyl_r = operation.cylcone_diameter / 2
+        s = tan(pi * (90 - angle / 2) / 180)  # angle in degrees
+        profile = (r, cyl_r, -1, 0, cyl_r, 0, s)
+
+    elif cutter_type == "BALLCONE":
+        angle = radians(operation.cutter_tip_angle) / 2
+        ball_r = operation.ball_radius
+        cutter_r = operation.cutter_diameter / 2
+        Ball_R = ball_r / cos(angle)
+        D_ofset = ball_r * tan(angle)
+        s = tan(pi / 2 - angle)
+        profile = (cutter_r, -1, ball_r, Ball_R, ball_r, Ball_R - D_ofset, s)
+
+    else:
+        return None
+
+    return np.array(profile, dtype=float)
+
+
 def check_min_z(o):
     """Check the minimum value based on the specified condition.
 
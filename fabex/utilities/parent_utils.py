@@ -1,4 +1,12 @@
-from shapely.geometry import Point
+from itertools import chain
+
+import numpy as np
+import shapely
+from shapely import STRtree
+from shapely.geometry import (
+    MultiPoint,
+    Point,
+)
 
 
 def parent_child_distance(parents, children, o, distance=None):
@@ -12,14 +20,43 @@ def parent_child_distance(parents, children, o, distance=None):
     else:
         dlim = distance
 
-    for child in children:
-        for parent in parents:
-            isrelation = False
+    if len(parents) == 0 or len(children) == 0:
+        return
 
-            if parent != child:
-                if parent.x_y_distance_within(child, cutoff=dlim):
-                    parent.children.append(child)
-                    child.parents.append(parent)
+    # chunks with more than 2 points are compared as polygons, others by their points
+    for chunk in chain(parents, children):
+        if chunk.poly is None:
+            chunk.update_poly()
+
+    parent_polygons = np.array([parent.poly for parent in parents])
+    child_polygons = np.array([child.poly for child in children])
+    parent_empty = shapely.is_empty(parent_polygons)
+    child_empty = shapely.is_empty(child_polygons)
+
+    # pairs of polygons, empty ones are left out of the tree and the query
+    tree = STRtree(np.where(parent_empty, None, parent_polygons))
+    child_index, parent_index = tree.query(
+        np.where(child_empty, None, child_polygons), predicate="dwithin", distance=dlim
+    )
+
+    if parent_empty.any() or child_empty.any():
+        tree = STRtree([MultiPoint(parent.points[:, :2]) for parent in parents])
+        points_child, points_parent = tree.query(
+            [MultiPoint(child.points[:, :2]) for child in children],
+            predicate="dwithin",
+            distance=dlim,
+        )
+        points_pairs = child_empty[points_child] | parent_empty[points_parent]
+        child_index = np.concatenate((child_index, points_child[points_pairs]))
+        parent_index = np.concatenate((parent_index, points_parent[points_pairs]))
+
+    # same order as looping over the children, then the parents
+    for i in np.lexsort((parent_index, child_index)):
+        child = children[child_index[i]]
+        parent = parents[parent_index[i]]
+        if parent != child:
+            parent.children.append(child)
+            child.parents.append(parent)
 
 
 def parent_child(parents, children, o):
@@ -0,0 +1,195 @@
+"""Fabex 'pool_utils.py' © 2025
+
+Exact mode sampling split across background Blender processes.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+import bpy
+
+from .async_utils import progress_async
+from .collision_utils import (
+    prepare_bullet_collision,
+    sample_bullet_points,
+)
+from .logging_utils import log
+from .operation_utils import get_operation_sources
+from .. import __package__ as base_package
+from ..exception import CamException
+
+# starting a worker takes a few seconds, smaller jobs are sampled on the main thread
+MIN_POOL_SAMPLES = 20000
+
+
+def use_sampling_pool(o, sample_count):
+    """Check if exact mode sampling should run in background processes.
+
+    Args:
+        o (object): The operation.
+        sample_count (int): Number of points to sample.
+
+    Returns:
+        bool: True if the pool should be used.
+    """
+    return (
+        o.optimisation.use_exact
+        and not o.optimisation.use_opencamlib
+        and o.optimisation.sampling_processes > 1
+        and sample_count >= MIN_POOL_SAMPLES
+    )
+
+
+def _split_chunks(counts, parts):
+    """Split consecutive chunks into parts with roughly equal point counts.
+
+    Args:
+        counts (list): Point count of each chunk.
+        parts (int): Number of parts.
+
+    Returns:
+        list: (first chunk, end chunk) of each non-empty part.
+    """
+    ends = np.cumsum(counts)
+    total = ends[-1] if len(ends) > 0 else 0
+    bounds = [0]
+    for i in range(1, parts):
+        # end each part after the chunk that reaches its share of the points
+        end = int(np.searchsorted(ends, total * i / parts)) + 1
+        bounds.append(min(max(bounds[-1], end), len(counts)))
+    bounds.append(len(counts))
+    return [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+async def sample_bullet_pool(o, pattern_points, ambient_masks, minz):
+    """Sample pattern chunks with Bullet collision in background Blender processes.
+
+    The current file is saved as a temporary copy, which every worker opens
+    to build its own collision world with prepare_bullet_collision. Each worker
+    samples a consecutive range of chunks exactly like the main thread would,
+    and writes the heights into a shared memory mapped array, so the results
+    are merged in the original order.
+
+    Args:
+        o (object): The operation.
+        pattern_points (list): (N, 2) arrays of x, y of each pattern chunk.
+        ambient_masks (list): Boolean arrays, True for points inside the ambient.
+        minz (float): Lowest allowed height.
+
+    Returns:
+        list: Height arrays, one for each pattern chunk.
+    """
+    counts = [len(p) for p in pattern_points]
+    offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+    total = int(offsets[-1])
+    parts = _split_chunks(counts, o.optimisation.sampling_processes)
+
+    folder = tempfile.mkdtemp(prefix="fabex_pool_")
+    processes = []
+    errors = None
+    try:
+        blend_path = os.path.join(folder, "pool.blend")
+        data_path = os.path.join(folder, "points.npz")
+        z_path = os.path.join(folder, "z.npy")
+        progress_path = os.path.join(folder, "progress.npy")
+        error_path = os.path.join(folder, "errors.txt")
+
+        bpy.ops.wm.save_as_mainfile(filepath=blend_path, copy=True, check_existing=False)
+        np.savez(
+            data_path,
+            points=np.concatenate(pattern_points) if total > 0 else np.empty((0, 2)),
+            ambient=np.concatenate(ambient_masks) if total > 0 else np.empty(0, dtype=bool),
+            offsets=offsets,
+        )
+        z_values = np.lib.format.open_memmap(z_path, mode="w+", dtype=np.double, shape=(total,))
+        done = np.lib.format.open_memmap(
+            progress_path, mode="w+", dtype=np.int64, shape=(len(parts),)
+        )
+
+        expression = (
+            "import importlib;"
+            f"importlib.import_module('{base_package}.utilities.pool_utils').bullet_worker_main()"
+        )
+        errors = open(error_path, "wb")
+        for worker, (first, end) in enumerate(parts):
+            processes.append(
+                subprocess.Popen(
+                    [
+                        bpy.app.binary_path,
+                        "-b",
+                        blend_path,
+                        "--python-exit-code",
+                        "1",
+                        "--python-expr",
+                        expression,
+                        "--",
+                        o.name,
+                        folder,
+                        str(worker),
+                        str(first),
+                        str(end),
+                        repr(minz),
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=errors,
+                )
+            )
+        log.info(f"Sampling {total} Points in {len(processes)} Processes")
+
+        while any(p.poll() is None for p in processes):
+            # whatever drives the coroutine spaces the polls, the workers run meanwhile
+            await progress_async("Sampling Paths", int(100 * np.sum(done) / max(total, 1)))
+
+        errors.close()
+        if any(p.returncode != 0 for p in processes):
+            with open(error_path, "rb") as f:
+                error = f.read().decode(errors="replace")
+            raise CamException(f"Sampling Process Failed:\n{error[-1000:]}")
+
+        results = [np.array(z_values[a:b]) for a, b in zip(offsets[:-1], offsets[1:])]
+        del z_values, done
+        return results
+
+    finally:
+        for p in processes:
+            if p.poll() is None:
+                p.kill()
+                p.wait()
+        if errors is not None:
+            errors.close()
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def bullet_worker_main():
+    """Entry point of a background sampling process started by sample_bullet_pool."""
+    args = sys.argv[sys.argv.index("--") + 1 :]
+    name, folder, worker, first, end, minz = args
+    worker, first, end, minz = int(worker), int(first), int(end), float(minz)
+
+    o = bpy.context.scene.cam_operations[name]
+    get_operation_sources(o)
+    prepare_bullet_collision(o)
+    cutter = o.cutter_shape
+    cutterdepth = cutter.dimensions.z / 2
+
+    with np.load(os.path.join(folder, "points.npz")) as data:
+        points = data["points"]
+        ambient = data["ambient"]
+        offsets = data["offsets"]
+    z_values = np.lib.format.open_memmap(os.path.join(folder, "z.npy"), mode="r+")
+    done = np.lib.format.open_memmap(os.path.join(folder, "progress.npy"), mode="r+")
+
+    for i in range(first, end):
+        a, b = offsets[i], offsets[i + 1]
+        z_values[a:b] = sample_bullet_points(
+            o, cutter, cutterdepth, points[a:b], ambient[a:b], minz
+        )
+        done[worker] += b - a
+
+    z_values.flush()
+    done.flush()
@@ -4,7 +4,7 @@ Module to allow the creation of reliefs from Images or View Layers.
 (https://en.wikipedia.org/wiki/Relief#Bas-relief_or_low_relief)
 """
 
-from math import ceil, floor, sqrt
+from math import sqrt
 import re
 import time
 
@@ -12,7 +12,7 @@ import numpy as np
 
 import bpy
 
-from ..constants import EPS, NUMPYALG
+from ..constants import EPS
 from .image_utils import (
     image_to_numpy,
     numpy_to_image,
@@ -36,7 +36,7 @@ def restrict_buffer(inbuf, outbuf):
     neighboring pixels in the input buffer to create a downsampled version
     in the output buffer. The method used for downsampling can vary based on
     the dimensions of the input and output buffers, utilizing either a
-    simple averaging method or a more complex numpy-based approach.
+    simple averaging method or box filters of varying width.
 
     Args:
         inbuf (numpy.ndarray): The input buffer to be downsampled, expected to be
@@ -67,64 +67,29 @@ def restrict_buffer(inbuf, outbuf):
             inbuf[::2, ::2] + inbuf[1::2, ::2] + inbuf[::2, 1::2] + inbuf[1::2, 1::2]
         ) / 4.0
 
-    elif NUMPYALG:  # numpy method
-        yrange = np.arange(0, outy)
-        xrange = np.arange(0, outx)
-
-        w = 0
-        sx = dx / 2 - 0.5
-
-        sxrange = xrange * dx + sx
-        syrange = yrange * dy + sy
-
-        sxstartrange = np.array(np.ceil(sxrange - xfiltersize), dtype=int)
-        sxstartrange[sxstartrange < 0] = 0
-        sxendrange = np.array(np.floor(sxrange + xfiltersize) + 1, dtype=int)
-        sxendrange[sxendrange > inx] = inx
-
-        systartrange = np.array(np.ceil(syrange - xfiltersize), dtype=int)
-        systartrange[systartrange < 0] = 0
-        syendrange = np.array(np.floor(syrange + xfiltersize) + 1, dtype=int)
-        syendrange[syendrange > iny] = iny
+    else:
+        # box filters of varying width, summed one offset at a time
+        x1, x2 = _filter_ranges(outx, dx / 2 - 0.5, dx, xfiltersize, inx)
+        y1, y2 = _filter_ranges(outy, sy, dy, xfiltersize, iny)
 
-        # 3 is the maximum value...?pff.
-        indices = np.arange(outx * outy * 2 * 3).reshape((2, outx * outy, 3))
+        columns = np.zeros((outx, iny))
+        for offset in range(int((x2 - x1).max())):
+            rows = np.minimum(x1 + offset, inx - 1)
+            columns += inbuf[rows] * (x1 + offset < x2)[:, None]
 
-        r = sxendrange - sxstartrange
+        outbuf.fill(0)
+        for offset in range(int((y2 - y1).max())):
+            rows = np.minimum(y1 + offset, iny - 1)
+            outbuf += columns[:, rows] * (y1 + offset < y2)
+        outbuf /= np.outer(x2 - x1, y2 - y1)
 
-        indices[0] = sxstartrange.repeat(outy)
-        indices[1] = systartrange.repeat(outx).reshape(outx, outy).swapaxes(0, 1).flatten()
 
-        outbuf.fill(0)
-        tempbuf = inbuf[indices[0], indices[1]]
-        tempbuf += inbuf[indices[0] + 1, indices[1]]
-        tempbuf += inbuf[indices[0], indices[1] + 1]
-        tempbuf += inbuf[indices[0] + 1, indices[1] + 1]
-        tempbuf /= 4.0
-        outbuf[:] = tempbuf.reshape((outx, outy))
-
-    else:  # old method
-        for y in range(0, outy):
-            sx = dx / 2 - 0.5
-            for x in range(0, outx):
-                pixVal = 0
-                w = 0
-
-                #
-                for ix in range(
-                    max(0, ceil(sx - dx * filterSize)),
-                    min(floor(sx + dx * filterSize), inx - 1) + 1,
-                ):
-                    for iy in range(
-                        max(0, ceil(sy - dx * filterSize)),
-                        min(floor(sy + dx * filterSize), iny - 1) + 1,
-                    ):
-                        pixVal += inbuf[ix, iy]
-                        w += 1
-                outbuf[x, y] = pixVal / w
-
-                sx += dx
-            sy += dy
+def _filter_ranges(count, start, step, filtersize, size):
+    """Pixel ranges of the restriction filter, accumulating the centres like a loop would."""
+    centres = np.cumsum(np.concatenate(([start], np.full(count - 1, step))))
+    first = np.maximum(np.ceil(centres - filtersize), 0).astype(int)
+    last = np.minimum(np.floor(centres + filtersize), size - 1).astype(int)
+    return first, last + 1
 
 
 def prolongate(inbuf, outbuf):
@@ -152,73 +117,45 @@ def prolongate(inbuf, outbuf):
     dx = inx / outx
     dy = iny / outy
 
-    filterSize = 1
-    xfiltersize = dx * filterSize
-
     if dx == 0.5 and dy == 0.5:
         outbuf[::2, ::2] = inbuf
         outbuf[1::2, ::2] = inbuf
         outbuf[::2, 1::2] = inbuf
         outbuf[1::2, 1::2] = inbuf
-    elif NUMPYALG:  # numpy method
-        sy = -dy / 2
-        sx = -dx / 2
-        xrange = np.arange(0, outx)
-        yrange = np.arange(0, outy)
-
-        sxrange = xrange * dx + sx
-        syrange = yrange * dy + sy
-
-        sxstartrange = np.array(np.ceil(sxrange - xfiltersize), dtype=int)
-        sxstartrange[sxstartrange < 0] = 0
-        sxendrange = np.array(np.floor(sxrange + xfiltersize) + 1, dtype=int)
-        sxendrange[sxendrange >= inx] = inx - 1
-        systartrange = np.array(np.ceil(syrange - xfiltersize), dtype=int)
-        systartrange[systartrange < 0] = 0
-        syendrange = np.array(np.floor(syrange + xfiltersize) + 1, dtype=int)
-        syendrange[syendrange >= iny] = iny - 1
-
-        indices = np.arange(outx * outy * 2).reshape((2, outx * outy))
-        indices[0] = sxstartrange.repeat(outy)
-        indices[1] = systartrange.repeat(outx).reshape(outx, outy).swapaxes(0, 1).flatten()
-
-        tempbuf = inbuf[indices[0], indices[1]]
-        tempbuf /= 4.0
-        outbuf[:] = tempbuf.reshape((outx, outy))
-
     else:
-        sy = -dy / 2
-        for y in range(0, outy):
-            sx = -dx / 2
-            for x in range(0, outx):
-                pixVal = 0
-                weight = 0
-
-                for ix in range(
-                    max(0, ceil(sx - filterSize)),
-                    min(floor(sx + filterSize), inx - 1) + 1,
-                ):
-                    for iy in range(
-                        max(0, ceil(sy - filterSize)),
-                        min(floor(sy + filterSize), iny - 1) + 1,
-                    ):
-                        fx = abs(sx - ix)
-                        fy = abs(sy - iy)
-
-                        fval = (1 - fx) * (1 - fy)
-
-                        pixVal += inbuf[ix, iy] * fval
-                        weight += fval
-                outbuf[x, y] = pixVal / weight
-                sx += dx
-            sy += dy
+        # bilinear interpolation, weights of pixels outside of the input are left out
+        indices, weights = _tent_weights(outx, -dx / 2, dx, inx)
+        columns = np.zeros((outx, iny))
+        for index, weight in zip(indices, weights):
+            columns += inbuf[index] * weight[:, None]
+
+        indices, weights = _tent_weights(outy, -dy / 2, dy, iny)
+        outbuf.fill(0)
+        for index, weight in zip(indices, weights):
+            outbuf += columns[:, index] * weight
+
+
+def _tent_weights(count, start, step, size):
+    """Pixels and normalized weights of the prolongation filter, 3 per output pixel."""
+    centres = np.cumsum(np.concatenate(([start], np.full(count - 1, step))))
+    first = np.ceil(centres - 1).astype(int)
+    last = np.minimum(np.floor(centres + 1), size - 1)
+    indices = []
+    weights = []
+    for offset in range(3):
+        index = first + offset
+        weight = np.where((index >= 0) & (index <= last), 1 - np.abs(centres - index), 0.0)
+        indices.append(np.clip(index, 0, size - 1))
+        weights.append(weight)
+    total = sum(weights)
+    return indices, [weight / total for weight in weights]
 
 
 def idx(r, c, cols):
     return r * cols + c + 1
 
 
-def smooth(U, F, linbcgiterations, planar):
+def smooth(U, F, linbcgiterations, planar, work=None):
     """Smooth a matrix U using a filter F at a specified level.
 
     This function applies a smoothing operation on the input matrix U using
@@ -232,6 +169,7 @@ def smooth(U, F, linbcgiterations, planar):
         F (numpy.ndarray): The filter used for smoothing.
         linbcgiterations (int): The number of iterations for the linear BCG method.
         planar (bool): A flag indicating whether to perform the operation in a planar manner.
+        work (list, optional): Work arrays for linear_bcg, reused between calls.
 
     Returns:
         None: This function modifies the input matrix U in place.
@@ -245,7 +183,7 @@ def smooth(U, F, linbcgiterations, planar):
 
     n = U.size
 
-    linear_bcg(n, F, U, 2, 0.001, linbcgiterations, iter, err, rows, cols, planar)
+    linear_bcg(n, F, U, 2, 0.001, linbcgiterations, iter, err, rows, cols, planar, work)
 
 
 def calculate_defect(D, U, F):
@@ -348,11 +286,13 @@ def solve_pde_multigrid(
     IU = []
     VF = []
     PLANAR = []
+    WORK = []
     for a in range(0, levels + 1):
         RHS.append(None)
         IU.append(None)
         VF.append(None)
         PLANAR.append(None)
+        WORK.append(None)
     VF[0] = np.zeros((xmax, ymax), dtype=np.float64)
     # numpy.fill(pix)!? TODO
 
@@ -372,6 +312,9 @@ def solve_pde_multigrid(
         IU[k + 1] = np.zeros((sx, sy), dtype=np.float64)
         VF[k + 1] = np.zeros((sx, sy), dtype=np.float64)
 
+        # work arrays of linear_bcg
+        WORK[k] = [np.empty(IU[k].shape) for i in range(7)]
+
         # restrict from level k to level k+1 (coarser-grid)
         restrict_buffer(PLANAR[k], PLANAR[k + 1])
         PLANAR[k + 1] = PLANAR[k + 1] > 0
@@ -413,7 +356,7 @@ def solve_pde_multigrid(
                     IU[k2].fill(0.0)
 
                 for i in range(0, smoothiterations):
-                    smooth(IU[k2], VF[k2], linbcgiterations, PLANAR[k2])
+                    smooth(IU[k2], VF[k2], linbcgiterations, PLANAR[k2], WORK[k2])
 
                 # 8. calculate defect at level
                 #  d[k2] = Lh * ~u[k2] - f[k2]
@@ -452,7 +395,7 @@ def solve_pde_multigrid(
 
                 # 14. post-smoothing of current sollution using target function
                 for i in range(0, smoothiterations):
-                    smooth(IU[k2], VF[k2], linbcgiterations, PLANAR[k2])
+                    smooth(IU[k2], VF[k2], linbcgiterations, PLANAR[k2], WORK[k2])
 
                 if useplanar and k2 == 0:
                     IU[0][planar] = IU[0].min()
@@ -468,8 +411,61 @@ def solve_pde_multigrid(
     U[:] = IU[0]
 
 
+def _dct(a, axis):
+    """Unnormalized DCT-II along an axis, from a FFT of the same length (Makhoul)."""
+    a = np.moveaxis(a, axis, 0)
+    n = a.shape[0]
+    v = np.fft.fft(np.concatenate((a[::2], a[1::2][::-1])), axis=0)
+    k = np.arange(n).reshape((-1,) + (1,) * (a.ndim - 1))
+    return np.moveaxis((v * np.exp(-0.5j * np.pi * k / n)).real, 0, axis)
+
+
+def _idct(a, axis):
+    """Inverse of _dct."""
+    a = np.moveaxis(a, axis, 0)
+    n = a.shape[0]
+    k = np.arange(n).reshape((-1,) + (1,) * (a.ndim - 1))
+    reverse = np.zeros_like(a)
+    reverse[1:] = a[:0:-1]
+    v = np.fft.ifft(np.exp(0.5j * np.pi * k / n) * (a - 1j * reverse), axis=0).real
+    result = np.empty_like(v)
+    half = (n + 1) // 2
+    result[::2] = v[:half]
+    result[1::2] = v[half:][::-1]
+    return np.moveaxis(result, 0, axis)
+
+
+def solve_pde_direct(F, U):
+    """Solve the partial differential equation of the relief directly.
+
+    The discrete Laplacian of atimes mirrors the image at its borders, so
+    the cosine transform turns it into a division by its eigenvalues. This
+    gives the exact solution in one step, up to a constant that tonemap
+    removes, which is what solve_pde_multigrid approaches with more
+    iterations. It can't hold the planar areas down like the multigrid
+    solver does.
+
+    Args:
+        F (numpy.ndarray): The right-hand side of the PDE represented as a 2D array.
+        U (numpy.ndarray): Array for the solution, modified in place.
+    """
+    sx = F.shape[0]
+    sy = F.shape[1]
+
+    eigenvalues = np.add.outer(
+        2 * np.cos(np.pi * np.arange(sx) / sx) - 2,
+        2 * np.cos(np.pi * np.arange(sy) / sy) - 2,
+    )
+    # the mean height is free, the average of the right-hand side has no solution
+    eigenvalues[0, 0] = 1
+    transformed = _dct(_dct(F, 0), 1) / eigenvalues
+    transformed[0, 0] = 0
+
+    U[:] = _idct(_idct(transformed, 0), 1)
+
+
 def asolve(b, x):
-    x[:] = -4 * b
+    np.multiply(b, -4, out=x)
 
 
 def atimes(x, res):
@@ -490,7 +486,16 @@ def atimes(x, res):
         None: The result is stored directly in the `res` array.
     """
 
-    res[1:-1, 1:-1] = x[:-2, 1:-1] + x[2:, 1:-1] + x[1:-1, :-2] + x[1:-1, 2:] - 4 * x[1:-1, 1:-1]
+    if np.shares_memory(x, res):
+        x = x.copy()
+
+    # the interior is summed in place, as this runs in every iteration of linear_bcg
+    inner = res[1:-1, 1:-1]
+    np.multiply(x[1:-1, 1:-1], -4, out=inner)
+    inner += x[:-2, 1:-1]
+    inner += x[2:, 1:-1]
+    inner += x[1:-1, :-2]
+    inner += x[1:-1, 2:]
     # sides
     res[1:-1, 0] = x[0:-2, 0] + x[2:, 0] + x[1:-1, 1] - 3 * x[1:-1, 0]
     res[1:-1, -1] = x[0:-2, -1] + x[2:, -1] + x[1:-1, -2] - 3 * x[1:-1, -1]
@@ -525,15 +530,13 @@ def snrm(n, sx, itol):
     """
 
     if itol <= 3:
-        temp = sx * sx
-        ans = temp.sum()
-        return sqrt(ans)
+        return sqrt(np.vdot(sx, sx))
     else:
         temp = np.abs(sx)
         return temp.max()
 
 
-def linear_bcg(n, b, x, itol, tol, itmax, iter, err, rows, cols, planar):
+def linear_bcg(n, b, x, itol, tol, itmax, iter, err, rows, cols, planar, work=None):
     """Solve a linear system using the Biconjugate Gradient Method.
 
     This function implements the Biconjugate Gradient Method as described in
@@ -555,21 +558,20 @@ def linear_bcg(n, b, x, itol, tol, itmax, iter, err, rows, cols, planar):
         rows (int): The number of rows in the matrix.
         cols (int): The number of columns in the matrix.
         planar (bool): A flag indicating if the problem is planar.
+        work (list, optional): Seven arrays of the shape of `x`, reused between calls
+            so that the iterations don't allocate. New arrays are made if None.
 
     Returns:
         None: The solution is stored in the input array `x`.
     """
 
-    p = np.zeros((cols, rows))
-    pp = np.zeros((cols, rows))
-    r = np.zeros((cols, rows))
-    rr = np.zeros((cols, rows))
-    z = np.zeros((cols, rows))
-    zz = np.zeros((cols, rows))
+    if work is None:
+        work = [np.empty((cols, rows)) for i in range(7)]
+    p, pp, r, rr, z, zz, scratch = work
 
     iter = 0
     atimes(x, r)
-    r[:] = b - r
+    np.subtract(b, r, out=r)
     rr[:] = r
 
     atimes(r, rr)  # minimum residual
@@ -598,11 +600,7 @@ def linear_bcg(n, b, x, itol, tol, itmax, iter, err, rows, cols, planar):
         zm1nrm = znrm
         asolve(rr, zz)
 
-        bknum = 0.0
-
-        temp = z * rr
-
-        bknum = temp.sum()  # -z[0]*rr[0]????
+        bknum = np.vdot(z, rr)  # -z[0]*rr[0]????
 
         if iter == 1:
             p[:] = z
@@ -610,18 +608,22 @@ def linear_bcg(n, b, x, itol, tol, itmax, iter, err, rows, cols, planar):
 
         else:
             bk = bknum / bkden
-            p = bk * p + z
-            pp = bk * pp + zz
+            p *= bk
+            p += z
+            pp *= bk
+            pp += zz
         bkden = bknum
         atimes(p, z)
-        temp = z * pp
-        akden = temp.sum()
+        akden = np.vdot(z, pp)
         ak = bknum / akden
         atimes(pp, zz)
 
-        x += ak * p
-        r -= ak * z
-        rr -= ak * zz
+        np.multiply(p, ak, out=scratch)
+        x += scratch
+        np.multiply(z, ak, out=scratch)
+        r -= scratch
+        np.multiply(zz, ak, out=scratch)
+        rr -= scratch
 
         asolve(r, z)
 
@@ -677,25 +679,101 @@ def tonemap(i, exponent):
     i[:] **= exponent
 
 
-def vert(column, row, z, XYscaling, Zscaling):
-    """Create a single vertex in 3D space.
+def _flat_rectangles(heights):
+    """Find rectangles of grid cells whose corners all have the same height.
 
-    This function calculates the 3D coordinates of a vertex based on the
-    provided column and row values, as well as scaling factors for the X-Y
-    and Z dimensions. The resulting coordinates are scaled accordingly to
-    fit within a specified 3D space.
+    Runs of flat cells in each row are merged with the same runs in the
+    following rows.
 
     Args:
-        column (float): The column value representing the X coordinate.
-        row (float): The row value representing the Y coordinate.
-        z (float): The Z coordinate value.
-        XYscaling (float): The scaling factor for the X and Y coordinates.
-        Zscaling (float): The scaling factor for the Z coordinate.
+        heights (numpy.ndarray): 2D array of the grid vertex heights.
 
     Returns:
-        tuple: A tuple containing the scaled X, Y, and Z coordinates.
+        list: (first row, first column, last row, last column) corner
+            indices of the rectangles.
     """
-    return column * XYscaling, row * XYscaling, z * Zscaling
+    corner = heights[:-1, :-1]
+    flat = (corner == heights[:-1, 1:]) & (corner == heights[1:, 1:]) & (corner == heights[1:, :-1])
+
+    rectangles = []
+    open_runs = {}
+    for r, row in enumerate(flat):
+        # neighbouring flat cells share two corners, so they are at the same height
+        starts = np.flatnonzero(row & ~np.concatenate(([False], row[:-1])))
+        ends = np.flatnonzero(row & ~np.concatenate((row[1:], [False]))) + 1
+        runs = {}
+        for run in zip(starts.tolist(), ends.tolist()):
+            runs[run] = open_runs.pop(run, r)
+        for (c0, c1), r0 in open_runs.items():
+            rectangles.append((r0, c0, r, c1))
+        open_runs = runs
+
+    for (c0, c1), r0 in open_runs.items():
+        rectangles.append((r0, c0, len(flat), c1))
+    return rectangles
+
+
+def grid_mesh(name, heights, merge_flat=False):
+    """Create a mesh from a height map, with one vertex per pixel.
+
+    Vertex (i, j) is at (i, j, heights[i, j]) and the pixels are connected
+    with quads. The vertex and face arrays are written with foreach_set,
+    without going through Python lists.
+
+    Args:
+        name (str): Name of the mesh.
+        heights (numpy.ndarray): 2D array of the vertex heights.
+        merge_flat (bool): Merge areas of the same height into single faces.
+            The faces keep all the vertices on their borders, so the mesh
+            keeps its shape and has no gaps.
+
+    Returns:
+        bpy.types.Mesh: The grid mesh.
+    """
+    rows, columns = heights.shape
+    i, j = np.meshgrid(np.arange(rows), np.arange(columns), indexing="ij")
+    vertices = np.column_stack((i.ravel(), j.ravel(), heights.ravel())).astype(np.float32)
+
+    cells = np.ones((rows - 1, columns - 1), dtype=bool)
+    polygons = []
+    if merge_flat:
+        for r0, c0, r1, c1 in _flat_rectangles(heights):
+            cells[r0:r1, c0:c1] = False
+            polygons.append(
+                np.concatenate(
+                    (
+                        r0 * columns + np.arange(c0, c1),
+                        np.arange(r0, r1) * columns + c1,
+                        r1 * columns + np.arange(c1, c0, -1),
+                        np.arange(r1, r0, -1) * columns + c0,
+                    )
+                )
+            )
+
+    # first vertex of the quad of each cell, the others follow counterclockwise
+    first = (i[:-1, :-1] * columns + j[:-1, :-1])[cells]
+    quads = first[:, np.newaxis] + np.array([0, 1, columns + 1, columns])
+    loops = np.concatenate([quads.ravel()] + polygons).astype(np.int32)
+    loop_totals = np.array([4] * len(quads) + [len(p) for p in polygons], dtype=np.int32)
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+
+    if merge_flat:
+        # vertices inside the merged areas are not used by any face
+        used = np.zeros(len(vertices), dtype=bool)
+        used[loops] = True
+        loops = (np.cumsum(used, dtype=np.int32) - 1)[loops]
+        vertices = vertices[used]
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(vertices))
+    mesh.loops.add(len(loops))
+    mesh.polygons.add(len(loop_starts))
+    mesh.attributes["position"].data.foreach_set("vector", vertices.ravel())
+    mesh.attributes[".corner_vert"].data.foreach_set("value", loops)
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    mesh.update(calc_edges=True)
+    return mesh
 
 
 def build_mesh(mesh_z, br):
@@ -705,20 +783,18 @@ def build_mesh(mesh_z, br):
     (mesh_z) and applies various transformations such as scaling and
     positioning based on the parameters defined in the br object. It first
     removes any existing BasReliefMesh objects from the scene, then creates
-    a new mesh from the height data, and finally applies decimation if the
-    specified ratio is within acceptable limits.
+    a new mesh from the height data, optionally merging its flat areas, and
+    finally applies decimation if the specified ratio is within acceptable
+    limits.
 
     Args:
         mesh_z (numpy.ndarray): A 2D array representing the height values
             for the mesh vertices.
         br (object): An object containing properties for width, height,
-            thickness, justification, and decimation ratio.
+            thickness, justification, flat area merging and decimation
+            ratio.
     """
 
-    global rows
-    global size
-    scale = 1
-    scalez = 1
     decimateRatio = br.decimate_ratio  # get variable from interactive table
     bpy.ops.object.select_all(action="DESELECT")
     for object in bpy.data.objects:
@@ -727,36 +803,10 @@ def build_mesh(mesh_z, br):
             log.info("Old BasRelief Removed")
 
     log.info("Building Mesh")
-    numY = mesh_z.shape[1]
-    numX = mesh_z.shape[0]
-    log.info(f"{numX}, {numY}")
-
-    verts = list()
-    faces = list()
-
-    for i, row in enumerate(mesh_z):
-        for j, col in enumerate(row):
-            verts.append(vert(i, j, col, scale, scalez))
-
-    count = 0
-    for i in range(0, numY * (numX - 1)):
-        if count < numY - 1:
-            A = i  # the first vertex
-            B = i + 1  # the second vertex
-            C = (i + numY) + 1  # the third vertex
-            D = i + numY  # the fourth vertex
-
-            face = (A, B, C, D)
-            faces.append(face)
-            count = count + 1
-        else:
-            count = 0
+    log.info(f"{mesh_z.shape[0]}, {mesh_z.shape[1]}")
 
     # Create Mesh Datablock
-    mesh = bpy.data.meshes.new("displacement")
-    mesh.from_pydata(verts, [], faces)
-
-    mesh.update()
+    mesh = grid_mesh("displacement", mesh_z, br.merge_flat_areas)
 
     # make object from mesh
     new_object = bpy.data.objects.new("BasReliefMesh", mesh)
@@ -1025,6 +1075,8 @@ def relief(br):
             processing.
             - use_planar (bool): Flag to indicate if planar processing should be
             used.
+            - use_direct_solve (bool): Flag to solve the relief directly instead of
+            with multigrid iterations, if planar processing isn't used.
             - gradient_scaling_mask_use (bool): Flag to indicate if a gradient
             scaling mask should be used.
             - gradient_scaling_mask_name (str): Name of the gradient scaling mask
@@ -1160,17 +1212,20 @@ def relief(br):
 
     target = np.zeros_like(divg)
 
-    solve_pde_multigrid(
-        divg,
-        target,
-        vcycleiterations,
-        linbcgiterations,
-        smoothiterations,
-        mins,
-        levels,
-        useplanar,
-        planar,
-    )
+    if br.use_direct_solve and not useplanar:
+        solve_pde_direct(divg, target)
+    else:
+        solve_pde_multigrid(
+            divg,
+            target,
+            vcycleiterations,
+            linbcgiterations,
+            smoothiterations,
+            mins,
+            levels,
+            useplanar,
+            planar,
+        )
 
     tonemap(target, 1)
 
@@ -0,0 +1,220 @@
+"""Fabex 'sort_utils.py' © 2025
+
+Spatial index used to find the closest chunk during path sorting.
+"""
+
+from math import (
+    floor,
+    sqrt,
+)
+
+import numpy as np
+
+# chunks further than this from the current position are never picked
+MAX_SORT_DISTANCE = 2000
+
+
+class ChunkSortIndex:
+    """Grid index over the entry points of chunks that are waiting to be sorted.
+
+    Closed chunks are indexed by all of their vertices, open chunks by their
+    start point, or by both ends when milling in MEANDER mode - the same points
+    that CamPathChunk.distance looks at.
+
+    Only chunks that are ready to be milled (all of their children already
+    sorted) are kept in the grid. Readiness is tracked with a counter of
+    unsorted children per chunk, so a chunk enters the grid as soon as
+    its last child is consumed, and leaves it when it is consumed itself.
+
+    Ties are resolved by the position of the chunk in the original list, so
+    the result is the same as a linear scan of the list in order.
+    """
+
+    def __init__(self, chunks, o):
+        self.o = o
+        self.chunks = list(chunks)
+        self.position = {id(ch): i for i, ch in reversed(list(enumerate(self.chunks)))}
+        self.consumed = np.zeros(len(self.chunks), dtype=bool)
+        self.remaining = len(self.chunks)
+
+        # readiness counters - chunks waiting for each child are stored by the child's id
+        self.pending = np.zeros(len(self.chunks), dtype=np.int64)
+        self.dependents = {}
+        for i, ch in enumerate(self.chunks):
+            for child in ch.children:
+                if not child.sorted:
+                    self.pending[i] += 1
+                    self.dependents.setdefault(id(child), []).append(i)
+
+        meander = o.movement.type == "MEANDER"
+        chunk_points = []
+        for ch in self.chunks:
+            points = ch.get_points_np()
+            if len(points) == 0:
+                chunk_points.append(np.empty((0, 2)))
+            elif ch.closed:
+                chunk_points.append(points[:, :2])
+            elif meander:
+                chunk_points.append(points[[0, -1], :2])
+            else:
+                chunk_points.append(points[:1, :2])
+
+        all_points = np.concatenate(chunk_points) if len(chunk_points) > 0 else np.empty((0, 2))
+        if len(all_points) > 0:
+            self.min_x, self.min_y = np.min(all_points, axis=0)
+            max_x, max_y = np.max(all_points, axis=0)
+        else:
+            self.min_x = self.min_y = max_x = max_y = 0.0
+
+        # aim for roughly one indexed point per cell
+        width = max_x - self.min_x
+        height = max_y - self.min_y
+        count = max(len(all_points), 1)
+        self.cell_size = max(sqrt(width * height / count), max(width, height) / count)
+        if self.cell_size <= 0:
+            self.cell_size = 1.0
+
+        self.size_x = int(width / self.cell_size) + 1
+        self.size_y = int(height / self.cell_size) + 1
+
+        self.chunk_cells = []
+        for points in chunk_points:
+            if len(points) == 0:
+                self.chunk_cells.append(())
+                continue
+            cx = np.minimum(
+                ((points[:, 0] - self.min_x) / self.cell_size).astype(int), self.size_x - 1
+            )
+            cy = np.minimum(
+                ((points[:, 1] - self.min_y) / self.cell_size).astype(int), self.size_y - 1
+            )
+            self.chunk_cells.append(tuple(set(zip(cx.tolist(), cy.tolist()))))
+
+        self.cells = {}
+        self.ready = set()
+        for i in range(len(self.chunks)):
+            if self.pending[i] == 0:
+                self._insert(i)
+
+    def _insert(self, i):
+        self.ready.add(i)
+        for cell in self.chunk_cells[i]:
+            self.cells.setdefault(cell, set()).add(i)
+
+    def _discard(self, i):
+        self.ready.discard(i)
+        for cell in self.chunk_cells[i]:
+            members = self.cells.get(cell)
+            if members is not None:
+                members.discard(i)
+                if not members:
+                    del self.cells[cell]
+
+    def __len__(self):
+        return self.remaining
+
+    def contains(self, ch):
+        i = self.position.get(id(ch))
+        return i is not None and not self.consumed[i]
+
+    def consume(self, ch):
+        """Remove a chunk from the index.
+
+        Must be called after the chunk's 'sorted' flag is set, so parents
+        waiting for it can become ready.
+        """
+        i = self.position[id(ch)]
+        self.consumed[i] = True
+        self.remaining -= 1
+        self._discard(i)
+
+        for parent in self.dependents.pop(id(ch), ()):
+            self.pending[parent] -= 1
+            if self.pending[parent] == 0 and not self.consumed[parent]:
+                self._insert(parent)
+
+    def remaining_chunks(self):
+        return [ch for i, ch in enumerate(self.chunks) if not self.consumed[i]]
+
+    def _best(self, candidates, pos, best_d, best_i):
+        for i in candidates:
+            if len(self.chunk_cells[i]) == 0:
+                continue
+            d = self.chunks[i].distance(pos, self.o)
+            if d < best_d or (d == best_d and best_i is not None and i < best_i):
+                best_d = d
+                best_i = i
+        return best_d, best_i
+
+    def closest(self, pos):
+        """Find the closest ready chunk to pos.
+
+        Args:
+            pos (tuple): Current position of the cutter.
+
+        Returns:
+            CamPathChunk: The closest chunk that can be milled, or None if no chunk
+                is closer than MAX_SORT_DISTANCE.
+        """
+        if not self.ready:
+            return None
+
+        best_d = MAX_SORT_DISTANCE
+        best_i = None
+        cell = self.cell_size
+        px = floor((pos[0] - self.min_x) / cell)
+        py = floor((pos[1] - self.min_y) / cell)
+
+        # rings closer than this are empty, rings further away don't exist
+        first_ring = max(0, -px, px - self.size_x + 1, -py, py - self.size_y + 1)
+        last_ring = max(px, self.size_x - 1 - px, py, self.size_y - 1 - py)
+        scan_limit = len(self.ready)
+        scanned = 0
+        seen = set()
+
+        for ring in range(first_ring, last_ring + 1):
+            # everything outside this ring is at least this far away
+            if best_i is not None and best_d < (ring - 1) * cell:
+                break
+            if (ring - 1) * cell >= MAX_SORT_DISTANCE:
+                break
+            if scanned > scan_limit:
+                # sparse index far from pos, scanning the ready chunks directly is cheaper
+                return self._closest_linear(pos)
+
+            candidates = set()
+            for cx, cy in self._ring_cells(px, py, ring):
+                scanned += 1
+                members = self.cells.get((cx, cy))
+                if members:
+                    candidates.update(members)
+            candidates -= seen
+            seen |= candidates
+            best_d, best_i = self._best(candidates, pos, best_d, best_i)
+
+        return self.chunks[best_i] if best_i is not None else None
+
+    def _closest_linear(self, pos):
+        best_d, best_i = self._best(self.ready, pos, MAX_SORT_DISTANCE, None)
+        return self.chunks[best_i] if best_i is not None else None
+
+    def _ring_cells(self, px, py, ring):
+        min_x = max(px - ring, 0)
+        max_x = min(px + ring, self.size_x - 1)
+        min_y = max(py - ring, 0)
+        max_y = min(py + ring, self.size_y - 1)
+        if min_x > max_x or min_y > max_y:
+            return
+        if ring == 0:
+            yield px, py
+            return
+        # top and bottom rows
+        for y in (py - ring, py + ring):
+            if min_y <= y <= max_y:
+                for x in range(min_x, max_x + 1):
+                    yield x, y
+        # left and right columns, without the corners
+        for x in (px - ring, px + ring):
+            if min_x <= x <= max_x:
+                for y in range(max(py - ring + 1, 0), min(py + ring - 1, self.size_y - 1) + 1):
+                    yield x, y
@@ -229,6 +229,13 @@ def get_strategy_list(scene, context):
             "SHARPCURVE",
             12,
         ),
+        (
+            "CRAZY",
+            "Adaptive",
+            "Adaptive clearing with constant cutter engagement, for roughing at full depth",
+            "FORCE_TURBULENCE",
+            13,
+        ),
     ]
     return items
 
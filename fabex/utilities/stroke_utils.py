@@ -1,607 +1,558 @@
+"""Fabex 'stroke_utils.py' © 2025
+
+Adaptive clearing, where the cutter follows the edge of the remaining
+material and keeps its engagement constant.
+
+The material is a bitmap in the pixels of the operation images. Each of its
+rows has an integral image, so the material under the cutter at any position
+is one difference per row of the cutter.
+"""
+
 from math import (
-    ceil,
-    pi,
+    acos,
+    degrees,
 )
-import random
 
 import numpy as np
-import numpy as np
-
-from mathutils import Vector, Euler
-
 
-from ..chunk_builder import (
-    CamPathChunk,
-    CamPathChunkBuilder,
-)
-from .geom_utils import get_circle_binary
-from .image_utils import (
-    prepare_area,
-)
+from ..chunk_builder import CamPathChunk
+from .image_utils import get_sample_image_array
 from .logging_utils import log
 from .operation_utils import get_move_and_spin
-from .parent_utils import (
-    parent_child_distance,
-)
+from .simple_utils import progress
 
+# directions tested in each step, spread evenly up to this angle to both sides
+ADAPTIVE_TURN = np.pi / 2
+ADAPTIVE_DIRECTIONS = 65
 
-def crazy_stroke_image(o):
-    """Generate a toolpath for a milling operation using a crazy stroke
-    strategy.
+# every this many directions are tested first, then the ones between them
+ADAPTIVE_REFINE = 4
 
-    This function computes a path for a milling cutter based on the provided
-    parameters and the offset image. It utilizes a circular cutter
-    representation and evaluates potential cutting positions based on
-    various thresholds. The algorithm iteratively tests different angles and
-    lengths for the cutter's movement until the desired cutting area is
-    achieved or the maximum number of tests is reached.
+# steps removing less than this fraction of the target engagement are moves in the air
+ADAPTIVE_AIR = 0.05
 
-    Args:
-        o (object): An object containing parameters such as cutter diameter,
-            optimization settings, movement type, and thresholds for
-            determining cutting effectiveness.
+# material under the cutter below this fraction of the target engagement is left for finishing
+ADAPTIVE_REST = 0.2
 
-    Returns:
-        list: A list of chunks representing the computed toolpath for the milling
-            operation.
-    """
+# shortest step in pixels, before giving up on following the material
+ADAPTIVE_MIN_STEP = 0.25
 
-    # this surprisingly works, and can be used as a basis for something similar to adaptive milling strategy.
-    minx, miny, minz, maxx, maxy, maxz = o.min.x, o.min.y, o.min.z, o.max.x, o.max.y, o.max.z
-    climb_CW, climb_CCW, conventional_CW, conventional_CCW = get_move_and_spin(o)
 
-    r = int((o.cutter_diameter / 2.0) / o.optimisation.pixsize)
-    d = 2 * r
-    coef = 0.75
-    ar = o.offset_image.copy()
-    maxarx = ar.shape[0]
-    maxary = ar.shape[1]
-    cutterArray = get_circle_binary(r)
-    cutterArrayNegative = -cutterArray
-    cutterimagepix = cutterArray.sum()
-    # a threshold which says if it is valuable to cut in a direction
-    satisfypix = cutterimagepix * o.crazy_threshold_1
-    toomuchpix = cutterimagepix * o.crazy_threshold_2
-    indices = ar.nonzero()  # first get white pixels
-    startpix = ar.sum()  #
-    totpix = startpix
-    chunk_builders = []
-    xs = indices[0][0] - r
-
-    if xs < r:
-        xs = r
-    ys = indices[1][0] - r
-
-    if ys < r:
-        ys = r
-
-    nchunk = CamPathChunkBuilder([(xs, ys)])  # startposition
-    log.info(indices)
-    log.info(f"{indices[0][0]}, {indices[1][0]}")
-    # vector is 3d, blender somehow doesn't rotate 2d vectors with angles.
-    lastvect = Vector((r, 0, 0))
-    # multiply *2 not to get values <1 pixel
-    testvect = lastvect.normalized() * r / 2.0
-    rot = Euler((0, 0, 1))
-    i = 0
-    perc = 0
-    itests = 0
-    totaltests = 0
-    maxtests = 500
-    maxtotaltests = 1000000
-
-    log.info(f"{xs}, {ys}, {indices[0][0]}, {indices[1][0]}, {r}")
-    ar[xs - r : xs - r + d, ys - r : ys - r + d] = (
-        ar[xs - r : xs - r + d, ys - r : ys - r + d] * cutterArrayNegative
-    )
-    # range for angle of toolpath vector versus material vector
-    anglerange = [-pi, pi]
-    testangleinit = 0
-    angleincrement = 0.05
-
-    if climb_CCW or conventional_CW:
-        anglerange = [-pi, 0]
-        testangleinit = 1
-        angleincrement = -angleincrement
-    elif conventional_CCW or climb_CW:
-        anglerange = [0, pi]
-        testangleinit = -1
-        angleincrement = angleincrement
-
-    while totpix > 0 and totaltests < maxtotaltests:  # a ratio when the algorithm is allowed to end
-        success = False
-        # define a vector which gets varied throughout the testing, growing and growing angle to sides.
-        testangle = testangleinit
-        testleftright = False
-        testlength = r
-
-        while not success:
-            xs = nchunk.points[-1][0] + int(testvect.x)
-            ys = nchunk.points[-1][1] + int(testvect.y)
-
-            if xs > r + 1 and xs < ar.shape[0] - r - 1 and ys > r + 1 and ys < ar.shape[1] - r - 1:
-                testar = ar[xs - r : xs - r + d, ys - r : ys - r + d] * cutterArray
-                if 0:
-                    log.info("Test")
-                    log.info(f"{testar.sum()}, {satisfypix}")
-                    log.info(f"{xs}, {ys}, {testlength}, {testangle}")
-                    log.info(lastvect)
-                    log.info(testvect)
-                    log.info(totpix)
-
-                eatpix = testar.sum()
-                cindices = testar.nonzero()
-                cx = cindices[0].sum() / eatpix
-                cy = cindices[1].sum() / eatpix
-                v = Vector((cx - r, cy - r))
-                angle = testvect.to_2d().angle_signed(v)
-                # this could be righthanded milling? lets see :)
-
-                if anglerange[0] < angle < anglerange[1]:
-                    if toomuchpix > eatpix > satisfypix:
-                        success = True
-
-            if success:
-                nchunk.points.append([xs, ys])
-                lastvect = testvect
-                ar[xs - r : xs - r + d, ys - r : ys - r + d] = ar[
-                    xs - r : xs - r + d, ys - r : ys - r + d
-                ] * (-cutterArray)
-                totpix -= eatpix
-                itests = 0
-
-                if 0:
-                    log.info("Success")
-                    log.info(f"{xs}, {ys}, {testlength}, {testangle}")
-                    log.info(lastvect)
-                    log.info(testvect)
-                    log.info(itests)
-            else:
-                # TODO: after all angles were tested into material higher than toomuchpix, it should cancel,
-                #  otherwise there is no problem with long travel in free space.....
-                # TODO:the testing should start not from the same angle as lastvector, but more towards material.
-                #  So values closer to toomuchpix are obtained rather than satisfypix
-                testvect = lastvect.normalized() * testlength
-                right = True
-
-                if testangleinit == 0:  # meander
-                    if testleftright:
-                        testangle = -testangle
-                        testleftright = False
-                    else:
-                        testangle = abs(testangle) + angleincrement  # increment angle
-                        testleftright = True
-                else:  # climb/conv.
-                    testangle += angleincrement
-
-                if abs(testangle) > o.crazy_threshold_3:  # /testlength
-                    testangle = testangleinit
-                    testlength += r / 4.0
-                if nchunk.points[-1][0] + testvect.x < r:
-                    testvect.x = r
-                if nchunk.points[-1][1] + testvect.y < r:
-                    testvect.y = r
-                if nchunk.points[-1][0] + testvect.x > maxarx - r:
-                    testvect.x = maxarx - r
-                if nchunk.points[-1][1] + testvect.y > maxary - r:
-                    testvect.y = maxary - r
-
-                rot.z = testangle
-                testvect.rotate(rot)
-
-            itests += 1
-            totaltests += 1
-
-            if itests > maxtests or testlength > r * 1.5:
-                indices = ar.nonzero()
-                chunk_builders.append(nchunk)
-
-                if len(indices[0]) > 0:
-                    xs = indices[0][0] - r
-
-                    if xs < r:
-                        xs = r
-                    ys = indices[1][0] - r
-
-                    if ys < r:
-                        ys = r
-                    nchunk = CamPathChunkBuilder([(xs, ys)])  # startposition
-                    ar[xs - r : xs - r + d, ys - r : ys - r + d] = (
-                        ar[xs - r : xs - r + d, ys - r : ys - r + d] * cutterArrayNegative
-                    )
-                    r = random.random() * 2 * pi
-                    e = Euler((0, 0, r))
-                    testvect = lastvect.normalized() * 4  # multiply *2 not to get values <1 pixel
-                    testvect.rotate(e)
-                    lastvect = testvect.copy()
-                success = True
-                itests = 0
-        i += 1
-
-        if i % 100 == 0:
-            log.info("100 Succesfull Tests Done")
-            totpix = ar.sum()
-            log.info(totpix)
-            log.info(totaltests)
-            i = 0
-
-    chunk_builders.append(nchunk)
-
-    for ch in chunk_builders:
-        ch = ch.points
-
-        for i in range(0, len(ch)):
-            ch[i] = (
-                (ch[i][0] + coef - o.borderwidth) * o.optimisation.pixsize + minx,
-                (ch[i][1] + coef - o.borderwidth) * o.optimisation.pixsize + miny,
-                0,
-            )
+def disk_spans(radius):
+    """Half widths of the rows of a disk of pixels.
 
-    return [c.to_chunk() for c in chunk_builders]
+    Args:
+        radius (float): Radius of the disk in pixels.
 
+    Returns:
+        tuple: Row offsets from the center and the half width of each row.
+    """
+    r = int(radius)
+    rows = np.arange(-r, r + 1)
+    return rows, np.floor(np.sqrt(radius * radius - rows * rows)).astype(np.int64)
 
-def crazy_stroke_image_binary(o, ar, avoidar):
-    """Perform a milling operation using a binary image representation.
 
-    This function implements a strategy for milling by navigating through a
-    binary image. It starts from a defined point and attempts to move in
-    various directions, evaluating the cutter load to determine the
-    appropriate path. The algorithm continues until it either exhausts the
-    available pixels to cut or reaches a predefined limit on the number of
-    tests. The function modifies the input array to represent the areas that
-    have been milled and returns the generated path as a list of chunks.
+def dilate_image(image, radius):
+    """Grow the True areas of a binary image by a disk.
 
     Args:
-        o (object): An object containing parameters for the milling operation, including
-            cutter diameter, thresholds, and movement type.
-        ar (np.ndarray): A 2D binary array representing the image to be milled.
-        avoidar (np.ndarray): A 2D binary array indicating areas to avoid during milling.
+        image (numpy.ndarray): 2D boolean array.
+        radius (float): Radius of the disk in pixels.
 
     Returns:
-        list: A list of chunks representing the path taken during the milling
-            operation.
+        numpy.ndarray: True for pixels within the radius of a True pixel.
+    """
+    rows, spans = disk_spans(radius)
+    r = len(rows) // 2
+    width, height = image.shape
+    padded = np.pad(image, r + 1)
+    prefix = np.zeros((padded.shape[0], padded.shape[1] + 1), dtype=np.int32)
+    np.cumsum(padded, axis=1, out=prefix[:, 1:])
+
+    result = np.zeros(image.shape, dtype=bool)
+    for row, span in zip(rows, spans):
+        rowprefix = prefix[r + 1 + row : r + 1 + row + width]
+        end = r + 2 + span
+        start = r + 1 - span
+        result |= rowprefix[:, end : end + height] > rowprefix[:, start : start + height]
+    return result
+
+
+class MaterialImage:
+    """Material bitmap with integral images of its rows.
+
+    A pixel is under the cutter if its center is within the cutter radius,
+    for cutter positions anywhere between pixel centers. The cutter must stay
+    at least its radius plus two pixels away from the image border.
     """
 
-    # this surprisingly works, and can be used as a basis for something similar to adaptive milling strategy.
-    # works like this:
-    # start 'somewhere'
-    # try to go in various directions.
-    # if somewhere the cutter load is appropriate - it is correct magnitude and side, continue in that directon
-    # try to continue straight or around that, looking
-    minx, miny, minz, maxx, maxy, maxz = o.min.x, o.min.y, o.min.z, o.max.x, o.max.y, o.max.z
-    climb_CW, climb_CCW, conventional_CW, conventional_CCW = get_move_and_spin(o)
-    # TODO this should be somewhere else, but here it is now to get at least some ambient for start of the operation.
-    ar[: o.borderwidth, :] = 0
-    ar[-o.borderwidth :, :] = 0
-    ar[:, : o.borderwidth] = 0
-    ar[:, -o.borderwidth :] = 0
-
-    # ceil((o.cutter_diameter/12)/o.optimisation.pixsize)
-    r = int((o.cutter_diameter / 2.0) / o.optimisation.pixsize)
-    d = 2 * r
-    coef = 0.75
-    maxarx = ar.shape[0]
-    maxary = ar.shape[1]
-
-    cutterArray = get_circle_binary(r)
-    cutterArrayNegative = -cutterArray
-
-    cutterimagepix = cutterArray.sum()
-
-    anglelimit = o.crazy_threshold_3
-    # a threshold which says if it is valuable to cut in a direction
-    satisfypix = cutterimagepix * o.crazy_threshold_1
-    toomuchpix = cutterimagepix * o.crazy_threshold_2  # same, but upper limit
-    # (satisfypix+toomuchpix)/2.0# the ideal eating ratio
-    optimalpix = cutterimagepix * o.crazy_threshold_5
-    indices = ar.nonzero()  # first get white pixels
-
-    startpix = ar.sum()  #
-    totpix = startpix
-
-    chunk_builders = []
-    # try to find starting point here
-
-    xs = indices[0][0] - r / 2
-    if xs < r:
-        xs = r
-    ys = indices[1][0] - r
-    if ys < r:
-        ys = r
-
-    nchunk = CamPathChunkBuilder([(xs, ys)])  # startposition
-    log.info(indices)
-    log.info(f"{indices[0][0]}, {indices[1][0]}")
-    # vector is 3d, blender somehow doesn't rotate 2d vectors with angles.
-    lastvect = Vector((r, 0, 0))
-    # multiply *2 not to get values <1 pixel
-    testvect = lastvect.normalized() * r / 4.0
-    rot = Euler((0, 0, 1))
-    i = 0
-    itests = 0
-    totaltests = 0
-    maxtests = 2000
-    maxtotaltests = 20000  # 1000000
-
-    margin = 0
-
-    # print(xs,ys,indices[0][0],indices[1][0],r)
-    ar[xs - r : xs + r, ys - r : ys + r] = (
-        ar[xs - r : xs + r, ys - r : ys + r] * cutterArrayNegative
-    )
-    anglerange = [-pi, pi]
-    # range for angle of toolpath vector versus material vector -
-    # probably direction negative to the force applied on cutter by material.
-    testangleinit = 0
-    angleincrement = o.crazy_threshold_4
-
-    if climb_CCW or conventional_CW:
-        anglerange = [-pi, 0]
-        testangleinit = anglelimit
-        angleincrement = -angleincrement
-    elif conventional_CCW or climb_CW:
-        anglerange = [0, pi]
-        testangleinit = -anglelimit
-        angleincrement = angleincrement
-
-    while totpix > 0 and totaltests < maxtotaltests:  # a ratio when the algorithm is allowed to end
-        success = False
-        # define a vector which gets varied throughout the testing, growing and growing angle to sides.
-        testangle = testangleinit
-        testleftright = False
-        testlength = r
-        foundsolutions = []
-
-        while not success:
-            xs = int(nchunk.points[-1][0] + testvect.x)
-            ys = int(nchunk.points[-1][1] + testvect.y)
-
-            if (
-                xs > r + margin
-                and xs < ar.shape[0] - r - margin
-                and ys > r + margin
-                and ys < ar.shape[1] - r - margin
-            ):
-                # avoidtest=avoidar[xs-r:xs+r,ys-r:ys+r]*cutterArray
-                if not avoidar[xs, ys]:
-                    testar = ar[xs - r : xs + r, ys - r : ys + r] * cutterArray
-                    eatpix = testar.sum()
-                    cindices = testar.nonzero()
-                    cx = cindices[0].sum() / eatpix
-                    cy = cindices[1].sum() / eatpix
-                    v = Vector((cx - r, cy - r))
-
-                    if v.length != 0:
-                        angle = testvect.to_2d().angle_signed(v)
-                        if (
-                            anglerange[0] < angle < anglerange[1]
-                            and toomuchpix > eatpix > satisfypix
-                        ) or (eatpix > 0 and totpix < startpix * 0.025):
-                            # this could be righthanded milling?
-                            # lets see :)
-                            foundsolutions.append([testvect.copy(), eatpix])
-                            # or totpix < startpix*0.025:
-                            if len(foundsolutions) >= 10:
-                                success = True
-            itests += 1
-            totaltests += 1
-
-            if success:
-                # fist, try to inter/extrapolate the recieved results.
-                closest = 100000000
-
-                for s in foundsolutions:
-                    if abs(s[1] - optimalpix) < closest:
-                        bestsolution = s
-                        closest = abs(s[1] - optimalpix)
-
-                # v1#+(v2-v1)*ratio#rewriting with interpolated vect.
-                testvect = bestsolution[0]
-                xs = int(nchunk.points[-1][0] + testvect.x)
-                ys = int(nchunk.points[-1][1] + testvect.y)
-                nchunk.points.append([xs, ys])
-                lastvect = testvect
-
-                ar[xs - r : xs + r, ys - r : ys + r] = (
-                    ar[xs - r : xs + r, ys - r : ys + r] * cutterArrayNegative
-                )
-                totpix -= bestsolution[1]
-                itests = 0
-                totaltests = 0
-            else:
-                # TODO: after all angles were tested into material higher than toomuchpix,
-                #  it should cancel, otherwise there is no problem with long travel in free space.....
-                # TODO:the testing should start not from the same angle as lastvector, but more towards material.
-                #  So values closer to toomuchpix are obtained rather than satisfypix
-                testvect = lastvect.normalized() * testlength
-
-                if testangleinit == 0:  # meander
-                    if testleftright:
-                        testangle = -testangle - angleincrement
-                        testleftright = False
-                    else:
-                        testangle = -testangle + angleincrement  # increment angle
-                        testleftright = True
-                else:  # climb/conv.
-                    testangle += angleincrement
-
-                if (abs(testangle) > o.crazy_threshold_3 and len(nchunk.points) > 1) or (
-                    abs(testangle) > 2 * pi
-                ):
-                    testangle = testangleinit
-                    testlength += r / 4.0
-
-                if nchunk.points[-1][0] + testvect.x < r:
-                    testvect.x = r
-                if nchunk.points[-1][1] + testvect.y < r:
-                    testvect.y = r
-                if nchunk.points[-1][0] + testvect.x > maxarx - r:
-                    testvect.x = maxarx - r
-                if nchunk.points[-1][1] + testvect.y > maxary - r:
-                    testvect.y = maxary - r
-
-                rot.z = testangle
-                testvect.rotate(rot)
-
-                if itests > maxtests or testlength > r * 1.5:
-                    andar = np.logical_and(ar, np.logical_not(avoidar))
-                    indices = andar.nonzero()
-
-                    if len(nchunk.points) > 1:
-                        parent_child_distance([nchunk], chunks, o, distance=r)
-                        chunk_builders.append(nchunk)
-
-                    if totpix > startpix * 0.001:
-                        found = False
-                        ftests = 0
-
-                        while not found:
-                            # look for next start point:
-                            index = random.randint(0, len(indices[0]) - 1)
-                            xs = indices[0][index]
-                            ys = indices[1][index]
-                            v = Vector((r - 1, 0, 0))
-                            randomrot = random.random() * 2 * pi
-                            e = Euler((0, 0, randomrot))
-                            v.rotate(e)
-                            xs += int(v.x)
-                            ys += int(v.y)
-
-                            if xs < r:
-                                xs = r
-                            if ys < r:
-                                ys = r
-                            if avoidar[xs, ys] == 0:
-                                testarsum = (
-                                    ar[xs - r : xs - r + d, ys - r : ys - r + d].sum() * pi / 4
-                                )
-
-                                if toomuchpix > testarsum > 0 or (totpix < startpix * 0.025):
-                                    # 0 now instead of satisfypix
-                                    found = True
-                                    nchunk = CamPathChunk([(xs, ys)])  # startposition
-                                    ar[xs - r : xs + r, ys - r : ys + r] = (
-                                        ar[xs - r : xs + r, ys - r : ys + r] * cutterArrayNegative
-                                    )
-                                    # lastvect=Vector((r,0,0))#vector is 3d,
-                                    # blender somehow doesn't rotate 2d vectors with angles.
-                                    randomrot = random.random() * 2 * pi
-                                    e = Euler((0, 0, randomrot))
-                                    testvect = lastvect.normalized() * 2
-                                    # multiply *2 not to get values <1 pixel
-                                    testvect.rotate(e)
-                                    lastvect = testvect.copy()
-                            if ftests > 2000:
-                                totpix = 0  # this quits the process now.
-                            ftests += 1
-
-                    success = True
-                    itests = 0
-        i += 1
-
-        if i % 100 == 0:
-            log.info("100 Succesfull Tests Done")
-            totpix = ar.sum()
-            log.info(totpix)
-            log.info(totaltests)
-            i = 0
-
-    if len(nchunk.points) > 1:
-        parent_child_distance([nchunk], chunks, o, distance=r)
-        chunk_builders.append(nchunk)
-
-    for ch in chunk_builders:
-        ch = ch.points
-
-        for i in range(0, len(ch)):
-            ch[i] = (
-                (ch[i][0] + coef - o.borderwidth) * o.optimisation.pixsize + minx,
-                (ch[i][1] + coef - o.borderwidth) * o.optimisation.pixsize + miny,
-                o.min_z,
-            )
+    def __init__(self, material, radius):
+        """
+        Args:
+            material (numpy.ndarray): 2D boolean array, True where material is left.
+            radius (float): Cutter radius in pixels.
+        """
+        self.radius = radius
+        self.rows, self.spans = disk_spans(radius)
+        self.r = len(self.rows) // 2
+        # rows of the cutter at any position, relative to the pixel under its center
+        self.offsets = np.arange(-self.r - 1, self.r + 2)
+
+        self.material = np.array(material, dtype=bool)
+        self.prefix = np.zeros(
+            (self.material.shape[0], self.material.shape[1] + 1),
+            dtype=np.int32,
+        )
+        np.cumsum(self.material, axis=1, out=self.prefix[:, 1:])
+        self.total = int(self.prefix[:, -1].sum())
+
+    def engagement(self, x, y):
+        """Count the material pixels under the cutter at many positions.
+
+        Args:
+            x (numpy.ndarray): First image coordinates of the positions.
+            y (numpy.ndarray): Second image coordinates of the positions.
+
+        Returns:
+            numpy.ndarray: The pixel count at each position.
+        """
+        rows = np.floor(x).astype(np.int64)[:, np.newaxis] + self.offsets
+        half_widths = self.radius * self.radius - (rows - x[:, np.newaxis]) ** 2
+        inside = half_widths >= 0
+        half_widths = np.sqrt(np.maximum(half_widths, 0))
+        start = np.ceil(y[:, np.newaxis] - half_widths).astype(np.int64)
+        end = np.floor(y[:, np.newaxis] + half_widths).astype(np.int64) + 1
+        counts = self.prefix[rows, end] - self.prefix[rows, start]
+        return (counts * inside).sum(axis=1)
+
+    def engagement_grid(self, x, y):
+        """Count the material pixels under the cutter on a grid of pixel centers.
+
+        Args:
+            x (numpy.ndarray): Integer first image coordinates of the grid.
+            y (numpy.ndarray): Integer second image coordinates of the grid.
+
+        Returns:
+            numpy.ndarray: (len(x), len(y)) array of the pixel counts.
+        """
+        rows = (x[:, np.newaxis] + self.rows)[:, np.newaxis, :]
+        columns = y[:, np.newaxis]
+        counts = (
+            self.prefix[rows, columns + self.spans + 1] - self.prefix[rows, columns - self.spans]
+        )
+        return counts.sum(axis=2)
+
+    def _block(self, x, y):
+        # pixels around a cutter position, and which of them are under the cutter
+        x0 = int(np.floor(x)) - self.r - 1
+        y0 = int(np.floor(y)) - self.r - 1
+        size = len(self.offsets)
+        distances = (np.arange(x0, x0 + size) - x)[:, np.newaxis] ** 2 + (
+            np.arange(y0, y0 + size) - y
+        ) ** 2
+        return x0, y0, distances <= self.radius * self.radius
+
+    def material_direction(self, x, y):
+        """Direction from a cutter position to the material under the cutter.
+
+        Returns:
+            numpy.ndarray: Vector to the center of the material pixels, zero
+                if there is none.
+        """
+        x0, y0, mask = self._block(x, y)
+        size = len(self.offsets)
+        indices = np.argwhere(self.material[x0 : x0 + size, y0 : y0 + size] & mask)
+        if len(indices) == 0:
+            return np.zeros(2)
+        return indices.mean(axis=0) + (x0 - x, y0 - y)
+
+    def clear(self, x, y):
+        """Remove the material under the cutter.
+
+        Only the integral images of the rows under the cutter are updated,
+        from the cutter to the end of the row.
+
+        Returns:
+            int: Number of removed pixels.
+        """
+        x0, y0, mask = self._block(x, y)
+        size = len(self.offsets)
+        block = self.material[x0 : x0 + size, y0 : y0 + size]
+        removed = block & mask
+        count = np.count_nonzero(removed)
+        if count > 0:
+            block &= ~mask
+            removed = np.cumsum(removed, axis=1, dtype=np.int32)
+            rows = slice(x0, x0 + size)
+            self.prefix[rows, y0 + 1 : y0 + size + 1] -= removed
+            self.prefix[rows, y0 + size + 1 :] -= removed[:, -1:]
+            self.total -= count
+        return count
+
+
+class AdaptiveClearing:
+    """Adaptive clearing of a material bitmap.
+
+    The cutter enters where it removes least material, with a spiral if it
+    has to plunge, then follows the edge of the material. In each step it
+    tests directions from the material side to the free side, and moves in
+    the first one where the removed material is not more than the target
+    engagement: the step length times the stepover, which is what the cutter
+    removes moving along a straight edge at that stepover. If no direction
+    fits, the step gets shorter. Strokes end when the cutter runs out of
+    material and the next stroke continues without lifting if the way to it
+    is already cleared.
+    """
 
-    return [c.to_chunk for c in chunk_builders]
+    def __init__(self, material, allowed, radius, stepover, material_left):
+        """
+        Args:
+            material (numpy.ndarray): 2D boolean array, True where material is left.
+            allowed (numpy.ndarray): 2D boolean array, True where the cutter center
+                can go.
+            radius (float): Cutter radius in pixels.
+            stepover (float): Stepover in pixels, the width of the material
+                removed along straight edges.
+            material_left (bool): Keep the material on the left of the cutter,
+                for climb milling with a counterclockwise spindle or conventional
+                milling with a clockwise one.
+        """
+        self.image = MaterialImage(material, radius)
+        margin = self.image.r + 2
+
+        self.allowed = np.zeros(allowed.shape, dtype=bool)
+        width, height = allowed.shape
+        self.allowed[margin : width - margin, margin : height - margin] = allowed[
+            margin : width - margin, margin : height - margin
+        ]
+
+        self.stepover = min(max(stepover, 1.0), 2 * radius)
+        self.step = min(self.stepover, max(radius / 2, 1.0))
+        self.target = self.step * self.stepover
+        self.air = max(ADAPTIVE_AIR * self.target, 1.0)
+        self.rest = max(ADAPTIVE_REST * self.target, self.air)
+        self.air_steps = int(radius / self.step) + 1
+        self.side = 1 if material_left else -1
+        self.spiral_radius = max(self.stepover, self.step)
+        # the cutter only plunges where the whole spiral fits
+        self.plunge_allowed = self.allowed & ~dilate_image(~self.allowed, self.spiral_radius + 1)
+        self.turns = self.side * np.linspace(ADAPTIVE_TURN, -ADAPTIVE_TURN, ADAPTIVE_DIRECTIONS)
+
+        log.info(
+            f"Adaptive Engagement Angle: {degrees(acos(max(1 - self.stepover / radius, -1))):.1f}°"
+        )
 
+    def strokes(self):
+        """Clear the material.
+
+        Returns:
+            list: (N, 2) arrays of the cutter positions of each stroke, in pixels.
+        """
+        image = self.image
+        start_total = max(image.total, 1)
+        strokes = []
+        stroke = []
+        position = None
+        entries = 0
+
+        while True:
+            entry = self._entry(position)
+            if entry is None:
+                break
+
+            point, heading, plunge = entry
+            if len(stroke) > 0 and not self._link(position, point):
+                strokes.append(np.array(stroke))
+                stroke = []
+            stroke.append(point)
+            image.clear(*point)
+            position = point
+
+            if plunge:
+                spiral = self._spiral(point)
+                for position in spiral:
+                    stroke.append(position)
+                    image.clear(*position)
+                if len(spiral) > 0:
+                    direction = stroke[-1] - stroke[-2]
+                    heading = np.arctan2(direction[1], direction[0])
+
+            air = 0
+            while True:
+                step = self._step(position, heading)
+                if step is None:
+                    break
+
+                position, heading, engagement = step
+                stroke.append(position)
+                image.clear(*position)
+
+                if engagement < self.air:
+                    air += 1
+                    if air > self.air_steps:
+                        break
+                else:
+                    air = 0
+
+            # moves in the air at the end of a stroke are not needed
+            if air > 0:
+                del stroke[-air:]
+                position = stroke[-1]
+
+            entries += 1
+            if entries % 20 == 0:
+                progress("Adaptive Clearing", 100 * (1 - image.total / start_total))
+
+        if len(stroke) > 0:
+            strokes.append(np.array(stroke))
+        return strokes
+
+    def _valid(self, points):
+        x, y = np.rint(points).astype(np.int64).T
+        width, height = self.allowed.shape
+        valid = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        valid[valid] = self.allowed[x[valid], y[valid]]
+        return valid
+
+    def _step(self, position, heading):
+        """Find the next cutter position along the edge of the material.
+
+        Returns:
+            tuple: The new position, heading and removed material, or None if
+                the cutter can't move on.
+        """
+        angles = heading + self.turns
+        directions = np.column_stack((np.cos(angles), np.sin(angles)))
+        length = self.step
+
+        while length >= ADAPTIVE_MIN_STEP:
+            points = position + length * directions
+            fits, engagement = self._fits(points[::ADAPTIVE_REFINE], length)
+            if not fits.any():
+                length /= 2
+                continue
+
+            if engagement.max() < self.air:
+                # in the air the cutter goes as straight as it can, along
+                # the walls, until it finds material again
+                straight = np.abs(self.turns[::ADAPTIVE_REFINE]) + np.pi * ~fits
+                k = np.argmin(straight) * ADAPTIVE_REFINE
+                return points[k], angles[k], 0
+
+            # directions are sorted from the material side
+            k = np.argmax(fits)
+            removed = engagement[k]
+            k *= ADAPTIVE_REFINE
+            if k > 0:
+                # the first fitting direction between the last two tested ones
+                between = np.arange(k - ADAPTIVE_REFINE + 1, k)
+                fits, engagement = self._fits(points[between], length)
+                if fits.any():
+                    removed = engagement[np.argmax(fits)]
+                    k = between[np.argmax(fits)]
+            return points[k], angles[k], removed
+
+        return None
+
+    def _fits(self, points, length):
+        # cutter positions that remove no more than the target engagement
+        valid = self._valid(points)
+        engagement = np.zeros(len(points), dtype=np.int64)
+        if valid.any():
+            engagement[valid] = self.image.engagement(*points[valid].T)
+        return valid & (engagement <= length * self.stepover), engagement
+
+    def _spiral(self, center):
+        """Positions of a spiral out of a plunge, one stepover apart per turn.
+
+        The spiral turns with the material on the milling side, until it is a
+        step wide, and stops early where the cutter can't go.
+        """
+        pitch = self.stepover / (2 * np.pi)
+        end = self.spiral_radius
+        angle = 0.0
+        positions = []
+
+        while pitch * angle < end:
+            angle += min(self.step / max(pitch * angle, self.step), np.pi / 4)
+            rho = min(pitch * angle, end)
+            position = center + rho * np.array((np.cos(angle), -self.side * np.sin(angle)))
+            if not self._valid(position[np.newaxis])[0]:
+                break
+            positions.append(position)
+
+        return positions
+
+    def _entry(self, position):
+        """Find where the next stroke starts.
+
+        Positions in cleared areas next to the material are preferred, the
+        closest one to the last position, looking around it first. Otherwise
+        the cutter plunges where it removes least material.
+
+        Returns:
+            tuple: The entry position, heading and whether the cutter plunges,
+                or None if all the material the cutter can reach is cleared.
+        """
+        image = self.image
+        if image.total < self.rest:
+            return None
+
+        r = image.r
+        width, height = self.allowed.shape
+        material_x = np.flatnonzero(image.prefix[:, -1])
+        material_y = np.flatnonzero(image.material[material_x[0] : material_x[-1] + 1].any(axis=0))
+        bounds = (
+            (max(material_x[0] - r, r), min(material_x[-1] + r + 1, width - r)),
+            (max(material_y[0] - r, r), min(material_y[-1] + r + 1, height - r)),
+        )
 
-async def crazy_path(o):
-    """Execute a greedy adaptive algorithm for path planning.
+        if position is not None:
+            reach = 2 * r + self.step
+            window = tuple(
+                (max(start, int(p - reach)), min(end, int(p + reach) + 1))
+                for (start, end), p in zip(bounds, position)
+            )
+            entry = self._entry_in(window, position)
+            if entry is not None and not entry[2]:
+                return entry
+
+        return self._entry_in(bounds, position)
+
+    def _entry_in(self, bounds, position):
+        # entry search on a grid of pixels within the bounds
+        image = self.image
+        grid = max(int(self.step), 1)
+        x = np.arange(*bounds[0], grid)
+        y = np.arange(*bounds[1], grid)
+        if len(x) == 0 or len(y) == 0:
+            return None
+
+        engagement = image.engagement_grid(x, y)
+        candidates = self.allowed[np.ix_(x, y)] & (engagement >= self.rest)
+        if not candidates.any():
+            return None
+
+        gentle = candidates & (engagement <= self.target) & ~image.material[np.ix_(x, y)]
+        plunge = position is None or not gentle.any()
+        if plunge:
+            spiral = candidates & self.plunge_allowed[np.ix_(x, y)]
+            if spiral.any():
+                candidates = spiral
+            indices = np.argwhere(candidates)
+            least = engagement[candidates]
+            indices = indices[least == least.min()]
+            points = np.column_stack((x[indices[:, 0]], y[indices[:, 1]]))
+            # plunge in the middle of the places where it is easiest
+            point = points[np.argmin(((points - points.mean(axis=0)) ** 2).sum(axis=1))]
+        else:
+            indices = np.argwhere(gentle)
+            points = np.column_stack((x[indices[:, 0]], y[indices[:, 1]]))
+            point = points[np.argmin(((points - position) ** 2).sum(axis=1))]
+
+        point = point.astype(float)
+        direction = image.material_direction(*point)
+        # the heading has the material on the milling side
+        heading = np.arctan2(direction[1], direction[0]) - self.side * np.pi / 2
+        return point, heading, plunge
+
+    def _link(self, start, end):
+        """Move the cutter straight to an entry position, if it cuts no more
+        than along the edge of the material.
+
+        Returns:
+            bool: True if the cutter moved, False if the material is unchanged.
+        """
+        image = self.image
+        length = np.hypot(*(end - start))
+        count = int(length / max(self.step / 2, 1)) + 2
+        points = start + np.linspace(0, 1, count)[:, np.newaxis] * (end - start)
+        if not self._valid(points).all():
+            return False
+
+        # the rows the cutter passes, to restore them if it cuts too much
+        rows = slice(
+            int(np.floor(points[:, 0].min())) - image.r - 1,
+            int(np.floor(points[:, 0].max())) + image.r + 2,
+        )
+        material = image.material[rows].copy()
+        prefix = image.prefix[rows].copy()
+        total = image.total
+
+        limit = length / (count - 1) * self.stepover
+        for point in points[1:-1]:
+            if image.clear(*point) > limit:
+                image.material[rows] = material
+                image.prefix[rows] = prefix
+                image.total = total
+                return False
+        return True
 
-    This function prepares an area based on the provided object `o`,
-    calculates the dimensions of the area, and initializes a mill image and
-    cutter array. The dimensions are determined by the maximum and minimum
-    coordinates of the object, adjusted by the simulation detail and border
-    width. The function is currently a stub and requires further
-    implementation.
+
+def adaptive_strokes(o, millarea, avoidarea):
+    """Strokes of the adaptive clearing of a layer, in pixels.
 
     Args:
-        o (object): An object containing properties such as max, min, optimisation, and
-            borderwidth.
+        o (Operation): The operation.
+        millarea (numpy.ndarray): 2D boolean array, True where there is
+            material at the layer depth.
+        avoidarea (numpy.ndarray): 2D boolean array, True where the cutter
+            center can't go down to the layer depth.
 
     Returns:
-        None: This function does not return a value.
+        list: (N, 2) arrays of the cutter positions of each stroke.
     """
+    pixsize = o.optimisation.pixsize
+    radius = o.cutter_diameter / 2 / pixsize
+    climb_CW, climb_CCW, conventional_CW, conventional_CCW = get_move_and_spin(o)
 
-    # TODO: try to do something with this  stuff, it's just a stub. It should be a greedy adaptive algorithm.
-    #  started another thing below.
-    await prepare_area(o)
-    sx = o.max.x - o.min.x
-    sy = o.max.y - o.min.y
-
-    resx = ceil(sx / o.optimisation.simulation_detail) + 2 * o.borderwidth
-    resy = ceil(sy / o.optimisation.simulation_detail) + 2 * o.borderwidth
+    # the offset image already keeps the cutter away from the walls by the skin
+    allowed = ~avoidarea
 
-    o.millimage = np.full(shape=(resx, resy), fill_value=0.0, dtype=np.float)
-    # getting inverted cutter
-    o.cutterArray = -get_cutter_array(o, o.optimisation.simulation_detail)
+    # only the operation area is cleared, and only where the cutter can reach
+    width, height = millarea.shape
+    area = (
+        slice(o.borderwidth, width - o.borderwidth),
+        slice(o.borderwidth, height - o.borderwidth),
+    )
+    material = np.zeros(millarea.shape, dtype=bool)
+    material[area] = millarea[area]
+    material &= dilate_image(allowed, radius)
+
+    clearing = AdaptiveClearing(
+        material,
+        allowed,
+        radius,
+        o.distance_between_paths / pixsize,
+        climb_CCW or conventional_CW,
+    )
+    return clearing.strokes()
 
 
-def build_stroke(start, end, cutterArray):
-    """Build a stroke array based on start and end points.
+def stroke_chunks(o, strokes, z):
+    """Convert adaptive strokes in pixels to chunks.
 
-    This function generates a 2D stroke array that represents a stroke from
-    a starting point to an ending point. It calculates the length of the
-    stroke and creates a grid that is filled based on the positions defined
-    by the start and end coordinates. The function uses a cutter array to
-    determine how the stroke interacts with the grid.
+    The cutter stays above the offset image by the skin, at least at the
+    layer depth.
 
     Args:
-        start (tuple): A tuple representing the starting coordinates (x, y, z).
-        end (tuple): A tuple representing the ending coordinates (x, y, z).
-        cutterArray: An object that contains size information used to modify
-            the stroke array.
+        o (Operation): The operation.
+        strokes (list): (N, 2) arrays of the cutter positions in pixels.
+        z (float): Depth of the layer.
 
     Returns:
-        numpy.ndarray: A 2D array representing the stroke, filled with
-            calculated values based on the input parameters.
+        list: A chunk for each stroke.
     """
-
-    strokelength = max(abs(end[0] - start[0]), abs(end[1] - start[1]))
-    size_x = abs(end[0] - start[0]) + cutterArray.size[0]
-    size_y = abs(end[1] - start[1]) + cutterArray.size[0]
-    r = cutterArray.size[0] / 2
-
-    strokeArray = np.full(shape=(size_x, size_y), fill_value=-10.0, dtype=np.float)
-    samplesx = np.round(np.linspace(start[0], end[0], strokelength))
-    samplesy = np.round(np.linspace(start[1], end[1], strokelength))
-    samplesz = np.round(np.linspace(start[2], end[2], strokelength))
-
-    for i in range(0, len(strokelength)):
-        strokeArray[samplesx[i] - r : samplesx[i] + r, samplesy[i] - r : samplesy[i] + r] = (
-            np.maximum(
-                strokeArray[samplesx[i] - r : samplesx[i] + r, samplesy[i] - r : samplesy[i] + r],
-                cutterArray + samplesz[i],
-            )
+    pixsize = o.optimisation.pixsize
+    chunks = []
+
+    for stroke in strokes:
+        points = np.empty((len(stroke), 3))
+        points[:, :2] = (stroke - o.borderwidth) * pixsize + (o.min.x, o.min.y)
+        points[:, 2] = np.maximum(
+            get_sample_image_array(stroke, o.offset_image, o.min_z) + o.skin,
+            z,
         )
-    return strokeArray
-
-
-def test_stroke():
-    pass
-
-
-def apply_stroke():
-    pass
-
+        chunks.append(CamPathChunk(points))
 
-def test_stroke_binary(img, stroke):
-    pass  # buildstroke()
+    return chunks
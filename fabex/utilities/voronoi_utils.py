@@ -32,6 +32,14 @@ Steve Fortune's homepage: http://netlib.bell-labs.com/cm/cs/who/sjf/index.html
 
 import math
 
+import numpy as np
+import shapely
+
+try:
+    from scipy.spatial import Voronoi
+except ImportError:
+    Voronoi = None
+
 from ..constants import (
     TOLERANCE,
     BIG_FLOAT,
@@ -1593,6 +1601,71 @@ def compute_voronoi_diagram(
             return clipPolygons
 
 
+def compute_voronoi_edges(points, xBuff=0, yBuff=0):
+    """Compute the edges of the Voronoi diagram of an array of points.
+
+    The diagram is calculated by scipy.spatial.Voronoi if scipy is
+    installed, and by shapely's voronoi_polygons otherwise, both are
+    compiled code. If they fail on degenerate input, the Python sweepline of
+    compute_voronoi_diagram is used. Only the edges between Voronoi vertices
+    inside the bounding box of the points, expanded by xBuff and yBuff
+    percent, are returned, edges going to infinity are left out.
+
+    Args:
+        points (numpy.ndarray): (N, 2) array of unique point coordinates.
+        xBuff (float?): The expansion percentage of the bounding box in the x-direction.
+            Defaults to 0.
+        yBuff (float?): The expansion percentage of the bounding box in the y-direction.
+            Defaults to 0.
+
+    Returns:
+        tuple: (M, 2) array of the vertex coordinates and (K, 2) array of the
+            vertex indices of each edge.
+    """
+    points = np.asarray(points, dtype=np.float64)[:, :2]
+    low = points.min(axis=0)
+    high = points.max(axis=0)
+    buffer = (high - low) * np.array([xBuff, yBuff]) / 100
+    low, high = low - buffer, high + buffer
+
+    try:
+        if Voronoi is not None:
+            diagram = Voronoi(points)
+            vertices = diagram.vertices
+            edges = np.array(diagram.ridge_vertices, dtype=np.int64).reshape(-1, 2)
+            # -1 marks the vertex at infinity
+            edges = edges[np.all(edges >= 0, axis=1)]
+        else:
+            # only_edges=True merges the edges with a slow union, the cell outlines are cheaper
+            cells = shapely.voronoi_polygons(
+                shapely.multipoints(points), extend_to=shapely.box(*low, *high)
+            )
+            coordinates, ring_index = shapely.get_coordinates(
+                shapely.get_exterior_ring(shapely.get_parts(cells)), return_index=True
+            )
+            # neighbouring cells share vertices with identical coordinates
+            vertices, inverse = np.unique(coordinates, axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            same_ring = ring_index[1:] == ring_index[:-1]
+            edges = np.stack((inverse[:-1][same_ring], inverse[1:][same_ring]), axis=1)
+            # each edge is on the outline of two cells
+            edges = np.unique(np.sort(edges, axis=1), axis=0)
+            edges = edges[edges[:, 0] != edges[:, 1]]
+    except (RuntimeError, shapely.errors.GEOSException) as e:
+        log.warning(f"Compiled Voronoi Failed, Using Python Version: {e}")
+        vertices, edges = compute_voronoi_diagram(
+            [shapely.Point(p) for p in points], xBuff, yBuff, formatOutput=True
+        )
+        vertices = np.array(vertices, dtype=np.float64).reshape(-1, 2)
+        edges = np.array(edges, dtype=np.int64).reshape(-1, 2)
+
+    # vertices on the border are where an infinite edge was clipped, with rounding errors
+    margin = (high - low) * 1e-9
+    inside = np.all((vertices > low + margin) & (vertices < high - margin), axis=1)
+    edges = edges[inside[edges].all(axis=1)]
+    return vertices, edges
+
+
 def format_edges_output(edges):
     """Format edges output for a list of edges.
 
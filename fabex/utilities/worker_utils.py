@@ -0,0 +1,437 @@
+"""Fabex 'worker_utils.py' © 2025
+
+Pool of background Blender processes calculating the paths of several operations.
+"""
+
+import json
+import os
+import secrets
+import socket
+import struct
+import subprocess
+from math import ceil
+
+from mathutils import Vector
+
+import bpy
+
+from .logging_utils import log
+from .operation_utils import reload_paths
+from .. import __package__ as base_package
+
+# seconds between updates of the background processes
+WORKER_POLL_INTERVAL = 0.1
+# size of the JSON message that follows
+MESSAGE_HEADER = struct.Struct("<I")
+
+
+def send_message(connection, message):
+    """Send a message to the other end of a socket.
+
+    Messages are JSON objects prefixed with their size, MessageReader
+    splits the received bytes into messages again.
+
+    Args:
+        connection (socket.socket): The connected socket.
+        message (dict): The message.
+    """
+    data = json.dumps(message).encode()
+    connection.sendall(MESSAGE_HEADER.pack(len(data)) + data)
+
+
+class MessageReader:
+    """Receive the messages send_message sends, without blocking."""
+
+    def __init__(self, connection):
+        connection.setblocking(False)
+        self.connection = connection
+        self.buffer = bytearray()
+        self.closed = False
+
+    def read(self):
+        """Read the messages that arrived since the last call.
+
+        Returns:
+            list: The complete messages, in the order they were sent.
+        """
+        while not self.closed:
+            try:
+                data = self.connection.recv(1 << 16)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                data = b""
+            if len(data) == 0:
+                self.closed = True
+            self.buffer += data
+
+        messages = []
+        start = 0
+        while len(self.buffer) - start >= MESSAGE_HEADER.size:
+            (size,) = MESSAGE_HEADER.unpack_from(self.buffer, start)
+            end = start + MESSAGE_HEADER.size + size
+            if len(self.buffer) < end:
+                break
+            messages.append(json.loads(self.buffer[start + MESSAGE_HEADER.size : end]))
+            start = end
+        del self.buffer[:start]
+        return messages
+
+    def close(self):
+        self.connection.close()
+        self.closed = True
+
+
+def get_worker_count():
+    """Get the number of background processes from the addon preferences.
+
+    Returns:
+        int: Number of processes, one for each CPU core if the preference is 0.
+    """
+    addon_prefs = bpy.context.preferences.addons[base_package].preferences
+    return addon_prefs.path_workers if addon_prefs.path_workers > 0 else os.cpu_count() or 1
+
+
+def estimate_path_cost(o):
+    """Estimate the calculation time of an operation from its source bounds.
+
+    The estimate is the number of samples on the source area, times the
+    number of layers, in arbitrary units. It is only used to start the
+    biggest jobs first.
+
+    Args:
+        o (object): The operation.
+
+    Returns:
+        float: The estimated cost.
+    """
+    if o.geometry_source == "OBJECT":
+        objects = [bpy.data.objects.get(o.object_name)]
+    elif o.geometry_source == "COLLECTION":
+        collection = bpy.data.collections.get(o.collection_name)
+        objects = collection.objects if collection is not None else []
+    else:
+        objects = []
+
+    corners = [
+        ob.matrix_world @ Vector(c) for ob in objects if ob is not None for c in ob.bound_box
+    ]
+    if len(corners) == 0:
+        return 1.0
+
+    size = [max(c[i] for c in corners) - min(c[i] for c in corners) for i in range(3)]
+    step = max(o.distance_between_paths, 1e-5) * max(o.distance_along_paths, 1e-5)
+    layers = ceil(size[2] / o.stepdown) if o.use_layers and o.stepdown > 0 else 1
+    return (size[0] * size[1] / step + 1) * max(layers, 1)
+
+
+def get_path_dependencies(operations):
+    """Find the operations that have to be calculated before each operation.
+
+    Operations in a chain depend on the operation before them, so rest
+    machining operations can see the paths of the operations they follow.
+    An operation that uses the path object of another operation as its
+    source depends on that operation too, if that path was calculated
+    before and has a known name.
+
+    Args:
+        operations (list): The operations that will be calculated.
+
+    Returns:
+        dict: Names of the operations each operation depends on, by operation name.
+    """
+    scene = bpy.context.scene
+    names = {o.name for o in operations}
+    dependencies = {name: set() for name in names}
+
+    for chain in scene.cam_chains:
+        chain_names = [reference.name for reference in chain.operations]
+        for before, name in zip(chain_names[:-1], chain_names[1:]):
+            if name in names and before in names and before != name:
+                dependencies[name].add(before)
+
+    path_names = {o.path_object_name: o.name for o in operations if o.path_object_name != ""}
+    for o in operations:
+        if o.geometry_source == "OBJECT" and o.object_name in path_names:
+            before = path_names[o.object_name]
+            if before != o.name:
+                dependencies[o.name].add(before)
+
+    return dependencies
+
+
+class PathWorker:
+    """A background Blender process of a PathWorkerPool."""
+
+    def __init__(self, index, proc):
+        self.index = index
+        self.proc = proc
+        # MessageReader, once the process has connected
+        self.reader = None
+        # name of the operation being calculated
+        self.job = None
+
+
+class PathWorkerPool:
+    """Calculate the paths of a list of operations in reused background processes.
+
+    At most worker_count Blender processes open the saved .blend file. Jobs
+    are sent to their stdin, biggest first, as soon as the operations they
+    depend on are finished. The processes connect back to a local socket
+    and report progress and results with send_message, update reads these
+    messages without blocking and loads every finished path with
+    reload_paths.
+    """
+
+    # pools with jobs left
+    pools = []
+
+    def __init__(self, operations, worker_count):
+        self.worker_count = max(worker_count, 1)
+        self.dependencies = get_path_dependencies(operations)
+        costs = {o.name: estimate_path_cost(o) for o in operations}
+        self.pending = sorted(costs, key=lambda name: -costs[name])
+        self.finished = set()
+        self.failed = set()
+        self.workers = []
+        self.worker_index = 0
+        # connections that didn't say which process they belong to yet
+        self.connecting = []
+        self.token = secrets.token_hex(16)
+        self.listener = None
+
+    def start(self):
+        """Start the background processes and the first jobs."""
+        for name in self.pending:
+            bpy.context.scene.cam_operations[name].computing = True
+
+        self.listener = socket.create_server(("127.0.0.1", 0))
+        self.listener.setblocking(False)
+        for _ in range(min(self.worker_count, len(self.pending))):
+            self.add_worker()
+
+        log.info(f"Calculating {len(self.pending)} Paths in {len(self.workers)} Processes")
+        PathWorkerPool.pools.append(self)
+        self.schedule()
+        if not bpy.app.timers.is_registered(update_path_workers):
+            bpy.app.timers.register(update_path_workers, first_interval=WORKER_POLL_INTERVAL)
+
+    def add_worker(self):
+        """Start a background process that waits for jobs."""
+        expression = (
+            "import importlib;"
+            f"importlib.import_module('{base_package}.operators.path_ops').path_worker_main()"
+        )
+        proc = subprocess.Popen(
+            [
+                bpy.app.binary_path,
+                "-b",
+                bpy.data.filepath,
+                "--python-exit-code",
+                "1",
+                "--python-expr",
+                expression,
+                "--",
+                str(self.listener.getsockname()[1]),
+                self.token,
+                str(self.worker_index),
+            ],
+            stdin=subprocess.PIPE,
+        )
+        self.workers.append(PathWorker(self.worker_index, proc))
+        self.worker_index += 1
+
+    def next_job(self):
+        """Take the next job whose dependencies are finished from the queue.
+
+        Returns:
+            str: Name of the operation, or None if no job can start now.
+        """
+        for name in list(self.pending):
+            failed = self.dependencies[name] & self.failed
+            if failed:
+                # the operations this one builds on have no paths
+                self.pending.remove(name)
+                self.failed.add(name)
+                bpy.context.scene.cam_operations[name].computing = False
+                log.error(f"Path of {name} Not Calculated, {', '.join(failed)} Failed")
+
+        for name in self.pending:
+            if self.dependencies[name] <= self.finished:
+                self.pending.remove(name)
+                return name
+
+        if len(self.pending) > 0 and not any(w.job is not None for w in self.workers):
+            # circular dependencies between chains, nothing else could ever start
+            name = self.pending.pop(0)
+            log.warning(f"Circular Chain Dependencies, Calculating {name} First")
+            return name
+        return None
+
+    def schedule(self):
+        """Give jobs to idle processes, and stop the processes when all jobs are done."""
+        for worker in self.workers:
+            if worker.job is None:
+                name = self.next_job()
+                if name is None:
+                    break
+                self.send_job(worker, name)
+
+        if len(self.pending) == 0 and all(w.job is None for w in self.workers):
+            self.close()
+
+    def send_job(self, worker, name):
+        """Send a job to a background process.
+
+        The process loads the paths of the finished dependencies first, so
+        its scene matches the results calculated by the other processes.
+
+        Args:
+            worker (PathWorker): The background process.
+            name (str): Name of the operation.
+        """
+        job = {"operation": name, "load": sorted(self.dependencies[name] & self.finished)}
+        worker.job = name
+        try:
+            worker.proc.stdin.write((json.dumps(job) + "\n").encode())
+            worker.proc.stdin.flush()
+        except OSError:
+            # the process died, update notices it
+            pass
+
+    def update(self):
+        """Read the messages of the background processes and load finished paths."""
+        while True:
+            try:
+                connection, address = self.listener.accept()
+            except (BlockingIOError, InterruptedError):
+                break
+            self.connecting.append(MessageReader(connection))
+
+        for reader in self.connecting[:]:
+            messages = reader.read()
+            if len(messages) > 0 or reader.closed:
+                self.connecting.remove(reader)
+                hello = messages[0] if len(messages) > 0 else {}
+                worker = next((w for w in self.workers if w.index == hello.get("worker")), None)
+                if hello.get("token") != self.token or worker is None:
+                    reader.close()
+                    continue
+                worker.reader = reader
+                for message in messages[1:]:
+                    self.handle_message(worker, message)
+
+        for worker in self.workers[:]:
+            if worker.reader is not None:
+                for message in worker.reader.read():
+                    self.handle_message(worker, message)
+
+            if worker.proc.poll() is not None:
+                # the process exited, all its messages are read by now
+                if worker.job is not None:
+                    log.error(f"Background Process of {worker.job} Exited Unexpectedly")
+                    self.job_done(worker, False)
+                self.remove_worker(worker)
+
+        self.schedule()
+
+    def handle_message(self, worker, message):
+        """Act on a message of a background process.
+
+        Args:
+            worker (PathWorker): The process that sent the message.
+            message (dict): The message.
+        """
+        if worker.job is None:
+            return
+        o = bpy.context.scene.cam_operations[worker.job]
+        if message["type"] == "progress":
+            o.out_text = message["text"]
+        elif message["type"] == "finished":
+            try:
+                reload_paths(o, message["path"])
+                success = True
+            except (OSError, ValueError) as e:
+                log.error(f"Couldn't Load Path of {o.name}: {e}")
+                success = False
+            o.out_text = "finished"
+            self.job_done(worker, success)
+        elif message["type"] == "error":
+            log.error(f"Background Calculation of {o.name} Failed {message['text']}")
+            o.out_text = message["text"]
+            self.job_done(worker, False)
+
+    def job_done(self, worker, success):
+        """Mark the job of a process as finished or failed.
+
+        Args:
+            worker (PathWorker): The process.
+            success (bool): True if the path was calculated and loaded.
+        """
+        (self.finished if success else self.failed).add(worker.job)
+        o = bpy.context.scene.cam_operations.get(worker.job)
+        if o is not None:
+            o.computing = False
+        worker.job = None
+
+    def remove_worker(self, worker):
+        """Stop a process, and replace it if there is work left.
+
+        Args:
+            worker (PathWorker): The process.
+        """
+        if worker.proc.poll() is None:
+            worker.proc.kill()
+        worker.proc.wait()
+        if worker.reader is not None:
+            worker.reader.close()
+        self.workers.remove(worker)
+        if len(self.pending) > 0 and len(self.workers) < self.worker_count:
+            self.add_worker()
+
+    def cancel(self, name):
+        """Remove a job from the queue, or stop the process calculating it.
+
+        Args:
+            name (str): Name of the operation.
+        """
+        if name in self.pending:
+            self.pending.remove(name)
+            self.failed.add(name)
+            bpy.context.scene.cam_operations[name].computing = False
+        for worker in self.workers[:]:
+            if worker.job == name:
+                self.job_done(worker, False)
+                self.remove_worker(worker)
+        self.schedule()
+
+    def close(self):
+        """Let the background processes exit."""
+        for worker in self.workers:
+            try:
+                worker.proc.stdin.close()
+            except OSError:
+                pass
+            if worker.reader is not None:
+                worker.reader.close()
+        for reader in self.connecting:
+            reader.close()
+        self.workers = []
+        self.connecting = []
+        self.listener.close()
+        if self in PathWorkerPool.pools:
+            PathWorkerPool.pools.remove(self)
+
+
+def update_path_workers():
+    """Timer that reads the messages of the background processes.
+
+    Returns:
+        float: Seconds until the next update, None to stop the timer.
+    """
+    for pool in PathWorkerPool.pools[:]:
+        pool.update()
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+    return WORKER_POLL_INTERVAL if len(PathWorkerPool.pools) > 0 else None
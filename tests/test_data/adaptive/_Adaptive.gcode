@@ -0,0 +1,3402 @@
+(Created with grbl post processor 2026/10/18 08:22)
+G21
+(G-code Generated with Fabex and NC library)
+G17G90
+(Tool: D = 4.0 mm  type END flutes 2)
+S12000M03
+G00 Z10.0
+
+G0X0Y0Z10
+Y9
+G1Z-3F500
+X0.088Y9.088F1000
+X0Y9.25
+X-0.265Y9.265
+X-0.5Y9
+X-0.441Y8.558
+X0Y8.25
+X0.618Y8.381
+X1Y9
+X0.234Y9.643
+X-0.71Y9.318
+X-0.723Y8.318
+X0.152Y7.836
+X1.062Y8.252
+X1.269Y9.231
+X0.57Y9.946
+X-0.428Y9.959
+X-1.144Y9.26
+X-1.107Y8.261
+X-0.409Y7.545
+X0.588Y7.484
+X1.426Y8.029
+X1.775Y8.967
+X1.403Y9.895
+X0.552Y10.42
+X-0.447Y10.432
+X-1.285Y9.887
+X-1.679Y8.968
+X-1.496Y7.985
+X-0.834Y7.235
+X0.132Y6.98
+X1.115Y7.163
+X1.865Y7.826
+X2.213Y8.763
+X2.078Y9.754
+X1.454Y10.535
+X0.555Y10.973
+X-0.444Y10.986
+X-1.353Y10.569
+X-1.997Y9.804
+X-2.204Y8.826
+X-2.021Y7.843
+X-1.435Y7.032
+X0.562Y7.106
+X1.556Y6.996
+X2.305Y7.658
+X2.699Y8.577
+X2.712Y9.577
+X2.295Y10.486
+X1.563Y11.167
+X0.625Y11.515
+X-0.372Y11.577
+X-1.332Y11.298
+X-2.113Y10.673
+X-2.595Y9.797
+X-2.802Y8.819
+X-2.668Y7.828
+X-2.164Y6.964
+X-0.183Y7.233
+X0.783Y6.978
+X1.783Y6.966
+X2.671Y7.426
+X3.196Y8.278
+X3.306Y9.272
+X3.123Y10.255
+X2.578Y11.093
+X1.782Y11.699
+X0.863Y12.093
+X-0.13Y12.203
+X-1.121Y12.068
+X-2.009Y11.608
+X-2.725Y10.91
+X-3.207Y10.033
+X-3.414Y9.055
+X-3.377Y8.056
+X-3.052Y7.11
+X-1.056Y6.987
+X1.916Y7.391
+X2.883Y7.136
+X3.564Y7.869
+X3.866Y8.822
+X3.878Y9.822
+X3.553Y10.768
+X2.967Y11.578
+X2.202Y12.222
+X1.303Y12.661
+X0.325Y12.868
+X-0.674Y12.88
+X-1.634Y12.602
+X-2.498Y12.098
+X-3.179Y11.366
+X-3.704Y10.514
+X-4.006Y9.561
+X-4.116Y8.567
+X-3.981Y7.576
+X-3.186Y6.971
+X-4.2Y7.9
+X-3.876Y6.953
+X-3.9Y10.9
+X-4.456Y10.068
+X-4.793Y9.127
+X-4.892Y8.132
+X-4.697Y7.151
+X-3.716Y6.955
+X3.283Y6.951
+X4.024Y7.623
+X4.407Y8.546
+X4.506Y9.541
+X4.36Y10.531
+X3.933Y11.435
+X3.299Y12.208
+X2.526Y12.843
+X1.531Y12.942
+X0.536Y12.844
+X-0.459Y12.943
+X-1.459
+X-2.439Y12.749
+X-3.322Y12.278
+X-4.125Y11.683
+X-4.797Y10.942
+X-5.225Y10.038
+X-5.516Y9.081
+X-5.566Y8.083
+X-5.276Y7.126
+X-4.3Y12.1
+X-5.081Y11.476
+X-5.687Y10.681
+X-6.083Y9.762
+X-6.291Y8.784
+X-6.206Y7.787
+X-5.622Y6.976
+X-6.7Y8.9
+X-6.787Y7.903
+X-6.395Y6.983
+X-6.4Y9.9
+X-7.074Y9.161
+X-7.32Y8.192
+X-7.177Y7.202
+X-7.2Y9.199
+X-7.735Y8.355
+X-7.761Y7.356
+X-6.828Y6.995
+X-7.9Y8.9
+X-8.306Y7.986
+X-7.993Y7.036
+X-7.999Y9
+X-8.656Y8.246
+X-8.637Y7.246
+X-7.674Y6.974
+G0Z10
+X-8.7Y6.9
+G1Z-3F500
+X-8.9Y6.7F1000
+X-9Y7.6
+X-9.196Y6.619
+X-9.083Y6.565
+X-6.1Y10.5
+X-7.076Y10.285
+X-7.992Y9.883
+X-8.752Y9.233
+X-9.331Y8.418
+X-9.695Y7.487
+X-9.577Y6.494
+X-9.6Y6.4
+X-10.7Y5.3
+X-9.818Y5.771
+X-10.9Y5.7
+X-10.09Y5.113
+X-9.97Y5.151
+X-11Y5.1
+X-10.008Y4.973
+X-11.1Y4.9
+X-10.175Y4.519
+X-11.2Y5.5
+X-11.178Y4.5
+X-10.229Y4.184
+X-10.3Y7.1
+X-11.122Y6.531
+X-11.664Y5.69
+X-11.746Y4.694
+X-11.1Y3.931
+X-10.103Y3.849
+X-11.2Y3.8
+X-10.273Y3.423
+X-10.062Y3.877
+X-12.1Y4.8
+X-11.891Y3.821
+X-11.141Y3.16
+X-10.142Y3.124
+X-12.2Y4.1
+X-11.835Y3.168
+X-10.987Y2.638
+X-10.056Y3.003
+X-12.1Y3
+X-11.391Y2.293
+X-10.391Y2.295
+X-10.4Y2.2
+X-11.5Y2.1
+X-10.55Y1.785
+X-10.056Y2.654
+X-11.1Y1.6
+X-10.107Y1.718
+X-12.2Y2.7
+X-11.932Y1.736
+X-11.086Y1.202
+X-10.089Y1.276
+X-12.1Y5.2
+X-12.645Y4.361
+X-12.876Y3.388
+X-12.814Y2.39
+X-12.376Y1.492
+X-11.595Y0.867
+X-10.622Y0.636
+X-11.7Y0.6
+X-10.769Y0.233
+X-10.074Y0.952
+X-13.1Y1.9
+X-12.773Y0.954
+X-12.11Y0.206
+X-11.211Y-0.231
+X-10.251Y0.048
+X-12.3Y0
+X-11.489Y-0.586
+X-10.489Y-0.574
+X-10.072Y0.334
+X-12.1Y-0.7
+X-11.193Y-1.121
+X-10.224Y-0.871
+X-12.3Y-0.9
+X-11.491Y-1.489
+X-10.492Y-1.529
+X-10.072Y-0.622
+X-11.1Y-1.7
+X-10.105Y-1.592
+X-13.2Y1.4
+X-13.215Y0.4
+X-13.084Y-0.591
+X-12.542Y-1.431
+X-11.779Y-2.078
+X-10.802Y-2.288
+X-10.05Y-1.629
+X-13.1Y3.3
+X-13.605Y2.437
+X-13.887Y1.477
+X-13.975Y0.481
+X-13.819Y-0.506
+X-13.383Y-1.405
+X-12.741Y-2.172
+X-11.878Y-2.678
+X-10.882Y-2.767
+X-10.056Y-2.203
+X-13.1Y-2.3
+X-12.392Y-3.007
+X-11.451Y-3.344
+X-10.47Y-3.149
+X-12.5Y-3.2
+X-11.658Y-3.74
+X-10.658Y-3.722
+X-10.077Y-2.909
+X-11.1Y-4
+X-10.128Y-3.764
+X-12.2Y-3.8
+X-11.382Y-4.375
+X-10.382Y-4.4
+X-10.069Y-3.45
+X-10.1Y-4.5
+X-11.2Y-4.6
+X-10.25Y-4.912
+X-10.3Y-5
+X-10.8Y-5.5
+X-10.061Y-4.825
+X-13.1Y-2.9
+X-12.832Y-3.863
+X-12.338Y-4.733
+X-11.761Y-5.549
+X-10.811Y-5.862
+X-9.967Y-5.326
+X-12.999Y-4.4
+X-12.704Y-5.355
+X-11.994Y-6.058
+X-11.035Y-6.344
+X-10.08Y-6.049
+X-13.1Y-5.1
+X-12.743Y-6.034
+X-11.957Y-6.652
+X-10.982Y-6.874
+X-10.017Y-6.611
+X-13.1Y-5.7
+X-12.768Y-6.643
+X-11.969Y-7.244
+X-10.989Y-7.445
+X-10.018Y-7.208
+X-9.498Y-6.353
+X-12.5Y-7.4
+X-11.633Y-7.898
+X-10.636Y-7.979
+X-9.719Y-7.58
+X-9.138Y-6.766
+X-12.2Y-7.8
+X-11.373Y-8.362
+X-10.375Y-8.42
+X-9.467Y-8.001
+X-8.789Y-7.266
+X-11.8Y-8.3
+X-10.971Y-8.86
+X-9.972Y-8.817
+X-9.066Y-8.394
+X-8.427Y-7.625
+X-8.936Y-6.764
+X-9Y-8.8
+X-8.21Y-8.185
+X-8.136Y-7.188
+X-9.2Y-9.2
+X-8.249Y-8.887
+X-7.713Y-8.043
+X-7.834Y-7.051
+X-10.9Y-9.099
+X-10.035Y-9.601
+X-9.038Y-9.685
+X-8.085Y-9.381
+X-7.388Y-8.664
+X-7.159Y-7.691
+X-7.2Y-8.7
+X-6.747Y-7.808
+X-7.433Y-7.081
+X-6.5Y-8.1
+X-6.705Y-7.121
+X-7Y-9
+X-6.224Y-8.368
+X-6.123Y-7.373
+X-7.2Y-9.4
+X-6.248Y-9.093
+X-5.706Y-8.252
+X-5.773Y-7.254
+X-6Y-9
+X-5.324Y-8.262
+X-5.319Y-7.262
+X-6.298Y-7.062
+X-5.3Y-7.1
+X-5Y-7.999
+X-5.1Y-7.1
+X-7.999Y-10
+X-7Y-9.983
+X-6.034Y-9.724
+X-5.184Y-9.196
+X-4.602Y-8.384
+X-4.471Y-7.392
+X-4.5Y-8.4
+X-4.06Y-7.501
+X-4.958Y-7.062
+X-4Y-7.1
+X-4.1Y-8.2
+X-3.614Y-7.325
+X-4.038Y-7.061
+X-6.1Y-10.1
+X-5.141Y-9.814
+X-4.281Y-9.304
+X-3.57Y-8.6
+X-3.139Y-7.698
+X-3.909Y-7.06
+X-3Y-8.1
+X-3.146Y-7.11
+X-5.2Y-10.199
+X-4.231Y-9.949
+X-3.378Y-9.429
+X-2.712Y-8.683
+X-2.524Y-7.7
+X-3.302Y-7.072
+X-2.4Y-8.1
+X-2.516Y-7.106
+X-2.6Y-9.2
+X-1.997Y-8.401
+X-1.891Y-7.407
+X-1.9Y-8.5
+X-1.483Y-7.59
+X-2.346Y-7.087
+X-1.4Y-8.1
+X-1.456Y-7.101
+X-4.5Y-10.199
+X-3.5Y-10.166
+X-2.539Y-9.891
+X-1.699Y-9.349
+X-1.052Y-8.586
+X-0.842Y-7.608
+X-0.9Y-8.7
+X-0.421Y-7.822
+X-1.086Y-7.075
+X-1.1Y-9.099
+X-0.258Y-8.56
+X-0.141Y-7.567
+X-1.2Y-9.6
+X-0.249Y-9.288
+X0.287Y-8.445
+X0.216Y-7.447
+X-0.715Y-7.085
+X0.2Y-7.1
+X0.1Y-9.2
+X0.684Y-8.388
+X0.817Y-7.397
+X0.8Y-8.4
+X1.182Y-7.476
+X1.1Y-8.5
+X1.592Y-7.629
+X0.774Y-7.054
+X1.7Y-8.1
+X1.605Y-7.104
+X0.6Y-9.2
+X1.555Y-8.905
+X2.106Y-8.07
+X2.052Y-7.072
+X-2Y-10.1
+X-1.002Y-10.168
+X-0.005Y-10.089
+X0.978Y-9.912
+X1.846Y-9.415
+X2.495Y-8.654
+X2.709Y-7.677
+X2.7Y-8.7
+X3.101Y-7.784
+X2.409Y-7.062
+X3.4Y-8.1
+X3.138Y-7.134
+X1.1Y-10.199
+X2.061Y-9.924
+X2.95Y-9.466
+X3.667Y-8.769
+X3.877Y-7.791
+X3.181Y-7.074
+X4.1Y-8.1
+X3.878Y-7.124
+X3.8Y-9.2
+X4.429Y-8.423
+X4.521Y-7.427
+X3.5Y-9.5
+X4.436Y-9.148
+X4.978Y-8.308
+X4.913Y-7.31
+X3.939Y-7.082
+X4.9Y-7.1
+X4.8Y-9.2
+X5.405Y-8.404
+X5.515Y-7.41
+X5.5Y-8.5
+X5.948Y-7.606
+X5.103Y-7.072
+X6.1Y-8.1
+X5.987Y-7.106
+X1.9Y-10.199
+X2.898Y-10.257
+X3.894Y-10.167
+X4.853Y-9.885
+X5.715Y-9.378
+X6.393Y-8.643
+X6.596Y-7.664
+X5.798Y-7.061
+X6.7Y-8.1
+X6.632Y-7.102
+X4.6Y-10.199
+X5.591Y-10.067
+X6.43Y-9.524
+X7.076Y-8.76
+X7.285Y-7.782
+X6.588Y-7.065
+X7.5Y-8.1
+X7.315Y-7.117
+X7.3Y-9.2
+X7.89Y-8.392
+X7.932Y-7.393
+X4.9Y-10.4
+X5.899Y-10.421
+X6.874Y-10.198
+X7.717Y-9.66
+X8.29Y-8.841
+X8.554Y-7.876
+X8.101Y-6.985
+G0Z10
+X4Y7
+G1Z-3F500
+X4.681Y7.732F1000
+X5.075Y8.651
+X5.186Y9.644
+X5.052Y10.635
+X4.681Y11.564
+X4.096Y12.375
+X3.272Y12.941
+X5.2Y10.9
+X5.078Y11.892
+X4.544Y12.737
+X5.5Y11.7
+X5.258Y12.67
+X4.288Y12.914
+X5.2Y12.9
+X5.1Y7.8
+X5.649Y8.635
+X6.12Y10.579
+X6.162Y11.578
+X6.008Y12.566
+X6Y8.5
+X6.542Y9.339
+X6.818Y10.301
+X6.9Y11.297
+X6.787Y12.291
+X6.004Y12.913
+X7Y11.899
+X6.777Y12.874
+X6.7Y8.8
+X7.25Y9.634
+X7.582Y10.578
+X7.674Y11.573
+X7.571Y12.568
+X6.645Y12.945
+X7.6Y12.9
+X7.5Y9.8
+X8.088Y10.608
+X8.275Y11.59
+X8.267Y12.59
+X8.2Y10.5
+X8.725Y11.35
+X8.837Y12.344
+X8.013Y12.911
+X9Y11.899
+X8.824Y12.884
+X8.8Y10.799
+X9.369Y11.621
+X9.435Y12.619
+X8.484Y12.926
+X9.4Y12.9
+X9.3Y10.799
+X9.867Y11.623
+X9.978Y12.617
+X7.9Y9.6
+X8.871Y9.836
+X9.706Y10.386
+X10.307Y11.185
+X10.557Y12.154
+X9.928Y12.931
+X10.899Y11.899
+X10.667Y12.872
+X10.6Y10.799
+X11.231Y11.575
+X11.276Y12.574
+X11Y11
+X11.693Y11.72
+X11.625Y12.718
+X10.65Y12.942
+X11.6Y12.9
+X9.5Y9.8
+X10.48Y9.995
+X11.362Y10.467
+X12.033Y11.208
+X12.276Y12.178
+X12.2Y11.1
+X12.669Y11.982
+X12.285Y12.905
+X12.2Y10.9
+X12.952Y11.558
+X12.97Y12.558
+X11.899Y10.5
+X12.858Y10.786
+X13.416Y11.615
+X13.371Y12.614
+X10.299Y9.6
+X11.299Y9.64
+X12.281Y9.827
+X13.143Y10.333
+X13.784Y11.101
+X13.988Y12.08
+X13.481Y12.942
+X14Y11
+X14.404Y11.914
+X14.183Y12.89
+X14.099Y10.799
+X14.753Y11.557
+X14.826Y12.554
+X11.8Y9.5
+X12.799Y9.503
+X13.755Y9.797
+X14.585Y10.355
+X15.178Y11.161
+X15.417Y12.131
+X14.819Y12.933
+X7.999Y9
+X8.986Y8.834
+X9.979Y8.718
+X10.977Y8.65
+X11.977Y8.632
+X12.968Y8.76
+X13.916Y9.08
+X14.757Y9.62
+X15.443Y10.348
+X15.887Y11.244
+X15.905Y12.244
+X15.177Y12.929
+X16.099Y11.899
+X15.903Y12.88
+X15.899Y10.799
+X16.491Y11.606
+X16.536Y12.605
+X13.499Y8.599
+X14.481Y8.789
+X15.342Y9.299
+X16.118Y9.929
+X16.757Y10.698
+X17.099Y11.638
+X17.006Y12.634
+X16.051Y12.929
+X16.999Y12.9
+X14.9Y8.8
+X15.871Y9.035
+X16.679Y9.625
+X17.319Y10.393
+X17.663Y11.332
+X17.769Y12.326
+X17.7Y10.299
+X18.232Y11.146
+X18.302Y12.144
+X17.684Y12.93
+X18.6Y11.899
+X18.364Y12.871
+X18.299Y10.799
+X18.934Y11.572
+X18.984Y12.571
+X16.899Y9.5
+X17.874Y9.725
+X18.688Y10.306
+X19.336Y11.067
+X19.596Y12.033
+X19.185Y12.944
+X16.099Y8.9
+X17.098Y8.844
+X18.057Y9.128
+X18.918Y9.637
+X19.629Y10.34
+X20.062Y11.241
+X20.069Y12.241
+X19.332Y12.917
+X20.299Y11.899
+X20.056Y12.869
+X17.999Y8.8
+X18.979Y9
+X19.779Y9.601
+X20.409Y10.377
+X20.786Y11.304
+X20.829Y12.303
+X20.052Y12.932
+X21Y11.899
+X20.866Y12.891
+X20.8Y10.799
+X21.378Y11.616
+X21.454Y12.613
+X20.399Y9.6
+X21.191Y10.211
+X21.771Y11.025
+X22.09Y11.973
+X21.735Y12.908
+X19.7Y8.9
+X20.678Y9.105
+X21.503Y9.67
+X22.167Y10.418
+X22.585Y11.327
+X22.574Y12.327
+X22.499Y10.299
+X22.931Y11.202
+X22.934Y12.202
+X22.266Y12.945
+X22.2Y9.9
+X22.917Y10.596
+X22.946Y12.596
+X21.9Y9.5
+X22.854Y9.797
+X22.944Y10.793
+X22.838Y11.788
+X22.928Y12.784
+X22.9Y9.699
+X19.8Y8.599
+X20.78Y8.402
+X21.769Y8.546
+X22.727Y8.834
+X22.928Y10.824
+X22.833Y11.819
+X22.933Y12.814
+X22.9Y8.8
+X21Y7.999
+X21.99Y7.864
+X22.944Y8.166
+X19.9Y8.099
+X20.723Y7.533
+X21.69Y7.276
+X22.681Y7.41
+X20.599Y7.4
+X21.457Y6.884
+X22.455Y6.834
+X22.928Y7.715
+X20.9Y6.7
+X21.819Y6.307
+X22.779Y6.587
+X20.7Y6.5
+X21.521Y5.929
+X22.521Y5.912
+X22.92Y6.829
+X20.9Y5.8
+X21.81Y5.386
+X22.776Y5.644
+X20.7Y5.6
+X21.508Y5.01
+X22.507Y4.97
+X22.927Y5.877
+X21.9Y4.8
+X22.894Y4.907
+X19.8Y6.9
+X19.888Y5.903
+X20.435Y5.067
+X21.233Y4.463
+X22.212Y4.259
+X22.926Y4.959
+X21.9Y3.9
+X22.86Y4.178
+X17.8Y8.099
+X18.143Y7.16
+X18.621Y6.282
+X19.141Y5.428
+X19.781Y4.66
+X20.493Y3.958
+X21.355Y3.45
+X22.354Y3.408
+X22.944Y4.215
+X21.9Y3.2
+X22.883Y3.378
+X20.8Y3.3
+X21.646Y2.768
+X22.646Y2.747
+X18.6Y5.7
+X18.91Y4.749
+X19.4Y3.877
+X20.012Y3.087
+X20.799Y2.469
+X21.73Y2.106
+X22.716Y2.273
+X22.939Y3.248
+X22.9Y2.2
+X20.8Y2.1
+X21.695Y1.655
+X22.693Y1.588
+X21.599Y1.5
+X22.532Y1.138
+X22.939Y2.051
+X21.9Y1
+X22.899Y1.002
+X19.8Y3
+X20.095Y2.044
+X20.655Y1.216
+X21.461Y0.624
+X22.433Y0.386
+X22.942Y1.247
+X21.9Y0.2
+X22.896Y0.286
+X19.8Y2.2
+X20.021Y1.224
+X20.598Y0.408
+X21.417Y-0.165
+X22.393Y-0.382
+X22.927Y0.463
+X21.9Y-0.6
+X22.891Y-0.471
+X18.8Y4.5
+X18.833Y3.5
+X18.915Y2.503
+X19.143Y1.53
+X19.556Y0.619
+X20.216Y-0.131
+X20.946Y-0.814
+X21.898Y-1.12
+X22.89Y-0.989
+X20.8Y-1
+X21.638Y-1.544
+X22.635Y-1.628
+X21.599Y-1.7
+X22.538Y-2.045
+X22.929Y-1.124
+X22.938Y-0.124
+X21.9Y-2.2
+X22.898Y-2.14
+X20.8Y-1.2
+X21.104Y-2.152
+X21.969Y-2.653
+X22.947Y-2.444
+X19.9Y-0.5
+X20.072Y-1.484
+X20.523Y-2.377
+X21.313Y-2.991
+X22.298Y-3.16
+X21.199Y-3.2
+X22.128Y-3.57
+X22.924Y-2.964
+X19.9Y-2
+X20.205Y-2.952
+X20.888Y-3.682
+X21.817Y-4.05
+X22.784Y-3.792
+X20.7Y-3.8
+X21.491Y-4.411
+X22.491Y-4.431
+X22.936Y-3.536
+X19.9Y-2.6
+X20.015Y-3.593
+X20.585Y-4.414
+X21.452Y-4.913
+X22.451Y-4.896
+X22.907Y-4.006
+X21.9Y-5.1
+X22.891Y-4.966
+X20.8Y-5
+X21.664Y-5.501
+X22.661Y-5.585
+X22.938Y-4.625
+X22.9Y-5.7
+X22.2Y-6.4
+X22.944Y-5.732
+X19.9Y-3.8
+X20.047Y-4.789
+X20.561Y-5.646
+X21.158Y-6.449
+X22.099Y-6.785
+X22.93Y-6.229
+X19.9Y-5.3
+X20.203Y-6.252
+X20.92Y-6.949
+X21.866Y-7.273
+X22.819Y-6.969
+X20.8Y-7
+X21.576Y-7.629
+X22.576Y-7.624
+X21.499Y-7.7
+X22.439Y-8.041
+X22.915Y-7.161
+X21.9Y-8.2
+X22.89Y-8.062
+X19.8Y-6.1
+X20.11Y-7.05
+X20.642Y-7.897
+X21.397Y-8.553
+X22.381Y-8.727
+X21.299Y-8.8
+X22.237Y-9.148
+X22.917Y-8.415
+X19.9Y-7.5
+X20.212Y-8.449
+X20.901Y-9.175
+X21.793Y-9.625
+X22.743Y-9.313
+X20.7Y-9.4
+X21.484Y-10.019
+X22.484Y-10.001
+X22.939Y-9.11
+X21.9Y-10.199
+X22.891Y-10.072
+X19.8Y-8.1
+X19.905Y-9.094
+X20.426Y-9.947
+X21.204Y-10.576
+X22.187Y-10.763
+X22.922Y-10.085
+X21.9Y-11.1
+X22.875Y-10.88
+X20.8Y-10.9
+X21.606Y-11.49
+X22.605Y-11.534
+X22.937Y-10.59
+X22.9Y-11.6
+X21.8Y-11.7
+X22.751Y-12.008
+X22.699Y-12.1
+X22.1Y-12.7
+X22.924Y-12.134
+X20.9Y-11.2
+X21.091Y-12.181
+X21.684Y-12.986
+X22.68Y-12.891
+X20.599Y-11.899
+X20.903Y-12.852
+X22.896Y-13.02
+X19.8Y-10.1
+X19.74Y-11.098
+X19.876Y-12.088
+X20.337Y-12.975
+X19.299Y-11
+X19.259Y-11.999
+X19.604Y-12.937
+X19.6Y-9
+X19.034Y-9.824
+X18.685Y-10.761
+X18.624Y-11.76
+X18.807Y-12.743
+X19.761Y-13.045
+X18.7Y-10.1
+X18.191Y-10.96
+X18.05Y-11.95
+X18.346Y-12.906
+X18.299Y-12.999
+X18.199Y-10.1
+X17.661Y-10.942
+X17.487Y-11.927
+X17.654Y-12.913
+X17.6Y-12.999
+X18.5Y-9.099
+X17.716Y-9.72
+X17.187Y-10.569
+X16.88Y-11.521
+X16.862Y-12.521
+X16.799Y-12.6
+X16.7Y-12.7
+X17.673Y-12.927
+X20.672Y-13.024
+X16.6Y-12.1
+X16.941Y-13.039
+X17.899Y-9.099
+X17.093Y-9.69
+X16.492Y-10.49
+X16.104Y-11.412
+X16.049Y-12.41
+X16.818Y-13.049
+X15.799Y-12.1
+X16.147Y-13.037
+X17.099Y-9.099
+X16.303Y-9.705
+X15.717Y-10.515
+X15.3Y-11.424
+X15.312Y-12.424
+X15.299Y-10.5
+X14.84Y-11.388
+X14.805Y-12.387
+X15.555Y-13.049
+X14.5Y-12.1
+X14.818Y-13.047
+X14.799Y-11.1
+X14.158Y-11.867
+X14.199Y-12.866
+X14.099Y-12.9
+X14Y-12.999
+X13.9Y-12.1
+X18.8Y-8.2
+X17.8Y-8.155
+X16.861Y-8.497
+X15.981Y-8.973
+X15.181Y-9.572
+X14.443Y-10.248
+X13.74Y-10.958
+X13.362Y-11.884
+X13.416Y-12.883
+X13.4Y-10.9
+X12.898Y-11.765
+X12.865Y-12.764
+X13.826Y-13.04
+X12.8Y-11.1
+X12.34Y-11.988
+X12.548Y-12.966
+X12.499Y-11
+X11.952Y-11.837
+X11.962Y-12.836
+X12.945Y-13.022
+X11.899Y-11.1
+X11.44Y-11.988
+X11.6Y-12.975
+Y-11
+X11.029Y-11.82
+X11.01Y-12.82
+X11.987Y-13.034
+X13.9Y-10.1
+X12.9Y-10.069
+X11.902Y-10.136
+X11.012Y-9.681
+X10.402Y-8.889
+X9.342Y-7.193
+X8.368Y-6.967
+X9.3Y-7
+X10.199Y-8.1
+X10.014Y-7.117
+X9.189Y-6.553Z-2.849
+X11.1Y-8.6Z-3
+X10.998Y-7.605
+X10.482Y-6.749
+X9.677Y-6.155
+X11.6Y-8.2
+X11.425Y-7.215
+X10.929Y-6.346
+X10.11Y-5.773
+X12.1Y-7.8
+X11.944Y-6.812
+X11.382Y-5.985
+X10.573Y-5.396
+X9.695Y-5.875
+X11.6Y-5.9
+X10.994Y-5.104
+X9.994Y-5.117
+X11.899Y-6.2
+X11.696Y-5.22
+X10.86Y-4.672
+X9.939Y-5.062
+X11.899Y-5.1
+X11.234Y-4.353
+X10.235Y-4.393
+X12.2Y-5.4
+X11.965Y-4.427
+X11.112Y-3.906
+X10.116Y-3.995
+X13.099Y-7.999
+X13.181Y-7.003
+X13.115Y-6.005
+X12.952Y-5.018
+X12.465Y-4.145
+X11.682Y-3.523
+X10.698Y-3.345
+X9.968Y-4.029
+X10.899Y-3.1
+X9.966Y-3.457
+X11.899Y-3.5
+X11.189Y-2.796
+X10.189Y-2.801
+X13.099Y-4.9
+X12.944Y-3.912
+X12.423Y-3.058
+X11.644Y-2.431
+X10.672Y-2.196
+X9.971Y-2.909
+X10.899Y-2
+X9.96Y-2.341
+X11.899Y-2.4
+X11.2Y-1.685
+X10.2Y-1.675
+X13.2Y-3.7
+X12.899Y-2.746
+X12.375Y-1.894
+X11.595Y-1.268
+X10.623Y-1.036
+X9.959Y-1.784
+X10.899Y-0.8
+X9.96Y-1.143
+X11.899Y-1.2
+X11.206Y-0.479
+X10.206Y-0.46
+X13.2Y-2.5
+X12.898Y-1.546
+X12.375Y-0.694
+X11.595Y-0.068
+X10.622Y0.163
+X9.959Y-0.585
+X10.899Y0.4
+X9.96Y0.056
+X11.899Y0
+X11.206Y0.72
+X10.206Y0.739
+X13.2Y-1.3
+X12.898Y-0.346
+X12.375Y0.505
+X11.595Y1.131
+X10.622Y1.363
+X9.959Y0.614
+X10.899Y1.6
+X9.96Y1.256
+X11.899Y1.2
+X11.206Y1.92
+X10.206Y1.939
+X13.2Y-0.1
+X12.898Y0.853
+X12.375Y1.705
+X11.595Y2.331
+X10.622Y2.563
+X9.959Y1.814
+X10.899Y2.8
+X9.96Y2.456
+X11.899Y2.4
+X11.206Y3.12
+X10.206Y3.139
+X13.2Y1.1
+X12.898Y2.053
+X12.375Y2.905
+X11.595Y3.531
+X10.622Y3.763
+X9.959Y3.014
+X10.899Y4
+X9.96Y3.656
+X11.899Y3.6
+X11.206Y4.32
+X10.206Y4.339
+X13.2Y2.3
+X12.898Y3.253
+X12.375Y4.105
+X11.626Y4.768
+X11.762Y5.759
+X12.495Y6.439
+X13.32Y7.004
+X14.24Y7.397
+X15.236Y7.31
+X16.1Y6.806
+X16.779Y6.072
+X17.217Y5.173
+X17.518Y4.22
+X18.026Y2.285
+X18.628Y0.378
+X18.786Y-0.609
+X18.907Y-2.605
+X18.918Y-3.605
+X18.88Y-4.604
+X18.508Y-5.532
+X17.882Y-6.312
+X17.116Y-6.956
+X16.133Y-6.771
+X15.385Y-6.108
+X14.861Y-5.256
+X14.56Y-4.303
+X14.354Y-3.324
+X14.173Y-0.33
+X14.162Y0.669
+X14.101Y1.667
+X15.1Y1.728
+X15.16Y0.729
+X16.099Y0.7
+X16.367Y-0.263
+X16.3Y-1.3
+X16.523Y-2.274
+X16.5Y2.7
+X15.801Y3.416
+X15.799Y4.4
+X10.7Y5.3
+X9.956Y4.631
+G0Z10
+X9.9Y7.6
+G1Z-3F500
+X9.588Y6.649F1000
+X9.761Y5.664
+G0Z10
+X8.7Y7.6
+G1Z-3F500
+X8.951Y6.632F1000
+X7.9Y7.6
+X6.8Y7.5
+X7.645Y6.966
+X7Y7
+X6
+X-5Y12
+X-6.891Y11.35
+X-7.8Y10.933
+X-8.611Y10.348
+X-9.327Y9.65
+X-9.971Y8.885
+X-10.687Y8.187
+X-12.049Y6.722
+X-12.654Y5.926
+X-13.179Y5.075
+X-13.662Y4.199
+X-14.101Y3.301
+X-14.45Y2.363
+X-14.657Y1.385
+X-14.67Y0.385
+X-14.304Y-1.58
+X-14.17Y-2.571
+X-14.085Y-3.567
+X-14.097Y-4.567
+X-13.914Y-5.55
+X-13.684Y-6.523
+X-13.313Y-7.452
+X-12.768Y-8.291
+X-12.106Y-9.04
+X-11.341Y-9.684
+X-10.442Y-10.123
+X-9.505Y-10.472
+X-8.527Y-10.679
+X-6.552Y-10.998
+X-5.554Y-11.059
+X-4.554Y-11.072
+X-3.555Y-11.035
+X0.444Y-11.086
+X1.442Y-11.148
+X2.442Y-11.16
+X4.438Y-11.283
+X5.437Y-11.247
+X6.421Y-11.064
+X7.381Y-10.786
+X8.318Y-11.135
+X9.016Y-11.851
+X9.641Y-12.632
+X10.56Y-13.026
+X8.5Y-12.1
+X9.071Y-12.92
+X9Y-12.999
+X7.9Y-12.1
+X8.287Y-13.021
+X7.2Y-12.1
+X7.539Y-13.04
+X6.5Y-12.1
+X6.833Y-13.042
+X5.8Y-12.1
+X6.133Y-13.042
+X5.1Y-12.1
+X5.428Y-13.044
+X4.4Y-12.1
+X4.754Y-13.035
+X3.7Y-12.1
+X4.013Y-13.049
+X3Y-12.1
+X3.342Y-13.039
+X2.3Y-12.1
+X2.62Y-13.047
+X1.6Y-12.1
+X1.912Y-13.049
+X0.9Y-12.1
+X1.212Y-13.049
+X0.2Y-12.1
+X0.512Y-13.049
+X-0.5Y-12.1
+X-0.147Y-13.035
+X-1.2Y-12.1
+X-0.872Y-13.044
+X-1.9Y-12.1
+X-1.541Y-13.033
+X-2.6Y-12.1
+X-2.277Y-13.046
+X-3.3Y-12.1
+X-2.983Y-13.048
+X-4Y-12.1
+X-3.687Y-13.049
+X-4.7Y-12.1
+X-4.363Y-13.041
+X-5.4Y-12.1
+X-5.073Y-13.045
+X-6.1Y-12.1
+X-5.751Y-13.037
+X-6.8Y-12.1
+X-6.457Y-13.039
+X-7.5Y-12.1
+X-7.147Y-13.035
+X-8.2Y-12.1
+X-7.876Y-13.046
+X-10.9Y-10.1
+X-10.64Y-11.065
+X-10.07Y-11.887
+X-9.46Y-12.68
+X-8.53Y-13.046
+X-11.6Y-10.1
+X-11.393Y-11.078
+X-10.955Y-11.977
+X-10.351Y-12.773
+X-9.378Y-13.005
+X-11.4Y-12.1
+X-10.878Y-12.953
+X-11.899Y-11
+X-11.992Y-11.995
+X-11.65Y-12.935
+X-11.7Y-12.999
+X-12.8Y-9.099
+X-13.033Y-10.072
+X-12.974Y-11.07
+X-12.817Y-12.058
+X-12.471Y-12.996
+X-11.472Y-13.035
+X-13.499Y-9.099
+X-13.709Y-10.077
+X-13.724Y-11.077
+X-13.592Y-12.068
+X-13.223Y-12.998
+X-10.224Y-13.043
+X-14Y-12
+X-13.807Y-12.981
+X-13.9Y-12.999
+X-14Y-11.1
+X-14.465Y-11.985
+X-14.409Y-12.983
+X-13.41Y-13.025
+X-14.5Y-11.1
+X-14.956Y-11.989
+X-14.889Y-12.987
+X-14.9Y-11
+X-15.395Y-11.868
+X-15.423Y-12.868
+X-14.438Y-13.042
+X-15.5Y-11.1
+X-15.95Y-11.993
+X-15.828Y-12.985
+X-15.899Y-11
+X-16.398Y-11.867
+X-16.379Y-12.866
+X-15.395Y-13.043
+X-16.4Y-11.1
+X-16.888Y-11.972
+X-16.761Y-12.964
+X-15.763Y-13.033
+X-13.78Y-12.778
+X-12.814Y-13.04
+X-14.9Y-10.1
+X-15.893Y-10.212
+X-16.744Y-10.738
+X-17.287Y-11.577
+X-17.42Y-12.568
+X-16.531Y-13.027
+X-17.6Y-12.1
+X-17.262Y-13.041
+X-17.3Y-11.1
+X-17.935Y-11.871
+X-17.888Y-12.87
+X-15.899Y-9.9
+X-16.875Y-10.121
+X-17.718Y-10.658
+X-18.332Y-11.448
+X-18.5Y-12.434
+X-17.71Y-13.047
+X-18.8Y-12.1
+X-18.469Y-13.043
+X-18.5Y-11.1
+X-19.126Y-11.879
+X-19.116Y-12.879
+X-19.199Y-12.9
+X-19.299Y-12.999
+X-19.399Y-12.1
+X-19.074Y-13.045
+X-19.099Y-11.1
+X-19.78Y-11.833
+X-19.889Y-12.826
+X-19.9Y-11.899
+X-20.188Y-12.857
+X-19.725Y-13.047
+X-19.8Y-11.1
+X-20.448Y-11.86
+X-20.614Y-12.847
+X-20.7Y-12.9
+X-20.8Y-12.999
+X-20.9Y-12.1
+X-20.544Y-13.034
+X-17.6Y-10.1
+X-18.599Y-10.09
+X-19.582Y-10.276
+X-20.444Y-10.782
+X-21.192Y-11.447
+X-21.444Y-12.415
+X-21.499Y-12.5
+X-22Y-12.999
+X-21.1Y-11.1
+X-21.919Y-11.672
+X-22.458Y-12.515
+X-22.35Y-13.003
+X-22.399Y-12.1
+X-20.499Y-10.199
+X-21.47Y-10.44
+X-22.303Y-10.994
+X-22.86Y-11.824
+X-22.912Y-12.823
+X-23Y-12.9
+X-21.1Y-10
+X-22.078Y-10.207
+X-22.873Y-10.814
+X-23.007Y-11.805
+X-22.1Y-9.9
+X-23.018Y-10.295
+X-23Y-10
+X-22.932Y-11.998
+X-23.045Y-12.992
+X-20.099Y-10
+X-20.967Y-9.502
+X-21.942Y-9.279
+X-22.935Y-9.396
+X-20Y-9.4
+X-20.85Y-8.873
+X-21.827Y-8.663
+X-22.819Y-8.795
+X-17.899Y-9.8
+X-18.629Y-9.116
+X-19.478Y-8.588
+X-20.396Y-8.19
+X-21.373Y-7.979
+X-22.373Y-8.011
+X-23.02Y-8.774
+X-22.1Y-7.8
+X-23.039Y-8.141
+X-18.099Y-9.2
+X-18.727Y-8.421
+X-19.525Y-7.818
+X-20.445Y-7.427
+X-21.413Y-7.175
+X-22.412Y-7.215
+X-23.015Y-8.013
+X-20.099Y-7.1
+X-20.996Y-6.657
+X-21.99Y-6.542
+X-22.879Y-6.999
+X-19.9Y-7
+X-20.602Y-6.288
+X-21.557Y-5.991
+X-22.539Y-6.18
+X-23.016Y-7.059
+G0Z10
+X-15Y-9
+G1Z-3F500
+X-15.953Y-8.697F1000
+X-16.872Y-8.303
+X-17.696Y-7.736
+X-19.16Y-6.374
+X-19.985Y-5.808
+X-20.922Y-5.459
+X-21.92Y-5.398
+X-22.829Y-5.814
+X-17.899Y-6.9
+X-18.49Y-6.092
+X-19.258Y-5.453
+X-20.137Y-4.975
+X-21.105Y-4.726
+X-22.101Y-4.817
+X-22.986Y-5.282
+X-18.999Y-5.3
+X-19.725Y-4.611
+X-20.64Y-4.207
+X-21.637Y-4.135
+X-22.612Y-4.356
+X-23.016Y-5.271
+X-23.039Y-6.27
+X-18.099Y-6.3
+X-18.308Y-5.322
+X-18.875Y-4.498
+X-19.687Y-3.913
+X-20.633Y-3.59
+X-21.629Y-3.506
+X-22.596Y-3.762
+X-23.011Y-4.672
+X-23Y-4
+X-21.1Y-3.1
+X-22.097Y-3.025
+X-23.03Y-3.385
+X-20.099Y-3.4
+X-20.842Y-2.73
+X-21.813Y-2.489
+X-22.801Y-2.638
+X-17.899Y-5.7
+X-16.943Y-5.409
+X-15.999Y-4.5
+X-16.951Y-4.193
+X-17.825Y-3.707
+X-18.674Y-3.179
+X-19.467Y-2.569
+X-20.364Y-2.127
+X-21.33Y-1.867
+X-22.33Y-1.851
+X-23.049Y-2.546
+X-22.1Y-1.6
+X-23.042Y-1.934
+X-20.099Y-2
+X-20.879Y-1.374
+X-21.839Y-1.094
+X-22.833Y-1.203
+X-17.899Y-3.3
+X-18.471Y-2.479
+X-19.158Y-1.752
+X-19.912Y-1.095
+X-20.803Y-0.641
+X-21.787Y-0.465
+X-22.773Y-0.632
+X-23.045Y-1.594
+X-20.099Y-0.6
+X-20.94Y-0.058
+X-21.924Y0.12
+X-22.89Y-0.138
+X-23.02Y-1.13
+X-20.099Y-0.2
+X-20.868Y0.439
+X-21.837Y0.688
+X-22.819Y0.499
+X-23.02Y-0.479
+X-19.099Y-1.5
+X-19.228Y-0.508
+X-19.768Y0.333
+X-20.56Y0.943
+X-21.512Y1.251
+X-22.511Y1.22
+X-23.041Y0.372
+X-21.1Y1.3
+X-22.02Y1.691
+X-22.964Y1.363
+X-18.999Y-0.7
+X-19.156Y0.287
+X-19.719Y1.113
+X-20.498Y1.741
+X-21.406Y2.16
+X-22.406Y2.15
+X-23.033Y1.371
+X-21.1Y2.3
+X-22.041Y2.637
+X-22.965Y2.255
+X-18.999Y0.2
+X-19.214Y1.176
+X-19.746Y2.023
+X-20.5Y2.68
+X-21.391Y3.133
+X-22.391Y3.113
+X-23.048Y2.358
+X-22.1Y3.3
+X-23.045Y2.973
+X-20.099Y2.9
+X-20.868Y3.539
+X-21.823Y3.836
+X-22.813Y3.696
+X-18.9Y0.6
+X-18.899Y1.6
+X-19.141Y2.57
+X-19.696Y3.401
+X-20.469Y4.036
+X-21.41Y4.374
+X-22.409Y4.423
+X-23.044Y3.651
+X-22.1Y4.6
+X-23.04Y4.259
+X-20.099Y4.2
+X-20.872Y4.834
+X-21.829Y5.125
+X-22.818Y4.979
+X-18.9Y2.9
+X-19.119Y3.875
+X-19.695Y4.692
+X-20.484Y5.307
+X-21.417Y5.667
+X-22.417Y5.691
+X-23.032Y4.902
+X-22.1Y5.9
+X-23.045Y5.575
+X-20.099Y5.5
+X-20.882Y6.122
+X-21.843Y6.398
+X-22.837Y6.285
+X-18.9Y4.2
+X-19.133Y5.172
+X-19.722Y5.98
+X-20.519Y6.584
+X-21.458Y6.929
+X-22.456Y6.988
+X-23.019Y6.161
+X-21.1Y7.1
+X-22.033Y7.458
+X-22.965Y7.098
+G0Z10
+X-15Y2
+G1Z-3F500
+X-15.981Y2.193F1000
+X-16.578Y2.995
+X-15.776Y3.592
+X-14.581Y1.988
+X-15.383Y1.391
+X-16.4Y1.3
+X-16.629Y0.326
+X-17.7Y4.3
+X-18.135Y5.2
+X-18.738Y5.998
+X-19.416Y6.732
+X-20.163Y7.397
+X-21.049Y7.861
+X-22.04Y7.999
+X-22.994Y7.7
+X-20
+X-20.787Y8.316
+X-21.762Y8.536
+X-22.755Y8.415
+X-23.023Y7.452
+X-18.099Y5.4
+X-18.373Y6.361
+X-18.785Y7.272
+X-19.367Y8.086
+X-20.16Y8.695
+X-21.077Y9.094
+X-22.071Y9.209
+X-22.982Y8.797
+X-17.999Y5.7
+X-17.958Y6.699
+X-18.302Y7.638
+X-18.863Y8.465
+X-19.609Y9.131
+X-20.494Y9.596
+X-21.466Y9.832
+X-22.461Y9.727
+X-23.01Y8.891
+X-20.099Y9.8
+X-20.975Y10.282
+X-21.969Y10.393
+X-22.879Y9.978
+X-23.038Y8.99
+X-18.099Y7.9
+X-18.46Y8.832
+X-18.996Y9.676
+X-19.722Y10.365
+X-20.615Y10.814
+X-21.601Y10.983
+X-22.586Y10.811
+X-23.034Y9.918
+X-20.099Y10.9
+X-20.964Y11.401
+X-21.956Y11.534
+X-22.892Y11.183
+X-19.9Y11.1
+X-20.615Y11.798
+X-21.575Y12.077
+X-22.569Y11.968
+X-23.03Y11.08
+X-18.099Y9
+X-18.431Y9.943
+X-18.854Y10.849
+X-19.404Y11.684
+X-20.204Y12.284
+X-21.144Y12.626
+X-22.142Y12.681
+X-23.003Y12.172
+X-18.099Y10.1
+X-18.312Y11.077
+X-18.799Y11.95
+X-19.552Y12.608
+X-20.499Y12.929
+X-21.499Y12.911
+X-22.498Y12.942
+X-19.5Y12.9
+X-17.6Y7.8
+X-17.395Y8.778
+X-17.336Y9.777
+X-17.472Y10.767
+X-17.8Y11.712
+X-18.262Y12.599
+X-19.201Y12.945
+X-22.198Y12.828
+X-23.035Y12.28
+X-16.999Y10
+X-16.972Y10.999
+X-17.189Y11.975
+X-17.721Y12.822
+X-16.799Y11.8
+X-17.042Y12.77
+X-18.031Y12.917
+X-17.099Y12.9
+X-17.2Y8.8
+X-16.581Y9.585
+X-16.263Y10.533
+X-16.136Y11.525
+X-16.254Y12.518
+X-16.3Y9.5
+X-15.731Y10.322
+X-15.52Y11.3
+X-15.602Y12.296
+X-16.365Y12.943
+X-15.4Y11.899
+X-15.58Y12.883
+X-15.6Y9.8
+X-15.05Y10.635
+X-14.814Y11.607
+X-14.871Y12.605
+X-14.9Y10.6
+X-14.373Y11.449
+X-14.309Y12.447
+X-15.183Y12.932
+X-14.2Y10.9
+X-13.8Y11.816
+X-14.074Y12.778
+X-14.099Y10.7
+X-13.466Y11.473
+X-13.419Y12.472
+X-14.301Y12.942
+X-13.4Y12.9
+X-13.499Y10.799
+X-12.722Y10.171
+X-13.351Y9.393
+X-14.4Y9.3
+X-14.069Y8.356
+X-15.013Y8.025
+G0Z10
+X-15.099Y7
+G1Z-3F500
+X-11.2Y9.9F1000
+X-11.688Y10.772
+X-11.997Y11.723
+X-12.397Y12.639
+X-11.4Y11.6
+X-11.661Y12.565
+X-12.592Y12.93
+X-11.6Y12.9
+X-10.7Y11.8
+X-10.847Y12.789
+X-9.9Y11.7
+X-10.082Y12.683
+X-11.048Y12.939
+X-10.1Y12.9
+X-8.2Y11.8
+X-8.655Y12.69
+X-7.7Y12.6
+X-8.645Y12.925
+X-7.7Y12.9
+X-5.9Y12.7
+X-6.875Y12.918
+X-5.9Y12.9
+X-5Y12.8
+G0Z10
+X0Y9
+G1Z-6F500
+X0.088Y9.088F1000
+X0Y9.25
+X-0.265Y9.265
+X-0.5Y9
+X-0.441Y8.558
+X0Y8.25
+X0.618Y8.381
+X1Y9
+X0.234Y9.643
+X-0.71Y9.318
+X-0.723Y8.318
+X0.152Y7.836
+X1.062Y8.252
+X1.269Y9.231
+X0.57Y9.946
+X-0.428Y9.959
+X-1.144Y9.26
+X-1.107Y8.261
+X-0.409Y7.545
+X0.588Y7.484
+X1.426Y8.029
+X1.775Y8.967
+X1.403Y9.895
+X0.552Y10.42
+X-0.447Y10.432
+X-1.285Y9.887
+X-1.679Y8.968
+X-1.496Y7.985
+X-0.834Y7.235
+X0.132Y6.98Z-4.856
+X1.115Y7.163Z-6F500
+X1.865Y7.826F1000
+X2.213Y8.763
+X2.078Y9.754
+X1.454Y10.535
+X0.555Y10.973
+X-0.444Y10.986
+X-1.353Y10.569
+X-1.997Y9.804
+X-2.204Y8.826
+X-2.021Y7.843
+X-1.435Y7.032
+X0.562Y7.106
+X1.556Y6.996Z-5.766
+X2.305Y7.658Z-6
+X2.699Y8.577
+X2.712Y9.577
+X2.295Y10.486
+X1.563Y11.167
+X0.625Y11.515
+X-0.372Y11.577
+X-1.332Y11.298
+X-2.113Y10.673
+X-2.595Y9.797
+X-2.802Y8.819
+X-2.668Y7.828
+X-2.164Y6.964Z-3.875
+X-1.173Y7.099Z-6F500
+X-0.183Y7.233F1000
+X0.783Y6.978Z-4.725
+X1.783Y6.966Z-3.986
+X2.671Y7.426Z-6F500
+X3.196Y8.278F1000
+X3.306Y9.272
+X3.123Y10.255
+X2.578Y11.093
+X1.782Y11.699
+X0.863Y12.093
+X-0.13Y12.203
+X-1.121Y12.068
+X-2.009Y11.608
+X-2.725Y10.91
+X-3.207Y10.033
+X-3.414Y9.055
+X-3.377Y8.056
+X-3.052Y7.11
+X-2.054Y7.049
+X-1.056Y6.987Z-5.278
+X-0.065Y7.122Z-6F500
+X1.916Y7.391F1000
+X2.883Y7.136
+X3.564Y7.869
+X3.866Y8.822
+X3.878Y9.822
+X3.553Y10.768
+X2.967Y11.578
+X2.202Y12.222
+X1.303Y12.661
+X0.325Y12.868
+X-0.674Y12.88
+X-1.634Y12.602
+X-2.498Y12.098
+X-3.179Y11.366
+X-3.704Y10.514
+X-4.006Y9.561
+X-4.116Y8.567
+X-3.981Y7.576
+X-3.186Y6.971Z-4.262
+X-4.2Y7.9Z-6F500
+X-3.876Y6.953Z-3.23F1000
+X-3.9Y10.9Z-6F500
+X-4.456Y10.068F1000
+X-4.793Y9.127
+X-4.892Y8.132
+X-4.697Y7.151
+X-3.716Y6.955Z-3.349
+X3.283Y6.951Z-3.112
+X4.024Y7.623Z-6F500
+X4.407Y8.546F1000
+X4.506Y9.541
+X4.36Y10.531
+X3.933Y11.435
+X3.299Y12.208
+X2.526Y12.843
+X1.531Y12.942Z-3.475
+X0.536Y12.844Z-6F500
+X-0.459Y12.943Z-3.408F1000
+X-1.459Z-3.374
+X-2.439Y12.749Z-6F500
+X-3.322Y12.278F1000
+X-4.125Y11.683
+X-4.797Y10.942
+X-5.225Y10.038
+X-5.516Y9.081
+X-5.566Y8.083
+X-5.276Y7.126
+X-4.3Y12.1
+X-5.081Y11.476
+X-5.687Y10.681
+X-6.083Y9.762
+X-6.291Y8.784
+X-6.206Y7.787
+X-5.622Y6.976Z-4.603
+X-6.7Y8.9Z-6F500
+X-6.787Y7.903F1000
+X-6.395Y6.983Z-5.036
+X-6.4Y9.9Z-6
+X-7.074Y9.161
+X-7.32Y8.192
+X-7.177Y7.202
+X-7.2Y9.199
+X-7.735Y8.355
+X-7.761Y7.356
+X-6.828Y6.995Z-5.71
+X-7.9Y8.9Z-6
+X-8.306Y7.986
+X-7.993Y7.036
+X-7.999Y9
+X-8.656Y8.246
+X-8.637Y7.246
+X-7.674Y6.974Z-4.484
+G0Z10
+X-8.7Y6.9
+G1Z-6F500
+X-8.9Y6.7F1000
+X-9Y7.6
+X-9.196Y6.619
+Z-3.299
+X-6.1Y10.5Z-6
+X-7.076Y10.285
+X-7.992Y9.883
+X-8.752Y9.233
+X-9.331Y8.418
+X-9.695Y7.487
+X-9.577Y6.494
+X-9.6Y6.4
+X-10.7Y5.3
+X-9.818Y5.771Z-4.594
+X-10.9Y5.7Z-6F500
+X-10.09Y5.113F1000
+X-9.97Y5.151Z-4.25
+X-11Y5.1Z-6F500
+X-10.008Y4.973Z-4.523F1000
+X-11.1Y4.9Z-6F500
+X-10.175Y4.519F1000
+X-11.2Y5.5
+X-11.178Y4.5
+X-10.229Y4.184
+X-10.3Y7.1
+X-11.122Y6.531
+X-11.664Y5.69
+X-11.746Y4.694
+X-11.1Y3.931
+X-10.103Y3.849
+X-11.2Y3.8
+X-10.273Y3.423
+X-10.062Y3.877Z-3.772
+X-12.1Y4.8Z-6F500
+X-11.891Y3.821F1000
+X-11.141Y3.16
+X-10.142Y3.124
+X-12.2Y4.1
+X-11.835Y3.168
+X-10.987Y2.638
+X-10.056Y3.003Z-3.381
+X-12.1Y3Z-6F500
+X-11.391Y2.293F1000
+X-10.391Y2.295
+X-10.4Y2.2
+X-11.5Y2.1
+X-10.55Y1.785
+X-10.056Y2.654Z-3.409
+X-11.1Y1.6Z-6F500
+X-10.107Y1.718F1000
+X-12.2Y2.7
+X-11.932Y1.736
+X-11.086Y1.202
+X-10.089Y1.276Z-5.379
+X-12.1Y5.2Z-6
+X-12.645Y4.361
+X-12.876Y3.388
+X-12.814Y2.39
+X-12.376Y1.492
+X-11.595Y0.867
+X-10.622Y0.636
+X-11.7Y0.6
+X-10.769Y0.233
+X-10.074Y0.952Z-4.485
+X-13.1Y1.9Z-6
+X-12.773Y0.954
+X-12.11Y0.206
+X-11.211Y-0.231
+X-10.251Y0.048
+X-12.3Y0
+X-11.489Y-0.586
+X-10.489Y-0.574
+X-10.072Y0.334Z-4.378
+X-12.1Y-0.7Z-6F500
+X-11.193Y-1.121F1000
+X-10.224Y-0.871
+X-12.3Y-0.9
+X-11.491Y-1.489
+X-10.492Y-1.529
+X-10.072Y-0.622Z-4.36
+X-11.1Y-1.7Z-6F500
+X-10.105Y-1.592F1000
+X-13.2Y1.4
+X-13.215Y0.4
+X-13.084Y-0.591
+X-12.542Y-1.431
+X-11.779Y-2.078
+X-10.802Y-2.288
+X-10.05Y-1.629Z-3.047
+X-13.1Y3.3Z-6
+X-13.605Y2.437
+X-13.887Y1.477
+X-13.975Y0.481
+X-13.819Y-0.506
+X-13.383Y-1.405
+X-12.741Y-2.172
+X-11.878Y-2.678
+X-10.882Y-2.767
+X-10.056Y-2.203Z-3.396
+X-13.1Y-2.3Z-6F500
+X-12.392Y-3.007F1000
+X-11.451Y-3.344
+X-10.47Y-3.149
+X-12.5Y-3.2
+X-11.658Y-3.74
+X-10.658Y-3.722
+X-10.077Y-2.909Z-4.657
+X-11.1Y-4Z-6F500
+X-10.128Y-3.764F1000
+X-12.2Y-3.8
+X-11.382Y-4.375
+X-10.382Y-4.4
+X-10.069Y-3.45Z-4.143
+X-10.1Y-4.5Z-6F500
+X-11.2Y-4.6F1000
+X-10.25Y-4.912
+X-10.3Y-5
+X-10.8Y-5.5
+X-10.061Y-4.825Z-3.694
+X-13.1Y-2.9Z-6F500
+X-12.832Y-3.863F1000
+X-12.338Y-4.733
+X-11.761Y-5.549
+X-10.811Y-5.862
+X-9.967Y-5.326Z-4.052
+X-12.999Y-4.4Z-6F500
+X-12.704Y-5.355F1000
+X-11.994Y-6.058
+X-11.035Y-6.344
+X-10.08Y-6.049
+X-13.1Y-5.1
+X-12.743Y-6.034
+X-11.957Y-6.652
+X-10.982Y-6.874
+X-10.017Y-6.611
+X-13.1Y-5.7
+X-12.768Y-6.643
+X-11.969Y-7.244
+X-10.989Y-7.445
+X-10.018Y-7.208
+X-9.498Y-6.353Z-3.181
+X-12.5Y-7.4Z-6F500
+X-11.633Y-7.898F1000
+X-10.636Y-7.979
+X-9.719Y-7.58
+X-9.138Y-6.766
+X-12.2Y-7.8
+X-11.373Y-8.362
+X-10.375Y-8.42
+X-9.467Y-8.001
+X-8.789Y-7.266
+X-11.8Y-8.3
+X-10.971Y-8.86
+X-9.972Y-8.817
+X-9.066Y-8.394
+X-8.427Y-7.625
+X-8.936Y-6.764Z-3.88
+X-9Y-8.8Z-6F500
+X-8.21Y-8.185F1000
+X-8.136Y-7.188
+X-9.2Y-9.2
+X-8.249Y-8.887
+X-7.713Y-8.043
+X-7.834Y-7.051Z-3.072
+X-10.9Y-9.099Z-6F500
+X-10.035Y-9.601F1000
+X-9.038Y-9.685
+X-8.085Y-9.381
+X-7.388Y-8.664
+X-7.159Y-7.691
+X-7.2Y-8.7
+X-6.747Y-7.808
+X-7.433Y-7.081Z-4.898
+X-6.5Y-8.1Z-6F500
+X-6.705Y-7.121F1000
+X-7Y-9
+X-6.224Y-8.368
+X-6.123Y-7.373
+X-7.2Y-9.4
+X-6.248Y-9.093
+X-5.706Y-8.252
+X-5.773Y-7.254
+X-6Y-9
+X-5.324Y-8.262
+X-5.319Y-7.262
+X-6.298Y-7.062Z-3.739
+X-5.3Y-7.1Z-6F500
+X-5Y-7.999F1000
+X-5.1Y-7.1
+X-7.999Y-10
+X-7Y-9.983
+X-6.034Y-9.724
+X-5.184Y-9.196
+X-4.602Y-8.384
+X-4.471Y-7.392
+X-4.5Y-8.4
+X-4.06Y-7.501
+X-4.958Y-7.062Z-3.738
+X-4Y-7.1Z-6F500
+X-4.1Y-8.2F1000
+X-3.614Y-7.325
+X-4.038Y-7.061Z-3.713
+X-6.1Y-10.1Z-6F500
+X-5.141Y-9.814F1000
+X-4.281Y-9.304
+X-3.57Y-8.6
+X-3.139Y-7.698
+X-3.909Y-7.06Z-3.636
+X-3Y-8.1Z-6F500
+X-3.146Y-7.11F1000
+X-5.2Y-10.199
+X-4.231Y-9.949
+X-3.378Y-9.429
+X-2.712Y-8.683
+X-2.524Y-7.7
+X-3.302Y-7.072Z-4.339
+X-2.4Y-8.1Z-6F500
+X-2.516Y-7.106F1000
+X-2.6Y-9.2
+X-1.997Y-8.401
+X-1.891Y-7.407
+X-1.9Y-8.5
+X-1.483Y-7.59
+X-2.346Y-7.087Z-5.227
+X-1.4Y-8.1Z-6
+X-1.456Y-7.101
+X-4.5Y-10.199
+X-3.5Y-10.166
+X-2.539Y-9.891
+X-1.699Y-9.349
+X-1.052Y-8.586
+X-0.842Y-7.608
+X-0.9Y-8.7
+X-0.421Y-7.822
+X-1.086Y-7.075Z-4.528
+X-1.1Y-9.099Z-6F500
+X-0.258Y-8.56F1000
+X-0.141Y-7.567
+X-1.2Y-9.6
+X-0.249Y-9.288
+X0.287Y-8.445
+X0.216Y-7.447
+X-0.715Y-7.085Z-5.129
+X0.2Y-7.1Z-6F500
+X0.1Y-9.2F1000
+X0.684Y-8.388
+X0.817Y-7.397
+X0.8Y-8.4
+X1.182Y-7.476
+X1.1Y-8.5
+X1.592Y-7.629
+X0.774Y-7.054Z-3.253
+X1.7Y-8.1Z-6F500
+X1.605Y-7.104F1000
+X0.6Y-9.2
+X1.555Y-8.905
+X2.106Y-8.07
+X2.052Y-7.072Z-4.336
+X-2Y-10.1Z-6
+X-1.002Y-10.168
+X-0.005Y-10.089
+X0.978Y-9.912
+X1.846Y-9.415
+X2.495Y-8.654
+X2.709Y-7.677
+X2.7Y-8.7
+X3.101Y-7.784
+X2.409Y-7.062Z-3.757
+X3.4Y-8.1Z-6F500
+X3.138Y-7.134F1000
+X1.1Y-10.199
+X2.061Y-9.924
+X2.95Y-9.466
+X3.667Y-8.769
+X3.877Y-7.791
+X3.181Y-7.074Z-4.456
+X4.1Y-8.1Z-6F500
+X3.878Y-7.124F1000
+X3.8Y-9.2
+X4.429Y-8.423
+X4.521Y-7.427
+X3.5Y-9.5
+X4.436Y-9.148
+X4.978Y-8.308
+X4.913Y-7.31
+X3.939Y-7.082Z-4.954
+X4.9Y-7.1Z-6F500
+X4.8Y-9.2F1000
+X5.405Y-8.404
+X5.515Y-7.41
+X5.5Y-8.5
+X5.948Y-7.606
+X5.103Y-7.072Z-4.327
+X6.1Y-8.1Z-6F500
+X5.987Y-7.106F1000
+X1.9Y-10.199
+X2.898Y-10.257
+X3.894Y-10.167
+X4.853Y-9.885
+X5.715Y-9.378
+X6.393Y-8.643
+X6.596Y-7.664
+X5.798Y-7.061Z-3.698
+X6.7Y-8.1Z-6F500
+X6.632Y-7.102F1000
+X4.6Y-10.199
+X5.591Y-10.067
+X6.43Y-9.524
+X7.076Y-8.76
+X7.285Y-7.782
+X6.588Y-7.065Z-3.911
+X7.5Y-8.1Z-6F500
+X7.315Y-7.117F1000
+X7.3Y-9.2
+X7.89Y-8.392
+X7.932Y-7.393
+X4.9Y-10.4
+X5.899Y-10.421
+X6.874Y-10.198
+X7.717Y-9.66
+X8.29Y-8.841
+X8.554Y-7.876
+X8.101Y-6.985Z-5.103
+G0Z10
+X4Y7
+G1Z-6F500
+X4.681Y7.732F1000
+X5.075Y8.651
+X5.186Y9.644
+X5.052Y10.635
+X4.681Y11.564
+X4.096Y12.375
+X3.272Y12.941Z-3.496
+X5.2Y10.9Z-6F500
+X5.078Y11.892F1000
+X4.544Y12.737
+X5.5Y11.7
+X5.258Y12.67
+X4.288Y12.914Z-5.137
+X5.2Y12.9Z-6F500
+X5.1Y7.8F1000
+X5.649Y8.635
+X6.12Y10.579
+X6.162Y11.578
+X6.008Y12.566
+X6Y8.5
+X6.542Y9.339
+X6.818Y10.301
+X6.9Y11.297
+X6.787Y12.291
+X6.004Y12.913Z-5.173
+X7Y11.899Z-6F500
+X6.777Y12.874F1000
+X6.7Y8.8
+X7.25Y9.634
+X7.582Y10.578
+X7.674Y11.573
+X7.571Y12.568
+X6.645Y12.945Z-3.25
+X7.6Y12.9Z-6F500
+X7.5Y9.8F1000
+X8.088Y10.608
+X8.275Y11.59
+X8.267Y12.59
+X8.2Y10.5
+X8.725Y11.35
+X8.837Y12.344
+X8.013Y12.911Z-5.323
+X9Y11.899Z-6
+X8.824Y12.884
+X8.8Y10.799
+X9.369Y11.621
+X9.435Y12.619
+X8.484Y12.926Z-4.423
+X9.4Y12.9Z-6F500
+X9.3Y10.799F1000
+X9.867Y11.623
+X9.978Y12.617
+X7.9Y9.6
+X8.871Y9.836
+X9.706Y10.386
+X10.307Y11.185
+X10.557Y12.154
+X9.928Y12.931Z-4.123
+X10.899Y11.899Z-6F500
+X10.667Y12.872F1000
+X10.6Y10.799
+X11.231Y11.575
+X11.276Y12.574
+X11Y11
+X11.693Y11.72
+X11.625Y12.718
+X10.65Y12.942Z-3.446
+X11.6Y12.9Z-6F500
+X9.5Y9.8F1000
+X10.48Y9.995
+X11.362Y10.467
+X12.033Y11.208
+X12.276Y12.178
+X12.2Y11.1
+X12.669Y11.982
+X12.285Y12.905Z-5.641
+X12.2Y10.9Z-6
+X12.952Y11.558
+X12.97Y12.558
+X11.899Y10.5
+X12.858Y10.786
+X13.416Y11.615
+X13.371Y12.614
+X10.299Y9.6
+X11.299Y9.64
+X12.281Y9.827
+X13.143Y10.333
+X13.784Y11.101
+X13.988Y12.08
+X13.481Y12.942Z-3.45
+X14Y11Z-6F500
+X14.404Y11.914F1000
+X14.183Y12.89
+X14.099Y10.799
+X14.753Y11.557
+X14.826Y12.554
+X11.8Y9.5
+X12.799Y9.503
+X13.755Y9.797
+X14.585Y10.355
+X15.178Y11.161
+X15.417Y12.131
+X14.819Y12.933Z-4.016
+X7.999Y9Z-6
+X8.986Y8.834
+X9.979Y8.718
+X10.977Y8.65
+X11.977Y8.632
+X12.968Y8.76
+X13.916Y9.08
+X14.757Y9.62
+X15.443Y10.348
+X15.887Y11.244
+X15.905Y12.244
+X15.177Y12.929Z-4.225
+X16.099Y11.899Z-6F500
+X15.903Y12.88F1000
+X15.899Y10.799
+X16.491Y11.606
+X16.536Y12.605
+X13.499Y8.599
+X14.481Y8.789
+X15.342Y9.299
+X16.118Y9.929
+X16.757Y10.698
+X17.099Y11.638
+X17.006Y12.634
+X16.051Y12.929Z-4.216
+X16.999Y12.9Z-6F500
+X14.9Y8.8F1000
+X15.871Y9.035
+X16.679Y9.625
+X17.319Y10.393
+X17.663Y11.332
+X17.769Y12.326
+X17.7Y10.299
+X18.232Y11.146
+X18.302Y12.144
+X17.684Y12.93Z-4.172
+X18.6Y11.899Z-6F500
+X18.364Y12.871F1000
+X18.299Y10.799
+X18.934Y11.572
+X18.984Y12.571
+X16.899Y9.5
+X17.874Y9.725
+X18.688Y10.306
+X19.336Y11.067
+X19.596Y12.033
+X19.185Y12.944Z-3.3
+X16.099Y8.9Z-6
+X17.098Y8.844
+X18.057Y9.128
+X18.918Y9.637
+X19.629Y10.34
+X20.062Y11.241
+X20.069Y12.241
+X19.332Y12.917Z-4.936
+X20.299Y11.899Z-6F500
+X20.056Y12.869F1000
+X17.999Y8.8
+X18.979Y9
+X19.779Y9.601
+X20.409Y10.377
+X20.786Y11.304
+X20.829Y12.303
+X20.052Y12.932Z-4.02
+X21Y11.899Z-6F500
+X20.866Y12.891F1000
+X20.8Y10.799
+X21.378Y11.616
+X21.454Y12.613
+X20.399Y9.6
+X21.191Y10.211
+X21.771Y11.025
+X22.09Y11.973
+X21.735Y12.908Z-5.497
+X19.7Y8.9Z-6
+X20.678Y9.105
+X21.503Y9.67
+X22.167Y10.418
+X22.585Y11.327
+X22.574Y12.327
+X22.499Y10.299
+X22.931Y11.202Z-4.138
+X22.934Y12.202Z-3.907
+X22.266Y12.945Z-3.248
+X22.2Y9.9Z-6F500
+X22.917Y10.596Z-4.961F1000
+X22.946Y12.596Z-3.218
+X21.9Y9.5Z-6F500
+X22.854Y9.797F1000
+X22.944Y10.793Z-3.326
+X22.838Y11.788Z-6F500
+X22.928Y12.784Z-4.289F1000
+X22.9Y9.699Z-6
+X19.8Y8.599
+X20.78Y8.402
+X21.769Y8.546
+X22.727Y8.834
+X22.828Y9.829
+X22.928Y10.824Z-4.28
+X22.833Y11.819Z-6F500
+X22.933Y12.814Z-3.974F1000
+X22.9Y8.8Z-6
+X21Y7.999
+X21.99Y7.864
+X22.944Y8.166Z-3.341
+X19.9Y8.099Z-6F500
+X20.723Y7.533F1000
+X21.69Y7.276
+X22.681Y7.41
+X20.599Y7.4
+X21.457Y6.884
+X22.455Y6.834
+X22.928Y7.715Z-4.3
+X20.9Y6.7Z-6F500
+X21.819Y6.307F1000
+X22.779Y6.587
+X20.7Y6.5
+X21.521Y5.929
+X22.521Y5.912
+X22.92Y6.829Z-4.785
+X20.9Y5.8Z-6
+X21.81Y5.386
+X22.776Y5.644
+X20.7Y5.6
+X21.508Y5.01
+X22.507Y4.97
+X22.927Y5.877Z-4.36
+X21.9Y4.8Z-6F500
+X22.894Y4.907F1000
+X19.8Y6.9
+X19.888Y5.903
+X20.435Y5.067
+X21.233Y4.463
+X22.212Y4.259
+X22.926Y4.959Z-4.439
+X21.9Y3.9Z-6F500
+X22.86Y4.178F1000
+X17.8Y8.099
+X18.143Y7.16
+X18.621Y6.282
+X19.141Y5.428
+X19.781Y4.66
+X20.493Y3.958
+X21.355Y3.45
+X22.354Y3.408
+X22.944Y4.215Z-3.344
+X21.9Y3.2Z-6F500
+X22.883Y3.378F1000
+X20.8Y3.3
+X21.646Y2.768
+X22.646Y2.747
+X18.6Y5.7
+X18.91Y4.749
+X19.4Y3.877
+X20.012Y3.087
+X20.799Y2.469
+X21.73Y2.106
+X22.716Y2.273
+X22.939Y3.248Z-3.645
+X22.9Y2.2Z-6F500
+X20.8Y2.1F1000
+X21.695Y1.655
+X22.693Y1.588
+X21.599Y1.5
+X22.532Y1.138
+X22.939Y2.051Z-3.633
+X21.9Y1Z-6F500
+X22.899Y1.002F1000
+X19.8Y3
+X20.095Y2.044
+X20.655Y1.216
+X21.461Y0.624
+X22.433Y0.386
+X22.942Y1.247Z-3.443
+X21.9Y0.2Z-6F500
+X22.896Y0.286F1000
+X19.8Y2.2
+X20.021Y1.224
+X20.598Y0.408
+X21.417Y-0.165
+X22.393Y-0.382
+X22.927Y0.463Z-4.375
+X21.9Y-0.6Z-6F500
+X22.891Y-0.471F1000
+X18.8Y4.5
+X18.833Y3.5
+X18.915Y2.503
+X19.143Y1.53
+X19.556Y0.619
+X20.216Y-0.131
+X20.946Y-0.814
+X21.898Y-1.12
+X22.89Y-0.989
+X20.8Y-1
+X21.638Y-1.544
+X22.635Y-1.628
+X21.599Y-1.7
+X22.538Y-2.045
+X22.929Y-1.124Z-4.236
+X22.938Y-0.124Z-3.702
+X21.9Y-2.2Z-6F500
+X22.898Y-2.14F1000
+X20.8Y-1.2
+X21.104Y-2.152
+X21.969Y-2.653
+X22.947Y-2.444Z-3.158
+X19.9Y-0.5Z-6F500
+X20.072Y-1.484F1000
+X20.523Y-2.377
+X21.313Y-2.991
+X22.298Y-3.16
+X21.199Y-3.2
+X22.128Y-3.57
+X22.924Y-2.964Z-4.552
+X19.9Y-2Z-6
+X20.205Y-2.952
+X20.888Y-3.682
+X21.817Y-4.05
+X22.784Y-3.792
+X20.7Y-3.8
+X21.491Y-4.411
+X22.491Y-4.431
+X22.936Y-3.536Z-3.813
+X19.9Y-2.6Z-6F500
+X20.015Y-3.593F1000
+X20.585Y-4.414
+X21.452Y-4.913
+X22.451Y-4.896
+X22.907Y-4.006Z-5.533
+X21.9Y-5.1Z-6
+X22.891Y-4.966
+X20.8Y-5
+X21.664Y-5.501
+X22.661Y-5.585
+X22.938Y-4.625Z-3.712
+X22.9Y-5.7Z-6F500
+X22.2Y-6.4F1000
+X22.944Y-5.732Z-3.308
+X19.9Y-3.8Z-6F500
+X20.047Y-4.789F1000
+X20.561Y-5.646
+X21.158Y-6.449
+X22.099Y-6.785
+X22.93Y-6.229Z-4.141
+X19.9Y-5.3Z-6F500
+X20.203Y-6.252F1000
+X20.92Y-6.949
+X21.866Y-7.273
+X22.819Y-6.969
+X20.8Y-7
+X21.576Y-7.629
+X22.576Y-7.624
+X21.499Y-7.7
+X22.439Y-8.041
+X22.915Y-7.161Z-5.063
+X21.9Y-8.2Z-6F500
+X22.89Y-8.062F1000
+X19.8Y-6.1
+X20.11Y-7.05
+X20.642Y-7.897
+X21.397Y-8.553
+X22.381Y-8.727
+X21.299Y-8.8
+X22.237Y-9.148
+X22.917Y-8.415Z-4.921
+X19.9Y-7.5Z-6
+X20.212Y-8.449
+X20.901Y-9.175
+X21.793Y-9.625
+X22.743Y-9.313
+X20.7Y-9.4
+X21.484Y-10.019
+X22.484Y-10.001
+X22.939Y-9.11Z-3.637
+X21.9Y-10.199Z-6F500
+X22.891Y-10.072F1000
+X19.8Y-8.1
+X19.905Y-9.094
+X20.426Y-9.947
+X21.204Y-10.576
+X22.187Y-10.763
+X22.922Y-10.085Z-4.631
+X21.9Y-11.1Z-6F500
+X22.875Y-10.88F1000
+X20.8Y-10.9
+X21.606Y-11.49
+X22.605Y-11.534
+X22.937Y-10.59Z-3.774
+X22.9Y-11.6Z-6F500
+X21.8Y-11.7F1000
+X22.751Y-12.008
+X22.699Y-12.1
+X22.1Y-12.7
+X22.924Y-12.134Z-4.527
+X20.9Y-11.2Z-6F500
+X21.091Y-12.181F1000
+X21.684Y-12.986
+X22.68Y-12.891
+X20.599Y-11.899
+X20.903Y-12.852
+X21.9Y-12.936
+X22.896Y-13.02Z-4.782
+X19.8Y-10.1Z-6
+X19.74Y-11.098
+X19.876Y-12.088
+X20.337Y-12.975
+X19.299Y-11
+X19.259Y-11.999
+X19.604Y-12.937
+X19.6Y-9
+X19.034Y-9.824
+X18.685Y-10.761
+X18.624Y-11.76
+X18.807Y-12.743
+X19.761Y-13.045Z-3.291
+X18.7Y-10.1Z-6F500
+X18.191Y-10.96F1000
+X18.05Y-11.95
+X18.346Y-12.906
+X18.299Y-12.999
+X18.199Y-10.1
+X17.661Y-10.942
+X17.487Y-11.927
+X17.654Y-12.913
+X17.6Y-12.999
+X18.5Y-9.099
+X17.716Y-9.72
+X17.187Y-10.569
+X16.88Y-11.521
+X16.862Y-12.521
+X16.799Y-12.6
+X16.7Y-12.7
+X17.673Y-12.927
+X19.672Y-12.992
+X20.672Y-13.024Z-4.501
+X16.6Y-12.1Z-6
+X16.941Y-13.039Z-3.609
+X17.899Y-9.099Z-6F500
+X17.093Y-9.69F1000
+X16.492Y-10.49
+X16.104Y-11.412
+X16.049Y-12.41
+X16.818Y-13.049Z-3.024
+X15.799Y-12.1Z-6F500
+X16.147Y-13.037Z-3.731F1000
+X17.099Y-9.099Z-6
+X16.303Y-9.705
+X15.717Y-10.515
+X15.3Y-11.424
+X15.312Y-12.424
+X15.299Y-10.5
+X14.84Y-11.388
+X14.805Y-12.387
+X15.555Y-13.049Z-3.057
+X14.5Y-12.1Z-6F500
+X14.818Y-13.047Z-3.121F1000
+X14.799Y-11.1Z-6F500
+X14.158Y-11.867F1000
+X14.199Y-12.866
+X14.099Y-12.9
+X14Y-12.999
+X13.9Y-12.1
+X18.8Y-8.2
+X17.8Y-8.155
+X16.861Y-8.497
+X15.981Y-8.973
+X15.181Y-9.572
+X14.443Y-10.248
+X13.74Y-10.958
+X13.362Y-11.884
+X13.416Y-12.883
+X13.4Y-10.9
+X12.898Y-11.765
+X12.865Y-12.764
+X13.826Y-13.04Z-3.565
+X12.8Y-11.1Z-6F500
+X12.34Y-11.988F1000
+X12.548Y-12.966
+X12.499Y-11
+X11.952Y-11.837
+X11.962Y-12.836
+X12.945Y-13.022Z-4.669
+X11.899Y-11.1Z-6F500
+X11.44Y-11.988F1000
+X11.6Y-12.975
+Y-11
+X11.029Y-11.82
+X11.01Y-12.82
+X11.987Y-13.034Z-3.953
+X13.9Y-10.1Z-6F500
+X12.9Y-10.069F1000
+X11.902Y-10.136
+X11.012Y-9.681
+X10.402Y-8.889
+X9.342Y-7.193
+X8.368Y-6.967Z-4.07
+X9.3Y-7Z-6F500
+X10.199Y-8.1F1000
+X10.014Y-7.117
+X9.189Y-6.553Z-2.849
+X11.1Y-8.6Z-6F500
+X10.998Y-7.605F1000
+X10.482Y-6.749
+X9.677Y-6.155
+X11.6Y-8.2
+X11.425Y-7.215
+X10.929Y-6.346
+X10.11Y-5.773
+X12.1Y-7.8
+X11.944Y-6.812
+X11.382Y-5.985
+X10.573Y-5.396
+X9.695Y-5.875Z-4.353
+X11.6Y-5.9Z-6F500
+X10.994Y-5.104F1000
+X9.994Y-5.117
+X11.899Y-6.2
+X11.696Y-5.22
+X10.86Y-4.672
+X9.939Y-5.062Z-4.657
+X11.899Y-5.1Z-6F500
+X11.234Y-4.353F1000
+X10.235Y-4.393
+X12.2Y-5.4
+X11.965Y-4.427
+X11.112Y-3.906
+X10.116Y-3.995
+X13.099Y-7.999
+X13.181Y-7.003
+X13.115Y-6.005
+X12.952Y-5.018
+X12.465Y-4.145
+X11.682Y-3.523
+X10.698Y-3.345
+X9.968Y-4.029Z-4.134
+X10.899Y-3.1Z-6F500
+X9.966Y-3.457Z-3.962F1000
+X11.899Y-3.5Z-6F500
+X11.189Y-2.796F1000
+X10.189Y-2.801
+X13.099Y-4.9
+X12.944Y-3.912
+X12.423Y-3.058
+X11.644Y-2.431
+X10.672Y-2.196
+X9.971Y-2.909Z-4.294
+X10.899Y-2Z-6F500
+X9.96Y-2.341Z-3.613F1000
+X11.899Y-2.4Z-6F500
+X11.2Y-1.685F1000
+X10.2Y-1.675
+X13.2Y-3.7
+X12.899Y-2.746
+X12.375Y-1.894
+X11.595Y-1.268
+X10.623Y-1.036
+X9.959Y-1.784Z-3.585
+X10.899Y-0.8Z-6F500
+X9.96Y-1.143Z-3.653F1000
+X11.899Y-1.2Z-6F500
+X11.206Y-0.479F1000
+X10.206Y-0.46
+X13.2Y-2.5
+X12.898Y-1.546
+X12.375Y-0.694
+X11.595Y-0.068
+X10.622Y0.163
+X9.959Y-0.585Z-3.553
+X10.899Y0.4Z-6F500
+X9.96Y0.056Z-3.653F1000
+X11.899Y0Z-6F500
+X11.206Y0.72F1000
+X10.206Y0.739
+X13.2Y-1.3
+X12.898Y-0.346
+X12.375Y0.505
+X11.595Y1.131
+X10.622Y1.363
+X9.959Y0.614Z-3.553
+X10.899Y1.6Z-6F500
+X9.96Y1.256Z-3.653F1000
+X11.899Y1.2Z-6F500
+X11.206Y1.92F1000
+X10.206Y1.939
+X13.2Y-0.1
+X12.898Y0.853
+X12.375Y1.705
+X11.595Y2.331
+X10.622Y2.563
+X9.959Y1.814Z-3.553
+X10.899Y2.8Z-6F500
+X9.96Y2.456Z-3.653F1000
+X11.899Y2.4Z-6F500
+X11.206Y3.12F1000
+X10.206Y3.139
+X13.2Y1.1
+X12.898Y2.053
+X12.375Y2.905
+X11.595Y3.531
+X10.622Y3.763
+X9.959Y3.014Z-3.553
+X10.899Y4Z-6F500
+X9.96Y3.656Z-3.653F1000
+X11.899Y3.6Z-6F500
+X11.206Y4.32F1000
+X10.206Y4.339
+X13.2Y2.3
+X12.898Y3.253
+X12.375Y4.105
+X11.626Y4.768
+X11.762Y5.759
+X12.495Y6.439
+X13.32Y7.004
+X14.24Y7.397
+X15.236Y7.31
+X16.1Y6.806
+X16.779Y6.072
+X17.217Y5.173
+X17.518Y4.22
+X18.026Y2.285
+X18.628Y0.378
+X18.786Y-0.609
+X18.907Y-2.605
+X18.918Y-3.605
+X18.88Y-4.604
+X18.508Y-5.532
+X17.882Y-6.312
+X17.116Y-6.956
+X16.133Y-6.771
+X15.385Y-6.108
+X14.861Y-5.256
+X14.56Y-4.303
+X14.354Y-3.324
+X14.173Y-0.33
+X14.162Y0.669
+X14.101Y1.667
+X15.1Y1.728
+X15.16Y0.729
+X16.099Y0.7
+X16.367Y-0.263
+X16.3Y-1.3
+X16.523Y-2.274
+X16.5Y2.7
+X15.801Y3.416
+X15.799Y4.4
+X10.7Y5.3
+X9.956Y4.631Z-3.396
+G0Z10
+X9.9Y7.6
+G1Z-6F500
+X9.588Y6.649F1000
+X9.761Y5.664Z-3.697
+G0Z10
+X8.7Y7.6
+G1Z-6F500
+X8.951Y6.632Z-4.024F1000
+X7.9Y7.6Z-6F500
+X6.8Y7.5F1000
+X7.645Y6.966Z-4.001
+X7Y7Z-6F500
+X6F1000
+X-5Y12
+X-6.891Y11.35
+X-7.8Y10.933
+X-8.611Y10.348
+X-9.327Y9.65
+X-9.971Y8.885
+X-10.687Y8.187
+X-12.049Y6.722
+X-12.654Y5.926
+X-13.179Y5.075
+X-13.662Y4.199
+X-14.101Y3.301
+X-14.45Y2.363
+X-14.657Y1.385
+X-14.67Y0.385
+X-14.304Y-1.58
+X-14.17Y-2.571
+X-14.085Y-3.567
+X-14.097Y-4.567
+X-13.914Y-5.55
+X-13.684Y-6.523
+X-13.313Y-7.452
+X-12.768Y-8.291
+X-12.106Y-9.04
+X-11.341Y-9.684
+X-10.442Y-10.123
+X-9.505Y-10.472
+X-8.527Y-10.679
+X-6.552Y-10.998
+X-5.554Y-11.059
+X-4.554Y-11.072
+X-3.555Y-11.035
+X0.444Y-11.086
+X1.442Y-11.148
+X2.442Y-11.16
+X4.438Y-11.283
+X5.437Y-11.247
+X6.421Y-11.064
+X7.381Y-10.786
+X8.318Y-11.135
+X9.016Y-11.851
+X9.641Y-12.632
+X10.56Y-13.026Z-4.403
+X8.5Y-12.1Z-6F500
+X9.071Y-12.92F1000
+X9Y-12.999
+X7.9Y-12.1
+X8.287Y-13.021Z-4.686
+X7.2Y-12.1Z-6F500
+X7.539Y-13.04Z-3.565F1000
+X6.5Y-12.1Z-6F500
+X6.833Y-13.042Z-3.426F1000
+X5.8Y-12.1Z-6F500
+X6.133Y-13.042Z-3.426F1000
+X5.1Y-12.1Z-6F500
+X5.428Y-13.044Z-3.321F1000
+X4.4Y-12.1Z-6F500
+X4.754Y-13.035Z-3.885F1000
+X3.7Y-12.1Z-6F500
+X4.013Y-13.049Z-3.029F1000
+X3Y-12.1Z-6F500
+X3.342Y-13.039Z-3.635F1000
+X2.3Y-12.1Z-6F500
+X2.62Y-13.047Z-3.168F1000
+X1.6Y-12.1Z-6F500
+X1.912Y-13.049Z-3F1000
+X0.9Y-12.1Z-6F500
+X1.212Y-13.049Z-3F1000
+X0.2Y-12.1Z-6F500
+X0.512Y-13.049Z-3F1000
+X-0.5Y-12.1Z-6F500
+X-0.147Y-13.035Z-3.842F1000
+X-1.2Y-12.1Z-6F500
+X-0.872Y-13.044Z-3.303F1000
+X-1.9Y-12.1Z-6F500
+X-1.541Y-13.033Z-3.978F1000
+X-2.6Y-12.1Z-6F500
+X-2.277Y-13.046Z-3.206F1000
+X-3.3Y-12.1Z-6F500
+X-2.983Y-13.048Z-3.092F1000
+X-4Y-12.1Z-6F500
+X-3.687Y-13.049Z-3F1000
+X-4.7Y-12.1Z-6F500
+X-4.363Y-13.041Z-3.49F1000
+X-5.4Y-12.1Z-6F500
+X-5.073Y-13.045Z-3.292F1000
+X-6.1Y-12.1Z-6F500
+X-5.751Y-13.037Z-3.755F1000
+X-6.8Y-12.1Z-6F500
+X-6.457Y-13.039Z-3.632F1000
+X-7.5Y-12.1Z-6F500
+X-7.147Y-13.035Z-3.843F1000
+X-8.2Y-12.1Z-6F500
+X-7.876Y-13.046Z-3.22F1000
+X-10.9Y-10.1Z-6F500
+X-10.64Y-11.065F1000
+X-10.07Y-11.887
+X-9.46Y-12.68
+X-8.53Y-13.046Z-3.193
+X-11.6Y-10.1Z-6F500
+X-11.393Y-11.078F1000
+X-10.955Y-11.977
+X-10.351Y-12.773
+X-9.378Y-13.005Z-5.648
+X-11.4Y-12.1Z-6
+X-10.878Y-12.953
+X-11.899Y-11
+X-11.992Y-11.995
+X-11.65Y-12.935
+X-11.7Y-12.999
+X-12.8Y-9.099
+X-13.033Y-10.072
+X-12.974Y-11.07
+X-12.817Y-12.058
+X-12.471Y-12.996
+X-11.472Y-13.035Z-3.867
+X-13.499Y-9.099Z-6
+X-13.709Y-10.077
+X-13.724Y-11.077
+X-13.592Y-12.068
+X-13.223Y-12.998
+X-12.223Y-13.013Z-5.202
+X-10.224Y-13.043Z-3.413
+X-14Y-12Z-6F500
+X-13.807Y-12.981F1000
+X-13.9Y-12.999
+X-14Y-11.1
+X-14.465Y-11.985
+X-14.409Y-12.983
+X-13.41Y-13.025Z-4.453
+X-14.5Y-11.1Z-6F500
+X-14.956Y-11.989F1000
+X-14.889Y-12.987
+X-14.9Y-11
+X-15.395Y-11.868
+X-15.423Y-12.868
+X-14.438Y-13.042Z-3.47
+X-15.5Y-11.1Z-6F500
+X-15.95Y-11.993F1000
+X-15.828Y-12.985
+X-15.899Y-11
+X-16.398Y-11.867
+X-16.379Y-12.866
+X-15.395Y-13.043Z-3.37
+X-16.4Y-11.1Z-6F500
+X-16.888Y-11.972F1000
+X-16.761Y-12.964
+X-15.763Y-13.033Z-4.016
+X-14.771Y-12.905Z-6F500
+X-13.78Y-12.778F1000
+X-12.814Y-13.04Z-3.563
+X-14.9Y-10.1Z-6F500
+X-15.893Y-10.212F1000
+X-16.744Y-10.738
+X-17.287Y-11.577
+X-17.42Y-12.568
+X-16.531Y-13.027Z-4.338
+X-17.6Y-12.1Z-6F500
+X-17.262Y-13.041Z-3.524F1000
+X-17.3Y-11.1Z-6F500
+X-17.935Y-11.871F1000
+X-17.888Y-12.87
+X-15.899Y-9.9
+X-16.875Y-10.121
+X-17.718Y-10.658
+X-18.332Y-11.448
+X-18.5Y-12.434
+X-17.71Y-13.047Z-3.159
+X-18.8Y-12.1Z-6F500
+X-18.469Y-13.043Z-3.365F1000
+X-18.5Y-11.1Z-6F500
+X-19.126Y-11.879F1000
+X-19.116Y-12.879
+X-19.199Y-12.9
+X-19.299Y-12.999
+X-19.399Y-12.1
+X-19.074Y-13.045Z-3.258
+X-19.099Y-11.1Z-6F500
+X-19.78Y-11.833F1000
+X-19.889Y-12.826
+X-19.9Y-11.899
+X-20.188Y-12.857
+X-19.725Y-13.047Z-3.127
+X-19.8Y-11.1Z-6F500
+X-20.448Y-11.86F1000
+X-20.614Y-12.847
+X-20.7Y-12.9
+X-20.8Y-12.999
+X-20.9Y-12.1
+X-20.544Y-13.034Z-3.919
+X-17.6Y-10.1Z-6
+X-18.599Y-10.09
+X-19.582Y-10.276
+X-20.444Y-10.782
+X-21.192Y-11.447
+X-21.444Y-12.415
+X-21.499Y-12.5
+X-22Y-12.999
+X-21.1Y-11.1
+X-21.919Y-11.672
+X-22.458Y-12.515
+X-22.35Y-13.003Z-5.784
+X-22.399Y-12.1Z-6
+X-20.499Y-10.199
+X-21.47Y-10.44
+X-22.303Y-10.994
+X-22.86Y-11.824
+X-22.912Y-12.823
+X-23Y-12.9
+X-21.1Y-10
+X-22.078Y-10.207
+X-22.873Y-10.814
+X-23.007Y-11.805Z-5.562
+X-22.1Y-9.9Z-6
+X-23.018Y-10.295Z-4.882
+X-23Y-10Z-6F500
+X-22.932Y-11.998F1000
+X-23.045Y-12.992Z-3.277
+X-20.099Y-10Z-6F500
+X-20.967Y-9.502F1000
+X-21.942Y-9.279
+X-22.935Y-9.396
+X-20Y-9.4
+X-20.85Y-8.873
+X-21.827Y-8.663
+X-22.819Y-8.795
+X-17.899Y-9.8
+X-18.629Y-9.116
+X-19.478Y-8.588
+X-20.396Y-8.19
+X-21.373Y-7.979
+X-22.373Y-8.011
+X-23.02Y-8.774Z-4.78
+X-22.1Y-7.8Z-6F500
+X-23.039Y-8.141Z-3.607F1000
+X-18.099Y-9.2Z-6
+X-18.727Y-8.421
+X-19.525Y-7.818
+X-20.445Y-7.427
+X-21.413Y-7.175
+X-22.412Y-7.215
+X-23.015Y-8.013Z-5.07
+X-20.099Y-7.1Z-6
+X-20.996Y-6.657
+X-21.99Y-6.542
+X-22.879Y-6.999
+X-19.9Y-7
+X-20.602Y-6.288
+X-21.557Y-5.991
+X-22.539Y-6.18
+X-23.016Y-7.059Z-4.999
+G0Z10
+X-15Y-9
+G1Z-6F500
+X-15.953Y-8.697F1000
+X-16.872Y-8.303
+X-17.696Y-7.736
+X-19.16Y-6.374
+X-19.985Y-5.808
+X-20.922Y-5.459
+X-21.92Y-5.398
+X-22.829Y-5.814
+X-17.899Y-6.9
+X-18.49Y-6.092
+X-19.258Y-5.453
+X-20.137Y-4.975
+X-21.105Y-4.726
+X-22.101Y-4.817
+X-22.986Y-5.282
+X-18.999Y-5.3
+X-19.725Y-4.611
+X-20.64Y-4.207
+X-21.637Y-4.135
+X-22.612Y-4.356
+X-23.016Y-5.271Z-4.995
+X-23.039Y-6.27Z-3.616
+X-18.099Y-6.3Z-6
+X-18.308Y-5.322
+X-18.875Y-4.498
+X-19.687Y-3.913
+X-20.633Y-3.59
+X-21.629Y-3.506
+X-22.596Y-3.762
+X-23.011Y-4.672Z-5.318
+X-23Y-4Z-6F500
+X-21.1Y-3.1F1000
+X-22.097Y-3.025
+X-23.03Y-3.385Z-4.174
+X-20.099Y-3.4Z-6F500
+X-20.842Y-2.73F1000
+X-21.813Y-2.489
+X-22.801Y-2.638
+X-17.899Y-5.7
+X-16.943Y-5.409
+X-15.999Y-4.5
+X-16.951Y-4.193
+X-17.825Y-3.707
+X-18.674Y-3.179
+X-19.467Y-2.569
+X-20.364Y-2.127
+X-21.33Y-1.867
+X-22.33Y-1.851
+X-23.049Y-2.546Z-3.057
+X-22.1Y-1.6Z-6F500
+X-23.042Y-1.934Z-3.464F1000
+X-20.099Y-2Z-6F500
+X-20.879Y-1.374F1000
+X-21.839Y-1.094
+X-22.833Y-1.203
+X-17.899Y-3.3
+X-18.471Y-2.479
+X-19.158Y-1.752
+X-19.912Y-1.095
+X-20.803Y-0.641
+X-21.787Y-0.465
+X-22.773Y-0.632
+X-23.045Y-1.594Z-3.297
+X-20.099Y-0.6Z-6F500
+X-20.94Y-0.058F1000
+X-21.924Y0.12
+X-22.89Y-0.138
+X-23.02Y-1.13Z-4.762
+X-20.099Y-0.2Z-6
+X-20.868Y0.439
+X-21.837Y0.688
+X-22.819Y0.499
+X-23.02Y-0.479Z-4.752
+X-19.099Y-1.5Z-6
+X-19.228Y-0.508
+X-19.768Y0.333
+X-20.56Y0.943
+X-21.512Y1.251
+X-22.511Y1.22
+X-23.041Y0.372Z-3.504
+X-21.1Y1.3Z-6F500
+X-22.02Y1.691F1000
+X-22.964Y1.363
+X-18.999Y-0.7
+X-19.156Y0.287
+X-19.719Y1.113
+X-20.498Y1.741
+X-21.406Y2.16
+X-22.406Y2.15
+X-23.033Y1.371Z-3.997
+X-21.1Y2.3Z-6F500
+X-22.041Y2.637F1000
+X-22.965Y2.255
+X-18.999Y0.2
+X-19.214Y1.176
+X-19.746Y2.023
+X-20.5Y2.68
+X-21.391Y3.133
+X-22.391Y3.113
+X-23.048Y2.358Z-3.109
+X-22.1Y3.3Z-6F500
+X-23.045Y2.973Z-3.278F1000
+X-20.099Y2.9Z-6F500
+X-20.868Y3.539F1000
+X-21.823Y3.836
+X-22.813Y3.696
+X-18.9Y0.6
+X-18.899Y1.6
+X-19.141Y2.57
+X-19.696Y3.401
+X-20.469Y4.036
+X-21.41Y4.374
+X-22.409Y4.423
+X-23.044Y3.651Z-3.328
+X-22.1Y4.6Z-6F500
+X-23.04Y4.259Z-3.587F1000
+X-20.099Y4.2Z-6F500
+X-20.872Y4.834F1000
+X-21.829Y5.125
+X-22.818Y4.979
+X-18.9Y2.9
+X-19.119Y3.875
+X-19.695Y4.692
+X-20.484Y5.307
+X-21.417Y5.667
+X-22.417Y5.691
+X-23.032Y4.902Z-4.065
+X-22.1Y5.9Z-6F500
+X-23.045Y5.575Z-3.253F1000
+X-20.099Y5.5Z-6F500
+X-20.882Y6.122F1000
+X-21.843Y6.398
+X-22.837Y6.285
+X-18.9Y4.2
+X-19.133Y5.172
+X-19.722Y5.98
+X-20.519Y6.584
+X-21.458Y6.929
+X-22.456Y6.988
+X-23.019Y6.161Z-4.817
+X-21.1Y7.1Z-6
+X-22.033Y7.458
+X-22.965Y7.098
+G0Z10
+X-15Y2
+G1Z-6F500
+X-15.981Y2.193F1000
+X-16.578Y2.995
+X-15.776Y3.592
+X-14.581Y1.988
+X-15.383Y1.391
+X-16.4Y1.3
+X-16.629Y0.326
+X-17.7Y4.3
+X-18.135Y5.2
+X-18.738Y5.998
+X-19.416Y6.732
+X-20.163Y7.397
+X-21.049Y7.861
+X-22.04Y7.999
+X-22.994Y7.7
+X-20
+X-20.787Y8.316
+X-21.762Y8.536
+X-22.755Y8.415
+X-23.023Y7.452Z-4.584
+X-18.099Y5.4Z-6
+X-18.373Y6.361
+X-18.785Y7.272
+X-19.367Y8.086
+X-20.16Y8.695
+X-21.077Y9.094
+X-22.071Y9.209
+X-22.982Y8.797
+X-17.999Y5.7
+X-17.958Y6.699
+X-18.302Y7.638
+X-18.863Y8.465
+X-19.609Y9.131
+X-20.494Y9.596
+X-21.466Y9.832
+X-22.461Y9.727
+X-23.01Y8.891Z-5.361
+X-20.099Y9.8Z-6
+X-20.975Y10.282
+X-21.969Y10.393
+X-22.879Y9.978
+X-23.038Y8.99Z-3.681
+X-18.099Y7.9Z-6
+X-18.46Y8.832
+X-18.996Y9.676
+X-19.722Y10.365
+X-20.615Y10.814
+X-21.601Y10.983
+X-22.586Y10.811
+X-23.034Y9.918Z-3.906
+X-20.099Y10.9Z-6F500
+X-20.964Y11.401F1000
+X-21.956Y11.534
+X-22.892Y11.183
+X-19.9Y11.1
+X-20.615Y11.798
+X-21.575Y12.077
+X-22.569Y11.968
+X-23.03Y11.08Z-4.162
+X-18.099Y9Z-6
+X-18.431Y9.943
+X-18.854Y10.849
+X-19.404Y11.684
+X-20.204Y12.284
+X-21.144Y12.626
+X-22.142Y12.681
+X-23.003Y12.172Z-5.786
+X-18.099Y10.1Z-6
+X-18.312Y11.077
+X-18.799Y11.95
+X-19.552Y12.608
+X-20.499Y12.929Z-4.251
+X-21.499Y12.911Z-5.313F500
+X-22.498Y12.942Z-3.43F1000
+X-19.5Y12.9Z-6F500
+X-17.6Y7.8F1000
+X-17.395Y8.778
+X-17.336Y9.777
+X-17.472Y10.767
+X-17.8Y11.712
+X-18.262Y12.599
+X-19.201Y12.945Z-3.278
+X-20.2Y12.906Z-5.623F500
+X-21.199Y12.867Z-6F1000
+X-22.198Y12.828
+X-23.035Y12.28Z-3.853
+X-16.999Y10Z-6
+X-16.972Y10.999
+X-17.189Y11.975
+X-17.721Y12.822
+X-16.799Y11.8
+X-17.042Y12.77
+X-18.031Y12.917Z-4.937
+X-17.099Y12.9Z-6F500
+X-17.2Y8.8F1000
+X-16.581Y9.585
+X-16.263Y10.533
+X-16.136Y11.525
+X-16.254Y12.518
+X-16.3Y9.5
+X-15.731Y10.322
+X-15.52Y11.3
+X-15.602Y12.296
+X-16.365Y12.943Z-3.401
+X-15.4Y11.899Z-6F500
+X-15.58Y12.883F1000
+X-15.6Y9.8
+X-15.05Y10.635
+X-14.814Y11.607
+X-14.871Y12.605
+X-14.9Y10.6
+X-14.373Y11.449
+X-14.309Y12.447
+X-15.183Y12.932Z-4.054
+X-14.2Y10.9Z-6F500
+X-13.8Y11.816F1000
+X-14.074Y12.778
+X-14.099Y10.7
+X-13.466Y11.473
+X-13.419Y12.472
+X-14.301Y12.942Z-3.426
+X-13.4Y12.9Z-6F500
+X-13.499Y10.799F1000
+X-12.722Y10.171
+X-13.351Y9.393
+X-14.4Y9.3
+X-14.069Y8.356
+X-15.013Y8.025
+G0Z10
+X-15.099Y7
+G1Z-6F500
+X-11.2Y9.9F1000
+X-11.688Y10.772
+X-11.997Y11.723
+X-12.397Y12.639
+X-11.4Y11.6
+X-11.661Y12.565
+X-12.592Y12.93Z-4.17
+X-11.6Y12.9Z-6F500
+X-10.7Y11.8F1000
+X-10.847Y12.789
+X-9.9Y11.7
+X-10.082Y12.683
+X-11.048Y12.939Z-3.659
+X-10.1Y12.9Z-6F500
+X-8.2Y11.8F1000
+X-8.655Y12.69
+X-7.7Y12.6
+X-8.645Y12.925Z-4.476
+X-7.7Y12.9Z-6F500
+X-5.9Y12.7F1000
+X-6.875Y12.918Z-4.902
+X-5.9Y12.9Z-6F500
+X-5Y12.8F1000
+G0Z10
+ 
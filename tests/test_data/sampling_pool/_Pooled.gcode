@@ -0,0 +1,2098 @@
+(Created with grbl post processor 2026/10/18 08:24)
+G21
+(G-code Generated with Fabex and NC library)
+G17G90
+(Tool: D = 3.0 mm  type END flutes 2)
+S12000M03
+G00 Z2.0
+
+G0X0Y0Z2
+X-99Y99
+G1Z0F500
+Y-99.999F1000
+X-98
+Y99
+X-97
+Y-99.999
+X-96
+Y99
+X-95
+Y-99.999
+X-94
+Y99
+X-93
+Y-99.999
+X-92
+Y99
+X-91
+Y-99.999
+X-90
+Y99
+X-89
+Y-99.999
+X-88
+Y99
+X-87
+Y-99.999
+X-86
+Y99
+X-85
+Y-99.999
+X-84
+Y99
+X-83
+Y-99.999
+X-82
+Y99
+X-81
+Y-99.999
+X-80
+Y99
+X-79
+Y-99.999
+X-78
+Y99
+X-77
+Y-99.999
+X-76
+Y99
+X-75
+Y-99.999
+X-74
+Y99
+X-73
+Y-99.999
+X-72
+Y99
+X-71
+Y-99.999
+X-70
+Y99
+X-69
+Y-99.999
+X-68
+Y-8.999
+Y-8.565Z-3F500
+Y8.566F1000
+Y9Z0
+Y99
+X-67
+Y15
+Y14.566Z-3F500
+Y-14.565F1000
+Y-14.999Z0
+Y-99.999
+X-66
+Y-18.999
+Y-18.565Z-3F500
+Y18.566F1000
+Y19Z0
+Y99
+X-65
+Y22
+Y21.566Z-3F500
+Y-21.565F1000
+Y-21.999Z0
+Y-99.999
+X-64
+Y-24.999
+Y-24.565Z-3F500
+Y24.566F1000
+Y25Z0
+Y99
+X-63
+Y27
+Y26.566Z-3F500
+Y-26.565F1000
+Y-26.999Z0
+Y-99.999
+X-62
+Y-29.999
+Y-29.565Z-3F500
+Y29.566F1000
+Y30Z0
+Y99
+X-61
+Y32
+Y31.566Z-3F500
+Y-31.565F1000
+Y-31.999Z0
+Y-99.999
+X-60
+Y-33.999
+Y-33.565Z-3F500
+Y33.566F1000
+Y34Z0
+Y99
+X-59
+Y35
+Y34.566Z-3F500
+Y-34.565F1000
+Y-34.999Z0
+Y-99.999
+X-58
+Y-36.999
+Y-36.565Z-3F500
+Y36.566F1000
+Y37Z0
+Y99
+X-57
+Y38
+Y37.566Z-3F500
+Y-37.565F1000
+Y-37.999Z0
+Y-99.999
+X-56
+Y-39.999
+Y-39.565Z-3F500
+Y39.566F1000
+Y40Z0
+Y99
+X-55
+Y41
+Y40.566Z-3F500
+Y-40.565F1000
+Y-40.999Z0
+Y-99.999
+X-54
+Y-42.999
+Y-42.565Z-3F500
+Y42.566F1000
+Y43Z0
+Y99
+X-53
+Y44
+Y43.566Z-3F500
+Y-43.565F1000
+Y-43.999Z0
+Y-99.999
+X-52
+Y-44.999
+Y-44.565Z-3F500
+Y44.566F1000
+Y45Z0
+Y99
+X-51
+Y46
+Y45.566Z-3F500
+Y-45.565F1000
+Y-45.999Z0
+Y-99.999
+X-50
+Y-46.999
+Y-46.565Z-3F500
+Y46.566F1000
+Y47Z0
+Y99
+X-49
+Y48
+Y47.566Z-3F500
+Y-47.565F1000
+Y-47.999Z0
+Y-99.999
+X-48
+Y-48.999
+Y-48.565Z-3F500
+Y48.566F1000
+Y49Z0
+Y99
+X-47
+Y50
+Y49.566Z-3F500
+Y-49.565F1000
+Y-49.999Z0
+Y-99.999
+X-46
+Y-50.999
+Y-50.565Z-3F500
+Y50.566F1000
+Y51Z0
+Y99
+X-45
+Y52
+Y51.566Z-3F500
+Y-51.565F1000
+Y-51.999Z0
+Y-99.999
+X-44
+Y-52.999
+Y-52.565Z-3F500
+Y52.566F1000
+Y53Z0
+Y99
+X-43
+Y54
+Y53.566Z-3F500
+Y-53.565F1000
+Y-53.999Z0
+Y-99.999
+X-42
+Y-54.999
+Y-54.565Z-3F500
+Y54.566F1000
+Y55Z0
+Y99
+X-41
+Y55
+Y54.566Z-3F500
+Y-54.565F1000
+Y-54.999Z0
+Y-99.999
+X-40
+Y-55.999
+Y-55.565Z-3F500
+Y55.566F1000
+Y56Z0
+Y99
+X-39
+Y57
+Y56.566Z-3F500
+Y-56.565F1000
+Y-56.999Z0
+Y-99.999
+X-38
+Y-56.999
+Y-56.565Z-3F500
+Y56.566F1000
+Y57Z0
+Y99
+X-37
+Y58
+Y57.566Z-3F500
+Y-57.565F1000
+Y-57.999Z0
+Y-99.999
+X-36
+Y-58.999
+Y-58.565Z-3F500
+Y58.566F1000
+Y59Z0
+Y99
+X-35
+Y59
+Y58.566Z-3F500
+Y-58.565F1000
+Y-58.999Z0
+Y-99.999
+X-34
+Y-59.999
+Y-59.565Z-3F500
+Y59.566F1000
+Y60Z0
+Y99
+X-33
+Y61
+Y60.566Z-3F500
+Y-60.565F1000
+Y-60.999Z0
+Y-99.999
+X-32
+Y-60.999
+Y-60.565Z-3F500
+Y60.566F1000
+Y61Z0
+Y99
+X-31
+Y62
+Y61.566Z-3F500
+Y-61.565F1000
+Y-61.999Z0
+Y-99.999
+X-30
+Y-61.999
+Y-61.565Z-3F500
+Y61.566F1000
+Y62Z0
+Y99
+X-29
+Y63
+Y62.566Z-3F500
+Y-62.565F1000
+Y-62.999Z0
+Y-99.999
+X-28
+Y-62.999
+Y-62.565Z-3F500
+Y62.566F1000
+Y63Z0
+Y99
+X-27
+Y63
+Y62.566Z-3F500
+Y-62.565F1000
+Y-62.999Z0
+Y-99.999
+X-26
+Y-63.999
+Y-63.565Z-3F500
+Y63.566F1000
+Y64Z0
+Y99
+X-25
+Y64
+Y63.566Z-3F500
+Y-63.565F1000
+Y-63.999Z0
+Y-99.999
+X-24
+Y-64.999
+Y-64.565Z-3F500
+Y64.566F1000
+Y65Z0
+Y99
+X-23
+Y65
+Y64.566Z-3F500
+Y-64.565F1000
+Y-64.999Z0
+Y-99.999
+X-22
+Y-64.999
+Y-64.565Z-3F500
+Y64.566F1000
+Y65Z0
+Y99
+X-21
+Y66
+Y65.566Z-3F500
+Y-65.565F1000
+Y-65.999Z0
+Y-99.999
+X-20
+Y-65.999
+Y-65.565Z-3F500
+Y65.566F1000
+Y66Z0
+Y99
+X-19
+Y66
+Y65.566Z-3F500
+Y-65.565F1000
+Y-65.999Z0
+Y-99.999
+X-18
+Y-66.999
+Y-66.565Z-3F500
+Y66.566F1000
+Y67Z0
+Y99
+X-17
+Y67
+Y66.566Z-3F500
+Y-66.565F1000
+Y-66.999Z0
+Y-99.999
+X-16
+Y-66.999
+Y-66.565Z-3F500
+Y66.566F1000
+Y67Z0
+Y99
+X-15
+Y67
+Y66.566Z-3F500
+Y-66.565F1000
+Y-66.999Z0
+Y-99.999
+X-14
+Y-67.999
+Y-67.565Z-3F500
+Y67.566F1000
+Y68Z0
+Y99
+X-13
+Y68
+Y67.566Z-3F500
+Y-67.565F1000
+Y-67.999Z0
+Y-99.999
+X-12
+Y-67.999
+Y-67.565Z-3F500
+Y67.566F1000
+Y68Z0
+Y99
+X-11
+Y68
+Y67.566Z-3F500
+Y-67.565F1000
+Y-67.999Z0
+Y-99.999
+X-10
+Y-67.999
+Y-67.565Z-3F500
+Y67.566F1000
+Y68Z0
+Y99
+X-9
+Y68
+Y67.566Z-3F500
+Y-67.565F1000
+Y-67.999Z0
+Y-99.999
+X-8
+Y-68.999
+Y-68.565Z-3F500
+Y68.566F1000
+Y69Z0
+Y99
+X-7
+Y69
+Y68.566Z-3F500
+Y-68.565F1000
+Y-68.999Z0
+Y-99.999
+X-6
+Y-68.999
+Y-68.565Z-3F500
+Y68.566F1000
+Y69Z0
+Y99
+X-5
+Y69
+Y68.566Z-3F500
+Y-68.565F1000
+Y-68.999Z0
+Y-99.999
+X-4
+Y-68.999
+Y-68.565Z-3F500
+Y68.566F1000
+Y69Z0
+Y99
+X-3
+Y69
+Y68.566Z-3F500
+Y-68.565F1000
+Y-68.999Z0
+Y-99.999
+X-2
+Y-68.999
+Y-68.565Z-3F500
+Y68.566F1000
+Y69Z0
+Y99
+X-1
+Y69
+Y68.566Z-3F500
+Y-68.565F1000
+Y-68.999Z0
+Y-99.999
+X0
+Y-68.999
+Y-68.565Z-3F500
+Y68.566F1000
+Y69Z0
+Y99
+X1
+Y69
+Y68.566Z-3F500
+Y-68.565F1000
+Y-68.999Z0
+Y-99.999
+X2
+Y-68.999
+Y-68.565Z-3F500
+Y68.566F1000
+Y69Z0
+Y99
+X3
+Y69
+Y68.566Z-3F500
+Y-68.565F1000
+Y-68.999Z0
+Y-99.999
+X4
+Y-68.999
+Y-68.565Z-3F500
+Y68.566F1000
+Y69Z0
+Y99
+X5
+Y69
+Y68.566Z-3F500
+Y-68.565F1000
+Y-68.999Z0
+Y-99.999
+X6
+Y-68.999
+Y-68.565Z-3F500
+Y68.566F1000
+Y69Z0
+Y99
+X7
+Y69
+Y68.566Z-3F500
+Y-68.565F1000
+Y-68.999Z0
+Y-99.999
+X8
+Y-68.999
+Y-68.565Z-3F500
+Y68.566F1000
+Y69Z0
+Y99
+X9
+Y68
+Y67.566Z-3F500
+Y-67.565F1000
+Y-67.999Z0
+Y-99.999
+X10
+Y-67.999
+Y-67.565Z-3F500
+Y67.566F1000
+Y68Z0
+Y99
+X11
+Y68
+Y67.566Z-3F500
+Y-67.565F1000
+Y-67.999Z0
+Y-99.999
+X12
+Y-67.999
+Y-67.565Z-3F500
+Y67.566F1000
+Y68Z0
+Y99
+X13
+Y68
+Y67.566Z-3F500
+Y-67.565F1000
+Y-67.999Z0
+Y-99.999
+X14
+Y-67.999
+Y-67.565Z-3F500
+Y67.566F1000
+Y68Z0
+Y99
+X15
+Y67
+Y66.566Z-3F500
+Y-66.565F1000
+Y-66.999Z0
+Y-99.999
+X16
+Y-66.999
+Y-66.565Z-3F500
+Y66.566F1000
+Y67Z0
+Y99
+X17
+Y67
+Y66.566Z-3F500
+Y-66.565F1000
+Y-66.999Z0
+Y-99.999
+X18
+Y-66.999
+Y-66.565Z-3F500
+Y66.566F1000
+Y67Z0
+Y99
+X19
+Y66
+Y65.566Z-3F500
+Y-65.565F1000
+Y-65.999Z0
+Y-99.999
+X20
+Y-65.999
+Y-65.565Z-3F500
+Y65.566F1000
+Y66Z0
+Y99
+X21
+Y66
+Y65.566Z-3F500
+Y-65.565F1000
+Y-65.999Z0
+Y-99.999
+X22
+Y-64.999
+Y-64.565Z-3F500
+Y64.566F1000
+Y65Z0
+Y99
+X23
+Y65
+Y64.566Z-3F500
+Y-64.565F1000
+Y-64.999Z0
+Y-99.999
+X24
+Y-64.999
+Y-64.565Z-3F500
+Y64.566F1000
+Y65Z0
+Y99
+X25
+Y64
+Y63.566Z-3F500
+Y-63.565F1000
+Y-63.999Z0
+Y-99.999
+X26
+Y-63.999
+Y-63.565Z-3F500
+Y63.566F1000
+Y64Z0
+Y99
+X27
+Y63
+Y62.566Z-3F500
+Y-62.565F1000
+Y-62.999Z0
+Y-99.999
+X28
+Y-62.999
+Y-62.565Z-3F500
+Y62.566F1000
+Y63Z0
+Y99
+X29
+Y63
+Y62.566Z-3F500
+Y-62.565F1000
+Y-62.999Z0
+Y-99.999
+X30
+Y-61.999
+Y-61.565Z-3F500
+Y61.566F1000
+Y62Z0
+Y99
+X31
+Y62
+Y61.566Z-3F500
+Y-61.565F1000
+Y-61.999Z0
+Y-99.999
+X32
+Y-60.999
+Y-60.565Z-3F500
+Y60.566F1000
+Y61Z0
+Y99
+X33
+Y61
+Y60.566Z-3F500
+Y-60.565F1000
+Y-60.999Z0
+Y-99.999
+X34
+Y-59.999
+Y-59.565Z-3F500
+Y59.566F1000
+Y60Z0
+Y99
+X35
+Y59
+Y58.566Z-3F500
+Y-58.565F1000
+Y-58.999Z0
+Y-99.999
+X36
+Y-58.999
+Y-58.565Z-3F500
+Y58.566F1000
+Y59Z0
+Y99
+X37
+Y58
+Y57.566Z-3F500
+Y-57.565F1000
+Y-57.999Z0
+Y-99.999
+X38
+Y-56.999
+Y-56.565Z-3F500
+Y56.566F1000
+Y57Z0
+Y99
+X39
+Y57
+Y56.566Z-3F500
+Y-56.565F1000
+Y-56.999Z0
+Y-99.999
+X40
+Y-55.999
+Y-55.565Z-3F500
+Y55.566F1000
+Y56Z0
+Y99
+X41
+Y55
+Y54.566Z-3F500
+Y-54.565F1000
+Y-54.999Z0
+Y-99.999
+X42
+Y-54.999
+Y-54.565Z-3F500
+Y54.566F1000
+Y55Z0
+Y99
+X43
+Y54
+Y53.566Z-3F500
+Y-53.565F1000
+Y-53.999Z0
+Y-99.999
+X44
+Y-52.999
+Y-52.565Z-3F500
+Y52.566F1000
+Y53Z0
+Y99
+X45
+Y52
+Y51.566Z-3F500
+Y-51.565F1000
+Y-51.999Z0
+Y-99.999
+X46
+Y-50.999
+Y-50.565Z-3F500
+Y50.566F1000
+Y51Z0
+Y99
+X47
+Y50
+Y49.566Z-3F500
+Y-49.565F1000
+Y-49.999Z0
+Y-99.999
+X48
+Y-48.999
+Y-48.565Z-3F500
+Y48.566F1000
+Y49Z0
+Y99
+X49
+Y48
+Y47.566Z-3F500
+Y-47.565F1000
+Y-47.999Z0
+Y-99.999
+X50
+Y-46.999
+Y-46.565Z-3F500
+Y46.566F1000
+Y47Z0
+Y99
+X51
+Y46
+Y45.566Z-3F500
+Y-45.565F1000
+Y-45.999Z0
+Y-99.999
+X52
+Y-44.999
+Y-44.565Z-3F500
+Y44.566F1000
+Y45Z0
+Y99
+X53
+Y44
+Y43.566Z-3F500
+Y-43.565F1000
+Y-43.999Z0
+Y-99.999
+X54
+Y-42.999
+Y-42.565Z-3F500
+Y42.566F1000
+Y43Z0
+Y99
+X55
+Y41
+Y40.566Z-3F500
+Y-40.565F1000
+Y-40.999Z0
+Y-99.999
+X56
+Y-39.999
+Y-39.565Z-3F500
+Y39.566F1000
+Y40Z0
+Y99
+X57
+Y38
+Y37.566Z-3F500
+Y-37.565F1000
+Y-37.999Z0
+Y-99.999
+X58
+Y-36.999
+Y-36.565Z-3F500
+Y36.566F1000
+Y37Z0
+Y99
+X59
+Y35
+Y34.566Z-3F500
+Y-34.565F1000
+Y-34.999Z0
+Y-99.999
+X60
+Y-33.999
+Y-33.565Z-3F500
+Y33.566F1000
+Y34Z0
+Y99
+X61
+Y32
+Y31.566Z-3F500
+Y-31.565F1000
+Y-31.999Z0
+Y-99.999
+X62
+Y-29.999
+Y-29.565Z-3F500
+Y29.566F1000
+Y30Z0
+Y99
+X63
+Y27
+Y26.566Z-3F500
+Y-26.565F1000
+Y-26.999Z0
+Y-99.999
+X64
+Y-24.999
+Y-24.565Z-3F500
+Y24.566F1000
+Y25Z0
+Y99
+X65
+Y22
+Y21.566Z-3F500
+Y-21.565F1000
+Y-21.999Z0
+Y-99.999
+X66
+Y-18.999
+Y-18.565Z-3F500
+Y18.566F1000
+Y19Z0
+Y99
+X67
+Y15
+Y14.566Z-3F500
+Y-14.565F1000
+Y-14.999Z0
+Y-99.999
+X68
+Y-8.999
+Y-8.565Z-3F500
+Y8.566F1000
+Y9Z0
+Y99
+X69
+Y-99.999
+X70
+Y99
+X71
+Y-99.999
+X72
+Y99
+X73
+Y-99.999
+X74
+Y99
+X75
+Y-99.999
+X76
+Y99
+X77
+Y-99.999
+X78
+Y99
+X79
+Y-99.999
+X80
+Y99
+X81
+Y-99.999
+X82
+Y99
+X83
+Y-99.999
+X84
+Y99
+X85
+Y-99.999
+X86
+Y99
+X87
+Y-99.999
+X88
+Y99
+X89
+Y-99.999
+X90
+Y99
+X91
+Y-99.999
+X92
+Y99
+X93
+Y-99.999
+X94
+Y99
+X95
+Y-99.999
+X96
+Y99
+X97
+Y-99.999
+X98
+Y99
+X99
+Y-99.999
+G0Z2
+X-68Y-8.565
+G1Z-3F500
+Y-8.131Z-6
+Y8.132F1000
+Y8.566Z-3
+G0Z2
+X-67Y14.566
+G1Z-3F500
+Y14.132Z-6
+Y-14.131F1000
+Y-14.565Z-3
+G0Z2
+X-66Y-18.565
+G1Z-3F500
+Y-18.131Z-6
+Y18.132F1000
+Y18.566Z-3
+G0Z2
+X-65Y21.566
+G1Z-3F500
+Y21.132Z-6
+Y-21.131F1000
+Y-21.565Z-3
+G0Z2
+X-64Y-24.565
+G1Z-3F500
+Y-24.131Z-6
+Y24.132F1000
+Y24.566Z-3
+X-63Y26.566
+Y26.132Z-6F500
+Y-26.131F1000
+Y-26.565Z-3
+G0Z2
+X-62Y-29.565
+G1Z-3F500
+Y-29.131Z-6
+Y29.132F1000
+Y29.566Z-3
+X-61Y31.566
+Y31.132Z-6F500
+Y-31.131F1000
+Y-31.565Z-3
+X-60Y-33.565
+Y-33.131Z-6F500
+Y33.132F1000
+Y33.566Z-3
+X-59Y34.566
+Y34.132Z-6F500
+Y-34.131F1000
+Y-34.565Z-3
+X-58Y-36.565
+Y-36.131Z-6F500
+Y36.132F1000
+Y36.566Z-3
+X-57Y37.566
+Y37.132Z-6F500
+Y-37.131F1000
+Y-37.565Z-3
+X-56Y-39.565
+Y-39.131Z-6F500
+Y39.132F1000
+Y39.566Z-3
+X-55Y40.566
+Y40.132Z-6F500
+Y-40.131F1000
+Y-40.565Z-3
+X-54Y-42.565
+Y-42.131Z-6F500
+Y42.132F1000
+Y42.566Z-3
+X-53Y43.566
+Y43.132Z-6F500
+Y-43.131F1000
+Y-43.565Z-3
+X-52Y-44.565
+Y-44.131Z-6F500
+Y44.132F1000
+Y44.566Z-3
+X-51Y45.566
+Y45.132Z-6F500
+Y-45.131F1000
+Y-45.565Z-3
+X-50Y-46.565
+Y-46.131Z-6F500
+Y46.132F1000
+Y46.566Z-3
+X-49Y47.566
+Y47.132Z-6F500
+Y-47.131F1000
+Y-47.565Z-3
+X-48Y-48.565
+Y-48.131Z-6F500
+Y48.132F1000
+Y48.566Z-3
+X-47Y49.566
+Y49.132Z-6F500
+Y-49.131F1000
+Y-49.565Z-3
+X-46Y-50.565
+Y-50.131Z-6F500
+Y50.132F1000
+Y50.566Z-3
+X-45Y51.566
+Y51.132Z-6F500
+Y-51.131F1000
+Y-51.565Z-3
+X-44Y-52.565
+Y-52.131Z-6F500
+Y52.132F1000
+Y52.566Z-3
+X-43Y53.566
+Y53.132Z-6F500
+Y-53.131F1000
+Y-53.565Z-3
+X-42Y-54.565
+Y-54.131Z-6F500
+Y54.132F1000
+Y54.566Z-3
+X-41
+Y54.132Z-6F500
+Y-54.131F1000
+Y-54.565Z-3
+X-40Y-55.565
+Y-55.131Z-6F500
+Y55.132F1000
+Y55.566Z-3
+X-39Y56.566
+Y56.132Z-6F500
+Y-56.131F1000
+Y-56.565Z-3
+X-38
+Y-56.131Z-6F500
+Y56.132F1000
+Y56.566Z-3
+X-37Y57.566
+Y57.132Z-6F500
+Y-57.131F1000
+Y-57.565Z-3
+X-36Y-58.565
+Y-58.131Z-6F500
+Y58.132F1000
+Y58.566Z-3
+X-35
+Y58.132Z-6F500
+Y-58.131F1000
+Y-58.565Z-3
+X-34Y-59.565
+Y-59.131Z-6F500
+Y59.132F1000
+Y59.566Z-3
+X-33Y60.566
+Y60.132Z-6F500
+Y-60.131F1000
+Y-60.565Z-3
+X-32
+Y-60.131Z-6F500
+Y60.132F1000
+Y60.566Z-3
+X-31Y61.566
+Y61.132Z-6F500
+Y-61.131F1000
+Y-61.565Z-3
+X-30
+Y-61.131Z-6F500
+Y61.132F1000
+Y61.566Z-3
+X-29Y62.566
+Y62.132Z-6F500
+Y-62.131F1000
+Y-62.565Z-3
+X-28
+Y-62.131Z-6F500
+Y62.132F1000
+Y62.566Z-3
+X-27
+Y62.132Z-6F500
+Y-62.131F1000
+Y-62.565Z-3
+X-26Y-63.565
+Y-63.131Z-6F500
+Y63.132F1000
+Y63.566Z-3
+X-25
+Y63.132Z-6F500
+Y-63.131F1000
+Y-63.565Z-3
+X-24Y-64.565
+Y-64.131Z-6F500
+Y64.132F1000
+Y64.566Z-3
+X-23
+Y64.132Z-6F500
+Y-64.131F1000
+Y-64.565Z-3
+X-22
+Y-64.131Z-6F500
+Y64.132F1000
+Y64.566Z-3
+X-21Y65.566
+Y65.132Z-6F500
+Y-65.131F1000
+Y-65.565Z-3
+X-20
+Y-65.131Z-6F500
+Y65.132F1000
+Y65.566Z-3
+X-19
+Y65.132Z-6F500
+Y-65.131F1000
+Y-65.565Z-3
+X-18Y-66.565
+Y-66.131Z-6F500
+Y66.132F1000
+Y66.566Z-3
+X-17
+Y66.132Z-6F500
+Y-66.131F1000
+Y-66.565Z-3
+X-16
+Y-66.131Z-6F500
+Y66.132F1000
+Y66.566Z-3
+X-15
+Y66.132Z-6F500
+Y-66.131F1000
+Y-66.565Z-3
+X-14Y-67.565
+Y-67.131Z-6F500
+Y67.132F1000
+Y67.566Z-3
+X-13
+Y67.132Z-6F500
+Y-67.131F1000
+Y-67.565Z-3
+X-12
+Y-67.131Z-6F500
+Y67.132F1000
+Y67.566Z-3
+X-11
+Y67.132Z-6F500
+Y-67.131F1000
+Y-67.565Z-3
+X-10
+Y-67.131Z-6F500
+Y67.132F1000
+Y67.566Z-3
+X-9
+Y67.132Z-6F500
+Y-67.131F1000
+Y-67.565Z-3
+X-8Y-68.565
+Y-68.131Z-6F500
+Y68.132F1000
+Y68.566Z-3
+X-7
+Y68.132Z-6F500
+Y-68.131F1000
+Y-68.565Z-3
+X-6
+Y-68.131Z-6F500
+Y68.132F1000
+Y68.566Z-3
+X-5
+Y68.132Z-6F500
+Y-68.131F1000
+Y-68.565Z-3
+X-4
+Y-68.131Z-6F500
+Y68.132F1000
+Y68.566Z-3
+X-3
+Y68.132Z-6F500
+Y-68.131F1000
+Y-68.565Z-3
+X-2
+Y-68.131Z-6F500
+Y68.132F1000
+Y68.566Z-3
+X-1
+Y68.132Z-6F500
+Y-68.131F1000
+Y-68.565Z-3
+X0
+Y-68.131Z-6F500
+Y68.132F1000
+Y68.566Z-3
+X1
+Y68.132Z-6F500
+Y-68.131F1000
+Y-68.565Z-3
+X2
+Y-68.131Z-6F500
+Y68.132F1000
+Y68.566Z-3
+X3
+Y68.132Z-6F500
+Y-68.131F1000
+Y-68.565Z-3
+X4
+Y-68.131Z-6F500
+Y68.132F1000
+Y68.566Z-3
+X5
+Y68.132Z-6F500
+Y-68.131F1000
+Y-68.565Z-3
+X6
+Y-68.131Z-6F500
+Y68.132F1000
+Y68.566Z-3
+X7
+Y68.132Z-6F500
+Y-68.131F1000
+Y-68.565Z-3
+X8
+Y-68.131Z-6F500
+Y68.132F1000
+Y68.566Z-3
+X9Y67.566
+Y67.132Z-6F500
+Y-67.131F1000
+Y-67.565Z-3
+X10
+Y-67.131Z-6F500
+Y67.132F1000
+Y67.566Z-3
+X11
+Y67.132Z-6F500
+Y-67.131F1000
+Y-67.565Z-3
+X12
+Y-67.131Z-6F500
+Y67.132F1000
+Y67.566Z-3
+X13
+Y67.132Z-6F500
+Y-67.131F1000
+Y-67.565Z-3
+X14
+Y-67.131Z-6F500
+Y67.132F1000
+Y67.566Z-3
+X15Y66.566
+Y66.132Z-6F500
+Y-66.131F1000
+Y-66.565Z-3
+X16
+Y-66.131Z-6F500
+Y66.132F1000
+Y66.566Z-3
+X17
+Y66.132Z-6F500
+Y-66.131F1000
+Y-66.565Z-3
+X18
+Y-66.131Z-6F500
+Y66.132F1000
+Y66.566Z-3
+X19Y65.566
+Y65.132Z-6F500
+Y-65.131F1000
+Y-65.565Z-3
+X20
+Y-65.131Z-6F500
+Y65.132F1000
+Y65.566Z-3
+X21
+Y65.132Z-6F500
+Y-65.131F1000
+Y-65.565Z-3
+X22Y-64.565
+Y-64.131Z-6F500
+Y64.132F1000
+Y64.566Z-3
+X23
+Y64.132Z-6F500
+Y-64.131F1000
+Y-64.565Z-3
+X24
+Y-64.131Z-6F500
+Y64.132F1000
+Y64.566Z-3
+X25Y63.566
+Y63.132Z-6F500
+Y-63.131F1000
+Y-63.565Z-3
+X26
+Y-63.131Z-6F500
+Y63.132F1000
+Y63.566Z-3
+X27Y62.566
+Y62.132Z-6F500
+Y-62.131F1000
+Y-62.565Z-3
+X28
+Y-62.131Z-6F500
+Y62.132F1000
+Y62.566Z-3
+X29
+Y62.132Z-6F500
+Y-62.131F1000
+Y-62.565Z-3
+X30Y-61.565
+Y-61.131Z-6F500
+Y61.132F1000
+Y61.566Z-3
+X31
+Y61.132Z-6F500
+Y-61.131F1000
+Y-61.565Z-3
+X32Y-60.565
+Y-60.131Z-6F500
+Y60.132F1000
+Y60.566Z-3
+X33
+Y60.132Z-6F500
+Y-60.131F1000
+Y-60.565Z-3
+X34Y-59.565
+Y-59.131Z-6F500
+Y59.132F1000
+Y59.566Z-3
+X35Y58.566
+Y58.132Z-6F500
+Y-58.131F1000
+Y-58.565Z-3
+X36
+Y-58.131Z-6F500
+Y58.132F1000
+Y58.566Z-3
+X37Y57.566
+Y57.132Z-6F500
+Y-57.131F1000
+Y-57.565Z-3
+X38Y-56.565
+Y-56.131Z-6F500
+Y56.132F1000
+Y56.566Z-3
+X39
+Y56.132Z-6F500
+Y-56.131F1000
+Y-56.565Z-3
+X40Y-55.565
+Y-55.131Z-6F500
+Y55.132F1000
+Y55.566Z-3
+X41Y54.566
+Y54.132Z-6F500
+Y-54.131F1000
+Y-54.565Z-3
+X42
+Y-54.131Z-6F500
+Y54.132F1000
+Y54.566Z-3
+X43Y53.566
+Y53.132Z-6F500
+Y-53.131F1000
+Y-53.565Z-3
+X44Y-52.565
+Y-52.131Z-6F500
+Y52.132F1000
+Y52.566Z-3
+X45Y51.566
+Y51.132Z-6F500
+Y-51.131F1000
+Y-51.565Z-3
+X46Y-50.565
+Y-50.131Z-6F500
+Y50.132F1000
+Y50.566Z-3
+X47Y49.566
+Y49.132Z-6F500
+Y-49.131F1000
+Y-49.565Z-3
+X48Y-48.565
+Y-48.131Z-6F500
+Y48.132F1000
+Y48.566Z-3
+X49Y47.566
+Y47.132Z-6F500
+Y-47.131F1000
+Y-47.565Z-3
+X50Y-46.565
+Y-46.131Z-6F500
+Y46.132F1000
+Y46.566Z-3
+X51Y45.566
+Y45.132Z-6F500
+Y-45.131F1000
+Y-45.565Z-3
+X52Y-44.565
+Y-44.131Z-6F500
+Y44.132F1000
+Y44.566Z-3
+X53Y43.566
+Y43.132Z-6F500
+Y-43.131F1000
+Y-43.565Z-3
+X54Y-42.565
+Y-42.131Z-6F500
+Y42.132F1000
+Y42.566Z-3
+X55Y40.566
+Y40.132Z-6F500
+Y-40.131F1000
+Y-40.565Z-3
+X56Y-39.565
+Y-39.131Z-6F500
+Y39.132F1000
+Y39.566Z-3
+X57Y37.566
+Y37.132Z-6F500
+Y-37.131F1000
+Y-37.565Z-3
+X58Y-36.565
+Y-36.131Z-6F500
+Y36.132F1000
+Y36.566Z-3
+X59Y34.566
+Y34.132Z-6F500
+Y-34.131F1000
+Y-34.565Z-3
+X60Y-33.565
+Y-33.131Z-6F500
+Y33.132F1000
+Y33.566Z-3
+X61Y31.566
+Y31.132Z-6F500
+Y-31.131F1000
+Y-31.565Z-3
+X62Y-29.565
+Y-29.131Z-6F500
+Y29.132F1000
+Y29.566Z-3
+G0Z2
+X63Y26.566
+G1Z-3F500
+Y26.132Z-6
+Y-26.131F1000
+Y-26.565Z-3
+X64Y-24.565
+Y-24.131Z-6F500
+Y24.132F1000
+Y24.566Z-3
+G0Z2
+X65Y21.566
+G1Z-3F500
+Y21.132Z-6
+Y-21.131F1000
+Y-21.565Z-3
+G0Z2
+X66Y-18.565
+G1Z-3F500
+Y-18.131Z-6
+Y18.132F1000
+Y18.566Z-3
+G0Z2
+X67Y14.566
+G1Z-3F500
+Y14.132Z-6
+Y-14.131F1000
+Y-14.565Z-3
+G0Z2
+X68Y-8.565
+G1Z-3F500
+Y-8.131Z-6
+Y8.132F1000
+Y8.566Z-3
+G0Z2
+X-68Y8.132
+G1Z-6F500
+Y8Z-6.912
+Y-7.999F1000
+Y-8.131Z-6
+G0Z2
+X-67Y-14.131
+G1Z-6F500
+Y-13.999Z-6.912
+Y14F1000
+Y14.132Z-6
+G0Z2
+X-66Y18.132
+G1Z-6F500
+Y18Z-6.912
+Y-17.999F1000
+Y-18.131Z-6
+G0Z2
+X-65Y-21.131
+G1Z-6F500
+Y-20.999Z-6.912
+Y21F1000
+Y21.132Z-6
+G0Z2
+X-64Y24.132
+G1Z-6F500
+Y24Z-6.912
+Y-23.999F1000
+Y-24.131Z-6
+X-63Y-26.131
+Y-25.999Z-6.912F500
+Y26F1000
+Y26.132Z-6
+G0Z2
+X-62Y29.132
+G1Z-6F500
+Y29Z-6.912
+Y-28.999F1000
+Y-29.131Z-6
+X-61Y-31.131
+Y-30.999Z-6.912F500
+Y31F1000
+Y31.132Z-6
+X-60Y33.132
+Y33Z-6.912F500
+Y-32.999F1000
+Y-33.131Z-6
+X-59Y-34.131
+Y-33.999Z-6.912F500
+Y34F1000
+Y34.132Z-6
+X-58Y36.132
+Y36Z-6.912F500
+Y-35.999F1000
+Y-36.131Z-6
+X-57Y-37.131
+Y-36.999Z-6.912F500
+Y37F1000
+Y37.132Z-6
+X-56Y39.132
+Y39Z-6.912F500
+Y-38.999F1000
+Y-39.131Z-6
+X-55Y-40.131
+Y-39.999Z-6.912F500
+Y40F1000
+Y40.132Z-6
+X-54Y42.132
+Y42Z-6.912F500
+Y-41.999F1000
+Y-42.131Z-6
+X-53Y-43.131
+Y-42.999Z-6.912F500
+Y43F1000
+Y43.132Z-6
+X-52Y44.132
+Y44Z-6.912F500
+Y-43.999F1000
+Y-44.131Z-6
+X-51Y-45.131
+Y-44.999Z-6.912F500
+Y45F1000
+Y45.132Z-6
+X-50Y46.132
+Y46Z-6.912F500
+Y-45.999F1000
+Y-46.131Z-6
+X-49Y-47.131
+Y-46.999Z-6.912F500
+Y47F1000
+Y47.132Z-6
+X-48Y48.132
+Y48Z-6.912F500
+Y-47.999F1000
+Y-48.131Z-6
+X-47Y-49.131
+Y-48.999Z-6.912F500
+Y49F1000
+Y49.132Z-6
+X-46Y50.132
+Y50Z-6.912F500
+Y-49.999F1000
+Y-50.131Z-6
+X-45Y-51.131
+Y-50.999Z-6.912F500
+Y51F1000
+Y51.132Z-6
+X-44Y52.132
+Y52Z-6.912F500
+Y-51.999F1000
+Y-52.131Z-6
+X-43Y-53.131
+Y-52.999Z-6.912F500
+Y53F1000
+Y53.132Z-6
+X-42Y54.132
+Y54Z-6.912F500
+Y-53.999F1000
+Y-54.131Z-6
+X-41
+Y-53.999Z-6.912F500
+Y54F1000
+Y54.132Z-6
+X-40Y55.132
+Y55Z-6.912F500
+Y-54.999F1000
+Y-55.131Z-6
+X-39Y-56.131
+Y-55.999Z-6.912F500
+Y56F1000
+Y56.132Z-6
+X-38
+Y56Z-6.912F500
+Y-55.999F1000
+Y-56.131Z-6
+X-37Y-57.131
+Y-56.999Z-6.912F500
+Y57F1000
+Y57.132Z-6
+X-36Y58.132
+Y58Z-6.912F500
+Y-57.999F1000
+Y-58.131Z-6
+X-35
+Y-57.999Z-6.912F500
+Y58F1000
+Y58.132Z-6
+X-34Y59.132
+Y59Z-6.912F500
+Y-58.999F1000
+Y-59.131Z-6
+X-33Y-60.131
+Y-59.999Z-6.912F500
+Y60F1000
+Y60.132Z-6
+X-32
+Y60Z-6.912F500
+Y-59.999F1000
+Y-60.131Z-6
+X-31Y-61.131
+Y-60.999Z-6.912F500
+Y61F1000
+Y61.132Z-6
+X-30
+Y61Z-6.912F500
+Y-60.999F1000
+Y-61.131Z-6
+X-29Y-62.131
+Y-61.999Z-6.912F500
+Y62F1000
+Y62.132Z-6
+X-28
+Y62Z-6.912F500
+Y-61.999F1000
+Y-62.131Z-6
+X-27
+Y-61.999Z-6.912F500
+Y62F1000
+Y62.132Z-6
+X-26Y63.132
+Y63Z-6.912F500
+Y-62.999F1000
+Y-63.131Z-6
+X-25
+Y-62.999Z-6.912F500
+Y63F1000
+Y63.132Z-6
+X-24Y64.132
+Y64Z-6.912F500
+Y-63.999F1000
+Y-64.131Z-6
+X-23
+Y-63.999Z-6.912F500
+Y64F1000
+Y64.132Z-6
+X-22
+Y64Z-6.912F500
+Y-63.999F1000
+Y-64.131Z-6
+X-21Y-65.131
+Y-64.999Z-6.912F500
+Y65F1000
+Y65.132Z-6
+X-20
+Y65Z-6.912F500
+Y-64.999F1000
+Y-65.131Z-6
+X-19
+Y-64.999Z-6.912F500
+Y65F1000
+Y65.132Z-6
+X-18Y66.132
+Y66Z-6.912F500
+Y-65.999F1000
+Y-66.131Z-6
+X-17
+Y-65.999Z-6.912F500
+Y66F1000
+Y66.132Z-6
+X-16
+Y66Z-6.912F500
+Y-65.999F1000
+Y-66.131Z-6
+X-15
+Y-65.999Z-6.912F500
+Y66F1000
+Y66.132Z-6
+X-14Y67.132
+Y67Z-6.912F500
+Y-66.999F1000
+Y-67.131Z-6
+X-13
+Y-66.999Z-6.912F500
+Y67F1000
+Y67.132Z-6
+X-12
+Y67Z-6.912F500
+Y-66.999F1000
+Y-67.131Z-6
+X-11
+Y-66.999Z-6.912F500
+Y67F1000
+Y67.132Z-6
+X-10
+Y67Z-6.912F500
+Y-66.999F1000
+Y-67.131Z-6
+X-9
+Y-66.999Z-6.912F500
+Y67F1000
+Y67.132Z-6
+X-8Y68.132
+Y68Z-6.912F500
+Y-67.999F1000
+Y-68.131Z-6
+X-7
+Y-67.999Z-6.912F500
+Y68F1000
+Y68.132Z-6
+X-6
+Y68Z-6.912F500
+Y-67.999F1000
+Y-68.131Z-6
+X-5
+Y-67.999Z-6.912F500
+Y68F1000
+Y68.132Z-6
+X-4
+Y68Z-6.912F500
+Y-67.999F1000
+Y-68.131Z-6
+X-3
+Y-67.999Z-6.912F500
+Y68F1000
+Y68.132Z-6
+X-2
+Y68Z-6.912F500
+Y-67.999F1000
+Y-68.131Z-6
+X-1
+Y-67.999Z-6.912F500
+Y68F1000
+Y68.132Z-6
+X0
+Y68Z-6.912F500
+Y-67.999F1000
+Y-68.131Z-6
+X1
+Y-67.999Z-6.912F500
+Y68F1000
+Y68.132Z-6
+X2
+Y68Z-6.912F500
+Y-67.999F1000
+Y-68.131Z-6
+X3
+Y-67.999Z-6.912F500
+Y68F1000
+Y68.132Z-6
+X4
+Y68Z-6.912F500
+Y-67.999F1000
+Y-68.131Z-6
+X5
+Y-67.999Z-6.912F500
+Y68F1000
+Y68.132Z-6
+X6
+Y68Z-6.912F500
+Y-67.999F1000
+Y-68.131Z-6
+X7
+Y-67.999Z-6.912F500
+Y68F1000
+Y68.132Z-6
+X8
+Y68Z-6.912F500
+Y-67.999F1000
+Y-68.131Z-6
+X9Y-67.131
+Y-66.999Z-6.912F500
+Y67F1000
+Y67.132Z-6
+X10
+Y67Z-6.912F500
+Y-66.999F1000
+Y-67.131Z-6
+X11
+Y-66.999Z-6.912F500
+Y67F1000
+Y67.132Z-6
+X12
+Y67Z-6.912F500
+Y-66.999F1000
+Y-67.131Z-6
+X13
+Y-66.999Z-6.912F500
+Y67F1000
+Y67.132Z-6
+X14
+Y67Z-6.912F500
+Y-66.999F1000
+Y-67.131Z-6
+X15Y-66.131
+Y-65.999Z-6.912F500
+Y66F1000
+Y66.132Z-6
+X16
+Y66Z-6.912F500
+Y-65.999F1000
+Y-66.131Z-6
+X17
+Y-65.999Z-6.912F500
+Y66F1000
+Y66.132Z-6
+X18
+Y66Z-6.912F500
+Y-65.999F1000
+Y-66.131Z-6
+X19Y-65.131
+Y-64.999Z-6.912F500
+Y65F1000
+Y65.132Z-6
+X20
+Y65Z-6.912F500
+Y-64.999F1000
+Y-65.131Z-6
+X21
+Y-64.999Z-6.912F500
+Y65F1000
+Y65.132Z-6
+X22Y64.132
+Y64Z-6.912F500
+Y-63.999F1000
+Y-64.131Z-6
+X23
+Y-63.999Z-6.912F500
+Y64F1000
+Y64.132Z-6
+X24
+Y64Z-6.912F500
+Y-63.999F1000
+Y-64.131Z-6
+X25Y-63.131
+Y-62.999Z-6.912F500
+Y63F1000
+Y63.132Z-6
+X26
+Y63Z-6.912F500
+Y-62.999F1000
+Y-63.131Z-6
+X27Y-62.131
+Y-61.999Z-6.912F500
+Y62F1000
+Y62.132Z-6
+X28
+Y62Z-6.912F500
+Y-61.999F1000
+Y-62.131Z-6
+X29
+Y-61.999Z-6.912F500
+Y62F1000
+Y62.132Z-6
+X30Y61.132
+Y61Z-6.912F500
+Y-60.999F1000
+Y-61.131Z-6
+X31
+Y-60.999Z-6.912F500
+Y61F1000
+Y61.132Z-6
+X32Y60.132
+Y60Z-6.912F500
+Y-59.999F1000
+Y-60.131Z-6
+X33
+Y-59.999Z-6.912F500
+Y60F1000
+Y60.132Z-6
+X34Y59.132
+Y59Z-6.912F500
+Y-58.999F1000
+Y-59.131Z-6
+X35Y-58.131
+Y-57.999Z-6.912F500
+Y58F1000
+Y58.132Z-6
+X36
+Y58Z-6.912F500
+Y-57.999F1000
+Y-58.131Z-6
+X37Y-57.131
+Y-56.999Z-6.912F500
+Y57F1000
+Y57.132Z-6
+X38Y56.132
+Y56Z-6.912F500
+Y-55.999F1000
+Y-56.131Z-6
+X39
+Y-55.999Z-6.912F500
+Y56F1000
+Y56.132Z-6
+X40Y55.132
+Y55Z-6.912F500
+Y-54.999F1000
+Y-55.131Z-6
+X41Y-54.131
+Y-53.999Z-6.912F500
+Y54F1000
+Y54.132Z-6
+X42
+Y54Z-6.912F500
+Y-53.999F1000
+Y-54.131Z-6
+X43Y-53.131
+Y-52.999Z-6.912F500
+Y53F1000
+Y53.132Z-6
+X44Y52.132
+Y52Z-6.912F500
+Y-51.999F1000
+Y-52.131Z-6
+X45Y-51.131
+Y-50.999Z-6.912F500
+Y51F1000
+Y51.132Z-6
+X46Y50.132
+Y50Z-6.912F500
+Y-49.999F1000
+Y-50.131Z-6
+X47Y-49.131
+Y-48.999Z-6.912F500
+Y49F1000
+Y49.132Z-6
+X48Y48.132
+Y48Z-6.912F500
+Y-47.999F1000
+Y-48.131Z-6
+X49Y-47.131
+Y-46.999Z-6.912F500
+Y47F1000
+Y47.132Z-6
+X50Y46.132
+Y46Z-6.912F500
+Y-45.999F1000
+Y-46.131Z-6
+X51Y-45.131
+Y-44.999Z-6.912F500
+Y45F1000
+Y45.132Z-6
+X52Y44.132
+Y44Z-6.912F500
+Y-43.999F1000
+Y-44.131Z-6
+X53Y-43.131
+Y-42.999Z-6.912F500
+Y43F1000
+Y43.132Z-6
+X54Y42.132
+Y42Z-6.912F500
+Y-41.999F1000
+Y-42.131Z-6
+X55Y-40.131
+Y-39.999Z-6.912F500
+Y40F1000
+Y40.132Z-6
+X56Y39.132
+Y39Z-6.912F500
+Y-38.999F1000
+Y-39.131Z-6
+X57Y-37.131
+Y-36.999Z-6.912F500
+Y37F1000
+Y37.132Z-6
+X58Y36.132
+Y36Z-6.912F500
+Y-35.999F1000
+Y-36.131Z-6
+X59Y-34.131
+Y-33.999Z-6.912F500
+Y34F1000
+Y34.132Z-6
+X60Y33.132
+Y33Z-6.912F500
+Y-32.999F1000
+Y-33.131Z-6
+X61Y-31.131
+Y-30.999Z-6.912F500
+Y31F1000
+Y31.132Z-6
+X62Y29.132
+Y29Z-6.912F500
+Y-28.999F1000
+Y-29.131Z-6
+G0Z2
+X63Y-26.131
+G1Z-6F500
+Y-25.999Z-6.912
+Y26F1000
+Y26.132Z-6
+X64Y24.132
+Y24Z-6.912F500
+Y-23.999F1000
+Y-24.131Z-6
+G0Z2
+X65Y-21.131
+G1Z-6F500
+Y-20.999Z-6.912
+Y21F1000
+Y21.132Z-6
+G0Z2
+X66Y18.132
+G1Z-6F500
+Y18Z-6.912
+Y-17.999F1000
+Y-18.131Z-6
+G0Z2
+X67Y-14.131
+G1Z-6F500
+Y-13.999Z-6.912
+Y14F1000
+Y14.132Z-6
+G0Z2
+X68Y8.132
+G1Z-6F500
+Y8Z-6.912
+Y-7.999F1000
+Y-8.131Z-6
+G0Z2
+ 